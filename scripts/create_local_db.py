@@ -0,0 +1,215 @@
+#!/usr/bin/env python3
+"""
+Create a local SQLite datEAUbase from the dictionary.
+
+For data loggers at remote stations without a database server, and for
+tests that need the real schema: ``create_local_database`` builds the
+as-designed SQLite schema (tables, foreign keys and the generated indexes,
+see generate_sql.py) in a database file. The file is put in WAL mode, so the
+logger can keep writing while readers query it, and every connection is
+tuned with SQLITE_PRAGMAS.
+
+``bulk_load`` is the fast path for large loads into such a file: it drops
+the table's secondary indexes, inserts all rows in one transaction with
+synchronous writes off, and rebuilds the indexes once at the end.
+
+Usage:
+    python create_local_db.py <json_path> <db_path>
+"""
+
+import sqlite3
+import sys
+from contextlib import contextmanager
+from itertools import islice
+from pathlib import Path
+
+# Add src to path to import models
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root / "src"))
+
+from generate_sql import get_db_config, iter_sql_schema, parse_parts_json
+from open_dateaubase.data_model.schema import extract_field_name
+from open_dateaubase.sql.writer import split_sql
+
+PACKAGED_DICTIONARY = project_root / "src" / "open_dateaubase" / "dictionary.json"
+
+# Applied to every connection (journal_mode is stored in the file)
+SQLITE_PRAGMAS = {
+    "journal_mode": "WAL",
+    # Safe in WAL mode: a power loss may lose the last commits, not corrupt the file
+    "synchronous": "NORMAL",
+    "foreign_keys": "ON",
+    "busy_timeout": 5000,  # ms
+    "temp_store": "MEMORY",
+    "cache_size": -16000,  # KiB (negative) rather than pages
+}
+
+# Temporarily applied by bulk_load
+BULK_LOAD_PRAGMAS = {"synchronous": "OFF"}
+
+
+def open_local_database(db_path, pragmas=None):
+    """
+    Open a local database with SQLITE_PRAGMAS applied.
+
+    Args:
+        db_path: Path to the SQLite file (or ':memory:')
+        pragmas: Pragmas overriding SQLITE_PRAGMAS
+
+    Returns:
+        sqlite3.Connection
+    """
+    connection = sqlite3.connect(db_path)
+    for name, value in {**SQLITE_PRAGMAS, **(pragmas or {})}.items():
+        connection.execute(f"PRAGMA {name} = {value}")
+    return connection
+
+
+def create_local_database(db_path, parts_data=None, pragmas=None, overwrite=False):
+    """
+    Create a SQLite database file with the dictionary's schema.
+
+    The schema is created in one explicit transaction; if a statement fails,
+    the partly created file is deleted.
+
+    Args:
+        db_path: Path of the SQLite file to create
+        parts_data: Parsed parts table data (defaults to the packaged dictionary)
+        pragmas: Pragmas overriding SQLITE_PRAGMAS
+        overwrite: Replace an existing file (and its -wal/-shm files)
+
+    Returns:
+        sqlite3.Connection to the new database
+
+    Raises:
+        FileExistsError: If the file exists and overwrite is False
+    """
+    db_path = Path(db_path)
+    if db_path.exists():
+        if not overwrite:
+            raise FileExistsError(f"Database already exists: {db_path}")
+        for suffix in ("", "-wal", "-shm"):
+            Path(f"{db_path}{suffix}").unlink(missing_ok=True)
+
+    if parts_data is None:
+        parts_data = parse_parts_json(PACKAGED_DICTIONARY)
+
+    db_path.parent.mkdir(parents=True, exist_ok=True)
+    connection = open_local_database(db_path, pragmas)
+    # sqlite3 commits before DDL by default; manage the transaction explicitly
+    previous_isolation = connection.isolation_level
+    connection.isolation_level = None
+    try:
+        connection.execute("BEGIN")
+        for statement in split_sql(iter_sql_schema(parts_data, "sqlite", include_timestamp=False)):
+            connection.execute(statement)
+        connection.execute("COMMIT")
+        connection.execute("PRAGMA optimize")
+    except BaseException:
+        connection.close()
+        for suffix in ("", "-journal", "-wal", "-shm"):
+            Path(f"{db_path}{suffix}").unlink(missing_ok=True)
+        raise
+    connection.isolation_level = previous_isolation
+    return connection
+
+
+@contextmanager
+def _pragmas(connection, pragmas):
+    """Apply pragmas for the duration of a block, then restore them."""
+    previous = {
+        name: connection.execute(f"PRAGMA {name}").fetchone()[0] for name in pragmas
+    }
+    for name, value in pragmas.items():
+        connection.execute(f"PRAGMA {name} = {value}")
+    try:
+        yield
+    finally:
+        for name, value in previous.items():
+            connection.execute(f"PRAGMA {name} = {value}")
+
+
+def bulk_load(connection, table_id, rows, parts_data=None, batch_size=50_000):
+    """
+    Insert many rows into a table of a local database, as fast as possible.
+
+    The table's secondary indexes are dropped and rebuilt after the load
+    (one sort instead of millions of B-tree updates), synchronous writes are
+    off and everything runs in a single transaction: an error rolls the whole
+    load back, indexes included.
+
+    Args:
+        connection: sqlite3.Connection to a database created from the dictionary
+        table_id: Table to load
+        rows: Iterable of tuples in the table's column order
+        parts_data: Parsed parts table data (defaults to the packaged dictionary)
+        batch_size: Rows per executemany call
+
+    Returns:
+        Number of rows inserted
+
+    Raises:
+        ValueError: If batch_size is not positive
+    """
+    if batch_size < 1:
+        raise ValueError(f"batch_size must be positive, got {batch_size}")
+    if parts_data is None:
+        parts_data = parse_parts_json(PACKAGED_DICTIONARY)
+
+    quote = get_db_config("sqlite")["quote"]
+    columns = [extract_field_name(f["part_id"]) for f in parts_data["tables"][table_id]["fields"]]
+    insert = (
+        f"INSERT INTO {quote(table_id)} ({', '.join(quote(c) for c in columns)}) "
+        f"VALUES ({', '.join('?' * len(columns))})"
+    )
+
+    # Explicit transaction; commit what the caller left open first
+    connection.commit()
+    previous_isolation = connection.isolation_level
+    with _pragmas(connection, BULK_LOAD_PRAGMAS):
+        connection.isolation_level = None
+        try:
+            connection.execute("BEGIN")
+            indexes = connection.execute(
+                "SELECT name, sql FROM sqlite_master "
+                "WHERE type = 'index' AND tbl_name = ? AND sql IS NOT NULL",
+                (table_id,),
+            ).fetchall()
+            for name, _ in indexes:
+                connection.execute(f"DROP INDEX {quote(name)}")
+
+            inserted = 0
+            rows = iter(rows)
+            while batch := list(islice(rows, batch_size)):
+                connection.executemany(insert, batch)
+                inserted += len(batch)
+
+            for _, sql in indexes:
+                connection.execute(sql)
+            connection.execute("COMMIT")
+        except BaseException:
+            connection.execute("ROLLBACK")
+            raise
+        finally:
+            connection.isolation_level = previous_isolation
+    return inserted
+
+
+def main():
+    """Main entry point for script."""
+    if len(sys.argv) != 3:
+        print("Usage: python create_local_db.py <json_path> <db_path>")
+        print("Example: python create_local_db.py src/open_dateaubase/dictionary.json station.db")
+        sys.exit(1)
+
+    json_path = Path(sys.argv[1])
+    db_path = Path(sys.argv[2])
+
+    connection = create_local_database(db_path, parse_parts_json(json_path))
+    tables = connection.execute("SELECT COUNT(*) FROM sqlite_master WHERE type = 'table'")
+    print(f"Created {db_path} with {tables.fetchone()[0]} tables")
+    connection.close()
+
+
+if __name__ == "__main__":
+    main()
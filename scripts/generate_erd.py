@@ -18,145 +18,16 @@ from dataclasses import dataclass, asdict
 project_root = Path(__file__).parent.parent
 sys.path.insert(0, str(project_root / "src"))
 
-from open_dateaubase.data_model.models import Dictionary, ViewPart, ViewColumnPart
+from open_dateaubase.data_model.schema import load_schema
 
 
 def parse_erd_json(json_path):
     """
     Parse dictionary.json using Pydantic validation.
-    Returns same dict structure as parse_parts_table() for compatibility.
+    Returns the compiled schema shared by all generators (see
+    open_dateaubase.data_model.schema.compile_schema).
     """
-    # Load and validate
-    with open(json_path, "r", encoding="utf-8") as f:
-        raw_data = json.load(f)
-
-    # Pydantic validation
-    dictionary = Dictionary.model_validate(raw_data)
-
-    # Transform to legacy format for generators
-    data = {
-        "tables": {},
-        "value_sets": {},
-        "metadata": {},
-        "id_field_locations": {},
-        "views": {},
-    }
-
-    # Process tables
-    for part in dictionary.parts:
-        if part.part_type == "table":
-            data["tables"][part.part_id] = {
-                "label": part.label,
-                "description": part.description,
-                "fields": [],
-            }
-
-    # Process views
-    for part in dictionary.parts:
-        if part.part_type == "view":
-            data["views"][part.part_id] = {
-                "label": part.label,
-                "description": part.description,
-                "view_definition": part.view_definition,
-                "columns": [],
-            }
-
-    # Process fields
-    for part in dictionary.parts:
-        # Only process field parts that have table_presence
-        if hasattr(part, "table_presence") and part.part_type in [
-            "key",
-            "property",
-            "compositeKeyFirst",
-            "compositeKeySecond",
-            "parentKey",
-        ]:
-            for table_name, presence in part.table_presence.items():
-                if table_name not in data["tables"]:
-                    continue
-
-                # Track ID field locations
-                if part.part_id.endswith("_ID"):
-                    if part.part_id not in data["id_field_locations"]:
-                        data["id_field_locations"][part.part_id] = {}
-                    data["id_field_locations"][part.part_id][table_name] = presence.role
-
-                # Determine FK target and relationship type from explicit metadata
-                fk_to = ""
-                relationship_type = None
-                if part.part_type == "parentKey":
-                    fk_to = part.ancestor_part_id
-                elif presence.relationship_type:
-                    # Infer FK target from field name (field ending in _ID references same-named primary key)
-                    if part.part_id.endswith("_ID"):
-                        fk_to = part.part_id
-                    relationship_type = presence.relationship_type
-
-                field_info = {
-                    "part_id": part.part_id,
-                    "label": part.label,
-                    "description": part.description,
-                    "part_type": presence.role,
-                    "sql_data_type": getattr(part, "sql_data_type", None) or "",
-                    "is_required": presence.required,
-                    "default_value": getattr(part, "default_value", None) or "",
-                    "fk_to": fk_to,
-                    "relationship_type": relationship_type,
-                    "value_set": getattr(part, "value_set_part_id", None) or "",
-                    "sort_order": presence.order,
-                }
-                data["tables"][table_name]["fields"].append(field_info)
-
-    # Process value sets
-    for part in dictionary.parts:
-        if part.part_type == "valueSet":
-            data["value_sets"][part.part_id] = {
-                "label": part.label,
-                "description": part.description,
-                "members": [],
-            }
-
-    for part in dictionary.parts:
-        if part.part_type == "valueSetMember":
-            value_set_id = part.member_of_set_part_id
-            if value_set_id in data["value_sets"]:
-                member_info = {
-                    "part_id": part.part_id,
-                    "label": part.label,
-                    "description": part.description,
-                    "sort_order": part.sort_order if part.sort_order else 999,
-                }
-                data["value_sets"][value_set_id]["members"].append(member_info)
-
-    # Sort fields and members
-    for table in data["tables"].values():
-        table["fields"].sort(key=lambda x: x["sort_order"])
-
-    for value_set in data["value_sets"].values():
-        value_set["members"].sort(key=lambda x: x["sort_order"])
-
-    # Process view columns
-    for part in dictionary.parts:
-        if part.part_type == "viewColumn":
-            for view_name, view_meta in part.view_presence.items():
-                if view_name not in data["views"]:
-                    continue
-
-                col_info = {
-                    "part_id": part.part_id,
-                    "label": part.label,
-                    "description": part.description,
-                    "source_field_part_id": part.source_field_part_id,
-                    "sql_data_type": part.sql_data_type or "",
-                    "sort_order": view_meta.get("order", 999),
-                }
-                data["views"][view_name]["columns"].append(col_info)
-
-    # Sort columns
-    for view in data["views"].values():
-        view["columns"].sort(key=lambda x: x["sort_order"])
-
-    return data
+    return load_schema(json_path)
 
 
 def generate_erd_files(parts_data, assets_path, output_path):
@@ -0,0 +1,711 @@
+#!/usr/bin/env python3
+"""
+Generate a migration script between two versions of the dictionary.
+
+Instead of regenerating the full DDL (which means dropping and reloading
+every table, including the very large ``value`` table), this script diffs two
+dictionaries and emits the ALTER statements that take a database from the old
+schema to the new one, in an order the database accepts:
+
+1. Drop foreign keys and indexes that are removed or in the way of a change
+2. Create new tables
+3. Add columns
+4. Change column types, nullability and defaults
+5. Drop columns
+6. Add foreign keys, then indexes
+7. Drop removed tables
+
+Large tables (tables with storage hints, plus any given explicitly) get
+online-friendly variants where the dialect has them: indexes are built
+online (MSSQL ``ONLINE = ON``, PostgreSQL ``CONCURRENTLY``), foreign keys are
+added unchecked and validated separately (``WITH NOCHECK`` / ``NOT VALID``),
+and type changes add a new column, backfill it in batches and swap it in
+rather than rewriting the table under a lock.
+
+The old side may also be an as-built DDL dump (a .sql file), parsed with
+open_dateaubase.sql.ddl_parser. Tables and columns that only exist in the
+dump are then left in place (listed as comments) rather than dropped.
+
+Usage:
+    python generate_migration.py <old_json_or_sql> <new_json> <output_path> [target_db]
+
+    Use '-' as <output_path> to print the migration to stdout (e.g. to pipe it
+    into sqlcmd or psql).
+"""
+
+import sys
+from pathlib import Path
+from datetime import datetime
+
+# Add src to path to import models
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root / "src"))
+sys.path.insert(0, str(Path(__file__).parent))
+
+from open_dateaubase.data_model.graph import ForeignKeyGraph
+from open_dateaubase.data_model.schema import compile_schema, load_schema, extract_field_name
+from open_dateaubase.sql.ddl_parser import ddl_to_dictionary, parse_ddl_file
+from open_dateaubase.sql.dialects import map_sql_type, format_default
+from generate_sql import (
+    get_db_config,
+    generate_create_table,
+    generate_field_definition,
+    generate_foreign_key_constraint,
+    generate_index_statement,
+    generate_table_storage,
+    resolve_foreign_key_target,
+    table_index_specs,
+    validate_no_circular_fks,
+)
+
+KEY_ROLES = ("key", "compositeKeyFirst", "compositeKeySecond")
+
+# Rows updated per statement when backfilling a column online
+DEFAULT_BATCH_SIZE = 50_000
+
+
+def parse_parts_json(json_path):
+    """
+    Parse dictionary.json using Pydantic validation.
+    Returns the compiled schema shared by all generators (see
+    open_dateaubase.data_model.schema.compile_schema).
+    """
+    return load_schema(json_path)
+
+
+def parse_old_schema(path):
+    """
+    Load the old side of a migration from a dictionary or a DDL dump.
+
+    Args:
+        path: dictionary.json, or a .sql dump of the current database
+
+    Returns:
+        Tuple of (compiled schema, list of DDL elements that were not imported)
+    """
+    path = Path(path)
+    if path.suffix.lower() != ".sql":
+        return parse_parts_json(path), []
+    dictionary, warnings = ddl_to_dictionary(parse_ddl_file(path))
+    return compile_schema(dictionary), warnings
+
+
+def column_signature(field, db_config):
+    """
+    Return what a column looks like in the target database.
+
+    Args:
+        field: Field metadata dict
+        db_config: Database-specific configuration
+
+    Returns:
+        Tuple of (mapped SQL type, is_required, default value); primary key
+        columns are always required
+    """
+    sql_type = field["sql_data_type"] if field["sql_data_type"] else "nvarchar(255)"
+    return (
+        map_sql_type(sql_type, db_config),
+        field["is_required"] or field["part_type"] in KEY_ROLES,
+        field["default_value"] or "",
+    )
+
+
+def primary_key_columns(table_id, table_info, db_config):
+    """Return the SQL column names of a table's primary key."""
+    columns = [
+        extract_field_name(f["part_id"])
+        for f in table_info["fields"]
+        if f["part_type"] in KEY_ROLES
+    ]
+    if columns:
+        storage = generate_table_storage(table_id, table_info, db_config)
+        columns += [c for c in storage["primary_key_columns"] if c not in columns]
+    return columns
+
+
+def diff_schemas(old, new, db_config):
+    """
+    Compare two compiled schemas as rendered for a target database.
+
+    Columns are matched by SQL column name within a table, foreign keys by
+    column and target, and indexes by name.
+
+    Args:
+        old: Compiled schema of the current database
+        new: Compiled schema to migrate to
+        db_config: Database-specific configuration
+
+    Returns:
+        Dict of lists:
+            added_tables / dropped_tables: table IDs, in the order to
+                create them (referenced tables first) / drop them
+                (referencing tables first)
+            added_columns / dropped_columns: (table_id, field)
+            changed_columns: (table_id, old_field, new_field, changes) where
+                changes is a set of 'type', 'nullability' and 'default'
+            added_foreign_keys / dropped_foreign_keys: (table_id, field)
+            added_indexes / dropped_indexes: (table_id, index spec)
+            storage_changes: table IDs whose storage hints differ
+    """
+    diff = {
+        "added_tables": [],
+        "dropped_tables": [],
+        "added_columns": [],
+        "dropped_columns": [],
+        "changed_columns": [],
+        "added_foreign_keys": [],
+        "dropped_foreign_keys": [],
+        "added_indexes": [],
+        "dropped_indexes": [],
+        "storage_changes": [],
+    }
+    old_tables = old["tables"]
+    new_tables = new["tables"]
+    # Create referenced tables first and drop them last; strongly connected
+    # components come referenced-first and also order schemas with cycles
+    new_order = ForeignKeyGraph.from_schema(new).strongly_connected_components()
+    old_order = ForeignKeyGraph.from_schema(old).strongly_connected_components()
+    diff["added_tables"] = [
+        t for component in new_order for t in component if t not in old_tables
+    ]
+    diff["dropped_tables"] = [
+        t for component in reversed(old_order) for t in component if t not in new_tables
+    ]
+
+    def foreign_keys(data, table_id):
+        keys = {}
+        for field in data["tables"][table_id]["fields"]:
+            target = resolve_foreign_key_target(field, data, db_config)
+            if target is not None:
+                keys[extract_field_name(field["part_id"])] = (field, target)
+        return keys
+
+    def indexes(data, table_id):
+        specs = table_index_specs(table_id, data["tables"][table_id], data, db_config)
+        return {spec["name"]: spec for spec in specs}
+
+    for table_id in diff["dropped_tables"]:
+        # Dropped first, so the tables can then be dropped in any order
+        if not db_config["inline_foreign_keys"]:
+            for field, _ in foreign_keys(old, table_id).values():
+                diff["dropped_foreign_keys"].append((table_id, field))
+    for table_id in diff["added_tables"]:
+        if not db_config["inline_foreign_keys"]:
+            for field, _ in foreign_keys(new, table_id).values():
+                diff["added_foreign_keys"].append((table_id, field))
+        for spec in indexes(new, table_id).values():
+            diff["added_indexes"].append((table_id, spec))
+
+    for table_id in sorted(set(old_tables) & set(new_tables)):
+        old_info = old_tables[table_id]
+        new_info = new_tables[table_id]
+        old_fields = {extract_field_name(f["part_id"]): f for f in old_info["fields"]}
+        new_fields = {extract_field_name(f["part_id"]): f for f in new_info["fields"]}
+
+        # Columns whose dependent FKs and indexes must be dropped first
+        disturbed = set()
+        for column, field in new_fields.items():
+            if column not in old_fields:
+                diff["added_columns"].append((table_id, field))
+        for column, field in old_fields.items():
+            if column not in new_fields:
+                diff["dropped_columns"].append((table_id, field))
+                disturbed.add(column)
+        for column in old_fields.keys() & new_fields.keys():
+            old_sig = column_signature(old_fields[column], db_config)
+            new_sig = column_signature(new_fields[column], db_config)
+            changes = {
+                name
+                for name, a, b in zip(("type", "nullability", "default"), old_sig, new_sig)
+                if a != b
+            }
+            if changes:
+                diff["changed_columns"].append(
+                    (table_id, old_fields[column], new_fields[column], changes)
+                )
+                if changes & {"type", "nullability"}:
+                    disturbed.add(column)
+
+        old_fks = foreign_keys(old, table_id)
+        new_fks = foreign_keys(new, table_id)
+        for column, (field, target) in old_fks.items():
+            kept = column in new_fks and new_fks[column][1] == target
+            if not kept or column in disturbed or target[0] in diff["dropped_tables"]:
+                diff["dropped_foreign_keys"].append((table_id, field))
+        for column, (field, target) in new_fks.items():
+            kept = column in old_fks and old_fks[column][1] == target
+            if not kept or column in disturbed:
+                diff["added_foreign_keys"].append((table_id, field))
+
+        old_indexes = indexes(old, table_id)
+        new_indexes = indexes(new, table_id)
+        for name, spec in old_indexes.items():
+            columns = {extract_field_name(c) for c in spec["columns"] + spec["include_columns"]}
+            if new_indexes.get(name) != spec or columns & disturbed:
+                diff["dropped_indexes"].append((table_id, spec))
+                if name in new_indexes:
+                    diff["added_indexes"].append((table_id, new_indexes[name]))
+        for name, spec in new_indexes.items():
+            if name not in old_indexes:
+                diff["added_indexes"].append((table_id, spec))
+
+        if old_info.get("storage") != new_info.get("storage"):
+            diff["storage_changes"].append(table_id)
+
+    return diff
+
+
+def generate_drop_index(table_id, index_name, db_config, online=False):
+    """Generate a DROP INDEX statement (a no-op if the index does not exist)."""
+    quote = db_config["quote"]
+    if db_config["drop_index_on_table"]:
+        option = " WITH (ONLINE = ON)" if online and db_config["online_ddl"] == "mssql" else ""
+        return f"DROP INDEX IF EXISTS {quote(index_name)} ON {quote(table_id)}{option};"
+    concurrently = "CONCURRENTLY " if online and db_config["online_ddl"] == "postgres" else ""
+    return f"DROP INDEX {concurrently}IF EXISTS {quote(index_name)};"
+
+
+def generate_online_index(statement, db_config):
+    """Turn a CREATE INDEX statement into its online variant for the dialect."""
+    if db_config["online_ddl"] == "mssql":
+        return statement[:-1] + " WITH (ONLINE = ON);"
+    if db_config["online_ddl"] == "postgres":
+        return statement.replace(" INDEX ", " INDEX CONCURRENTLY ", 1)
+    return statement
+
+
+def generate_drop_default(table_id, column, db_config):
+    """
+    Generate the statements that drop a column default.
+
+    MSSQL defaults declared inline get a system-generated constraint name, so
+    the name is looked up at run time.
+    """
+    quote = db_config["quote"]
+    if db_config["alter_column"] == "postgres":
+        return [f"ALTER TABLE {quote(table_id)} ALTER COLUMN {quote(column)} DROP DEFAULT;"]
+    # Variables live for the whole batch, so each lookup gets its own; the
+    # declaration and its use must not be split by a GO separator
+    variable = f"@default_{table_id}_{column}"
+    return [
+        f"DECLARE {variable} sysname = (",
+        "    SELECT name FROM sys.default_constraints",
+        f"    WHERE parent_object_id = OBJECT_ID('{table_id}')",
+        f"    AND parent_column_id = COLUMNPROPERTY(OBJECT_ID('{table_id}'), '{column}', 'ColumnId'));",
+        f"IF {variable} IS NOT NULL",
+        f"    EXEC('ALTER TABLE {quote(table_id)} DROP CONSTRAINT [' + {variable} + ']');",
+    ]
+
+
+def generate_set_default(table_id, field, db_config):
+    """Generate the statement that sets a column default."""
+    quote = db_config["quote"]
+    column = extract_field_name(field["part_id"])
+    default = format_default(field["default_value"], field["sql_data_type"], db_config)
+    if db_config["alter_column"] == "postgres":
+        return f"ALTER TABLE {quote(table_id)} ALTER COLUMN {quote(column)} SET DEFAULT {default};"
+    return f"ALTER TABLE {quote(table_id)} ADD DEFAULT {default} FOR {quote(column)};"
+
+
+def generate_add_column(table_id, field, data, db_config):
+    """
+    Generate the statements that add a column to an existing table.
+
+    A required column without a default cannot be added to a table that
+    already has rows, so it is added as NULL and the NOT NULL change is left
+    commented out until the column has been backfilled.
+    """
+    quote = db_config["quote"]
+    column = extract_field_name(field["part_id"])
+    keyword = db_config["add_column_keyword"]
+    needs_backfill = field["is_required"] and not field["default_value"]
+
+    definition = generate_field_definition(
+        {**field, "is_required": False} if needs_backfill else field, data, db_config
+    ).strip()
+    if db_config["inline_foreign_keys"]:
+        target = resolve_foreign_key_target(field, data, db_config)
+        if target is not None:
+            definition += f" REFERENCES {quote(target[0])} ({quote(target[1])})"
+
+    statements = [f"ALTER TABLE {quote(table_id)} {keyword} {definition};"]
+    if needs_backfill:
+        statements.append(
+            f"-- {table_id}.{column} is required but has no default: backfill it, then run"
+        )
+        statements.extend(
+            f"-- {s}" for s in generate_alter_column(table_id, field, db_config, {"nullability"})
+        )
+    return statements
+
+
+def generate_alter_column(table_id, field, db_config, changes):
+    """
+    Generate the statements that change a column's type and/or nullability in place.
+
+    Args:
+        table_id: Table ID
+        field: New field metadata
+        db_config: Database-specific configuration
+        changes: Subset of {'type', 'nullability'}
+
+    Returns:
+        List of SQL statements
+    """
+    quote = db_config["quote"]
+    column = extract_field_name(field["part_id"])
+    sql_type = column_signature(field, db_config)[0]
+    table = quote(table_id)
+
+    if db_config["alter_column"] == "mssql":
+        null = "NOT NULL" if field["is_required"] else "NULL"
+        return [f"ALTER TABLE {table} ALTER COLUMN {quote(column)} {sql_type} {null};"]
+
+    statements = []
+    if "type" in changes:
+        statements.append(
+            f"ALTER TABLE {table} ALTER COLUMN {quote(column)} TYPE {sql_type} "
+            f"USING CAST({quote(column)} AS {sql_type});"
+        )
+    if "nullability" in changes:
+        action = "SET NOT NULL" if field["is_required"] else "DROP NOT NULL"
+        statements.append(f"ALTER TABLE {table} ALTER COLUMN {quote(column)} {action};")
+    return statements
+
+
+def generate_online_type_change(table_id, field, db_config, batch_size):
+    """
+    Generate an online type change: add a column, backfill it in batches, swap.
+
+    Each batch is a short transaction, so the table stays available while
+    the new column is filled, instead of being rewritten under one lock.
+    MSSQL compiles a whole batch before running it, so the statements that
+    use the staging column are separated from its creation and renaming by
+    GO; the PostgreSQL loop commits after every batch, which requires
+    PostgreSQL 11+ and running the script outside a transaction block.
+
+    Args:
+        table_id: Table ID
+        field: New field metadata
+        db_config: Database-specific configuration
+        batch_size: Rows updated per batch
+
+    Returns:
+        List of SQL statements
+    """
+    quote = db_config["quote"]
+    column = extract_field_name(field["part_id"])
+    staging = f"{column}__new"
+    sql_type = column_signature(field, db_config)[0]
+    table = quote(table_id)
+    keyword = db_config["add_column_keyword"]
+
+    statements = [f"ALTER TABLE {table} {keyword} {quote(staging)} {sql_type} NULL;"]
+    assignment = f"{quote(staging)} = CAST({quote(column)} AS {sql_type})"
+    pending = f"{quote(staging)} IS NULL AND {quote(column)} IS NOT NULL"
+
+    if db_config["online_ddl"] == "mssql":
+        statements += [
+            "GO",
+            "WHILE 1 = 1",
+            "BEGIN",
+            f"    UPDATE TOP ({batch_size}) {table} SET {assignment}",
+            f"    WHERE {pending};",
+            "    IF @@ROWCOUNT = 0 BREAK;",
+            "END;",
+            "GO",
+        ]
+    else:
+        statements += [
+            "-- Commits after each batch: run outside a transaction block (PostgreSQL 11+)",
+            "DO $$",
+            "BEGIN",
+            "    LOOP",
+            f"        UPDATE {table} SET {assignment}",
+            # tableoid keeps ctid unique across the partitions of a partitioned table
+            f"        WHERE (tableoid, ctid) IN (SELECT tableoid, ctid FROM {table}",
+            f"            WHERE {pending} LIMIT {batch_size});",
+            "        EXIT WHEN NOT FOUND;",
+            "        COMMIT;",
+            "    END LOOP;",
+            "END $$;",
+        ]
+
+    statements.append(f"ALTER TABLE {table} DROP COLUMN {quote(column)};")
+    if db_config["rename_column"] == "sp_rename":
+        statements.append(f"EXEC sp_rename '{table_id}.{staging}', '{column}', 'COLUMN';")
+        statements.append("GO")
+    else:
+        statements.append(
+            f"ALTER TABLE {table} RENAME COLUMN {quote(staging)} TO {quote(column)};"
+        )
+    if field["is_required"]:
+        statements.extend(generate_alter_column(table_id, field, db_config, {"nullability"}))
+    return statements
+
+
+def generate_online_foreign_key(table_id, field, data, db_config):
+    """
+    Add a foreign key without scanning the table under lock, then validate it.
+
+    The constraint is created unchecked (MSSQL WITH NOCHECK, PostgreSQL NOT
+    VALID) so it only applies to new rows; the separate validation step scans
+    existing rows without blocking writes.
+    """
+    statement = generate_foreign_key_constraint(table_id, field, data, db_config)
+    quote = db_config["quote"]
+    name = quote(f"FK_{table_id}_{extract_field_name(field['part_id'])}")
+    table = quote(table_id)
+
+    if db_config["online_ddl"] == "mssql":
+        statement = statement.replace(f"ALTER TABLE {table}\n", f"ALTER TABLE {table} WITH NOCHECK\n", 1)
+        return [statement, f"ALTER TABLE {table} WITH CHECK CHECK CONSTRAINT {name};\n"]
+    statement = statement.rstrip().rstrip(";") + " NOT VALID;\n"
+    return [statement, f"ALTER TABLE {table} VALIDATE CONSTRAINT {name};\n"]
+
+
+def generate_migration(
+    old,
+    new,
+    target_db="mssql",
+    large_tables=(),
+    batch_size=DEFAULT_BATCH_SIZE,
+    include_timestamp=True,
+    keep_extra=False,
+):
+    """
+    Generate the SQL that migrates a database from one dictionary version to another.
+
+    Args:
+        old: Compiled schema of the current database
+        new: Compiled schema to migrate to
+        target_db: Target database flavor
+        large_tables: Tables to change with online-friendly statements, in
+            addition to the tables with storage hints in the new schema
+        batch_size: Rows per batch when backfilling a column online
+        include_timestamp: Whether to include generation timestamp
+        keep_extra: Leave tables and columns missing from the new schema in
+            place (listed as comments) instead of dropping them, e.g. when
+            the old schema was read from an as-built database
+
+    Returns:
+        Migration SQL as a string
+
+    Raises:
+        ValueError: If the new schema has circular foreign keys, or a change
+            is not supported by the dialect (e.g. altering a column in SQLite)
+    """
+    validate_no_circular_fks(new)
+    db_config = get_db_config(target_db)
+    quote = db_config["quote"]
+    diff = diff_schemas(old, new, db_config)
+
+    kept = []
+    if keep_extra:
+        kept = [f"-- Not dropped: table {t}" for t in diff["dropped_tables"]]
+        kept += [
+            f"-- Not dropped: column {t}.{extract_field_name(f['part_id'])}"
+            for t, f in diff["dropped_columns"]
+        ]
+        extra = set(diff["dropped_tables"])
+        extra.update((t, f["part_id"]) for t, f in diff["dropped_columns"])
+        diff["dropped_foreign_keys"] = [
+            (t, f)
+            for t, f in diff["dropped_foreign_keys"]
+            if t not in extra and (t, f["part_id"]) not in extra
+        ]
+        recreated = {(t, spec["name"]) for t, spec in diff["added_indexes"]}
+        diff["dropped_indexes"] = [
+            (t, spec) for t, spec in diff["dropped_indexes"] if (t, spec["name"]) in recreated
+        ]
+        diff["dropped_tables"] = []
+        diff["dropped_columns"] = []
+
+    large = set(large_tables)
+    large.update(t for t, info in new["tables"].items() if info.get("storage"))
+    online = db_config["online_ddl"] is not None
+    # PostgreSQL cannot build indexes concurrently or add NOT VALID foreign
+    # keys on a partitioned table, so those keep the regular statements there
+    online_constraints = large - {
+        t
+        for t, info in new["tables"].items()
+        if db_config["partitioning"] == "declarative"
+        and info.get("storage")
+        and info["storage"]["partition_column"]
+    }
+
+    unsupported = [
+        f"{table_id}.{extract_field_name(new_field['part_id'])}"
+        for table_id, _, new_field, changes in diff["changed_columns"]
+        if changes & {"type", "nullability"} and db_config["alter_column"] is None
+    ]
+    if db_config["inline_foreign_keys"]:
+        added_columns = {(t, f["part_id"]) for t, f in diff["added_columns"]}
+        unsupported += [
+            f"{table_id}.{extract_field_name(field['part_id'])} (foreign key)"
+            for table_id, field in diff["added_foreign_keys"]
+            if (table_id, field["part_id"]) not in added_columns
+        ]
+        # Inline constraints of kept tables cannot be dropped either
+        unsupported += [
+            f"{table_id}.{extract_field_name(field['part_id'])} (dropped foreign key)"
+            for table_id, field in diff["dropped_foreign_keys"]
+        ]
+    for table_id, old_field, _, changes in diff["changed_columns"]:
+        column = extract_field_name(old_field["part_id"])
+        if "type" in changes and column in primary_key_columns(
+            table_id, old["tables"][table_id], db_config
+        ):
+            unsupported.append(f"{table_id}.{column} (primary key type)")
+    if unsupported:
+        raise ValueError(
+            f"Changes not supported by {target_db} without rebuilding the table: "
+            f"{', '.join(unsupported)}"
+        )
+
+    sql = ["-- Auto-generated migration between two versions of dictionary.json"]
+    sql.append(f"-- Target database: {target_db.upper()}")
+    if include_timestamp:
+        sql.append(f"-- Generated: {datetime.now().isoformat()}")
+    if online and large:
+        sql.append(f"-- Online-friendly statements for: {', '.join(sorted(large))}")
+    if db_config["online_ddl"] == "postgres" and online_constraints:
+        sql.append("-- CREATE INDEX CONCURRENTLY cannot run inside a transaction block")
+    for table_id in diff["storage_changes"]:
+        sql.append(f"-- Storage hints of {table_id} changed; repartitioning is not generated")
+    sql.extend(kept)
+
+    def section(title, statements):
+        if statements:
+            sql.append(f"\n-- {title}\n")
+            sql.extend(statements)
+
+    # 1. Drop what is in the way
+    dropped_fks = []
+    for table_id, field in diff["dropped_foreign_keys"]:
+        name = quote(f"FK_{table_id}_{extract_field_name(field['part_id'])}")
+        dropped_fks.append(f"ALTER TABLE {quote(table_id)} DROP CONSTRAINT IF EXISTS {name};")
+    section("Drop Foreign Keys", dropped_fks)
+
+    section(
+        "Drop Indexes",
+        [
+            generate_drop_index(
+                table_id, spec["name"], db_config, online=table_id in online_constraints
+            )
+            for table_id, spec in diff["dropped_indexes"]
+        ],
+    )
+
+    # 2. New tables
+    created = []
+    for table_id in diff["added_tables"]:
+        created.extend(generate_create_table(table_id, new["tables"][table_id], new, db_config))
+    section("Create Tables", created)
+
+    # 3. New columns
+    added = []
+    for table_id, field in diff["added_columns"]:
+        added.extend(generate_add_column(table_id, field, new, db_config))
+    section("Add Columns", added)
+
+    # 4. Changed columns
+    altered = []
+    for table_id, old_field, new_field, changes in diff["changed_columns"]:
+        column = extract_field_name(new_field["part_id"])
+        altered.append(f"-- {table_id}.{column}: {', '.join(sorted(changes))}")
+        if old_field["default_value"] and (changes & {"default", "type"}):
+            altered.extend(generate_drop_default(table_id, column, db_config))
+        if "type" in changes and online and table_id in large:
+            altered.extend(generate_online_type_change(table_id, new_field, db_config, batch_size))
+        elif changes & {"type", "nullability"}:
+            altered.extend(generate_alter_column(table_id, new_field, db_config, changes))
+        if new_field["default_value"] and (changes & {"default", "type"}):
+            altered.append(generate_set_default(table_id, new_field, db_config))
+    section("Alter Columns", altered)
+
+    # 5. Removed columns
+    dropped_columns = []
+    for table_id, field in diff["dropped_columns"]:
+        column = extract_field_name(field["part_id"])
+        if field["default_value"] and db_config["alter_column"] == "mssql":
+            dropped_columns.extend(generate_drop_default(table_id, column, db_config))
+        dropped_columns.append(f"ALTER TABLE {quote(table_id)} DROP COLUMN {quote(column)};")
+    section("Drop Columns", dropped_columns)
+
+    # 6. Foreign keys, then indexes
+    added_columns = {(t, f["part_id"]) for t, f in diff["added_columns"]}
+    fks = []
+    for table_id, field in diff["added_foreign_keys"]:
+        if db_config["inline_foreign_keys"]:
+            continue  # Declared with the new table or column
+        if online and table_id in online_constraints and table_id not in diff["added_tables"]:
+            fks.extend(generate_online_foreign_key(table_id, field, new, db_config))
+        else:
+            fks.append(generate_foreign_key_constraint(table_id, field, new, db_config))
+    section("Add Foreign Keys", fks)
+
+    created_indexes = []
+    for table_id, spec in diff["added_indexes"]:
+        statement = generate_index_statement(
+            table_id,
+            spec["name"],
+            spec["columns"],
+            db_config,
+            include_columns=spec["include_columns"],
+            is_unique=spec["is_unique"],
+        )
+        if table_id in online_constraints and table_id not in diff["added_tables"]:
+            statement = generate_online_index(statement, db_config)
+        created_indexes.append(statement)
+    section("Create Indexes", created_indexes)
+
+    # 7. Removed tables (their FKs were dropped above)
+    section(
+        "Drop Tables",
+        [f"DROP TABLE {quote(table_id)};" for table_id in diff["dropped_tables"]],
+    )
+
+    return "\n".join(sql)
+
+
+def main():
+    """Main entry point for script."""
+    if len(sys.argv) not in (4, 5):
+        print(
+            "Usage: python generate_migration.py <old_json_or_sql> <new_json> <output_path> [target_db]"
+        )
+        print(
+            "Example: python generate_migration.py old/dictionary.json dictionary.json migration.sql mssql"
+        )
+        print(
+            "Example: python generate_migration.py as_built.sql dictionary.json migration.sql mssql"
+        )
+        sys.exit(1)
+
+    old_path = Path(sys.argv[1])
+    new_path = Path(sys.argv[2])
+    output_path = None if sys.argv[3] == "-" else Path(sys.argv[3])
+    target_db = sys.argv[4] if len(sys.argv) == 5 else "mssql"
+    # Keep stdout clean when the migration is piped into sqlcmd/psql
+    log = sys.stderr if output_path is None else sys.stdout
+
+    old, warnings = parse_old_schema(old_path)
+    for warning in warnings:
+        print(f"Not imported from {old_path.name}: {warning}", file=log)
+    migration = generate_migration(
+        old,
+        parse_parts_json(new_path),
+        target_db=target_db,
+        keep_extra=old_path.suffix.lower() == ".sql",
+    )
+    if output_path is None:
+        print(migration)
+        return
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    output_path.write_text(migration, encoding="utf-8")
+    print(f"Generated {target_db} migration at {output_path}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,283 @@
+#!/usr/bin/env python3
+"""
+Generate typed row classes from dictionary.
+
+Emits a Python module with one slotted dataclass per table. Each class has
+one attribute per column (named like the SQL column), a ``from_row``
+classmethod that builds an instance from a DB-API row in column order while
+coercing each value to the column's Python type, and a ``to_params`` method
+returning the values in the same order for INSERT parameters.
+
+Slotted instances have no per-instance ``__dict__``, so holding millions of
+rows costs a fraction of the memory of one dict per row.
+
+Usage:
+    python generate_row_classes.py <json_path> <output_path>
+
+    from rows import Value
+    values = [Value.from_row(r) for r in cursor.execute("SELECT ... FROM value")]
+    cursor.executemany(insert_sql, [v.to_params() for v in values])
+"""
+
+import sys
+from pathlib import Path
+
+# Add src to path to import models
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root / "src"))
+
+from open_dateaubase.data_model.schema import load_schema, extract_field_name
+
+# Base SQL type (lowercase, without size) -> (Python annotation, coercer)
+PYTHON_TYPES = {
+    "bit": ("bool", "_bool"),
+    "tinyint": ("int", "_int"),
+    "smallint": ("int", "_int"),
+    "int": ("int", "_int"),
+    "integer": ("int", "_int"),
+    "bigint": ("int", "_int"),
+    "real": ("float", "_float"),
+    "float": ("float", "_float"),
+    "double precision": ("float", "_float"),
+    "numeric": ("Decimal", "_decimal"),
+    "decimal": ("Decimal", "_decimal"),
+    "char": ("str", "_str"),
+    "nchar": ("str", "_str"),
+    "varchar": ("str", "_str"),
+    "nvarchar": ("str", "_str"),
+    "text": ("str", "_str"),
+    "ntext": ("str", "_str"),
+    "date": ("date", "_date"),
+    "datetime": ("datetime", "_datetime"),
+    "datetime2": ("datetime", "_datetime"),
+    "datetimeoffset": ("datetime", "_datetime"),
+    "timestamp": ("datetime", "_datetime"),
+    "timestamptz": ("datetime", "_datetime"),
+    "time": ("time", "_time"),
+    "blob": ("bytes", "_bytes"),
+    "image": ("bytes", "_bytes"),
+    "varbinary": ("bytes", "_bytes"),
+}
+
+# Coercers shared by all generated classes; each passes None through
+MODULE_HEADER = '''"""
+Typed row classes for the open-dateaubase tables.
+
+Auto-generated from dictionary.json by scripts/generate_row_classes.py.
+Do not edit by hand.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import date, datetime, time
+from decimal import Decimal
+from typing import Any, ClassVar, Dict, Mapping, Optional, Sequence, Tuple
+
+
+_BOOL_STRINGS = {"1": True, "0": False, "true": True, "false": False}
+
+
+def _bool(value: Any) -> Optional[bool]:
+    if value is None or type(value) is bool:
+        return value
+    if type(value) is int and value in (0, 1):
+        return bool(value)
+    if isinstance(value, str):
+        parsed = _BOOL_STRINGS.get(value.strip().lower())
+        if parsed is not None:
+            return parsed
+    raise ValueError(f"Invalid bit value: {value!r}")
+
+
+def _int(value: Any) -> Optional[int]:
+    return value if value is None or type(value) is int else int(value)
+
+
+def _float(value: Any) -> Optional[float]:
+    return value if value is None or type(value) is float else float(value)
+
+
+def _decimal(value: Any) -> Optional[Decimal]:
+    if value is None or type(value) is Decimal:
+        return value
+    return Decimal(str(value))
+
+
+def _str(value: Any) -> Optional[str]:
+    return value if value is None or type(value) is str else str(value)
+
+
+def _bytes(value: Any) -> Optional[bytes]:
+    return value if value is None or type(value) is bytes else bytes(value)
+
+
+def _date(value: Any) -> Optional[date]:
+    if value is None or type(value) is date:
+        return value
+    if isinstance(value, datetime):
+        return value.date()
+    return date.fromisoformat(str(value))
+
+
+def _datetime(value: Any) -> Optional[datetime]:
+    if value is None or isinstance(value, datetime):
+        return value
+    return datetime.fromisoformat(str(value))
+
+
+def _time(value: Any) -> Optional[time]:
+    if value is None or type(value) is time:
+        return value
+    return time.fromisoformat(str(value))
+'''
+
+
+def parse_parts_json(json_path):
+    """
+    Parse dictionary.json using Pydantic validation.
+    Returns the compiled schema shared by all generators (see
+    open_dateaubase.data_model.schema.compile_schema).
+    """
+    return load_schema(json_path)
+
+
+def python_type(sql_type):
+    """
+    Map a SQL column type to its Python annotation and coercer name.
+
+    numeric/decimal columns with scale 0 map to int; unknown types map to Any
+    and are not coerced.
+
+    Args:
+        sql_type: SQL data type from the dictionary (e.g. 'nvarchar(100)')
+
+    Returns:
+        Tuple of (annotation, coercer name or None)
+    """
+    base = (sql_type or "").split("(")[0].strip().lower()
+    if base in ("numeric", "decimal") and "(" in sql_type:
+        size = sql_type[sql_type.index("(") + 1 : sql_type.rindex(")")].split(",")
+        if len(size) == 1 or int(size[1]) == 0:
+            return "int", "_int"
+    return PYTHON_TYPES.get(base, ("Any", None))
+
+
+def class_name(table_id):
+    """
+    Convert a table ID to a class name (e.g. 'equipment_model' -> 'EquipmentModel').
+
+    Args:
+        table_id: Table Part_ID
+
+    Returns:
+        CamelCase class name
+    """
+    return "".join(word[:1].upper() + word[1:] for word in table_id.split("_") if word)
+
+
+def tuple_source(items):
+    """Render a sequence of source expressions as a tuple display."""
+    if len(items) == 1:
+        return f"({items[0]},)"
+    return f"({', '.join(items)})"
+
+
+def generate_row_class(table_id, table_info):
+    """
+    Generate the source of the row class of one table.
+
+    Args:
+        table_id: Table Part_ID
+        table_info: Compiled table entry
+
+    Returns:
+        Python source of the class
+    """
+    name = class_name(table_id)
+    columns = [
+        (extract_field_name(field["part_id"]), *python_type(field["sql_data_type"]))
+        for field in table_info["fields"]
+    ]
+
+    lines = ["", "", "@dataclass(slots=True)", f"class {name}:"]
+    docstring = f"{table_info['label']}: {table_info['description']}"
+    docstring = docstring.replace("\\", "\\\\").replace('"""', '\\"\\"\\"')
+    lines.append(f'    """{docstring}"""')
+    lines.append("")
+    lines.append(f"    __table__: ClassVar[str] = {table_id!r}")
+    names = tuple_source([repr(column) for column, _, _ in columns])
+    lines.append(f"    __columns__: ClassVar[Tuple[str, ...]] = {names}")
+    if columns:
+        lines.append("")
+    for column, annotation, _ in columns:
+        lines.append(f"    {column}: Optional[{annotation}] = None")
+
+    # from_row: positional, one coercion call per column, no loop
+    coerced = [
+        f"{coercer}(row[{i}])" if coercer else f"row[{i}]"
+        for i, (_, _, coercer) in enumerate(columns)
+    ]
+    lines.append("")
+    lines.append("    @classmethod")
+    lines.append(f'    def from_row(cls, row: Sequence[Any]) -> "{name}":')
+    lines.append('        """Build a row from values in __columns__ order, coercing types."""')
+    lines.append(f"        return cls({', '.join(coerced)})")
+
+    lines.append("")
+    lines.append("    @classmethod")
+    lines.append(f'    def from_mapping(cls, values: Mapping[str, Any]) -> "{name}":')
+    lines.append('        """Build a row from a column -> value mapping (missing -> None)."""')
+    lines.append("        return cls.from_row([values.get(c) for c in cls.__columns__])")
+
+    params = tuple_source([f"self.{column}" for column, _, _ in columns])
+    lines.append("")
+    lines.append("    def to_params(self) -> Tuple[Any, ...]:")
+    lines.append('        """Return the values in __columns__ order, for INSERT parameters."""')
+    lines.append(f"        return {params}")
+    return "\n".join(lines)
+
+
+def generate_row_classes(data):
+    """
+    Generate the source of a module with one row class per table.
+
+    Args:
+        data: Parsed dictionary data
+
+    Returns:
+        Python source of the module
+    """
+    source = [MODULE_HEADER.rstrip("\n")]
+    registry = []
+    for table_id, table_info in sorted(data["tables"].items()):
+        source.append(generate_row_class(table_id, table_info))
+        registry.append(f"    {table_id!r}: {class_name(table_id)},")
+
+    source.append("")
+    source.append("")
+    source.append("# Table ID -> row class")
+    source.append("ROW_CLASSES: Dict[str, type] = {")
+    source.extend(registry)
+    source.append("}")
+    return "\n".join(source) + "\n"
+
+
+def main():
+    """Main entry point for script."""
+    if len(sys.argv) != 3:
+        print("Usage: python generate_row_classes.py <json_path> <output_path>")
+        print("Example: python generate_row_classes.py dictionary.json rows.py")
+        sys.exit(1)
+
+    json_path = Path(sys.argv[1])
+    output_path = Path(sys.argv[2])
+
+    parts_data = parse_parts_json(json_path)
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    output_path.write_text(generate_row_classes(parts_data), encoding="utf-8")
+    print(f"Generated row classes at {output_path}")
+
+
+if __name__ == "__main__":
+    main()
@@ -7,11 +7,16 @@ to create a modular, testable component.
 
 Usage:
     python generate_sql.py <json_path> <output_path> <target_dbs>
+
+    <target_dbs> is a comma-separated list of dialects (mssql, postgres, sqlite).
+    Use '-' as <output_path> to stream the script to stdout, e.g.
+    python generate_sql.py dictionary.json - postgres | psql -d site
 """
 
 import sys
-import json
 from pathlib import Path
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
 from importlib.metadata import version
 
@@ -19,7 +24,20 @@ from importlib.metadata import version
 project_root = Path(__file__).parent.parent
 sys.path.insert(0, str(project_root / "src"))
 
-from open_dateaubase.data_model.models import Dictionary, ViewPart, ViewColumnPart
+from open_dateaubase.data_model.schema import (
+    load_schema,
+    extract_field_name,
+    key_table,
+    thaw_schema,
+)
+from open_dateaubase.data_model.graph import ForeignKeyGraph
+from open_dateaubase.sql.dialects import (
+    get_dialect,
+    map_sql_type,
+    format_default,
+    format_literal,
+)
+from open_dateaubase.sql.writer import execute_sql, write_sql
 
 package_version = version("open-dateaubase")
 
@@ -27,149 +45,79 @@ package_version = version("open-dateaubase")
 def parse_parts_json(json_path):
     """
     Parse dictionary.json using Pydantic validation.
-    Returns same dict structure as parse_parts_table() for compatibility.
-    """
-    # Load and validate
-    with open(json_path, "r", encoding="utf-8") as f:
-        raw_data = json.load(f)
-
-    # Pydantic validation
-    dictionary = Dictionary.model_validate(raw_data)
-
-    # Transform to legacy format for generators
-    data = {
-        "tables": {},
-        "value_sets": {},
-        "metadata": {},
-        "id_field_locations": {},
-        "views": {},
-    }
+    Returns the compiled schema shared by all generators (see
+    open_dateaubase.data_model.schema.compile_schema).
+    """
+    return load_schema(json_path)
 
-    # Process tables
-    for part in dictionary.parts:
-        if part.part_type == "table":
-            data["tables"][part.part_id] = {
-                "label": part.label,
-                "description": part.description,
-                "fields": [],
-            }
 
-    # Process views
-    for part in dictionary.parts:
-        if part.part_type == "view":
-            data["views"][part.part_id] = {
-                "label": part.label,
-                "description": part.description,
-                "view_definition": part.view_definition,
-                "columns": [],
-            }
+def generate_sql_schemas(parts_data, output_path, db_list, max_workers=None):
+    """
+    Generate SQL schemas for multiple database types.
 
-    # Process fields
-    for part in dictionary.parts:
-        # Only process field parts that have table_presence
-        if hasattr(part, "table_presence") and part.part_type in [
-            "key",
-            "property",
-            "compositeKeyFirst",
-            "compositeKeySecond",
-            "parentKey",
-        ]:
-            for table_name, presence in part.table_presence.items():
-                if table_name not in data["tables"]:
-                    continue
-
-                # Track ID field locations
-                if part.part_id.endswith("_ID"):
-                    if part.part_id not in data["id_field_locations"]:
-                        data["id_field_locations"][part.part_id] = {}
-                    data["id_field_locations"][part.part_id][table_name] = presence.role
-
-                # Determine FK target and relationship type from explicit metadata
-                fk_to = ""
-                relationship_type = None
-                if part.part_type == "parentKey":
-                    fk_to = part.ancestor_part_id
-                elif presence.relationship_type:
-                    # Infer FK target from field name (field ending in _ID references same-named primary key)
-                    if part.part_id.endswith("_ID"):
-                        fk_to = part.part_id
-                    relationship_type = presence.relationship_type
-
-                field_info = {
-                    "part_id": part.part_id,
-                    "label": part.label,
-                    "description": part.description,
-                    "part_type": presence.role,
-                    "sql_data_type": getattr(part, "sql_data_type", None) or "",
-                    "is_required": presence.required,
-                    "default_value": getattr(part, "default_value", None) or "",
-                    "fk_to": fk_to,
-                    "relationship_type": relationship_type,
-                    "value_set": getattr(part, "value_set_part_id", None) or "",
-                    "sort_order": presence.order,
-                }
-                data["tables"][table_name]["fields"].append(field_info)
-
-    # Process value sets
-    for part in dictionary.parts:
-        if part.part_type == "valueSet":
-            data["value_sets"][part.part_id] = {
-                "label": part.label,
-                "description": part.description,
-                "members": [],
-            }
+    The dialect-independent work is done once (see prepare_sql_schema); the
+    dialects are then rendered in parallel worker processes, each streaming
+    its own file.
+
+    Args:
+        parts_data: Parsed parts table data
+        output_path: Output directory, or None to write to stdout
+        db_list: Target database flavors
+        max_workers: Maximum number of worker processes (default: one per
+            dialect); 1 renders in this process
+    """
+    prepared = prepare_sql_schema(parts_data)
+
+    if output_path is None:
+        for target_db in db_list:
+            write_sql(render_sql_schema(prepared, target_db), sys.stdout)
+            sys.stdout.write("\n")
+        return
+
+    jobs = [
+        (target_db, output_path / f"v{package_version}_as-designed_{target_db}.sql")
+        for target_db in db_list
+    ]
+    if len(jobs) == 1 or max_workers == 1:
+        for job in jobs:
+            _write_sql_file(prepared, job)
+            print(f"Generated SQL schema for {job[0]} at {job[1]}")
+        return
+
+    # Compiled schemas are read-only mappings that cannot be pickled
+    prepared = dict(prepared, schema=thaw_schema(prepared["schema"]))
+    # Forking a process that already runs threads (e.g. pyarrow's pool) is
+    # unsafe, so workers start fresh and receive the schema by pickle
+    with ProcessPoolExecutor(
+        max_workers=min(max_workers or len(jobs), len(jobs)),
+        mp_context=multiprocessing.get_context("spawn"),
+        initializer=_init_worker,
+        initargs=(prepared,),
+    ) as pool:
+        for target_db, path in pool.map(_write_worker, jobs):
+            print(f"Generated SQL schema for {target_db} at {path}")
+
+
+# Prepared schema of a worker process (see generate_sql_schemas)
+_worker_schema = None
 
-    for part in dictionary.parts:
-        if part.part_type == "valueSetMember":
-            value_set_id = part.member_of_set_part_id
-            if value_set_id in data["value_sets"]:
-                member_info = {
-                    "part_id": part.part_id,
-                    "label": part.label,
-                    "description": part.description,
-                    "sort_order": part.sort_order if part.sort_order else 999,
-                }
-                data["value_sets"][value_set_id]["members"].append(member_info)
-
-    # Sort fields and members
-    for table in data["tables"].values():
-        table["fields"].sort(key=lambda x: x["sort_order"])
-
-    for value_set in data["value_sets"].values():
-        value_set["members"].sort(key=lambda x: x["sort_order"])
-
-    # Process view columns
-    for part in dictionary.parts:
-        if part.part_type == "viewColumn":
-            for view_name, view_meta in part.view_presence.items():
-                if view_name not in data["views"]:
-                    continue
-
-                col_info = {
-                    "part_id": part.part_id,
-                    "label": part.label,
-                    "description": part.description,
-                    "source_field_part_id": part.source_field_part_id,
-                    "sql_data_type": part.sql_data_type or "",
-                    "sort_order": view_meta.get("order", 999),
-                }
-                data["views"][view_name]["columns"].append(col_info)
-
-    # Sort columns
-    for view in data["views"].values():
-        view["columns"].sort(key=lambda x: x["sort_order"])
-
-    return data
-
-
-def generate_sql_schemas(parts_data, output_path, db_list):
-    """Generate SQL schemas for multiple database types."""
-    for target_db in db_list:
-        sql_schema = generate_sql_schema(parts_data, target_db=target_db)
-        version_str = package_version
-        filename = f"v{version_str}_as-designed_{target_db}.sql"
-        (output_path / filename).write_text(sql_schema, encoding="utf-8")
-        print(f"Generated SQL schema for {target_db} at {output_path / filename}")
+
+def _init_worker(prepared):
+    global _worker_schema
+    _worker_schema = prepared
+
+
+def _write_worker(job):
+    return _write_sql_file(_worker_schema, job)
+
+
+def _write_sql_file(prepared, job):
+    """Render one (target_db, path) job of generate_sql_schemas."""
+    target_db, path = job
+    lines = render_sql_schema(prepared, target_db)
+    with open(path, "w", encoding="utf-8") as f:
+        write_sql(lines, f)
+    return job
 
 
 def generate_sql_schema(data, target_db="mssql", include_timestamp=True):
@@ -178,7 +126,8 @@ def generate_sql_schema(data, target_db="mssql", include_timestamp=True):
 
     Args:
         data: Parsed parts table data
-        target_db: Target database flavor ('mssql', 'postgres', 'mysql' - future)
+        target_db: Target database flavor ('mssql', 'postgres', 'sqlite', or
+            any dialect registered in open_dateaubase.sql.dialects)
         include_timestamp: Whether to include generation timestamp (default: True)
 
     Returns:
@@ -187,186 +136,396 @@ def generate_sql_schema(data, target_db="mssql", include_timestamp=True):
     Raises:
         ValueError: If circular foreign key dependencies detected
     """
-    # Validate no circular FK dependencies
-    validate_no_circular_fks(data)
+    return "\n".join(iter_sql_schema(data, target_db, include_timestamp))
 
-    sql = ["-- Auto-generated SQL schema from dictionary.json"]
-    sql.append(f"-- Target database: {target_db.upper()}")
-    if include_timestamp:
-        sql.append(f"-- Generated: {datetime.now().isoformat()}")
-    sql.append("\n")
+
+def write_sql_schema(data, stream, target_db="mssql", include_timestamp=True):
+    """
+    Write the SQL DDL to a text stream without building it in memory.
+
+    Args:
+        data: Parsed parts table data
+        stream: Writable text stream (file, sys.stdout, ...)
+        target_db: Target database flavor
+        include_timestamp: Whether to include generation timestamp (default: True)
+
+    Raises:
+        ValueError: If circular foreign key dependencies detected
+    """
+    write_sql(iter_sql_schema(data, target_db, include_timestamp), stream)
+
+
+def execute_sql_schema(data, connection, target_db="mssql", batch_size=100):
+    """
+    Create the schema directly on a DB-API connection.
+
+    Args:
+        data: Parsed parts table data
+        connection: DB-API connection to an empty database
+        target_db: Target database flavor of the connection
+        batch_size: Number of statements per transaction
+
+    Returns:
+        Number of statements executed
+
+    Raises:
+        ValueError: If circular foreign key dependencies detected
+    """
+    return execute_sql(
+        iter_sql_schema(data, target_db, include_timestamp=False),
+        connection,
+        batch_size=batch_size,
+    )
+
+
+def iter_sql_schema(data, target_db="mssql", include_timestamp=True):
+    """
+    Generate the SQL DDL line by line (see generate_sql_schema).
+
+    The schema is validated before the first line is produced; the lines
+    themselves are generated lazily, one table at a time.
+
+    Args:
+        data: Parsed parts table data
+        target_db: Target database flavor
+        include_timestamp: Whether to include generation timestamp (default: True)
+
+    Returns:
+        Iterator of SQL lines, to be joined with newlines
+
+    Raises:
+        ValueError: If circular foreign key dependencies detected
+    """
+    return render_sql_schema(prepare_sql_schema(data), target_db, include_timestamp)
+
+
+def prepare_sql_schema(data):
+    """
+    Do the dialect-independent part of SQL generation once.
+
+    Builds and validates the foreign key graph and fixes the table orders,
+    so any number of dialects can then be rendered from the result (see
+    render_sql_schema) without repeating that work.
+
+    Args:
+        data: Parsed parts table data
+
+    Returns:
+        Dict with 'schema' (the parts data), 'table_order' (table IDs,
+        sorted), 'dependency_order' (table IDs, each after the tables it
+        references) and 'fk_graph' (table ID -> referenced table IDs)
+
+    Raises:
+        ValueError: If circular foreign key dependencies detected
+    """
+    fk_graph = ForeignKeyGraph.from_schema(data)
+    validate_no_circular_fks(data, fk_graph)
+    return {
+        "schema": data,
+        "table_order": sorted(data["tables"]),
+        "dependency_order": fk_graph.topological_order(),
+        "fk_graph": fk_graph.edges(),
+    }
+
+
+def render_sql_schema(prepared, target_db="mssql", include_timestamp=True):
+    """
+    Render a prepared schema (see prepare_sql_schema) for one dialect.
+
+    Args:
+        prepared: Result of prepare_sql_schema
+        target_db: Target database flavor
+        include_timestamp: Whether to include generation timestamp (default: True)
+
+    Returns:
+        Iterator of SQL lines, to be joined with newlines
+
+    Raises:
+        ValueError: If the dialect is unknown or cannot express the schema
+    """
+    data = prepared["schema"]
 
     # Get DB-specific config
     db_config = get_db_config(target_db)
+    validate_partitioned_tables_not_referenced(data, db_config)
 
-    # First pass: Create all tables without foreign keys
-    for table_id, table_info in sorted(data["tables"].items()):
-        sql.append(f"\n-- {table_info['description']}")
-        sql.append(f"CREATE TABLE {db_config['quote'](table_id)} (")
-
-        field_definitions = []
-        pk_fields = []
+    return _iter_sql_schema(prepared, target_db, db_config, include_timestamp)
 
-        for field in table_info["fields"]:
-            field_def = generate_field_definition(field, data, db_config)
-            field_definitions.append(field_def)
 
-            # Track primary key fields
-            if field["part_type"] in ["key", "compositeKeyFirst", "compositeKeySecond"]:
-                field_name = extract_field_name(field["part_id"])
-                pk_fields.append(f"{db_config['quote'](field_name)}")
+def _iter_sql_schema(prepared, target_db, db_config, include_timestamp):
+    """Yield the lines of a validated schema (see render_sql_schema)."""
+    data = prepared["schema"]
+    # Inline foreign keys can only reference tables that already exist
+    order = prepared["dependency_order" if db_config["inline_foreign_keys"] else "table_order"]
+    tables = [(table_id, data["tables"][table_id]) for table_id in order]
 
-        # Add primary key constraint
-        if pk_fields:
-            pk_name = "PK_" + table_id
-            pk_constraint = f"    CONSTRAINT {db_config['quote'](pk_name)} PRIMARY KEY ({', '.join(pk_fields)})"
-            field_definitions.append(pk_constraint)
+    yield "-- Auto-generated SQL schema from dictionary.json"
+    yield f"-- Target database: {target_db.upper()}"
+    if include_timestamp:
+        yield f"-- Generated: {datetime.now().isoformat()}"
+    yield "\n"
 
-        sql.append(",\n".join(field_definitions))
-        sql.append(");\n")
+    # First pass: Create all tables without foreign keys
+    for table_id, table_info in tables:
+        yield from generate_create_table(table_id, table_info, data, db_config)
 
     # Second pass: Add foreign key constraints
-    sql.append("\n-- Foreign Key Constraints\n")
-    for table_id, table_info in sorted(data["tables"].items()):
+    fk_tables = [] if db_config["inline_foreign_keys"] else tables
+    yield "\n-- Foreign Key Constraints\n"
+    for table_id, table_info in fk_tables:
         for field in table_info["fields"]:
             if field["fk_to"]:
                 fk_sql = generate_foreign_key_constraint(
                     table_id, field, data, db_config
                 )
                 if fk_sql:
-                    sql.append(fk_sql)
-
-    # Third pass: Create views
+                    yield fk_sql
+
+    # Third pass: Create indexes (FK columns and declared indexes)
+    header = "\n-- Indexes\n"
+    for table_id, table_info in tables:
+        for statement in generate_table_indexes(table_id, table_info, data, db_config):
+            if header:
+                yield header
+                header = None
+            yield statement
+
+    # Fourth pass: Create views
     if "views" in data and data["views"]:
-        sql.append("\n-- Views\n")
+        yield "\n-- Views\n"
         for view_id, view_info in sorted(data["views"].items()):
-            sql.append(f"\n-- {view_info['description']}")
-            sql.append(f"CREATE VIEW {db_config['quote'](view_id)} AS")
-            sql.append(f"{view_info['view_definition']};")
+            yield f"\n-- {view_info['description']}"
+            yield f"CREATE VIEW {db_config['quote'](view_id)} AS"
+            yield f"{view_info['view_definition']};"
+
+
+def generate_create_table(table_id, table_info, data, db_config):
+    """
+    Generate the CREATE TABLE statement of a table, with its storage DDL.
+
+    Foreign keys are only included for dialects that declare them inline.
+
+    Args:
+        table_id: Table ID
+        table_info: Table metadata with 'fields' and optional 'storage'
+        data: Full parsed data (for FK target resolution)
+        db_config: Database-specific configuration
+
+    Returns:
+        List of SQL lines
+    """
+    statements = []
+    storage = generate_table_storage(table_id, table_info, db_config)
+
+    statements.append(f"\n-- {table_info['description']}")
+    statements.extend(storage["before"])
+    statements.append(f"CREATE TABLE {db_config['quote'](table_id)} (")
+
+    field_definitions = []
+    pk_fields = []
+
+    for field in table_info["fields"]:
+        field_def = generate_field_definition(field, data, db_config)
+        field_definitions.append(field_def)
+
+        # Track primary key fields
+        if field["part_type"] in ["key", "compositeKeyFirst", "compositeKeySecond"]:
+            field_name = extract_field_name(field["part_id"])
+            pk_fields.append(f"{db_config['quote'](field_name)}")
+
+    # Add primary key constraint
+    if pk_fields:
+        for field_name in storage["primary_key_columns"]:
+            if db_config["quote"](field_name) not in pk_fields:
+                pk_fields.append(db_config["quote"](field_name))
+        pk_name = "PK_" + table_id
+        pk_constraint = f"    CONSTRAINT {db_config['quote'](pk_name)} PRIMARY KEY{storage['primary_key_options']} ({', '.join(pk_fields)})"
+        field_definitions.append(pk_constraint)
+
+    # Dialects without ALTER TABLE ... ADD CONSTRAINT declare FKs inline
+    if db_config["inline_foreign_keys"]:
+        for field in table_info["fields"]:
+            fk_clause = generate_foreign_key_clause(table_id, field, data, db_config)
+            if fk_clause:
+                field_definitions.append(f"    {fk_clause}")
 
-    return "\n".join(sql)
+    statements.append(",\n".join(field_definitions))
+    statements.append(f"){storage['table_options']};\n")
+    statements.extend(storage["after"])
+    return statements
 
 
 def get_db_config(target_db):
     """
     Get database-specific configuration.
 
+    Dialects are defined in open_dateaubase.sql.dialects; use
+    register_dialect() there to add a new target.
+
     Args:
         target_db: Database flavor string
 
     Returns:
         Dict with DB-specific settings
     """
-    configs = {
-        "mssql": {
-            "quote_char": "[",
-            "quote_char_end": "]",
-            "type_mappings": {
-                "nvarchar": "nvarchar",
-                "ntext": "nvarchar(max)",  # ntext deprecated in modern MSSQL
-                "int": "int",
-                "float": "float",
-                "real": "real",
-                "numeric": "numeric",
-                "bit": "bit",
-            },
-            "supports_check_constraints": True,
-            "supports_deferred_constraints": False,
-        },
-        # Future: postgres, mysql, sqlite configs
-    }
-
-    if target_db not in configs:
-        raise ValueError(
-            f"Unsupported database: {target_db}. Supported: {list(configs.keys())}"
-        )
-
-    config = configs[target_db]
-
-    # Add convenience method for quoting identifiers
-    if config["quote_char_end"]:
-        config["quote"] = lambda name: (
-            f"{config['quote_char']}{name}{config['quote_char_end']}"
-        )
-    else:
-        config["quote"] = lambda name: (
-            f"{config['quote_char']}{name}{config['quote_char_end']}"
-        )
+    return get_dialect(target_db)
 
-    return config
 
-
-def extract_field_name(part_id):
+def validate_no_circular_fks(data, fk_graph=None):
     """
-    Extract field name from Part_ID.
+    Check for circular foreign key dependencies between tables.
 
-    NEW FORMAT handling:
-    - ID fields (e.g., 'Equipment_ID', 'Project_ID'): Use as-is (these are actual SQL field names)
-    - Table-prefixed fields (e.g., 'site_City', 'purpose_Description'): Remove table prefix
-    - Non-prefixed fields: Use as-is
+    Cycles of any length are found (see ForeignKeyGraph.cycles);
+    self-referential foreign keys are allowed.
 
     Args:
-        part_id: Part_ID from dictionary
+        data: Parsed parts table data
+        fk_graph: ForeignKeyGraph of data, if already built
 
-    Returns:
-        Field name to use in SQL
+    Raises:
+        ValueError: If circular FK dependencies found
     """
-    # ID fields are used as-is in SQL
-    if part_id.endswith("_ID"):
-        return part_id
-
-    # Table-prefixed non-ID fields: remove prefix
-    # Format is lowercase_table_MixedCaseField (e.g., 'site_City', 'contact_City')
-    if "_" in part_id:
-        # Check if first part looks like a table name (lowercase)
-        parts = part_id.split("_", 1)
-        if len(parts) == 2 and parts[0].islower():
-            # This is likely a table-prefixed field, remove prefix
-            return parts[1]
+    if fk_graph is None:
+        fk_graph = ForeignKeyGraph.from_schema(data)
 
-    # Otherwise use as-is
-    return part_id
+    circular_deps = fk_graph.cycles()
+    if circular_deps:
+        error_msg = "Circular foreign key dependencies detected:\n"
+        for component in circular_deps:
+            if len(component) == 2:
+                error_msg += f"  - {component[0]} ↔ {component[1]}\n"
+            else:
+                error_msg += f"  - {' → '.join(fk_graph.cycle_path(component))}\n"
+        error_msg += "\nEach group of tables has FKs pointing to each other, which creates ambiguity in table creation order."
+        raise ValueError(error_msg)
 
 
-def validate_no_circular_fks(data):
+def validate_partitioned_tables_not_referenced(data, db_config):
     """
-    Check for circular foreign key dependencies between tables.
+    Check that no foreign key references a table partitioned by the dialect.
+
+    Partitioning adds the partition column to the table's primary key, so a
+    single-column foreign key could no longer reference it.
 
     Args:
         data: Parsed parts table data
+        db_config: Database-specific configuration
 
     Raises:
-        ValueError: If circular FK dependencies found
+        ValueError: If a partitioned table is referenced by a foreign key
     """
-    # Build adjacency list of FK relationships
-    fk_graph = {table_id: set() for table_id in data["tables"]}
+    if not db_config["partitioning"]:
+        return
+
+    partitioned = {
+        table_id
+        for table_id, table_info in data["tables"].items()
+        if (table_info.get("storage") or {}).get("partition_column")
+    }
+    if not partitioned:
+        return
 
     for table_id, table_info in data["tables"].items():
         for field in table_info["fields"]:
-            if field["fk_to"] and "_" in field["fk_to"]:
-                target_table = field["fk_to"].split("_", 1)[0]
-                if target_table in fk_graph:
-                    fk_graph[table_id].add(target_table)
-
-    # Check for bidirectional relationships (A->B and B->A)
-    circular_deps = []
-    for table_a, targets in fk_graph.items():
-        for table_b in targets:
-            if table_b == table_a:
-                # self-referential FKs are allowed
+            target = resolve_foreign_key_target(field, data, db_config)
+            if not target:
                 continue
-            if table_a in fk_graph.get(table_b, set()):
-                # Found circular dependency
-                pair = tuple(sorted([table_a, table_b]))
-                if pair not in circular_deps:
-                    circular_deps.append(pair)
+            # Dialects that derive the referenced table from the field name
+            # (MSSQL) do not return table IDs; check the table holding the key
+            target_table = key_table(data, target[1]) or target[0]
+            if target_table in partitioned and target_table != table_id:
+                raise ValueError(
+                    f"Table '{target_table}' is partitioned and cannot be referenced "
+                    f"by the foreign key '{field['part_id']}' of table '{table_id}'"
+                )
 
-    if circular_deps:
-        error_msg = "Circular foreign key dependencies detected:\n"
-        for table_a, table_b in circular_deps:
-            error_msg += f"  - {table_a} ↔ {table_b}\n"
-        error_msg += "\nEach pair of tables has FKs pointing to each other, which creates ambiguity in table creation order."
-        raise ValueError(error_msg)
+
+def generate_table_storage(table_id, table_info, db_config):
+    """
+    Generate the dialect-specific DDL for a table's storage hints.
+
+    Range partitioning becomes a partition function and scheme on MSSQL and
+    a partitioned table with one partition per boundary interval on
+    PostgreSQL. The partition column is added to the primary key, as both
+    databases require for unique constraints on partitioned tables. The
+    columnstore hint becomes a clustered columnstore index on MSSQL (with a
+    nonclustered primary key). Hints the dialect does not support are ignored.
+
+    Args:
+        table_id: Table ID
+        table_info: Table metadata with 'fields' and optional 'storage'
+        db_config: Database-specific configuration
+
+    Returns:
+        Dict with 'before' and 'after' (statements around CREATE TABLE),
+        'table_options' (appended to CREATE TABLE), 'primary_key_options'
+        and 'primary_key_columns' (field names to add to the primary key)
+    """
+    storage_ddl = {
+        "before": [],
+        "after": [],
+        "table_options": "",
+        "primary_key_options": "",
+        "primary_key_columns": [],
+    }
+    storage = table_info.get("storage")
+    if not storage:
+        return storage_ddl
+
+    quote = db_config["quote"]
+    partitioning = db_config["partitioning"] if storage["partition_column"] else None
+    on_scheme = ""
+
+    if partitioning:
+        field = next(
+            f for f in table_info["fields"] if f["part_id"] == storage["partition_column"]
+        )
+        column = quote(extract_field_name(field["part_id"]))
+        boundaries = [
+            format_literal(boundary, field["sql_data_type"], db_config)
+            for boundary in storage["partition_boundaries"]
+        ]
+        storage_ddl["primary_key_columns"].append(extract_field_name(field["part_id"]))
+
+        if partitioning == "scheme":
+            function = quote(f"PF_{table_id}")
+            scheme = quote(f"PS_{table_id}")
+            sql_type = map_sql_type(field["sql_data_type"] or "nvarchar(255)", db_config)
+            storage_ddl["before"].append(
+                f"CREATE PARTITION FUNCTION {function} ({sql_type})\n"
+                f"    AS RANGE RIGHT FOR VALUES ({', '.join(boundaries)});"
+            )
+            storage_ddl["before"].append(
+                f"CREATE PARTITION SCHEME {scheme}\n"
+                f"    AS PARTITION {function} ALL TO ({quote('PRIMARY')});"
+            )
+            on_scheme = f" ON {scheme} ({column})"
+            storage_ddl["table_options"] = on_scheme
+
+        elif partitioning == "declarative":
+            storage_ddl["table_options"] = f" PARTITION BY RANGE ({column})"
+            bounds = ["MINVALUE", *boundaries, "MAXVALUE"]
+            for number, (lower, upper) in enumerate(zip(bounds, bounds[1:])):
+                storage_ddl["after"].append(
+                    f"CREATE TABLE {quote(f'{table_id}_p{number}')} "
+                    f"PARTITION OF {quote(table_id)} "
+                    f"FOR VALUES FROM ({lower}) TO ({upper});"
+                )
+
+        else:
+            raise ValueError(f"Unknown partitioning style: {partitioning}")
+
+    if storage["columnstore"] and db_config["supports_columnstore"]:
+        storage_ddl["primary_key_options"] = " NONCLUSTERED"
+        storage_ddl["after"].append(
+            f"CREATE CLUSTERED COLUMNSTORE INDEX {quote(f'CCI_{table_id}')} "
+            f"ON {quote(table_id)}{on_scheme};"
+        )
+
+    if storage_ddl["after"]:
+        storage_ddl["after"].append("")
+
+    return storage_ddl
 
 
 def generate_field_definition(field, data, db_config):
@@ -387,21 +546,9 @@ def generate_field_definition(field, data, db_config):
 
     parts = [f"    {quote(field_name)}"]
 
-    # Data type with mapping
+    # Data type with mapping for target DB
     sql_type = field["sql_data_type"] if field["sql_data_type"] else "nvarchar(255)"
-    # Apply type mapping for target DB
-    base_type = sql_type.split("(")[
-        0
-    ]  # Extract base type (e.g., 'nvarchar' from 'nvarchar(255)')
-    if base_type in db_config["type_mappings"]:
-        # Preserve parameters if they exist
-        if "(" in sql_type:
-            params = sql_type[sql_type.index("(") :]
-            sql_type = db_config["type_mappings"][base_type].split("(")[0] + params
-        else:
-            sql_type = db_config["type_mappings"][base_type]
-
-    parts.append(sql_type)
+    parts.append(map_sql_type(sql_type, db_config))
 
     # NULL constraint
     if field["is_required"]:
@@ -411,21 +558,10 @@ def generate_field_definition(field, data, db_config):
 
     # Default value
     if field["default_value"]:
-        default_val = field["default_value"]
-        # Handle boolean defaults
-        if default_val in ["True", "False"]:
-            default_val = "1" if default_val == "True" else "0"
-        # Handle numeric vs string defaults
-        if field["sql_data_type"] and field["sql_data_type"].split("(")[0] in [
-            "int",
-            "float",
-            "real",
-            "numeric",
-            "bit",
-        ]:
-            parts.append(f"DEFAULT {default_val}")
-        else:
-            parts.append(f"DEFAULT '{default_val}'")
+        default_val = format_default(
+            field["default_value"], field["sql_data_type"], db_config
+        )
+        parts.append(f"DEFAULT {default_val}")
 
     # Note: Value set CHECK constraints removed per requirement #3
     # Future: could add back conditionally based on target_db config
@@ -433,13 +569,41 @@ def generate_field_definition(field, data, db_config):
     return " ".join(parts)
 
 
-def generate_foreign_key_constraint(table_id, field, data, db_config):
+def resolve_foreign_key_target(field, data, db_config):
     """
-    Generate ALTER TABLE statement for foreign key.
+    Resolve the (table, field) referenced by a foreign key field.
+
+    NEW FORMAT: fk_to is Part_ID of target field (e.g., 'TestTable_ID').
+    The target table is the table where that field has role 'key' (preferring
+    the table named after the field when several tables share the key).
+    Dialects flagged with 'derive_fk_table_from_field_name' instead derive the
+    table name from the FK field name, as the published MSSQL scripts do.
+
+    Args:
+        field: Field metadata with FK reference
+        data: Full parsed data (for id_field_locations lookup)
+        db_config: Database-specific configuration
+
+    Returns:
+        (target_table, target_field) tuple or None
+    """
+    fk_target = field["fk_to"]
+    if not fk_target or not fk_target.endswith("_ID"):
+        # Non-ID FK (shouldn't happen in new format)
+        return None
+
+    if not db_config.get("derive_fk_table_from_field_name"):
+        target_table = key_table(data, fk_target)
+        if target_table:
+            return target_table, fk_target
+
+    # Extract table name from FK field name (e.g., 'Equipment_model_ID' -> 'Equipment_model')
+    return fk_target[:-3], fk_target
+
 
-    NEW FORMAT: fk_to is Part_ID of target field (e.g., 'TestTable_ID')
-    We need to find which table has this field as a primary key by looking up
-    the table Part_ID from the data model.
+def generate_foreign_key_clause(table_id, field, data, db_config):
+    """
+    Generate the CONSTRAINT ... FOREIGN KEY clause for a field.
 
     Args:
         table_id: Source table ID
@@ -448,26 +612,43 @@ def generate_foreign_key_constraint(table_id, field, data, db_config):
         db_config: Database-specific configuration
 
     Returns:
-        SQL ALTER TABLE statement or None
+        Constraint clause string or None
     """
-    if not field["fk_to"]:
+    target = resolve_foreign_key_target(field, data, db_config)
+    if target is None:
         return None
 
-    # fk_to is Part_ID of target (e.g., 'TestTable_ID')
-    fk_target = field["fk_to"]
+    target_table, target_field = target
     source_field = extract_field_name(field["part_id"])
+    quote = db_config["quote"]
+    constraint_name = f"FK_{table_id}_{source_field}"
 
-    # For ID fields like 'TestTable_ID', extract table name from FK field
-    # This preserves the capitalization pattern from the data model
-    if fk_target.endswith("_ID"):
-        target_field = fk_target  # e.g., 'TestTable_ID'
-        # Extract table name from FK field name (e.g., 'Equipment_model_ID' -> 'Equipment_model')
-        # This matches the capitalization used in the original data model design
-        target_table = fk_target[:-3]  # Remove '_ID'
-    else:
-        # Non-ID FK (shouldn't happen in new format, but fallback)
+    return (
+        f"CONSTRAINT {quote(constraint_name)} "
+        f"FOREIGN KEY ({quote(source_field)}) "
+        f"REFERENCES {quote(target_table)} ({quote(target_field)})"
+    )
+
+
+def generate_foreign_key_constraint(table_id, field, data, db_config):
+    """
+    Generate ALTER TABLE statement for foreign key.
+
+    Args:
+        table_id: Source table ID
+        field: Field metadata with FK reference
+        data: Full parsed data (for id_field_locations lookup)
+        db_config: Database-specific configuration
+
+    Returns:
+        SQL ALTER TABLE statement or None
+    """
+    target = resolve_foreign_key_target(field, data, db_config)
+    if target is None:
         return None
 
+    target_table, target_field = target
+    source_field = extract_field_name(field["part_id"])
     quote = db_config["quote"]
     constraint_name = f"FK_{table_id}_{source_field}"
 
@@ -480,21 +661,144 @@ def generate_foreign_key_constraint(table_id, field, data, db_config):
     return sql
 
 
+def generate_index_statement(
+    table_id, index_name, columns, db_config, include_columns=(), is_unique=False
+):
+    """
+    Generate a CREATE INDEX statement.
+
+    Args:
+        table_id: Indexed table ID
+        index_name: Index name
+        columns: Part_IDs of the key columns, in order
+        db_config: Database-specific configuration
+        include_columns: Part_IDs of covering (non-key) columns
+        is_unique: Whether to create a UNIQUE index
+
+    Returns:
+        SQL CREATE INDEX statement
+    """
+    quote = db_config["quote"]
+    key_columns = [extract_field_name(c) for c in columns]
+    included = [extract_field_name(c) for c in include_columns]
+
+    if included and not db_config["supports_include_columns"]:
+        # Without INCLUDE, covering columns become trailing key columns. That
+        # would weaken a UNIQUE constraint, so unique indexes just drop them.
+        if not is_unique:
+            key_columns.extend(included)
+        included = []
+
+    unique = "UNIQUE " if is_unique else ""
+    sql = (
+        f"CREATE {unique}INDEX {quote(index_name)} ON {quote(table_id)} "
+        f"({', '.join(quote(c) for c in key_columns)})"
+    )
+    if included:
+        sql += f" INCLUDE ({', '.join(quote(c) for c in included)})"
+    return sql + ";"
+
+
+def table_index_specs(table_id, table_info, data, db_config):
+    """
+    List the indexes of a table.
+
+    Every foreign key column gets a single-column index unless it already
+    leads the primary key or a declared index (either of which serves the
+    join). Declared indexes (Part_type 'index') follow in dictionary order.
+
+    Args:
+        table_id: Table ID
+        table_info: Table metadata with 'fields' and optional 'indexes'
+        data: Full parsed data (for FK target resolution)
+        db_config: Database-specific configuration
+
+    Returns:
+        List of dicts with 'name', 'columns', 'include_columns' and
+        'is_unique' (columns are Part_IDs)
+    """
+    declared = table_info.get("indexes", [])
+
+    leading_columns = {index["columns"][0] for index in declared}
+    pk_fields = [
+        field["part_id"]
+        for field in table_info["fields"]
+        if field["part_type"] in ["key", "compositeKeyFirst", "compositeKeySecond"]
+    ]
+    if pk_fields:
+        leading_columns.add(pk_fields[0])
+
+    specs = []
+    for field in table_info["fields"]:
+        if field["part_id"] in leading_columns:
+            continue
+        if resolve_foreign_key_target(field, data, db_config) is None:
+            continue
+        specs.append(
+            {
+                "name": f"IX_{table_id}_{extract_field_name(field['part_id'])}",
+                "columns": [field["part_id"]],
+                "include_columns": [],
+                "is_unique": False,
+            }
+        )
+
+    for index in declared:
+        specs.append(
+            {
+                "name": index["part_id"],
+                "columns": list(index["columns"]),
+                "include_columns": list(index["include_columns"]),
+                "is_unique": index["is_unique"],
+            }
+        )
+
+    return specs
+
+
+def generate_table_indexes(table_id, table_info, data, db_config):
+    """
+    Generate the CREATE INDEX statements of a table (see table_index_specs).
+
+    Args:
+        table_id: Table ID
+        table_info: Table metadata with 'fields' and optional 'indexes'
+        data: Full parsed data (for FK target resolution)
+        db_config: Database-specific configuration
+
+    Returns:
+        List of SQL CREATE INDEX statements
+    """
+    return [
+        generate_index_statement(
+            table_id,
+            spec["name"],
+            spec["columns"],
+            db_config,
+            include_columns=spec["include_columns"],
+            is_unique=spec["is_unique"],
+        )
+        for spec in table_index_specs(table_id, table_info, data, db_config)
+    ]
+
+
 def main():
     """Main entry point for script."""
     if len(sys.argv) != 4:
         print("Usage: python generate_sql.py <json_path> <output_path> <target_dbs>")
         print(
-            "Example: python generate_sql.py dictionary.json sql_generation_scripts mssql"
+            "Example: python generate_sql.py dictionary.json sql_generation_scripts mssql,postgres,sqlite"
         )
+        print("Example: python generate_sql.py dictionary.json - postgres | psql -d site")
         sys.exit(1)
 
     json_path = Path(sys.argv[1])
-    output_path = Path(sys.argv[2])
+    output_path = None if sys.argv[2] == "-" else Path(sys.argv[2])
     db_list = sys.argv[3].split(",")  # Comma-separated list of databases
 
     # Ensure output directory exists
-    output_path.mkdir(parents=True, exist_ok=True)
+    if output_path is not None:
+        output_path.mkdir(parents=True, exist_ok=True)
 
     # Parse JSON
     parts_data = parse_parts_json(json_path)
@@ -25,8 +25,8 @@ from generate_dictionary_reference import (
     generate_tables_markdown,
     generate_value_sets_markdown,
 )
-from generate_erd import parse_erd_json, generate_erd_files
-from generate_sql import parse_parts_json as parse_sql_json, generate_sql_schemas
+from generate_erd import generate_erd_files
+from generate_sql import generate_sql_schemas
 
 
 def copy_generated_assets(assets_dir):
@@ -93,7 +93,7 @@ def main():
     print(f"  Assets: {assets_dir}")
     print(f"  Target databases: {target_dbs}")
 
-    # Parse JSON once (each script can parse independently)
+    # Parse and compile JSON once; every generator consumes the same schema
     parts_data = parse_parts_json(json_path)
 
     # Generate dictionary reference
@@ -109,13 +109,11 @@ def main():
 
     # Generate ERD
     print("\n=== Generating ERD ===")
-    erd_parts_data = parse_erd_json(json_path)
-    generate_erd_files(erd_parts_data, assets_dir, docs_dir)
+    generate_erd_files(parts_data, assets_dir, docs_dir)
 
     # Generate SQL schemas
     print("\n=== Generating SQL Schemas ===")
-    sql_parts_data = parse_sql_json(json_path)
-    generate_sql_schemas(sql_parts_data, sql_dir, target_dbs)
+    generate_sql_schemas(parts_data, sql_dir, target_dbs)
 
     # Copy assets
     print("\n=== Copying Assets ===")
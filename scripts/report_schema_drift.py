@@ -0,0 +1,65 @@
+#!/usr/bin/env python3
+"""
+Report drift between an as-built DDL dump and the dictionary.
+
+Parses the dump (see open_dateaubase.sql.ddl_parser) and lists the tables,
+columns, types, nullability, defaults, primary keys and foreign keys that
+differ from dictionary.json, as Markdown.
+
+Usage:
+    python report_schema_drift.py <ddl_path> <json_path> [output_path]
+"""
+
+import sys
+from pathlib import Path
+
+# Add src to path to import models
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root / "src"))
+
+from open_dateaubase.data_model.schema import load_schema
+from open_dateaubase.sql.ddl_parser import (
+    format_drift_report,
+    parse_ddl_file,
+    schema_drift,
+)
+
+
+def generate_drift_report(ddl_path, json_path):
+    """
+    Generate the drift report of a DDL dump against a dictionary.
+
+    Args:
+        ddl_path: Path to the as-built .sql dump
+        json_path: Path to dictionary.json
+
+    Returns:
+        Markdown report as a string
+    """
+    drift = schema_drift(parse_ddl_file(ddl_path), load_schema(json_path))
+    return format_drift_report(drift, title=f"Schema drift: {Path(ddl_path).name}")
+
+
+def main():
+    """Main entry point for script."""
+    if len(sys.argv) not in (3, 4):
+        print("Usage: python report_schema_drift.py <ddl_path> <json_path> [output_path]")
+        print(
+            "Example: python report_schema_drift.py "
+            "sql_generation_scripts/2025-09-08_as-built_mssql.sql "
+            "src/open_dateaubase/dictionary.json drift.md"
+        )
+        sys.exit(1)
+
+    report = generate_drift_report(Path(sys.argv[1]), Path(sys.argv[2]))
+    if len(sys.argv) == 4:
+        output_path = Path(sys.argv[3])
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        output_path.write_text(report, encoding="utf-8")
+        print(f"Generated drift report at {output_path}")
+    else:
+        print(report)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,132 @@
+"""
+Content-hash keyed snapshot cache for validated dictionaries.
+
+Validating dictionary.json with Pydantic dominates start-up time for processes
+that only need the dictionary for lookups. ``load_dictionary`` hashes the raw
+JSON bytes and, on a hit, restores the already-validated ``Dictionary`` from a
+binary (pickle) snapshot without re-running validation. On a miss the JSON is
+validated as usual and a snapshot is written for the next process.
+
+The cache key also covers the Pydantic version and the source of the models
+module, so a change to either invalidates existing snapshots.
+
+Snapshots are named after the file and a hash of its location, so several
+dictionaries (e.g. one per site) can share the cache directory; writing a
+new snapshot only removes older snapshots of the same file.
+
+Snapshots are written to ``$OPEN_DATEAUBASE_CACHE_DIR`` if set, otherwise to
+``$XDG_CACHE_HOME/open_dateaubase`` (``~/.cache/open_dateaubase``). Snapshots
+are pickles: only point the cache at a directory you trust.
+
+Usage:
+    from open_dateaubase.data_model.cache import load_dictionary
+
+    dictionary = load_dictionary("src/open_dateaubase/dictionary.json")
+"""
+
+import hashlib
+import json
+import os
+import pickle
+import tempfile
+from functools import lru_cache
+from pathlib import Path
+
+import pydantic
+
+from . import models
+from .models import Dictionary
+
+CACHE_DIR_ENV = "OPEN_DATEAUBASE_CACHE_DIR"
+
+
+def default_cache_dir() -> Path:
+    """Return the directory used for dictionary snapshots."""
+    if os.environ.get(CACHE_DIR_ENV):
+        return Path(os.environ[CACHE_DIR_ENV])
+    base = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(base) / "open_dateaubase"
+
+
+@lru_cache(maxsize=1)
+def _model_fingerprint() -> bytes:
+    """Hash of everything besides the JSON that determines the validated model."""
+    digest = hashlib.sha256(pydantic.VERSION.encode())
+    digest.update(Path(models.__file__).read_bytes())
+    return digest.digest()
+
+
+def snapshot_key(raw: bytes) -> str:
+    """Return the cache key for raw dictionary JSON bytes."""
+    digest = hashlib.sha256(_model_fingerprint())
+    digest.update(raw)
+    return digest.hexdigest()
+
+
+def load_dictionary(
+    path, cache_dir: str | Path | None = None, use_cache: bool = True
+) -> Dictionary:
+    """
+    Load a validated Dictionary, reusing a cached snapshot when possible.
+
+    Args:
+        path: Path to dictionary JSON (a Path, str or importlib Traversable)
+        cache_dir: Snapshot directory (defaults to default_cache_dir())
+        use_cache: If False, always parse and validate the JSON
+
+    Returns:
+        Validated Dictionary instance
+
+    Raises:
+        FileNotFoundError: If the JSON file does not exist
+        json.JSONDecodeError: If the JSON is malformed
+        pydantic.ValidationError: If the dictionary is invalid
+    """
+    path = Path(path) if isinstance(path, str) else path
+    raw = path.read_bytes()
+
+    if not use_cache:
+        return Dictionary.model_validate(json.loads(raw))
+
+    cache_dir = Path(cache_dir) if cache_dir is not None else default_cache_dir()
+    prefix = f"{Path(path.name).stem}-{_location_key(path)}"
+    snapshot = cache_dir / f"{prefix}-{snapshot_key(raw)}.pickle"
+
+    try:
+        with open(snapshot, "rb") as f:
+            dictionary = pickle.load(f)
+        if isinstance(dictionary, Dictionary):
+            return dictionary
+    except Exception:
+        # A missing, truncated or unreadable snapshot is just a cache miss
+        pass
+
+    dictionary = Dictionary.model_validate(json.loads(raw))
+    _write_snapshot(snapshot, prefix, dictionary)
+    return dictionary
+
+
+def _location_key(path) -> str:
+    """Return a short hash of where a dictionary file lives."""
+    location = str(path.resolve()) if isinstance(path, Path) else str(path)
+    return hashlib.sha256(location.encode()).hexdigest()[:16]
+
+
+def _write_snapshot(snapshot: Path, prefix: str, dictionary: Dictionary) -> None:
+    """Atomically write a snapshot and drop older snapshots of the same file."""
+    try:
+        snapshot.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_name = tempfile.mkstemp(dir=snapshot.parent, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                pickle.dump(dictionary, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_name, snapshot)
+        finally:
+            Path(tmp_name).unlink(missing_ok=True)
+
+        for old in snapshot.parent.glob(f"{prefix}-*.pickle"):
+            if old != snapshot:
+                old.unlink(missing_ok=True)
+    except OSError:
+        # The cache is best effort: a read-only or full disk must not break loading
+        pass
@@ -0,0 +1,268 @@
+"""
+Table-level foreign key graph of a compiled schema.
+
+``ForeignKeyGraph`` is built once from a compiled schema: every field with a
+foreign key (``fk_to``) adds an edge from its table to the table that owns
+the referenced key (see ``key_table``). The graph answers the ordering
+questions of the SQL generators and loaders:
+
+- ``cycles()`` finds every circular dependency, of any length, with Tarjan's
+  strongly connected components algorithm. Self-references (parent keys)
+  are not cycles: a table can always be created before rows point into it.
+- ``topological_order()`` lists tables so that every table comes after the
+  tables it references, which is the order to create and load them in.
+- ``waves()`` groups that order into waves of tables that only reference
+  tables of earlier waves, so the tables of one wave can be loaded in
+  parallel.
+
+Ties are broken by table name, so all orders are deterministic.
+
+Usage:
+    from open_dateaubase.data_model.graph import ForeignKeyGraph
+    from open_dateaubase.data_model.schema import load_schema
+
+    graph = ForeignKeyGraph.from_schema(load_schema("src/open_dateaubase/dictionary.json"))
+    graph.cycles()               # [] when the schema can be created
+    graph.topological_order()    # ['comments', 'contact', ..., 'value']
+    graph.waves()                # [['comments', 'contact', ...], ['equipment', ...], ...]
+"""
+
+import heapq
+from typing import Any, Dict, Iterable, List, Mapping, Set
+
+from .schema import key_table
+
+
+class ForeignKeyGraph:
+    """Directed graph of table -> referenced tables."""
+
+    def __init__(self, edges: Mapping[str, Iterable[str]]):
+        """
+        Build a graph from an adjacency mapping.
+
+        Args:
+            edges: Table ID -> IDs of the tables it references. Referenced
+                tables missing from the keys are added as tables without
+                references.
+        """
+        self._references: Dict[str, Set[str]] = {t: set(targets) for t, targets in edges.items()}
+        for targets in list(self._references.values()):
+            for target in targets:
+                self._references.setdefault(target, set())
+        self._referenced_by: Dict[str, Set[str]] = {t: set() for t in self._references}
+        for table_id, targets in self._references.items():
+            for target in targets:
+                self._referenced_by[target].add(table_id)
+
+    @classmethod
+    def from_schema(cls, schema: Mapping[str, Any]) -> "ForeignKeyGraph":
+        """
+        Build the foreign key graph of a compiled schema.
+
+        Foreign keys whose key is not the primary key of any table are left
+        out, as the SQL generators do not declare them either.
+
+        Args:
+            schema: Compiled schema (see open_dateaubase.data_model.schema)
+
+        Returns:
+            ForeignKeyGraph over all tables of the schema
+        """
+        edges: Dict[str, Set[str]] = {}
+        for table_id, table_info in schema["tables"].items():
+            targets = edges.setdefault(table_id, set())
+            for field in table_info["fields"]:
+                if not field["fk_to"]:
+                    continue
+                target = key_table(schema, field["fk_to"])
+                if target is not None:
+                    targets.add(target)
+        return cls(edges)
+
+    # ========================================================================
+    # Lookups
+    # ========================================================================
+
+    @property
+    def tables(self) -> List[str]:
+        """All table IDs, sorted."""
+        return sorted(self._references)
+
+    def references(self, table_id: str) -> Set[str]:
+        """Tables referenced by a table's foreign keys (including itself)."""
+        return set(self._references[table_id])
+
+    def referenced_by(self, table_id: str) -> Set[str]:
+        """Tables with a foreign key to a table (including itself)."""
+        return set(self._referenced_by[table_id])
+
+    def edges(self) -> Dict[str, List[str]]:
+        """Table ID -> sorted referenced table IDs (a plain, picklable copy)."""
+        return {t: sorted(targets) for t, targets in sorted(self._references.items())}
+
+    # ========================================================================
+    # Cycles
+    # ========================================================================
+
+    def strongly_connected_components(self) -> List[List[str]]:
+        """
+        Find the strongly connected components (Tarjan's algorithm).
+
+        The traversal is iterative, so deep reference chains cannot hit the
+        recursion limit.
+
+        Returns:
+            Components as sorted lists of table IDs. Components come in
+            reverse topological order: a component only references
+            components listed before it.
+        """
+        index: Dict[str, int] = {}
+        lowlink: Dict[str, int] = {}
+        on_stack: Set[str] = set()
+        stack: List[str] = []
+        components: List[List[str]] = []
+
+        for root in self.tables:
+            if root in index:
+                continue
+            # (table, iterator over its remaining references)
+            work = [(root, iter(sorted(self._references[root])))]
+            index[root] = lowlink[root] = len(index)
+            stack.append(root)
+            on_stack.add(root)
+
+            while work:
+                table_id, targets = work[-1]
+                target = next(targets, None)
+                if target is not None:
+                    if target not in index:
+                        index[target] = lowlink[target] = len(index)
+                        stack.append(target)
+                        on_stack.add(target)
+                        work.append((target, iter(sorted(self._references[target]))))
+                    elif target in on_stack:
+                        lowlink[table_id] = min(lowlink[table_id], index[target])
+                    continue
+
+                work.pop()
+                if work:
+                    parent = work[-1][0]
+                    lowlink[parent] = min(lowlink[parent], lowlink[table_id])
+                if lowlink[table_id] == index[table_id]:
+                    component = []
+                    while True:
+                        member = stack.pop()
+                        on_stack.discard(member)
+                        component.append(member)
+                        if member == table_id:
+                            break
+                    components.append(sorted(component))
+
+        return components
+
+    def cycles(self) -> List[List[str]]:
+        """
+        Find the groups of tables that reference each other in a cycle.
+
+        Returns:
+            Sorted list of components with more than one table (each a sorted
+            list of table IDs); empty if the graph has no cycles
+        """
+        return sorted(c for c in self.strongly_connected_components() if len(c) > 1)
+
+    def cycle_path(self, component: Iterable[str]) -> List[str]:
+        """
+        Return one cycle through a component, for error messages.
+
+        Args:
+            component: Tables of a strongly connected component
+
+        Returns:
+            Table IDs along the cycle, starting and ending with the same table
+        """
+        members = set(component)
+        start = min(members)
+        # Breadth-first search back to start within the component
+        previous: Dict[str, str] = {}
+        frontier = [start]
+        while frontier:
+            next_frontier = []
+            for table_id in frontier:
+                for target in sorted(self._references[table_id] & members):
+                    if target == start and table_id != start:
+                        chain = []
+                        while table_id != start:
+                            chain.append(table_id)
+                            table_id = previous[table_id]
+                        return [start, *reversed(chain), start]
+                    if target not in previous and target != start:
+                        previous[target] = table_id
+                        next_frontier.append(target)
+            frontier = next_frontier
+        return [start, start]
+
+    # ========================================================================
+    # Orders
+    # ========================================================================
+
+    def waves(self) -> List[List[str]]:
+        """
+        Group the tables into dependency waves.
+
+        Every table of a wave only references tables of earlier waves (or
+        itself), so the tables of a wave can be created or loaded in
+        parallel once the previous waves are done.
+
+        Returns:
+            Waves as sorted lists of table IDs
+
+        Raises:
+            ValueError: If the graph has cycles
+        """
+        self._check_acyclic()
+        pending = {t: len(targets - {t}) for t, targets in self._references.items()}
+        wave = sorted(t for t, count in pending.items() if count == 0)
+        waves = []
+        while wave:
+            waves.append(wave)
+            next_wave = []
+            for table_id in wave:
+                for child in self._referenced_by[table_id] - {table_id}:
+                    pending[child] -= 1
+                    if pending[child] == 0:
+                        next_wave.append(child)
+            wave = sorted(next_wave)
+        return waves
+
+    def topological_order(self) -> List[str]:
+        """
+        Order the tables so each comes after the tables it references.
+
+        Among the tables that are ready, the alphabetically first one comes
+        next, so unrelated tables keep their alphabetical order.
+
+        Returns:
+            List of all table IDs
+
+        Raises:
+            ValueError: If the graph has cycles
+        """
+        self._check_acyclic()
+        pending = {t: len(targets - {t}) for t, targets in self._references.items()}
+        ready = [t for t, count in pending.items() if count == 0]
+        heapq.heapify(ready)
+        order = []
+        while ready:
+            table_id = heapq.heappop(ready)
+            order.append(table_id)
+            for child in self._referenced_by[table_id] - {table_id}:
+                pending[child] -= 1
+                if pending[child] == 0:
+                    heapq.heappush(ready, child)
+        return order
+
+    def _check_acyclic(self) -> None:
+        cycles = self.cycles()
+        if cycles:
+            paths = "; ".join(" -> ".join(self.cycle_path(c)) for c in cycles)
+            raise ValueError(f"Foreign keys form cycles: {paths}")
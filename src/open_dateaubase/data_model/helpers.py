@@ -8,10 +8,16 @@ Usage:
     mgr.create_value_set("Status_set", "Valid status values")
     mgr.add_value_set_member("Status_set", "active", "Active status", order=1)
     mgr.save()
+
+    # Apply many operations atomically, with one validation and one save
+    with mgr.batch():
+        mgr.create_table("site", "Site", "Sampling sites")
+        mgr.add_field_to_table("site", "Site_ID", "Site ID", "PK", role="key")
 """
 
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Optional, Literal
+from typing import Iterator, Optional, Literal
 import json
 from .models import (
     Dictionary,
@@ -21,36 +27,79 @@ from .models import (
     CompositeKeyFirstPart,
     CompositeKeySecondPart,
     ParentKeyPart,
+    IndexPart,
     ValueSetPart,
     ValueSetMemberPart,
     TablePresence,
     Part,
+    part_reference_errors,
 )
+from .index import DictionaryIndex
+from .cache import load_dictionary
 
 
 class DictionaryManager:
     """Manages dictionary operations with validation."""
 
-    def __init__(self, dictionary: Dictionary, path: Path):
+    def __init__(self, dictionary: Dictionary, path: Path, incremental: bool = True):
+        """
+        Args:
+            dictionary: A validated Dictionary
+            path: Default path used by save()
+            incremental: If True, mutations only validate the parts and
+                cross-references they touch and the full dictionary check is
+                deferred to commit() (or save()). If False, every mutation
+                re-validates the entire dictionary.
+        """
         self.dictionary = dictionary
         self.path = path
+        self.incremental = incremental
+        self._uncommitted = False
+        # Undo log of the active batch (None outside of batch())
+        self._batch: Optional[dict] = None
+
+    @property
+    def dictionary(self) -> Dictionary:
+        """The managed dictionary."""
+        return self._dictionary
+
+    @dictionary.setter
+    def dictionary(self, dictionary: Dictionary) -> None:
+        # Replacing the dictionary invalidates every index entry
+        self._dictionary = dictionary
+        self.index = DictionaryIndex(dictionary)
 
     @classmethod
-    def load(cls, path: str | Path | None = None) -> "DictionaryManager":
-        """Load dictionary from JSON file with validation."""
+    def load(
+        cls,
+        path: str | Path | None = None,
+        incremental: bool = True,
+        use_cache: bool = True,
+    ) -> "DictionaryManager":
+        """Load dictionary from JSON file with validation.
+
+        Unchanged files are restored from a validated snapshot (see
+        open_dateaubase.data_model.cache) unless use_cache is False.
+        """
         if path is None:
             # Default path when no path specified
             from importlib.resources import files
             path = files('open_dateaubase').joinpath('dictionary.json')
         
         path = Path(path) if isinstance(path, str) else path
-        with open(path, "r", encoding="utf-8") as f:
-            raw_data = json.load(f)
-        dictionary = Dictionary.model_validate(raw_data)
-        return cls(dictionary, path)
+        dictionary = load_dictionary(path, use_cache=use_cache)
+        return cls(dictionary, path, incremental=incremental)
 
     def save(self, path: Optional[Path] = None) -> None:
-        """Save dictionary to JSON file."""
+        """Save dictionary to JSON file (committing pending changes first).
+
+        Raises:
+            RuntimeError: If called inside batch(), which saves on exit
+        """
+        if self._batch is not None:
+            raise RuntimeError("Cannot save inside a batch; batch() saves on exit")
+        if self._uncommitted:
+            self.commit()
         target = path or self.path
         # Export as dict, convert to JSON with PascalCase keys
         data = self.dictionary.model_dump(by_alias=True)
@@ -60,14 +109,123 @@ class DictionaryManager:
 
     def _find_part(self, part_id: str) -> Optional[Part]:
         """Find a part by Part_ID."""
-        for part in self.dictionary.parts:
-            if part.part_id == part_id:
-                return part
-        return None
+        return self.index.get(part_id)
 
     def _part_exists(self, part_id: str) -> bool:
         """Check if a part exists."""
-        return self._find_part(part_id) is not None
+        return part_id in self.index
+
+    def _append_part(self, part: Part) -> None:
+        """Validate a new part's references, then append and index it."""
+        self._check_references(part)
+        self.dictionary.parts.append(part)
+        self.index.add_part(part)
+        if self._batch is not None:
+            self._batch["operations"] += 1
+
+    def _check_references(self, part: Part) -> None:
+        """Check the cross-references of a single part against the index.
+
+        This applies Dictionary.validate_cross_references to one part, so a
+        mutation only pays for the references it actually introduces.
+        """
+        errors = part_reference_errors(part, self.index.get)
+        if errors:
+            raise ValueError("\n".join(errors))
+
+    def _check_table_reference(self, field_id: str, table_id: str) -> None:
+        """Check that a field's table_presence points to an existing table."""
+        table = self.index.get(table_id)
+        if table is None or table.part_type != "table":
+            raise ValueError(
+                f"Field '{field_id}' references non-existent "
+                f"table '{table_id}' in table_presence"
+            )
+
+    def _log(self, message: str) -> None:
+        """Report a mutation, unless it is part of a batch."""
+        if self._batch is None:
+            print(message)
+
+    def _after_mutation(self) -> None:
+        """Defer the full check in incremental mode or batches, run it otherwise."""
+        if self.incremental or self._batch is not None:
+            self._uncommitted = True
+        else:
+            self.commit()
+
+    def commit(self) -> None:
+        """Run the full dictionary validation once and adopt the result.
+
+        Inside batch() this is a no-op: the batch validates once on exit, and
+        adopting new part objects mid-batch would detach its undo log.
+        """
+        if self._batch is None:
+            self._validate()
+
+    def _validate(self) -> None:
+        """Validate the whole dictionary and adopt the validated copy."""
+        self.dictionary = Dictionary.model_validate(
+            self.dictionary.model_dump(by_alias=True)
+        )
+        self._uncommitted = False
+
+    @contextmanager
+    def batch(self, save: bool = True) -> Iterator["DictionaryManager"]:
+        """Apply a group of mutations atomically.
+
+        Mutations made inside the block are applied as usual (with their
+        incremental reference checks) but without per-operation output. On
+        exit the full validation runs once and, if ``save`` is True, the
+        dictionary is saved once. If the block or the final validation
+        raises, every mutation made inside the block is rolled back.
+
+        Nested batches are folded into the outermost one.
+
+        Args:
+            save: Whether to save the dictionary after a successful batch
+
+        Example:
+            with mgr.batch():
+                mgr.create_table("site", "Site", "Sampling sites")
+                mgr.add_field_to_table("site", "Site_ID", "Site ID", "PK", role="key")
+        """
+        if self._batch is not None:
+            yield self
+            return
+
+        self._batch = {
+            "part_count": len(self.dictionary.parts),
+            "presences": [],  # (part, table_id, previous TablePresence or None)
+            "uncommitted": self._uncommitted,
+            "operations": 0,
+        }
+        try:
+            yield self
+            self._validate()
+        except BaseException:
+            self._rollback()
+            raise
+        finally:
+            operations = self._batch["operations"]
+            self._batch = None
+
+        print(f"Applied {operations} operations")
+        if save:
+            self.save()
+
+    def _rollback(self) -> None:
+        """Undo every mutation recorded by the active batch."""
+        batch = self._batch
+        del self.dictionary.parts[batch["part_count"] :]
+        for part, table_id, previous in reversed(batch["presences"]):
+            if previous is None:
+                del part.table_presence[table_id]
+            else:
+                part.table_presence[table_id] = previous
+        # Reassigning rebuilds the index from the restored parts
+        self.dictionary = self.dictionary
+        self._uncommitted = batch["uncommitted"]
 
     # ========================================================================
     # Value Set Operations
@@ -81,12 +239,9 @@ class DictionaryManager:
         value_set = ValueSetPart(
             Part_ID=part_id, Label=label, Description=description, Part_type="valueSet"
         )
-        self.dictionary.parts.append(value_set)
-        # Re-validate entire dictionary
-        self.dictionary = Dictionary.model_validate(
-            self.dictionary.model_dump(by_alias=True)
-        )
-        print(f"Created value set '{part_id}'")
+        self._append_part(value_set)
+        self._after_mutation()
+        self._log(f"Created value set '{part_id}'")
 
     def add_value_set_member(
         self,
@@ -111,12 +266,9 @@ class DictionaryManager:
             Member_of_set_part_ID=value_set_id,
             Sort_order=order,
         )
-        self.dictionary.parts.append(member)
-        # Re-validate
-        self.dictionary = Dictionary.model_validate(
-            self.dictionary.model_dump(by_alias=True)
-        )
-        print(f"Added member '{member_id}' to value set '{value_set_id}'")
+        self._append_part(member)
+        self._after_mutation()
+        self._log(f"Added member '{member_id}' to value set '{value_set_id}'")
 
     # ========================================================================
     # Table Operations
@@ -130,12 +282,9 @@ class DictionaryManager:
         table = TablePart(
             Part_ID=table_id, Label=label, Description=description, Part_type="table"
         )
-        self.dictionary.parts.append(table)
-        # Re-validate
-        self.dictionary = Dictionary.model_validate(
-            self.dictionary.model_dump(by_alias=True)
-        )
-        print(f"Created table '{table_id}'")
+        self._append_part(table)
+        self._after_mutation()
+        self._log(f"Created table '{table_id}'")
 
     def add_field_to_table(
         self,
@@ -164,10 +313,17 @@ class DictionaryManager:
                 raise ValueError(f"Part '{field_id}' exists but is not a field type")
 
             # Add table presence
+            self._check_table_reference(field_id, table_id)
+            if self._batch is not None:
+                self._batch["presences"].append(
+                    (existing_part, table_id, existing_part.table_presence.get(table_id))
+                )
+                self._batch["operations"] += 1
             existing_part.table_presence[table_id] = TablePresence(
                 role=role, required=required, order=order
             )
-            print(f"Added '{field_id}' to table '{table_id}' with role '{role}'")
+            self.index.add_table_presence(existing_part, table_id)
+            self._log(f"Added '{field_id}' to table '{table_id}' with role '{role}'")
         else:
             # Create new field
             presence = {
@@ -199,13 +355,10 @@ class DictionaryManager:
                 field_kwargs["Value_set_part_ID"] = value_set_id
 
             field = field_class(**field_kwargs)
-            self.dictionary.parts.append(field)
-            print(f"Created field '{field_id}' in table '{table_id}'")
+            self._append_part(field)
+            self._log(f"Created field '{field_id}' in table '{table_id}'")
 
-        # Re-validate entire dictionary
-        self.dictionary = Dictionary.model_validate(
-            self.dictionary.model_dump(by_alias=True)
-        )
+        self._after_mutation()
 
     def add_parent_key(
         self,
@@ -240,12 +393,40 @@ class DictionaryManager:
                 table_id: TablePresence(role="property", required=required, order=order)
             },
         )
-        self.dictionary.parts.append(parent_key)
-        # Re-validate
-        self.dictionary = Dictionary.model_validate(
-            self.dictionary.model_dump(by_alias=True)
+        self._append_part(parent_key)
+        self._after_mutation()
+        self._log(f"Added parent key '{parent_key_id}' to table '{table_id}'")
+
+    def create_index(
+        self,
+        table_id: str,
+        index_id: str,
+        label: str,
+        description: str,
+        columns: list[str],
+        include_columns: Optional[list[str]] = None,
+        unique: bool = False,
+    ) -> None:
+        """Declare a composite and/or covering index on a table."""
+        if not self._part_exists(table_id):
+            raise ValueError(f"Table '{table_id}' does not exist")
+
+        if self._part_exists(index_id):
+            raise ValueError(f"Part '{index_id}' already exists")
+
+        index = IndexPart(
+            Part_ID=index_id,
+            Label=label,
+            Description=description,
+            Part_type="index",
+            Table_part_ID=table_id,
+            Index_columns=columns,
+            Include_columns=include_columns or [],
+            Is_unique=unique,
         )
-        print(f"Added parent key '{parent_key_id}' to table '{table_id}'")
+        self._append_part(index)
+        self._after_mutation()
+        self._log(f"Created index '{index_id}' on table '{table_id}'")
 
     # ========================================================================
     # Validation & Integrity
@@ -262,17 +443,11 @@ class DictionaryManager:
 
     def list_tables(self) -> list[str]:
         """List all table Part_IDs."""
-        return [
-            part.part_id for part in self.dictionary.parts if part.part_type == "table"
-        ]
+        return [part.part_id for part in self.index.parts_of_type("table")]
 
     def list_value_sets(self) -> list[str]:
         """List all value set Part_IDs."""
-        return [
-            part.part_id
-            for part in self.dictionary.parts
-            if part.part_type == "valueSet"
-        ]
+        return [part.part_id for part in self.index.parts_of_type("valueSet")]
 
     # ========================================================================
     # Query Operations (replacing old SQL queries)
@@ -296,25 +471,16 @@ class DictionaryManager:
         if not value_set_id:
             return []
 
-        # Find all members of this value set
-        members = []
-        for part in self.dictionary.parts:
-            if (
-                hasattr(part, "member_of_set_part_id")
-                and part.member_of_set_part_id == value_set_id
-            ):
-                members.append(
-                    {
-                        "Part_ID": part.part_id,
-                        "Label": part.label,
-                        "Description": part.description,
-                        "Sort_order": getattr(part, "sort_order", 999),
-                    }
-                )
-
-        # Sort by sort_order
-        members.sort(key=lambda x: x["Sort_order"])
-        return members
+        # Members are kept sorted by sort_order in the index
+        return [
+            {
+                "Part_ID": part.part_id,
+                "Label": part.label,
+                "Description": part.description,
+                "Sort_order": getattr(part, "sort_order", 999),
+            }
+            for part in self.index.value_set_members(value_set_id)
+        ]
 
     def get_table_columns(self, table_id: str) -> list[dict]:
         """Get all columns that appear in a specific table.
@@ -325,26 +491,18 @@ class DictionaryManager:
         Returns:
             List of dictionaries with column metadata
         """
-        columns = []
-        for part in self.dictionary.parts:
-            # Only field parts have table_presence
-            if hasattr(part, "table_presence") and part.table_presence:
-                if table_id in part.table_presence:
-                    presence = part.table_presence[table_id]
-                    columns.append(
-                        {
-                            "Part_ID": part.part_id,
-                            "Label": part.label,
-                            "SQL_data_type": getattr(part, "sql_data_type", None),
-                            "Is_required": presence.required,
-                            "Role": presence.role,
-                            "Order": presence.order,
-                        }
-                    )
-
-        # Sort by order
-        columns.sort(key=lambda x: x["Order"])
-        return columns
+        # Columns are kept sorted by order in the index
+        return [
+            {
+                "Part_ID": part.part_id,
+                "Label": part.label,
+                "SQL_data_type": getattr(part, "sql_data_type", None),
+                "Is_required": presence.required,
+                "Role": presence.role,
+                "Order": presence.order,
+            }
+            for part, presence in self.index.table_columns(table_id)
+        ]
 
     def get_field_tables(self, field_id: str) -> list[dict]:
         """Find all tables where a specific field appears.
@@ -355,12 +513,8 @@ class DictionaryManager:
         Returns:
             List of dictionaries with table and role information
         """
-        field = self._find_part(field_id)
-        if not field or not hasattr(field, "table_presence"):
-            return []
-
         tables = []
-        for table_id, presence in field.table_presence.items():
+        for table_id, presence in self.index.field_tables(field_id).items():
             tables.append(
                 {
                     "Table_ID": table_id,
@@ -379,23 +533,22 @@ class DictionaryManager:
             List of dictionaries with primary key information
         """
         primary_keys = []
-        for part in self.dictionary.parts:
-            if part.part_type == "key":
-                # Find which table this key belongs to
-                tables = []
-                if hasattr(part, "table_presence") and part.table_presence:
-                    for table_id, presence in part.table_presence.items():
-                        if presence.role == "key":
-                            tables.append(table_id)
-
-                primary_keys.append(
-                    {
-                        "Part_ID": part.part_id,
-                        "Label": part.label,
-                        "SQL_data_type": getattr(part, "sql_data_type", None),
-                        "Primary_in_tables": tables,
-                    }
-                )
+        for part in self.index.parts_of_type("key"):
+            # Find which table this key belongs to
+            tables = []
+            if hasattr(part, "table_presence") and part.table_presence:
+                for table_id, presence in part.table_presence.items():
+                    if presence.role == "key":
+                        tables.append(table_id)
+
+            primary_keys.append(
+                {
+                    "Part_ID": part.part_id,
+                    "Label": part.label,
+                    "SQL_data_type": getattr(part, "sql_data_type", None),
+                    "Primary_in_tables": tables,
+                }
+            )
 
         return primary_keys
 
@@ -406,25 +559,20 @@ class DictionaryManager:
             List of dictionaries with shared field information
         """
         shared_fields = []
-        for part in self.dictionary.parts:
-            if (
-                hasattr(part, "table_presence")
-                and part.table_presence
-                and len(part.table_presence) > 1
-            ):
-                tables = []
-                for table_id, presence in part.table_presence.items():
-                    tables.append({"Table_ID": table_id, "Role": presence.role})
-
-                shared_fields.append(
-                    {
-                        "Part_ID": part.part_id,
-                        "Label": part.label,
-                        "Part_type": part.part_type,
-                        "Table_count": len(part.table_presence),
-                        "Tables": tables,
-                    }
-                )
+        for part in self.index.shared_fields():
+            tables = []
+            for table_id, presence in part.table_presence.items():
+                tables.append({"Table_ID": table_id, "Role": presence.role})
+
+            shared_fields.append(
+                {
+                    "Part_ID": part.part_id,
+                    "Label": part.label,
+                    "Part_type": part.part_type,
+                    "Table_count": len(part.table_presence),
+                    "Tables": tables,
+                }
+            )
 
         # Sort by table count (most shared first)
         shared_fields.sort(key=lambda x: x["Table_count"], reverse=True)
@@ -0,0 +1,147 @@
+"""
+Hash indexes over the parts of a Dictionary.
+
+``DictionaryIndex`` is a companion object to a ``Dictionary``: it is built in a
+single pass over ``Dictionary.parts`` and answers the common metadata lookups
+(part by ID, columns of a table, members of a value set, tables of a field,
+columns of a view) with dictionary hits instead of scans over every part.
+
+The index holds references to the part objects themselves. Code that adds
+parts or table presences must report them through ``add_part`` and
+``add_table_presence`` to keep the index consistent; ``DictionaryManager``
+does this for all of its mutators.
+
+Usage:
+    from open_dateaubase.data_model.index import DictionaryIndex
+
+    index = DictionaryIndex(dictionary)
+    index.get("Site_ID")
+    index.table_columns("site")
+"""
+
+from bisect import insort
+from typing import Dict, List, Optional, Tuple
+
+from .models import (
+    Dictionary,
+    FieldPartBase,
+    Part,
+    TablePresence,
+    ValueSetMemberPart,
+    ViewColumnPart,
+)
+
+# Sort key used inside the ordered buckets: (display order, position of the
+# part in Dictionary.parts). The position keeps ties in dictionary order.
+_SortKey = Tuple[int, int]
+
+
+class DictionaryIndex:
+    """Hash indexes over a Dictionary's parts for constant-time lookups."""
+
+    def __init__(self, dictionary: Dictionary):
+        self._parts: Dict[str, Part] = {}
+        self._position: Dict[str, int] = {}
+        self._by_type: Dict[str, Dict[str, Part]] = {}
+        self._table_columns: Dict[str, List[Tuple[_SortKey, str]]] = {}
+        self._set_members: Dict[str, List[Tuple[_SortKey, str]]] = {}
+        self._view_columns: Dict[str, List[Tuple[_SortKey, str]]] = {}
+        self._shared_fields: Dict[str, None] = {}  # Insertion-ordered set
+
+        for part in dictionary.parts:
+            self.add_part(part)
+
+    # ========================================================================
+    # Maintenance
+    # ========================================================================
+
+    def add_part(self, part: Part) -> None:
+        """Register a part appended to the dictionary."""
+        if part.part_id in self._parts:
+            raise ValueError(f"Part '{part.part_id}' already exists")
+
+        position = len(self._position)
+        self._parts[part.part_id] = part
+        self._position[part.part_id] = position
+        self._by_type.setdefault(part.part_type, {})[part.part_id] = part
+
+        if isinstance(part, FieldPartBase):
+            for table_id in part.table_presence:
+                self.add_table_presence(part, table_id)
+
+        elif isinstance(part, ValueSetMemberPart):
+            order = part.sort_order if part.sort_order is not None else 999
+            insort(
+                self._set_members.setdefault(part.member_of_set_part_id, []),
+                ((order, position), part.part_id),
+            )
+
+        elif isinstance(part, ViewColumnPart):
+            for view_id, view_meta in part.view_presence.items():
+                insort(
+                    self._view_columns.setdefault(view_id, []),
+                    ((view_meta.get("order", 999), position), part.part_id),
+                )
+
+    def add_table_presence(self, part: FieldPartBase, table_id: str) -> None:
+        """Register (or refresh) the presence of an indexed field in a table."""
+        position = self._position[part.part_id]
+        columns = self._table_columns.setdefault(table_id, [])
+
+        # Drop a previous entry for this field if its presence is being replaced
+        for i, (_, field_id) in enumerate(columns):
+            if field_id == part.part_id:
+                del columns[i]
+                break
+
+        order = part.table_presence[table_id].order
+        insort(columns, ((order, position), part.part_id))
+
+        if len(part.table_presence) > 1:
+            self._shared_fields[part.part_id] = None
+
+    # ========================================================================
+    # Lookups
+    # ========================================================================
+
+    def __contains__(self, part_id: str) -> bool:
+        return part_id in self._parts
+
+    def __len__(self) -> int:
+        return len(self._parts)
+
+    def get(self, part_id: str) -> Optional[Part]:
+        """Return the part with the given Part_ID, or None."""
+        return self._parts.get(part_id)
+
+    def parts_of_type(self, part_type: str) -> List[Part]:
+        """Return all parts of a Part_type, in dictionary order."""
+        return list(self._by_type.get(part_type, {}).values())
+
+    def table_columns(self, table_id: str) -> List[Tuple[FieldPartBase, TablePresence]]:
+        """Return (field, presence) pairs for a table, sorted by display order."""
+        columns = []
+        for _, field_id in self._table_columns.get(table_id, []):
+            part = self._parts[field_id]
+            columns.append((part, part.table_presence[table_id]))
+        return columns
+
+    def field_tables(self, field_id: str) -> Dict[str, TablePresence]:
+        """Return the table_presence mapping of a field (empty if unknown)."""
+        part = self._parts.get(field_id)
+        return getattr(part, "table_presence", None) or {}
+
+    def value_set_members(self, value_set_id: str) -> List[ValueSetMemberPart]:
+        """Return the members of a value set, sorted by Sort_order."""
+        return [self._parts[pid] for _, pid in self._set_members.get(value_set_id, [])]
+
+    def view_columns(self, view_id: str) -> List[ViewColumnPart]:
+        """Return the columns of a view, sorted by display order."""
+        return [self._parts[pid] for _, pid in self._view_columns.get(view_id, [])]
+
+    def shared_fields(self) -> List[FieldPartBase]:
+        """Return fields present in more than one table, in dictionary order."""
+        return sorted(
+            (self._parts[pid] for pid in self._shared_fields),
+            key=lambda part: self._position[part.part_id],
+        )
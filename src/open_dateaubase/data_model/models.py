@@ -5,7 +5,7 @@ This module defines the type-safe schema for the dictionary using discriminated
 unions to enforce Part_type-specific validation rules.
 """
 
-from typing import Literal, Union, Dict, Optional, List, Any, Annotated
+from typing import Literal, Union, Dict, Optional, List, Any, Annotated, Callable
 from pydantic import BaseModel, Field, field_validator, model_validator, ConfigDict
 
 
@@ -93,10 +93,44 @@ class PartBase(BaseModel):
 # ============================================================================
 
 
+class TableStorage(BaseModel):
+    """Physical storage hints for a (large) table."""
+
+    model_config = ConfigDict(frozen=True, populate_by_name=True)
+
+    partition_column: Optional[str] = Field(
+        None,
+        alias="Partition_column",
+        description="Part_ID of the field the table is range-partitioned on",
+    )
+    partition_boundaries: List[str] = Field(
+        default_factory=list,
+        alias="Partition_boundaries",
+        description="Ascending partition boundary values (each starts a partition)",
+    )
+    columnstore: bool = Field(
+        default=False,
+        alias="Columnstore",
+        description="Store the table as a clustered columnstore where supported",
+    )
+
+    @model_validator(mode="after")
+    def validate_partitioning(self):
+        """Boundaries need a partition column and must be distinct."""
+        if self.partition_boundaries and not self.partition_column:
+            raise ValueError("Partition_boundaries require a Partition_column")
+        if len(set(self.partition_boundaries)) != len(self.partition_boundaries):
+            raise ValueError(
+                f"Partition_boundaries must be distinct: {self.partition_boundaries}"
+            )
+        return self
+
+
 class TablePart(PartBase):
     """Represents a database table definition."""
 
     part_type: Literal["table"] = Field(alias="Part_type")
+    storage: Optional[TableStorage] = Field(None, alias="Storage")
 
     @field_validator("part_id")
     @classmethod
@@ -112,6 +146,69 @@ class TablePart(PartBase):
 # ============================================================================
 
 
+# Maximum fractional-second precision of parameterised temporal types
+_TEMPORAL_PRECISION = {
+    "datetime2": 7,
+    "datetimeoffset": 7,
+    "time": 7,
+    "timestamptz": 6,
+}
+
+# Exact numeric types taking (precision[, scale])
+_EXACT_NUMERIC_TYPES = ("numeric", "decimal")
+
+_MAX_NUMERIC_PRECISION = 38
+
+
+def sql_type_errors(sql_type: str) -> List[str]:
+    """
+    Check the parameters of temporal and exact numeric SQL types.
+
+    Types other than the parameterised temporal types (datetime2, time,
+    datetimeoffset, timestamptz) and numeric/decimal are not checked.
+
+    Args:
+        sql_type: SQL type as written in the dictionary (e.g. 'datetime2(3)')
+
+    Returns:
+        List of error messages (empty if the type is valid)
+    """
+    base_type, _, params = sql_type.partition("(")
+    base_type = base_type.strip().lower()
+    if base_type not in _TEMPORAL_PRECISION and base_type not in _EXACT_NUMERIC_TYPES:
+        return []
+
+    params = params.strip()
+    if params and not params.endswith(")"):
+        return [f"Malformed SQL type '{sql_type}'"]
+    values = [p.strip() for p in params[:-1].split(",")] if params else []
+    if not all(value.isdigit() for value in values):
+        return [f"SQL type '{sql_type}' has non-integer parameters"]
+    values = [int(value) for value in values]
+
+    if base_type in _TEMPORAL_PRECISION:
+        max_precision = _TEMPORAL_PRECISION[base_type]
+        if len(values) > 1 or (values and values[0] > max_precision):
+            return [
+                f"SQL type '{sql_type}' takes a single fractional-second "
+                f"precision between 0 and {max_precision}"
+            ]
+
+    elif values:
+        precision, scale = values[0], values[1] if len(values) > 1 else 0
+        if (
+            len(values) > 2
+            or not 1 <= precision <= _MAX_NUMERIC_PRECISION
+            or scale > precision
+        ):
+            return [
+                f"SQL type '{sql_type}' needs 1 <= precision <= "
+                f"{_MAX_NUMERIC_PRECISION} and 0 <= scale <= precision"
+            ]
+
+    return []
+
+
 class FieldPartBase(PartBase):
     """Base for parts that represent table columns."""
 
@@ -119,10 +216,37 @@ class FieldPartBase(PartBase):
     is_required: bool = Field(default=False, alias="Is_required")
     default_value: Optional[str] = Field(None, alias="Default_value")
     value_set_part_id: Optional[str] = Field(None, alias="Value_set_part_ID")
+    time_unit: Optional[Literal["s", "ms", "us", "ns"]] = Field(
+        None,
+        alias="Time_unit",
+        description="Unit of a bigint Unix epoch timestamp column",
+    )
     table_presence: Dict[str, TablePresence] = Field(
         default_factory=dict, description="Maps table_name -> TablePresence metadata"
     )
 
+    @field_validator("sql_data_type")
+    @classmethod
+    def validate_sql_data_type(cls, v: Optional[str]) -> Optional[str]:
+        """Temporal precision and numeric precision/scale must be in range."""
+        if v:
+            errors = sql_type_errors(v)
+            if errors:
+                raise ValueError(errors[0])
+        return v
+
+    @model_validator(mode="after")
+    def validate_time_unit(self):
+        """Epoch time units only apply to bigint columns."""
+        if self.time_unit is not None:
+            base_type = (self.sql_data_type or "").split("(")[0].strip().lower()
+            if base_type != "bigint":
+                raise ValueError(
+                    f"Field '{self.part_id}' declares Time_unit "
+                    f"'{self.time_unit}' but is not a bigint epoch column"
+                )
+        return self
+
     @model_validator(mode="after")
     def validate_table_presence_not_empty(self):
         """Field parts must appear in at least one table."""
@@ -200,6 +324,52 @@ class ParentKeyPart(FieldPartBase):
     ancestor_part_id: str = Field(..., alias="Ancestor_part_ID", min_length=1)
 
 
+# ============================================================================
+# Index Parts
+# ============================================================================
+
+
+class IndexPart(PartBase):
+    """Secondary (composite and/or covering) index on a table.
+
+    Single-column indexes on foreign key columns are generated automatically
+    by the SQL generator; index parts declare everything else.
+    """
+
+    part_type: Literal["index"] = Field(alias="Part_type")
+    table_part_id: str = Field(..., alias="Table_part_ID", min_length=1)
+    index_columns: List[str] = Field(
+        ...,
+        alias="Index_columns",
+        min_length=1,
+        description="Part_IDs of the indexed fields, in key order",
+    )
+    include_columns: List[str] = Field(
+        default_factory=list,
+        alias="Include_columns",
+        description="Part_IDs of non-key fields stored in the index (covering index)",
+    )
+    is_unique: bool = Field(default=False, alias="Is_unique")
+
+    @field_validator("part_id")
+    @classmethod
+    def validate_index_name(cls, v: str) -> str:
+        """Index names are used as SQL identifiers."""
+        if " " in v:
+            raise ValueError(f"Index name '{v}' should not contain spaces")
+        return v
+
+    @model_validator(mode="after")
+    def validate_columns_unique(self):
+        """A field may appear only once across key and included columns."""
+        columns = self.index_columns + self.include_columns
+        if len(set(columns)) != len(columns):
+            raise ValueError(
+                f"Index '{self.part_id}' lists a field more than once: {columns}"
+            )
+        return self
+
+
 # ============================================================================
 # View Parts
 # ============================================================================
@@ -305,6 +475,7 @@ Part = Annotated[
         CompositeKeyFirstPart,
         CompositeKeySecondPart,
         ParentKeyPart,
+        IndexPart,
         ValueSetPart,
         ValueSetMemberPart,
         ViewPart,
@@ -314,6 +485,127 @@ Part = Annotated[
 ]
 
 
+# ============================================================================
+# Cross-reference Checks
+# ============================================================================
+
+_KEY_PART_TYPES = (KeyPart, CompositeKeyFirstPart, CompositeKeySecondPart)
+
+
+def part_reference_errors(
+    part: PartBase, find_part: Callable[[str], Optional[PartBase]]
+) -> List[str]:
+    """
+    Collect the cross-reference errors of a single part.
+
+    Args:
+        part: The part whose references are checked
+        find_part: Lookup returning the part with a given Part_ID, or None
+
+    Returns:
+        List of error messages (empty if every reference resolves)
+    """
+    errors = []
+
+    if isinstance(part, FieldPartBase):
+        # Validate value_set_part_id references
+        if part.value_set_part_id and find_part(part.value_set_part_id) is None:
+            errors.append(
+                f"Field '{part.part_id}' references non-existent "
+                f"value set '{part.value_set_part_id}'"
+            )
+
+        # Validate table_presence references
+        has_relationship = False
+        for table_name, presence in part.table_presence.items():
+            target = find_part(table_name)
+            if target is None or target.part_type != "table":
+                errors.append(
+                    f"Field '{part.part_id}' references non-existent "
+                    f"table '{table_name}' in table_presence"
+                )
+            has_relationship = has_relationship or bool(presence.relationship_type)
+
+        # Validate foreign key relationships: the FK target is inferred from
+        # the field name (a field ending in _ID references the same-named
+        # primary key), so the field itself must be a key field
+        if (
+            has_relationship
+            and part.part_id.endswith("_ID")
+            and not isinstance(part, _KEY_PART_TYPES)
+        ):
+            errors.append(
+                f"Field '{part.part_id}' appears to be a foreign key but is not defined as a key field"
+            )
+
+    # Validate ancestor_part_id references
+    if isinstance(part, ParentKeyPart) and find_part(part.ancestor_part_id) is None:
+        errors.append(
+            f"Parent key '{part.part_id}' references non-existent "
+            f"ancestor '{part.ancestor_part_id}'"
+        )
+
+    # Validate the partition column of table storage hints
+    if isinstance(part, TablePart) and part.storage and part.storage.partition_column:
+        column = find_part(part.storage.partition_column)
+        if (
+            not isinstance(column, FieldPartBase)
+            or part.part_id not in column.table_presence
+        ):
+            errors.append(
+                f"Table '{part.part_id}' is partitioned on field "
+                f"'{part.storage.partition_column}' which is not in the table"
+            )
+
+    # Validate index table and column references
+    if isinstance(part, IndexPart):
+        table = find_part(part.table_part_id)
+        if table is None or table.part_type != "table":
+            errors.append(
+                f"Index '{part.part_id}' references non-existent "
+                f"table '{part.table_part_id}'"
+            )
+        else:
+            for column_id in part.index_columns + part.include_columns:
+                column = find_part(column_id)
+                if (
+                    not isinstance(column, FieldPartBase)
+                    or part.table_part_id not in column.table_presence
+                ):
+                    errors.append(
+                        f"Index '{part.part_id}' references field '{column_id}' "
+                        f"which is not in table '{part.table_part_id}'"
+                    )
+
+    # Validate member_of_set_part_id references
+    if isinstance(part, ValueSetMemberPart):
+        if find_part(part.member_of_set_part_id) is None:
+            errors.append(
+                f"Value set member '{part.part_id}' references "
+                f"non-existent set '{part.member_of_set_part_id}'"
+            )
+
+    if isinstance(part, ViewColumnPart):
+        # Validate view_presence references
+        for view_name in part.view_presence.keys():
+            target = find_part(view_name)
+            if target is None or target.part_type != "view":
+                errors.append(
+                    f"View column '{part.part_id}' references non-existent "
+                    f"view '{view_name}' in view_presence"
+                )
+
+        # Validate source_field_part_id references
+        source = find_part(part.source_field_part_id)
+        if not isinstance(source, FieldPartBase):
+            errors.append(
+                f"View column '{part.part_id}' references non-existent "
+                f"field '{part.source_field_part_id}' in source_field_part_id"
+            )
+
+    return errors
+
+
 # ============================================================================
 # Dictionary Root
 # ============================================================================
@@ -328,113 +620,36 @@ class Dictionary(BaseModel):
     @classmethod
     def validate_unique_part_ids(cls, v: List[Part]) -> List[Part]:
         """Ensure all Part_IDs are unique."""
-        part_ids = [part.part_id for part in v]
-        duplicates = [pid for pid in set(part_ids) if part_ids.count(pid) > 1]
+        seen = set()
+        duplicates = {}  # Insertion-ordered set
+        for part in v:
+            if part.part_id in seen:
+                duplicates[part.part_id] = None
+            seen.add(part.part_id)
         if duplicates:
-            raise ValueError(f"Duplicate Part_IDs found: {duplicates}")
+            raise ValueError(f"Duplicate Part_IDs found: {list(duplicates)}")
         return v
 
     @model_validator(mode="after")
     def validate_cross_references(self):
-        """Validate that all cross-references point to existing parts."""
-        part_ids = {part.part_id for part in self.parts}
-
-        # Validate value_set_part_id references
-        for part in self.parts:
-            if isinstance(part, FieldPartBase) and part.value_set_part_id:
-                if part.value_set_part_id not in part_ids:
-                    raise ValueError(
-                        f"Field '{part.part_id}' references non-existent "
-                        f"value set '{part.value_set_part_id}'"
-                    )
-
-        # Validate member_of_set_part_id references
-        for part in self.parts:
-            if isinstance(part, ValueSetMemberPart):
-                if part.member_of_set_part_id not in part_ids:
-                    raise ValueError(
-                        f"Value set member '{part.part_id}' references "
-                        f"non-existent set '{part.member_of_set_part_id}'"
-                    )
+        """Validate that all cross-references point to existing parts.
 
-        # Validate ancestor_part_id references
-        for part in self.parts:
-            if isinstance(part, ParentKeyPart):
-                if part.ancestor_part_id not in part_ids:
-                    raise ValueError(
-                        f"Parent key '{part.part_id}' references non-existent "
-                        f"ancestor '{part.ancestor_part_id}'"
-                    )
-
-        # Validate table_presence references
-        table_names = {
-            part.part_id for part in self.parts if isinstance(part, TablePart)
-        }
-        for part in self.parts:
-            if isinstance(part, FieldPartBase):
-                for table_name in part.table_presence.keys():
-                    if table_name not in table_names:
-                        raise ValueError(
-                            f"Field '{part.part_id}' references non-existent "
-                            f"table '{table_name}' in table_presence"
-                        )
+        Parts are indexed once by Part_ID and every reference is resolved
+        with a dictionary lookup. All dangling references are reported
+        together rather than stopping at the first one.
+        """
+        parts_by_id = {part.part_id: part for part in self.parts}
 
-        # Validate view_presence references
-        view_names = {part.part_id for part in self.parts if isinstance(part, ViewPart)}
+        errors = []
         for part in self.parts:
-            if isinstance(part, ViewColumnPart):
-                for view_name in part.view_presence.keys():
-                    if view_name not in view_names:
-                        raise ValueError(
-                            f"View column '{part.part_id}' references non-existent "
-                            f"view '{view_name}' in view_presence"
-                        )
+            errors.extend(part_reference_errors(part, parts_by_id.get))
 
-        # Validate source_field_part_id references
-        field_part_ids = {
-            p.part_id
-            for p in self.parts
-            if isinstance(
-                p,
-                (
-                    KeyPart,
-                    PropertyPart,
-                    CompositeKeyFirstPart,
-                    CompositeKeySecondPart,
-                    ParentKeyPart,
-                ),
+        if len(errors) == 1:
+            raise ValueError(errors[0])
+        if errors:
+            raise ValueError(
+                f"Found {len(errors)} invalid cross-references:\n"
+                + "\n".join(f"  - {error}" for error in errors)
             )
-        }
-        for part in self.parts:
-            if isinstance(part, ViewColumnPart):
-                if part.source_field_part_id not in field_part_ids:
-                    raise ValueError(
-                        f"View column '{part.part_id}' references non-existent "
-                        f"field '{part.source_field_part_id}' in source_field_part_id"
-                    )
-
-        # Validate foreign key relationships by inferring targets from field names
-        for part in self.parts:
-            if isinstance(part, FieldPartBase):
-                for table_name, presence in part.table_presence.items():
-                    if presence.relationship_type:
-                        # Infer FK target from field name (field name ending in _ID references same-named primary key)
-                        if part.part_id.endswith("_ID"):
-                            # Validate that the inferred target exists and is a key field
-                            target_part = next(
-                                (p for p in self.parts if p.part_id == part.part_id),
-                                None,
-                            )
-                            if target_part and not isinstance(
-                                target_part,
-                                (
-                                    KeyPart,
-                                    CompositeKeyFirstPart,
-                                    CompositeKeySecondPart,
-                                ),
-                            ):
-                                raise ValueError(
-                                    f"Field '{part.part_id}' appears to be a foreign key but is not defined as a key field"
-                                )
 
         return self
@@ -0,0 +1,285 @@
+"""
+Compiled schema representation shared by the documentation and SQL generators.
+
+The generators in ``scripts/`` all consume the same "parts data" layout
+(tables with ordered fields, value sets with ordered members, views with
+ordered columns). This module builds that layout once, in a single pass over
+``Dictionary.parts``, and freezes it so a single compiled schema can safely be
+handed to every generator.
+
+Usage:
+    from open_dateaubase.data_model.schema import load_schema
+
+    schema = load_schema("src/open_dateaubase/dictionary.json")
+    schema["tables"]["site"]["fields"]
+"""
+
+from pathlib import Path
+from types import MappingProxyType
+from typing import Any, Mapping
+
+from .cache import load_dictionary
+from .models import Dictionary
+
+# Part types that describe table columns (i.e. carry table_presence)
+FIELD_PART_TYPES = frozenset(
+    {"key", "property", "compositeKeyFirst", "compositeKeySecond", "parentKey"}
+)
+
+
+def _sort_key(item: dict) -> int:
+    return item["sort_order"]
+
+
+def _freeze(value: Any) -> Any:
+    """Recursively convert dicts to read-only mappings and lists to tuples."""
+    if isinstance(value, dict):
+        return MappingProxyType({k: _freeze(v) for k, v in value.items()})
+    if isinstance(value, list):
+        return tuple(_freeze(v) for v in value)
+    return value
+
+
+def thaw_schema(value: Any) -> Any:
+    """
+    Return a plain dict/list copy of a compiled schema.
+
+    Compiled schemas are read-only mappings, which cannot be pickled; thaw
+    them to hand a schema to worker processes.
+    """
+    if isinstance(value, (MappingProxyType, dict)):
+        return {k: thaw_schema(v) for k, v in value.items()}
+    if isinstance(value, (tuple, list)):
+        return [thaw_schema(v) for v in value]
+    return value
+
+
+def extract_field_name(part_id):
+    """
+    Extract field name from Part_ID.
+
+    NEW FORMAT handling:
+    - ID fields (e.g., 'Equipment_ID', 'Project_ID'): Use as-is (these are actual SQL field names)
+    - Table-prefixed fields (e.g., 'site_City', 'purpose_Description'): Remove table prefix
+    - Non-prefixed fields: Use as-is
+
+    Args:
+        part_id: Part_ID from dictionary
+
+    Returns:
+        Field name to use in SQL
+    """
+    # ID fields are used as-is in SQL
+    if part_id.endswith("_ID"):
+        return part_id
+
+    # Table-prefixed non-ID fields: remove prefix
+    # Format is lowercase_table_MixedCaseField (e.g., 'site_City', 'contact_City')
+    if "_" in part_id:
+        # Check if first part looks like a table name (lowercase)
+        parts = part_id.split("_", 1)
+        if len(parts) == 2 and parts[0].islower():
+            # This is likely a table-prefixed field, remove prefix
+            return parts[1]
+
+    # Otherwise use as-is
+    return part_id
+
+
+def key_table(schema: Mapping[str, Any], field_id: str) -> str | None:
+    """
+    Return the table whose primary key is an ID field.
+
+    When several tables use the field as their key, the table named after the
+    field (e.g. 'equipment' for 'Equipment_ID') is preferred.
+
+    Args:
+        schema: Compiled schema
+        field_id: Part_ID of an ID field (e.g. 'Equipment_ID')
+
+    Returns:
+        Table ID, or None if no table has the field as its key
+    """
+    locations = schema.get("id_field_locations", {}).get(field_id, {})
+    key_tables = [table_id for table_id, role in locations.items() if role == "key"]
+    derived = field_id[:-3].lower()
+    for table_id in key_tables:
+        if table_id.lower() == derived:
+            return table_id
+    return key_tables[0] if key_tables else None
+
+
+def compile_schema(dictionary: Dictionary) -> Mapping[str, Any]:
+    """
+    Compile a validated dictionary into the generators' parts data layout.
+
+    Every part is visited exactly once; fields, indexes, value set members and
+    view columns are bucketed by their owning table, set or view as they are
+    encountered and sorted once at the end (indexes keep dictionary order).
+
+    Args:
+        dictionary: A validated Dictionary instance
+
+    Returns:
+        Read-only mapping with 'tables', 'value_sets', 'metadata',
+        'id_field_locations' and 'views' keys
+    """
+    tables = {}
+    views = {}
+    value_sets = {}
+    fields_by_table = {}
+    members_by_set = {}
+    columns_by_view = {}
+    indexes_by_table = {}
+    id_field_locations = {}
+
+    for part in dictionary.parts:
+        part_type = part.part_type
+
+        if part_type == "table":
+            tables[part.part_id] = {
+                "label": part.label,
+                "description": part.description,
+                "storage": (
+                    {
+                        "partition_column": part.storage.partition_column,
+                        "partition_boundaries": list(
+                            part.storage.partition_boundaries
+                        ),
+                        "columnstore": part.storage.columnstore,
+                    }
+                    if part.storage
+                    else None
+                ),
+            }
+
+        elif part_type in FIELD_PART_TYPES:
+            is_id_field = part.part_id.endswith("_ID")
+            sql_data_type = part.sql_data_type or ""
+            default_value = part.default_value or ""
+            value_set = part.value_set_part_id or ""
+
+            for table_name, presence in part.table_presence.items():
+                # Track ID field locations
+                if is_id_field:
+                    id_field_locations.setdefault(part.part_id, {})[
+                        table_name
+                    ] = presence.role
+
+                # Determine FK target and relationship type from explicit metadata
+                fk_to = ""
+                relationship_type = None
+                if part_type == "parentKey":
+                    fk_to = part.ancestor_part_id
+                elif presence.relationship_type:
+                    # Infer FK target from field name (field ending in _ID references same-named primary key)
+                    if is_id_field:
+                        fk_to = part.part_id
+                    relationship_type = presence.relationship_type
+
+                fields_by_table.setdefault(table_name, []).append(
+                    {
+                        "part_id": part.part_id,
+                        "label": part.label,
+                        "description": part.description,
+                        "part_type": presence.role,
+                        "sql_data_type": sql_data_type,
+                        "is_required": presence.required,
+                        "default_value": default_value,
+                        "fk_to": fk_to,
+                        "relationship_type": relationship_type,
+                        "value_set": value_set,
+                        "time_unit": part.time_unit,
+                        "sort_order": presence.order,
+                    }
+                )
+
+        elif part_type == "index":
+            indexes_by_table.setdefault(part.table_part_id, []).append(
+                {
+                    "part_id": part.part_id,
+                    "description": part.description,
+                    "columns": list(part.index_columns),
+                    "include_columns": list(part.include_columns),
+                    "is_unique": part.is_unique,
+                }
+            )
+
+        elif part_type == "valueSet":
+            value_sets[part.part_id] = {
+                "label": part.label,
+                "description": part.description,
+            }
+
+        elif part_type == "valueSetMember":
+            members_by_set.setdefault(part.member_of_set_part_id, []).append(
+                {
+                    "part_id": part.part_id,
+                    "label": part.label,
+                    "description": part.description,
+                    "sort_order": part.sort_order if part.sort_order else 999,
+                }
+            )
+
+        elif part_type == "view":
+            views[part.part_id] = {
+                "label": part.label,
+                "description": part.description,
+                "view_definition": part.view_definition,
+            }
+
+        elif part_type == "viewColumn":
+            for view_name, view_meta in part.view_presence.items():
+                columns_by_view.setdefault(view_name, []).append(
+                    {
+                        "part_id": part.part_id,
+                        "label": part.label,
+                        "description": part.description,
+                        "source_field_part_id": part.source_field_part_id,
+                        "sql_data_type": part.sql_data_type or "",
+                        "sort_order": view_meta.get("order", 999),
+                    }
+                )
+
+    # Attach buckets to their owners, dropping references to unknown owners
+    for table_id, table_info in tables.items():
+        table_info["fields"] = sorted(fields_by_table.get(table_id, []), key=_sort_key)
+        table_info["indexes"] = indexes_by_table.get(table_id, [])
+    for value_set_id, value_set_info in value_sets.items():
+        value_set_info["members"] = sorted(
+            members_by_set.get(value_set_id, []), key=_sort_key
+        )
+    for view_id, view_info in views.items():
+        view_info["columns"] = sorted(columns_by_view.get(view_id, []), key=_sort_key)
+
+    id_field_locations = {
+        field_id: {t: role for t, role in locations.items() if t in tables}
+        for field_id, locations in id_field_locations.items()
+    }
+    id_field_locations = {k: v for k, v in id_field_locations.items() if v}
+
+    return _freeze(
+        {
+            "tables": tables,
+            "value_sets": value_sets,
+            "metadata": {},
+            "id_field_locations": id_field_locations,
+            "views": views,
+        }
+    )
+
+
+def load_schema(json_path: str | Path, use_cache: bool = True) -> Mapping[str, Any]:
+    """
+    Load, validate and compile a dictionary JSON file.
+
+    Args:
+        json_path: Path to dictionary.json
+        use_cache: Reuse a validated snapshot of an unchanged file
+            (see open_dateaubase.data_model.cache)
+
+    Returns:
+        Compiled schema (see compile_schema)
+    """
+    dictionary = load_dictionary(json_path, use_cache=use_cache)
+    return compile_schema(dictionary)
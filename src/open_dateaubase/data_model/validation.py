@@ -0,0 +1,512 @@
+"""
+Validation of incoming data against the dictionary.
+
+``RecordValidator`` compiles one check function per table from the
+dictionary: required columns, string lengths, numeric types and ranges,
+value sets and foreign keys (against cached sets of existing keys). Bad rows
+can then be rejected before they reach the database, where a single
+constraint violation would abort a whole bulk-insert batch.
+
+``ValueSetValidator`` compiles every value set of a compiled schema into a
+frozenset of member Part_IDs, and records which table columns are
+constrained by which value set. Membership of a value is then a single hash
+lookup, and whole columns are checked at once:
+
+- row-oriented batches (sequences of values or row dicts) return an integer
+  bitmask with bit ``i`` set when row ``i`` holds a value outside the set;
+- columnar batches (NumPy arrays) are encoded to categorical codes with one
+  lookup per distinct value, and return a boolean violation array.
+
+NULL (None) never violates a value set; whether a column may be NULL is a
+separate check.
+
+Usage:
+    from open_dateaubase.data_model.schema import load_schema
+    from open_dateaubase.data_model.validation import RecordValidator
+
+    validator = RecordValidator(load_schema("dictionary.json"))
+    validator.load_keys(connection)
+    valid, rejected = validator.split("value", rows)
+"""
+
+from decimal import Decimal, InvalidOperation
+from functools import partial
+from typing import (
+    Any,
+    Callable,
+    Collection,
+    Dict,
+    FrozenSet,
+    Iterable,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+)
+
+from open_dateaubase.sql.connection import connection_dialect
+from .schema import extract_field_name, key_table
+
+# Categorical codes of values that are NULL or not in the value set
+NULL_CODE = -1
+INVALID_CODE = -2
+
+
+def rows_bitmask(rows: Iterable[int]) -> int:
+    """
+    Build a violation bitmask from row positions.
+
+    The mask is assembled in a byte buffer, so the cost stays linear in the
+    number of rows however many of them are set.
+
+    Args:
+        rows: Row positions, in increasing order
+
+    Returns:
+        Bitmask with bit i set for every row i
+    """
+    rows = list(rows)
+    if not rows:
+        return 0
+    buffer = bytearray(rows[-1] // 8 + 1)
+    for row in rows:
+        buffer[row >> 3] |= 1 << (row & 7)
+    return int.from_bytes(buffer, "little")
+
+
+def bitmask_rows(mask: int) -> list[int]:
+    """
+    Return the row positions set in a violation bitmask.
+
+    Args:
+        mask: Bitmask with bit i set for row i
+
+    Returns:
+        Sorted list of row positions
+    """
+    rows = []
+    for offset, byte in enumerate(mask.to_bytes((mask.bit_length() + 7) // 8, "little")):
+        while byte:
+            low = byte & -byte
+            rows.append(offset * 8 + low.bit_length() - 1)
+            byte ^= low
+    return rows
+
+
+class ValueSetValidator:
+    """Checks value-set constrained columns with hash lookups."""
+
+    def __init__(self, schema: Mapping[str, Any]):
+        """
+        Args:
+            schema: Compiled schema (see open_dateaubase.data_model.schema)
+        """
+        # Value set -> member Part_IDs, in sort order (the categories)
+        self.categories: Dict[str, Tuple[str, ...]] = {
+            value_set_id: tuple(m["part_id"] for m in value_set["members"])
+            for value_set_id, value_set in schema["value_sets"].items()
+        }
+        self.members: Dict[str, FrozenSet[str]] = {
+            value_set_id: frozenset(members)
+            for value_set_id, members in self.categories.items()
+        }
+        # Table -> column name -> value set constraining it
+        self.columns: Dict[str, Dict[str, str]] = {}
+        for table_id, table_info in schema["tables"].items():
+            constrained = {
+                extract_field_name(f["part_id"]): f["value_set"]
+                for f in table_info["fields"]
+                if f["value_set"] in self.members
+            }
+            if constrained:
+                self.columns[table_id] = constrained
+
+        # Members plus NULL, so a column is checked with one lookup per value
+        self._accepted = {k: v | {None} for k, v in self.members.items()}
+        self._codes = {
+            value_set_id: {m: code for code, m in enumerate(members)}
+            for value_set_id, members in self.categories.items()
+        }
+
+    def is_member(self, value_set_id: str, value: Any) -> bool:
+        """Return whether a value is NULL or a member of the value set."""
+        return value in self._accepted[value_set_id]
+
+    def violations(self, value_set_id: str, values: Iterable[Any]) -> int:
+        """
+        Check a column of values against a value set.
+
+        Args:
+            value_set_id: Value set Part_ID
+            values: Column values (None for NULL)
+
+        Returns:
+            Bitmask with bit i set when values[i] is not a member
+        """
+        accepted = self._accepted[value_set_id]
+        return rows_bitmask(i for i, value in enumerate(values) if value not in accepted)
+
+    def validate_rows(
+        self, table_id: str, rows: Sequence[Mapping[str, Any]]
+    ) -> Dict[str, int]:
+        """
+        Check the value-set constrained columns of a batch of row dicts.
+
+        Args:
+            table_id: Table the rows belong to
+            rows: Row dicts keyed by column name (missing columns are NULL)
+
+        Returns:
+            Column name -> violation bitmask, for columns with violations
+        """
+        result = {}
+        for column, value_set_id in self.columns.get(table_id, {}).items():
+            mask = self.violations(value_set_id, (row.get(column) for row in rows))
+            if mask:
+                result[column] = mask
+        return result
+
+    def encode(self, value_set_id: str, values: Sequence[Any]):
+        """
+        Encode a column as categorical codes of the value set.
+
+        Codes index into ``categories[value_set_id]``; NULLs are NULL_CODE
+        and non-members INVALID_CODE. Values are compared as text, and
+        only distinct values are looked up.
+
+        Args:
+            value_set_id: Value set Part_ID
+            values: Column values (NumPy array or sequence, None for NULL)
+
+        Returns:
+            NumPy int32 array of codes
+
+        Raises:
+            ImportError: If numpy is not installed
+        """
+        np = _import_numpy()
+        values = np.asarray(values, dtype=object)
+        if not len(values):
+            return np.zeros(0, dtype=np.int32)
+
+        nulls = np.fromiter((v is None for v in values), dtype=bool, count=len(values))
+        codes = np.full(len(values), NULL_CODE, dtype=np.int32)
+        present = values[~nulls].astype(str)
+        if len(present):
+            distinct, inverse = np.unique(present, return_inverse=True)
+            lookup = self._codes[value_set_id]
+            distinct_codes = np.array(
+                [lookup.get(v, INVALID_CODE) for v in distinct.tolist()], dtype=np.int32
+            )
+            codes[~nulls] = distinct_codes[inverse]
+        return codes
+
+    def violation_mask(self, value_set_id: str, values: Sequence[Any]):
+        """
+        Check a columnar batch column against a value set.
+
+        Args:
+            value_set_id: Value set Part_ID
+            values: Column values (NumPy array or sequence, None for NULL)
+
+        Returns:
+            NumPy boolean array, True where the value is not a member
+        """
+        return self.encode(value_set_id, values) == INVALID_CODE
+
+    def validate_batch(self, table_id: str, columns: Mapping[str, Sequence[Any]]):
+        """
+        Check the value-set constrained columns of a columnar batch.
+
+        Args:
+            table_id: Table the batch belongs to
+            columns: Column name -> values (columns not present are skipped)
+
+        Returns:
+            Column name -> NumPy boolean violation array, for columns with violations
+        """
+        result = {}
+        for column, value_set_id in self.columns.get(table_id, {}).items():
+            if column in columns:
+                mask = self.violation_mask(value_set_id, columns[column])
+                if mask.any():
+                    result[column] = mask
+        return result
+
+
+def _import_numpy():
+    """Import numpy, with an install hint if it is missing."""
+    try:
+        import numpy
+    except ImportError as e:
+        raise ImportError(
+            "Columnar validation requires numpy: "
+            'pip install "open-dateaubase[columnar]"'
+        ) from e
+    return numpy
+
+
+# Integer SQL types -> (minimum, maximum)
+INTEGER_RANGES = {
+    "bit": (0, 1),
+    "tinyint": (0, 255),
+    "smallint": (-(2**15), 2**15 - 1),
+    "int": (-(2**31), 2**31 - 1),
+    "integer": (-(2**31), 2**31 - 1),
+    "bigint": (-(2**63), 2**63 - 1),
+}
+FLOAT_TYPES = ("real", "float", "double precision")
+STRING_TYPES = ("char", "nchar", "varchar", "nvarchar", "text", "ntext")
+
+# Per-value check: True if the (non-NULL) value is acceptable
+Check = Callable[[Any], bool]
+# (column, rule) -> bitmask of violating rows
+Violations = Dict[Tuple[str, str], int]
+
+
+def _integer_check(minimum: int, maximum: int) -> Check:
+    def check(value: Any) -> bool:
+        if type(value) is not int:
+            if isinstance(value, bool) or not isinstance(value, (str, Decimal, float)):
+                return False
+            try:
+                number = Decimal(str(value).strip())
+            except InvalidOperation:
+                return False
+            if number != number.to_integral_value():
+                return False
+            value = int(number)
+        return minimum <= value <= maximum
+
+    return check
+
+
+def _float_check(value: Any) -> bool:
+    if type(value) is float or type(value) is int:
+        return True
+    if isinstance(value, bool) or not isinstance(value, (str, Decimal)):
+        return False
+    try:
+        float(value)
+    except ValueError:
+        return False
+    return True
+
+
+def _decimal_check(precision: int, scale: int) -> Check:
+    def check(value: Any) -> bool:
+        if isinstance(value, bool):
+            return False
+        try:
+            number = Decimal(str(value).strip())
+        except InvalidOperation:
+            return False
+        if not number.is_finite():
+            return False
+        _, digits, exponent = number.normalize().as_tuple()
+        fraction = max(0, -exponent)
+        integer = max(0, len(digits) + exponent)
+        return fraction <= scale and integer <= precision - scale
+
+    return check
+
+
+def type_check(sql_type: str) -> Optional[Check]:
+    """
+    Build the value check of a SQL column type.
+
+    Integer types accept ints and integral strings within the type's range,
+    float types anything float() accepts, numeric/decimal values that fit the
+    declared precision and scale, and string types strings no longer than the
+    declared length. Other types are not checked.
+
+    Args:
+        sql_type: SQL data type from the dictionary (e.g. 'nvarchar(100)')
+
+    Returns:
+        Check function, or None if values of the type are not checked
+    """
+    base = sql_type.split("(")[0].strip().lower()
+    size = sql_type[sql_type.index("(") + 1 : sql_type.rindex(")")] if "(" in sql_type else ""
+
+    if base in INTEGER_RANGES:
+        return _integer_check(*INTEGER_RANGES[base])
+    if base in FLOAT_TYPES:
+        return _float_check
+    if base in ("numeric", "decimal"):
+        precision, _, scale = size.partition(",")
+        return _decimal_check(
+            int(precision) if precision.strip() else 18,
+            int(scale) if scale.strip() else 0,
+        )
+    if base in STRING_TYPES:
+        if size.strip().isdigit():
+            length = int(size)
+            return lambda value: isinstance(value, str) and len(value) <= length
+        return lambda value: isinstance(value, str)
+    return None
+
+
+class RecordValidator:
+    """Per-table record checks compiled from the dictionary."""
+
+    def __init__(
+        self,
+        schema: Mapping[str, Any],
+        key_sets: Optional[Mapping[str, Collection[Any]]] = None,
+    ):
+        """
+        Args:
+            schema: Compiled schema (see open_dateaubase.data_model.schema)
+            key_sets: Table -> existing keys, for foreign key checks (tables
+                without a key set are not checked; see load_keys)
+        """
+        self.schema = schema
+        self.value_sets = ValueSetValidator(schema)
+        self.key_sets: Dict[str, Set[Any]] = {
+            table_id: set(keys) for table_id, keys in (key_sets or {}).items()
+        }
+        # Table -> key column, for tables referenced by a foreign key
+        self.key_columns: Dict[str, str] = {}
+        self._checks: Dict[str, Callable[[Sequence[Mapping[str, Any]]], Violations]] = {}
+
+        for table_id, table_info in schema["tables"].items():
+            for field in table_info["fields"]:
+                target = key_table(schema, field["fk_to"]) if field["fk_to"] else None
+                if target:
+                    self.key_columns[target] = extract_field_name(field["fk_to"])
+
+    def check_function(
+        self, table_id: str
+    ) -> Callable[[Sequence[Mapping[str, Any]]], Violations]:
+        """
+        Return the compiled check function of a table.
+
+        Args:
+            table_id: Table Part_ID
+
+        Returns:
+            Function taking a batch of row dicts (keyed by column name) and
+            returning {(column, rule): violation bitmask} for failed rules
+
+        Raises:
+            KeyError: If the table is not in the dictionary
+        """
+        if table_id not in self._checks:
+            self._checks[table_id] = self._compile(table_id)
+        return self._checks[table_id]
+
+    def validate(self, table_id: str, rows: Sequence[Mapping[str, Any]]) -> Violations:
+        """
+        Check a batch of rows of a table.
+
+        Rules are 'required', 'type' (including string length), 'value_set'
+        and 'foreign_key'. NULL (None or missing) only violates 'required',
+        and not for columns with a default value.
+
+        Args:
+            table_id: Table Part_ID
+            rows: Row dicts keyed by column name
+
+        Returns:
+            {(column, rule): bitmask with bit i set if rows[i] fails the rule}
+        """
+        return self.check_function(table_id)(rows)
+
+    def split(
+        self, table_id: str, rows: Sequence[Mapping[str, Any]]
+    ) -> Tuple[List[Mapping[str, Any]], List[Mapping[str, Any]]]:
+        """
+        Separate the valid rows of a batch from the rejected ones.
+
+        Args:
+            table_id: Table Part_ID
+            rows: Row dicts keyed by column name
+
+        Returns:
+            (valid rows, rejected rows), each in input order
+        """
+        mask = 0
+        for violations in self.validate(table_id, rows).values():
+            mask |= violations
+        if not mask:
+            return list(rows), []
+        rejected = set(bitmask_rows(mask))
+        return (
+            [row for i, row in enumerate(rows) if i not in rejected],
+            [row for i, row in enumerate(rows) if i in rejected],
+        )
+
+    def load_keys(self, connection: Any, dialect: Optional[str] = None) -> None:
+        """
+        Cache the existing keys of every table referenced by a foreign key.
+
+        Args:
+            connection: DB-API connection
+            dialect: SQL dialect name (optional for sqlite3 connections)
+        """
+        quote = connection_dialect(connection, dialect)["quote"]
+        cursor = connection.cursor()
+        try:
+            for table_id, column in self.key_columns.items():
+                cursor.execute(f"SELECT {quote(column)} FROM {quote(table_id)}")
+                self.key_sets[table_id] = {row[0] for row in cursor.fetchall()}
+        finally:
+            cursor.close()
+
+    def add_keys(self, table_id: str, keys: Iterable[Any]) -> None:
+        """Record keys inserted since load_keys, so later batches may reference them."""
+        self.key_sets.setdefault(table_id, set()).update(keys)
+
+    def _compile(self, table_id: str) -> Callable[[Sequence[Mapping[str, Any]]], Violations]:
+        """Build the list of (column, rule, check) of a table and its check function."""
+        rules: List[Tuple[str, str, Callable[[Any], bool]]] = []
+        for field in self.schema["tables"][table_id]["fields"]:
+            column = extract_field_name(field["part_id"])
+            if field["is_required"] and not field["default_value"]:
+                rules.append((column, "required", lambda value: value is not None))
+
+            check = type_check(field["sql_data_type"] or "")
+            if check is not None:
+                rules.append((column, "type", _skip_null(check)))
+
+            if field["value_set"] in self.value_sets.members:
+                rules.append(
+                    (column, "value_set", partial(self.value_sets.is_member, field["value_set"]))
+                )
+
+            target = key_table(self.schema, field["fk_to"]) if field["fk_to"] else None
+            if target:
+                rules.append((column, "foreign_key", self._key_check(target)))
+
+        def check_rows(rows: Sequence[Mapping[str, Any]]) -> Violations:
+            violations = {}
+            for column, rule, ok in rules:
+                mask = rows_bitmask(
+                    i for i, row in enumerate(rows) if not ok(row.get(column))
+                )
+                if mask:
+                    violations[(column, rule)] = mask
+            return violations
+
+        return check_rows
+
+    def _key_check(self, table_id: str) -> Check:
+        """Check against the key set of a table, looked up at check time."""
+
+        def check(value: Any) -> bool:
+            keys = self.key_sets.get(table_id)
+            if value is None or keys is None or value in keys:
+                return True
+            # Keys read from text files arrive as strings
+            if isinstance(value, str) and value.strip().lstrip("-").isdigit():
+                return int(value) in keys
+            return False
+
+        return check
+
+
+def _skip_null(check: Check) -> Check:
+    return lambda value: value is None or check(value)
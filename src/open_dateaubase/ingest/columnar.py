@@ -0,0 +1,350 @@
+"""
+Columnar batches of value rows.
+
+``ValueBatch`` holds a batch of the ``value`` table as one NumPy array per
+column, with dtypes derived from the columns' SQL types in the dictionary,
+plus one boolean null mask per column (integer and datetime arrays cannot
+hold NULL themselves). Checks and conversions then run once per column
+instead of once per row.
+
+Requires the optional ``numpy`` dependency
+(``pip install "open-dateaubase[columnar]"``); Parquet conversion also
+requires ``pyarrow`` (``pip install "open-dateaubase[parquet]"``).
+
+Usage:
+    from open_dateaubase.ingest.columnar import ValueBatch
+
+    batch = ValueBatch.from_params(rows)       # tuples in BATCH_FIELDS order
+    bad = batch.null_mask("Timestamp", "Value") | batch.out_of_range("Value", 0, 14)
+    cursor.executemany(insert_sql, batch.filter(~bad).to_params())
+"""
+
+from functools import lru_cache
+from importlib.resources import files
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Mapping, Optional, Sequence, Tuple
+
+try:
+    import numpy as np
+except ImportError as e:
+    raise ImportError(
+        "Columnar batches require numpy: "
+        'pip install "open-dateaubase[columnar]"'
+    ) from e
+
+from open_dateaubase.data_model.schema import load_schema
+from open_dateaubase.sql.value_table import VALUE_TABLE
+
+# Columns held by a ValueBatch, in parameter order
+BATCH_FIELDS = ("Value_ID", "Metadata_ID", "Timestamp", "Value", "Number_of_experiment")
+
+# Base SQL type (lowercase, without size) -> NumPy dtype
+NUMPY_DTYPES = {
+    "bit": "bool",
+    "tinyint": "uint8",
+    "smallint": "int16",
+    "int": "int32",
+    "integer": "int32",
+    "bigint": "int64",
+    "real": "float32",
+    "float": "float64",
+    "double precision": "float64",
+    "date": "datetime64[D]",
+    "datetime": "datetime64[ms]",
+}
+
+# datetime2/datetimeoffset/timestamp fractional-second precision -> unit
+_TEMPORAL_UNITS = ((0, "s"), (3, "ms"), (6, "us"), (9, "ns"))
+_TEMPORAL_TYPES = ("datetime2", "datetimeoffset", "timestamp", "timestamptz")
+
+
+def numpy_dtype(sql_type: str, time_unit: Optional[str] = None) -> "np.dtype":
+    """
+    Map a SQL column type to the NumPy dtype of its column arrays.
+
+    Args:
+        sql_type: SQL data type from the dictionary (e.g. 'datetime2(3)')
+        time_unit: Time_unit of a bigint epoch column ('s', 'ms', 'us', 'ns')
+
+    Returns:
+        NumPy dtype (object for types without a native dtype, e.g. strings)
+    """
+    if time_unit:
+        return np.dtype(f"datetime64[{time_unit}]")
+
+    base = sql_type.split("(")[0].strip().lower()
+    size = sql_type[sql_type.index("(") + 1 : sql_type.rindex(")")] if "(" in sql_type else ""
+
+    if base in _TEMPORAL_TYPES:
+        precision = int(size) if size else 7
+        unit = next(u for digits, u in _TEMPORAL_UNITS if precision <= digits)
+        return np.dtype(f"datetime64[{unit}]")
+    if base in ("numeric", "decimal"):
+        precision, _, scale = size.partition(",")
+        if not scale.strip() or int(scale) == 0:
+            return np.dtype("int64" if not precision or int(precision) <= 18 else "object")
+        return np.dtype("float64")
+    return np.dtype(NUMPY_DTYPES.get(base, "object"))
+
+
+@lru_cache(maxsize=None)
+def value_dtypes(json_path: Optional[str] = None) -> Dict[str, "np.dtype"]:
+    """
+    Return the dtype of each batch column from the 'value' table definition.
+
+    Args:
+        json_path: Dictionary to read (defaults to the packaged dictionary)
+
+    Returns:
+        Dict of field name -> dtype, in BATCH_FIELDS order
+    """
+    path = json_path or files("open_dateaubase").joinpath("dictionary.json")
+    fields = {f["part_id"]: f for f in load_schema(path)["tables"][VALUE_TABLE]["fields"]}
+    return {
+        name: numpy_dtype(fields[name]["sql_data_type"], fields[name]["time_unit"])
+        for name in BATCH_FIELDS
+    }
+
+
+def _column(values: Sequence[Any], dtype: "np.dtype") -> Tuple["np.ndarray", "np.ndarray"]:
+    """Convert a sequence with None for NULL into (values, null mask)."""
+    nulls = np.fromiter((v is None for v in values), dtype=bool, count=len(values))
+    if nulls.any():
+        fill = None if dtype.kind == "O" else np.zeros((), dtype=dtype).item()
+        values = [fill if null else v for v, null in zip(values, nulls)]
+    return np.asarray(values, dtype=dtype), nulls
+
+
+class ValueBatch:
+    """A batch of value rows stored as one array (and null mask) per column."""
+
+    __slots__ = ("columns", "nulls")
+
+    def __init__(
+        self,
+        columns: Mapping[str, "np.ndarray"],
+        nulls: Optional[Mapping[str, "np.ndarray"]] = None,
+    ):
+        """
+        Args:
+            columns: Field -> array for every field of BATCH_FIELDS
+            nulls: Field -> boolean mask, True where the value is NULL
+                (defaults to no NULLs)
+
+        Raises:
+            ValueError: If a field is missing or the arrays differ in length
+        """
+        missing = [f for f in BATCH_FIELDS if f not in columns]
+        if missing:
+            raise ValueError(f"Missing batch columns: {missing}")
+        lengths = {len(columns[f]) for f in BATCH_FIELDS}
+        if len(lengths) > 1:
+            raise ValueError(f"Batch columns differ in length: {sorted(lengths)}")
+
+        size = lengths.pop()
+        nulls = nulls or {}
+        self.columns = {f: columns[f] for f in BATCH_FIELDS}
+        self.nulls = {
+            f: nulls[f] if f in nulls else np.zeros(size, dtype=bool)
+            for f in BATCH_FIELDS
+        }
+
+    def __len__(self) -> int:
+        return len(self.columns[BATCH_FIELDS[0]])
+
+    @classmethod
+    def from_params(
+        cls,
+        rows: Sequence[Sequence[Any]],
+        dtypes: Optional[Mapping[str, "np.dtype"]] = None,
+    ) -> "ValueBatch":
+        """
+        Build a batch from parameter tuples in BATCH_FIELDS order.
+
+        Args:
+            rows: Row tuples (None for NULL); timestamps may be datetimes or
+                ISO 8601 strings
+            dtypes: Column dtypes (defaults to value_dtypes())
+
+        Returns:
+            ValueBatch
+        """
+        dtypes = dtypes or value_dtypes()
+        transposed = list(zip(*rows)) if rows else [()] * len(BATCH_FIELDS)
+        columns = {}
+        nulls = {}
+        for field, values in zip(BATCH_FIELDS, transposed):
+            columns[field], nulls[field] = _column(values, dtypes[field])
+        return cls(columns, nulls)
+
+    def to_params(self, text_timestamps: bool = False) -> List[Tuple[Any, ...]]:
+        """
+        Return the rows as parameter tuples in BATCH_FIELDS order.
+
+        Each column is converted to Python values in one call; NULLs become
+        None and timestamps become datetime objects.
+
+        Args:
+            text_timestamps: Render timestamps as 'YYYY-MM-DD HH:MM:SS.fff'
+                strings instead (for SQLite, which stores them as TEXT)
+
+        Returns:
+            List of row tuples for executemany
+        """
+        values = []
+        for field in BATCH_FIELDS:
+            column = self.columns[field]
+            if text_timestamps and column.dtype.kind == "M":
+                column = np.char.replace(np.datetime_as_string(column), "T", " ")
+            column = column.tolist()
+            nulls = self.nulls[field]
+            if nulls.any():
+                for i in np.flatnonzero(nulls).tolist():
+                    column[i] = None
+            values.append(column)
+        return list(zip(*values))
+
+    def filter(self, mask: "np.ndarray") -> "ValueBatch":
+        """
+        Return the rows selected by a boolean mask.
+
+        Args:
+            mask: Boolean array, True for rows to keep
+
+        Returns:
+            New ValueBatch
+        """
+        return ValueBatch(
+            {f: a[mask] for f, a in self.columns.items()},
+            {f: n[mask] for f, n in self.nulls.items()},
+        )
+
+    def null_mask(self, *fields: str) -> "np.ndarray":
+        """
+        Return a mask of the rows with a NULL in any of the given fields.
+
+        Args:
+            *fields: Fields to check (defaults to all)
+
+        Returns:
+            Boolean array, True where a value is NULL
+        """
+        mask = np.zeros(len(self), dtype=bool)
+        for field in fields or BATCH_FIELDS:
+            mask |= self.nulls[field]
+        return mask
+
+    def out_of_range(
+        self, field: str, minimum: Any = None, maximum: Any = None
+    ) -> "np.ndarray":
+        """
+        Return a mask of the rows whose non-NULL value lies outside [minimum, maximum].
+
+        Args:
+            field: Field to check
+            minimum: Smallest allowed value (None for no lower bound)
+            maximum: Largest allowed value (None for no upper bound)
+
+        Returns:
+            Boolean array, True where the value is out of range
+        """
+        column = self.columns[field]
+        mask = np.zeros(len(self), dtype=bool)
+        if minimum is not None:
+            mask |= column < np.asarray(minimum, dtype=column.dtype)
+        if maximum is not None:
+            mask |= column > np.asarray(maximum, dtype=column.dtype)
+        return mask & ~self.nulls[field]
+
+    def to_arrow(self):
+        """
+        Convert the batch to a pyarrow Table (NULLs become Arrow nulls).
+
+        Raises:
+            ImportError: If pyarrow is not installed
+        """
+        pa = _import_pyarrow()
+        return pa.table(
+            {
+                f: pa.array(self.columns[f], mask=self.nulls[f])
+                for f in BATCH_FIELDS
+            }
+        )
+
+    @classmethod
+    def from_arrow(
+        cls, table, dtypes: Optional[Mapping[str, "np.dtype"]] = None
+    ) -> "ValueBatch":
+        """
+        Build a batch from a pyarrow Table or RecordBatch with BATCH_FIELDS columns.
+
+        Args:
+            table: pyarrow Table or RecordBatch
+            dtypes: Column dtypes (defaults to value_dtypes())
+
+        Returns:
+            ValueBatch
+        """
+        pa = _import_pyarrow()
+        dtypes = dtypes or value_dtypes()
+        columns = {}
+        nulls = {}
+        for field in BATCH_FIELDS:
+            column = table.column(field)
+            nulls[field] = np.asarray(column.is_null(), dtype=bool)
+            if nulls[field].any() and dtypes[field].kind != "O":
+                column = column.fill_null(pa.scalar(0).cast(column.type))
+            columns[field] = np.asarray(column).astype(dtypes[field], copy=False)
+        return cls(columns, nulls)
+
+    def write_parquet(self, path: str | Path) -> None:
+        """
+        Write the batch to a Parquet file.
+
+        Args:
+            path: Output file path
+
+        Raises:
+            ImportError: If pyarrow is not installed
+        """
+        import pyarrow.parquet as pq
+
+        pq.write_table(self.to_arrow(), path)
+
+    @classmethod
+    def read_parquet(
+        cls, path: str | Path, batch_size: int = 100_000
+    ) -> Iterator["ValueBatch"]:
+        """
+        Stream a Parquet file with BATCH_FIELDS columns as batches.
+
+        Args:
+            path: Path to the file
+            batch_size: Maximum number of rows per batch
+
+        Yields:
+            ValueBatch per Parquet record batch
+
+        Raises:
+            ImportError: If pyarrow is not installed
+        """
+        _import_pyarrow()
+        import pyarrow.parquet as pq
+
+        parquet_file = pq.ParquetFile(path)
+        for record_batch in parquet_file.iter_batches(
+            batch_size=batch_size, columns=list(BATCH_FIELDS)
+        ):
+            yield cls.from_arrow(record_batch)
+
+
+def _import_pyarrow():
+    """Import pyarrow, with an install hint if it is missing."""
+    try:
+        import pyarrow
+    except ImportError as e:
+        raise ImportError(
+            "Parquet conversion requires pyarrow: "
+            'pip install "open-dateaubase[parquet]"'
+        ) from e
+    return pyarrow
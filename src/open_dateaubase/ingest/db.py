@@ -0,0 +1,33 @@
+"""
+DB-API helpers shared by the ingestion components.
+
+The as-designed schema declares plain integer keys (no IDENTITY or sequence),
+so loaders allocate keys themselves, starting after the current maximum.
+This assumes a single loader writes to a table at a time.
+
+The placeholder and dialect helpers live in open_dateaubase.sql.connection.
+"""
+
+from typing import Any
+
+
+def next_key(connection: Any, table: str, key_field: str, quote) -> int:
+    """
+    Return the first unused integer key of a table (current maximum + 1).
+
+    Args:
+        connection: DB-API connection
+        table: Table name
+        key_field: Integer key column
+        quote: Identifier quoting function of the dialect
+
+    Returns:
+        Next free key
+    """
+    cursor = connection.cursor()
+    try:
+        cursor.execute(f"SELECT MAX({quote(key_field)}) FROM {quote(table)}")
+        (current,) = cursor.fetchone()
+    finally:
+        cursor.close()
+    return (current or 0) + 1
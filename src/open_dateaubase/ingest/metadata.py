@@ -0,0 +1,263 @@
+"""
+Resolution of metadata combinations to Metadata_IDs.
+
+Each row of the ``metadata`` table is a unique combination of the IDs that
+give a value its context (equipment, parameter, unit, sampling point, ...).
+``MetadataResolver`` maps such a combination to its Metadata_ID, creating a
+new metadata row the first time a combination is seen. During ingestion the
+same few combinations repeat for millions of rows, so answers are cached in
+memory and the database is only queried for combinations it has not seen.
+
+Usage:
+    from open_dateaubase.ingest.metadata import MetadataResolver
+
+    resolver = MetadataResolver(connection)
+    metadata_id = resolver.resolve(resolver.key({"Equipment_ID": 3, "Unit_ID": 1}))
+    resolver.flush()  # Insert new combinations
+    connection.commit()
+"""
+
+from collections import OrderedDict
+from functools import lru_cache
+from importlib.resources import files
+from typing import Any, Dict, List, Mapping, Optional, Sequence, Tuple
+
+from open_dateaubase.data_model.schema import load_schema
+from open_dateaubase.sql.connection import connection_dialect, placeholder
+from .db import next_key
+
+METADATA_TABLE = "metadata"
+METADATA_ID = "Metadata_ID"
+
+Combination = Tuple[Optional[int], ...]
+
+
+@lru_cache(maxsize=None)
+def metadata_key_fields(json_path: Optional[str] = None) -> Tuple[str, ...]:
+    """
+    Return the fields that make up a metadata combination, in table order.
+
+    These are the non-key columns of the 'metadata' table in the dictionary.
+
+    Args:
+        json_path: Dictionary to read (defaults to the packaged dictionary)
+
+    Returns:
+        Tuple of field names
+    """
+    path = json_path or files("open_dateaubase").joinpath("dictionary.json")
+    fields = load_schema(path)["tables"][METADATA_TABLE]["fields"]
+    return tuple(f["part_id"] for f in fields if f["part_type"] != "key")
+
+
+class MetadataResolver:
+    """Resolve metadata combinations to Metadata_IDs, creating missing rows.
+
+    Resolved combinations are kept in a bounded LRU cache, preloaded with the
+    most recent rows of the metadata table. While the cache holds the whole
+    table, a cache miss is known to be a new combination and costs no query;
+    once rows have been evicted, misses fall back to a SELECT.
+
+    New combinations get their Metadata_ID immediately but are inserted in
+    batches: ``flush()`` (called automatically every ``insert_batch_size``
+    new rows, and by the ingestion pipeline before each value batch) writes
+    them with a single ``executemany``. The resolver does not commit: call
+    ``mark_committed()`` after the transaction holding those inserts is
+    committed, or ``discard_uncommitted()`` after it is rolled back so that
+    the cache forgets the IDs that never reached the database.
+    """
+
+    def __init__(
+        self,
+        connection: Any,
+        dialect: Optional[str] = None,
+        key_fields: Optional[Sequence[str]] = None,
+        cache_size: int = 100_000,
+        insert_batch_size: int = 1_000,
+        preload: bool = True,
+    ):
+        """
+        Args:
+            connection: DB-API connection to a database with a metadata table
+            dialect: SQL dialect name (optional for sqlite3 connections)
+            key_fields: Fields of a combination (defaults to metadata_key_fields())
+            cache_size: Maximum number of cached combinations
+            insert_batch_size: Number of new combinations inserted per batch
+            preload: Load existing metadata rows into the cache
+        """
+        if cache_size < 1 or insert_batch_size < 1:
+            raise ValueError("cache_size and insert_batch_size must be positive")
+
+        self.connection = connection
+        self.key_fields = tuple(key_fields or metadata_key_fields())
+        self.cache_size = cache_size
+        self.insert_batch_size = insert_batch_size
+        self._quote = connection_dialect(connection, dialect)["quote"]
+        self._placeholder = placeholder(connection)
+        self._cache: OrderedDict[Combination, int] = OrderedDict()
+        self._pending: Dict[Combination, int] = {}  # Created, not yet inserted
+        self._uncommitted: List[Combination] = []  # Created since mark_committed()
+        self._next_id: Optional[int] = None
+        # True while the cache holds every row of the metadata table
+        self._complete = False
+
+        self.hits = 0
+        self.misses = 0
+        self.created = 0
+
+        if preload:
+            self.preload()
+
+    def __len__(self) -> int:
+        return len(self._cache)
+
+    def key(self, values: Mapping[str, Any]) -> Combination:
+        """Build a combination from a mapping of field -> ID (missing -> None)."""
+        return tuple(
+            None if values.get(f) in (None, "") else int(values[f])
+            for f in self.key_fields
+        )
+
+    def preload(self) -> int:
+        """
+        Fill the cache with the most recent metadata rows.
+
+        Returns:
+            Number of rows loaded
+        """
+        quote = self._quote
+        columns = ", ".join(quote(c) for c in (METADATA_ID, *self.key_fields))
+        cursor = self.connection.cursor()
+        try:
+            cursor.execute(
+                f"SELECT {columns} FROM {quote(METADATA_TABLE)} "
+                f"ORDER BY {quote(METADATA_ID)} DESC"
+            )
+            rows = cursor.fetchmany(self.cache_size)
+            truncated = bool(cursor.fetchmany(1))
+        finally:
+            cursor.close()
+
+        # Oldest first, so the most recent rows are the last to be evicted
+        self._cache.clear()
+        for row in reversed(rows):
+            self._cache[tuple(row[1:])] = row[0]
+        self._complete = not truncated
+        return len(rows)
+
+    def resolve(self, combination: Combination) -> int:
+        """
+        Return the Metadata_ID of a combination, creating the row if needed.
+
+        Args:
+            combination: IDs in key_fields order (None for unset fields)
+
+        Returns:
+            Metadata_ID
+        """
+        metadata_id = self._cache.get(combination)
+        if metadata_id is not None:
+            self._cache.move_to_end(combination)
+            self.hits += 1
+            return metadata_id
+
+        self.misses += 1
+        metadata_id = self._pending.get(combination)
+        if metadata_id is None and not self._complete:
+            metadata_id = self._select(combination)
+        if metadata_id is None:
+            metadata_id = self._create(combination)
+
+        self._cache[combination] = metadata_id
+        if len(self._cache) > self.cache_size:
+            self._cache.popitem(last=False)
+            self._complete = False
+        return metadata_id
+
+    def flush(self) -> int:
+        """
+        Insert the pending new combinations.
+
+        Returns:
+            Number of rows inserted
+        """
+        if not self._pending:
+            return 0
+
+        columns = (METADATA_ID, *self.key_fields)
+        rows = [(metadata_id, *c) for c, metadata_id in self._pending.items()]
+        cursor = self.connection.cursor()
+        try:
+            cursor.executemany(
+                f"INSERT INTO {self._quote(METADATA_TABLE)} "
+                f"({', '.join(self._quote(c) for c in columns)}) "
+                f"VALUES ({', '.join([self._placeholder] * len(columns))})",
+                rows,
+            )
+        finally:
+            cursor.close()
+        self._pending.clear()
+        return len(rows)
+
+    def mark_committed(self) -> None:
+        """Record that the combinations created so far are committed."""
+        self._uncommitted.clear()
+
+    def discard_uncommitted(self) -> int:
+        """
+        Forget the combinations created since the last mark_committed().
+
+        Call this after rolling back the transaction that inserted them, so
+        that they are not resolved to IDs missing from the database.
+
+        Returns:
+            Number of combinations discarded
+        """
+        for combination in self._uncommitted:
+            self._cache.pop(combination, None)
+        discarded = len(self._uncommitted)
+        self._uncommitted.clear()
+        self._pending.clear()
+        # Rolled-back keys may be reused; read the maximum again
+        self._next_id = None
+        return discarded
+
+    def _select(self, combination: Combination) -> Optional[int]:
+        """Look up an existing metadata row."""
+        quote = self._quote
+        conditions = []
+        params = []
+        for field, value in zip(self.key_fields, combination):
+            if value is None:
+                conditions.append(f"{quote(field)} IS NULL")
+            else:
+                conditions.append(f"{quote(field)} = {self._placeholder}")
+                params.append(value)
+
+        cursor = self.connection.cursor()
+        try:
+            cursor.execute(
+                f"SELECT {quote(METADATA_ID)} FROM {quote(METADATA_TABLE)} "
+                f"WHERE {' AND '.join(conditions)}",
+                params,
+            )
+            row = cursor.fetchone()
+        finally:
+            cursor.close()
+        return row[0] if row else None
+
+    def _create(self, combination: Combination) -> int:
+        """Allocate a Metadata_ID for a new combination and queue its insert."""
+        if self._next_id is None:
+            self._next_id = next_key(
+                self.connection, METADATA_TABLE, METADATA_ID, self._quote
+            )
+        metadata_id = self._next_id
+        self._next_id += 1
+
+        self._pending[combination] = metadata_id
+        self._uncommitted.append(combination)
+        self.created += 1
+        if len(self._pending) >= self.insert_batch_size:
+            self.flush()
+        return metadata_id
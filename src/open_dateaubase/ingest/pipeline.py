@@ -0,0 +1,355 @@
+"""
+Bulk loading of time-series values into the value table.
+
+``ingest`` streams a sensor export (CSV/TSV or Parquet, see
+``open_dateaubase.ingest.readers``) into a database:
+
+1. A reader thread parses the file in chunks into a bounded queue. When the
+   database falls behind, the queue fills up and the reader blocks
+   (backpressure), so memory stays bounded whatever the file size.
+2. The calling thread resolves each row's metadata combination to a
+   Metadata_ID through ``MetadataResolver`` (cached) and buffers value rows.
+3. ``ValueWriter`` inserts the new metadata rows and then the buffered value
+   rows with one ``executemany`` each per batch, and commits each batch. If
+   a batch fails it is rolled back, and the resolver forgets the metadata
+   rows created since the last commit.
+
+All database work happens on the calling thread, so any DB-API connection
+(including sqlite3's thread-bound connections) can be used.
+
+Usage:
+    import sqlite3
+    from open_dateaubase.ingest.pipeline import ingest
+
+    connection = sqlite3.connect("dateaubase.db")
+    report = ingest(
+        "export.csv",
+        connection,
+        metadata={"Equipment_ID": 3, "Parameter_ID": 7, "Unit_ID": 2},
+        column_map={"Timestamp": "time", "Value": "NH4"},
+    )
+    print(report)
+"""
+
+import queue
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable, Iterable, List, Mapping, Optional, Tuple
+
+from open_dateaubase.sql.connection import connection_dialect, placeholder
+from open_dateaubase.sql.value_table import VALUE_TABLE, format_timestamp
+from .db import next_key
+from .metadata import MetadataResolver
+from .readers import Chunk, read_chunks
+
+VALUE_ID = "Value_ID"
+# Columns written for each value, after the allocated Value_ID
+VALUE_FIELDS = ("Metadata_ID", "Timestamp", "Value", "Number_of_experiment", "Comment_ID")
+
+_DONE = object()  # End-of-stream marker on the chunk queue
+
+
+@dataclass
+class IngestReport:
+    """Counters of an ingestion run."""
+
+    rows_read: int = 0
+    rows_written: int = 0
+    rows_rejected: int = 0
+    batches: int = 0
+    elapsed: float = 0.0
+
+    @property
+    def rows_per_second(self) -> float:
+        """Write throughput over the run so far."""
+        return self.rows_written / self.elapsed if self.elapsed else 0.0
+
+    def __str__(self) -> str:
+        return (
+            f"Ingested {self.rows_written} rows in {self.elapsed:.2f}s "
+            f"({self.rows_per_second:,.0f} rows/s, {self.batches} batches, "
+            f"{self.rows_rejected} rejected)"
+        )
+
+
+class ValueWriter:
+    """Buffers value rows and inserts them in batches."""
+
+    def __init__(
+        self,
+        connection: Any,
+        dialect: Optional[str] = None,
+        batch_size: int = 10_000,
+        before_flush: Optional[Callable[[], Any]] = None,
+        after_commit: Optional[Callable[[], Any]] = None,
+    ):
+        """
+        Args:
+            connection: DB-API connection to a database with a value table
+            dialect: SQL dialect name (optional for sqlite3 connections)
+            batch_size: Number of rows per INSERT batch (and transaction)
+            before_flush: Called before each batch is inserted, inside its
+                transaction (e.g. MetadataResolver.flush, so that the
+                metadata rows a batch references exist)
+            after_commit: Called once a batch is committed (e.g.
+                MetadataResolver.mark_committed)
+        """
+        if batch_size < 1:
+            raise ValueError(f"batch_size must be positive, got {batch_size}")
+
+        self.connection = connection
+        self.batch_size = batch_size
+        self.before_flush = before_flush
+        self.after_commit = after_commit
+        self._quote = connection_dialect(connection, dialect)["quote"]
+        self._rows: List[Tuple[Any, ...]] = []
+        self._next_id: Optional[int] = None
+
+        columns = (VALUE_ID, *VALUE_FIELDS)
+        self._sql = (
+            f"INSERT INTO {self._quote(VALUE_TABLE)} "
+            f"({', '.join(self._quote(c) for c in columns)}) "
+            f"VALUES ({', '.join([placeholder(connection)] * len(columns))})"
+        )
+
+    def write(self, row: Tuple[Any, ...]) -> int:
+        """
+        Buffer one row (values in VALUE_FIELDS order), flushing full batches.
+
+        Returns:
+            Number of rows written to the database by this call
+        """
+        self._rows.append(row)
+        if len(self._rows) >= self.batch_size:
+            return self.flush()
+        return 0
+
+    def flush(self) -> int:
+        """
+        Insert and commit the buffered rows.
+
+        If the insert fails, the transaction is rolled back, the buffered
+        rows are dropped and the error is raised.
+
+        Returns:
+            Number of rows written
+        """
+        if not self._rows:
+            return 0
+
+        if self._next_id is None:
+            self._next_id = next_key(self.connection, VALUE_TABLE, VALUE_ID, self._quote)
+        first_id = self._next_id
+        rows = [(first_id + i, *row) for i, row in enumerate(self._rows)]
+
+        try:
+            if self.before_flush is not None:
+                self.before_flush()
+
+            cursor = self.connection.cursor()
+            try:
+                cursor.executemany(self._sql, rows)
+            finally:
+                cursor.close()
+            self.connection.commit()
+        except BaseException:
+            self.connection.rollback()
+            self._next_id = None
+            self._rows = []
+            raise
+
+        if self.after_commit is not None:
+            self.after_commit()
+        self._next_id += len(rows)
+        self._rows = []
+        return len(rows)
+
+
+def _to_float(value: Any) -> Optional[float]:
+    if value is None or value == "":
+        return None
+    return float(value)
+
+
+def _to_int(value: Any) -> Optional[int]:
+    if value is None or value == "":
+        return None
+    return int(value)
+
+
+def _put(chunks: queue.Queue, item: Any, stop: threading.Event) -> bool:
+    """Put an item, waiting while the queue is full unless asked to stop."""
+    while not stop.is_set():
+        try:
+            chunks.put(item, timeout=0.1)
+            return True
+        except queue.Full:
+            continue
+    return False
+
+
+def _produce(source: Iterable[Chunk], chunks: queue.Queue, stop: threading.Event) -> None:
+    """Reader thread: move chunks from the source into the bounded queue."""
+    try:
+        for chunk in source:
+            if not _put(chunks, chunk, stop):
+                return
+        _put(chunks, _DONE, stop)
+    except BaseException as e:
+        _put(chunks, e, stop)
+
+
+def ingest(
+    source: str | Path | Iterable[Chunk],
+    connection: Any,
+    *,
+    dialect: Optional[str] = None,
+    metadata: Optional[Mapping[str, Any]] = None,
+    column_map: Optional[Mapping[str, str]] = None,
+    batch_size: int = 10_000,
+    max_pending_chunks: int = 4,
+    resolver: Optional[MetadataResolver] = None,
+    parse_timestamp: Callable[[Any], Optional[str]] = format_timestamp,
+    progress: Optional[Callable[[IngestReport], None]] = None,
+) -> IngestReport:
+    """
+    Load a sensor export into the value table.
+
+    Each source row provides a timestamp and a value, plus any metadata fields
+    (Equipment_ID, Parameter_ID, ...) that vary within the file. Fields that
+    are constant for the file are passed as ``metadata``. Rows without a
+    timestamp or value, or with unparsable timestamps or numbers, are counted
+    as rejected.
+
+    If writing fails, the current batch is rolled back, along with the
+    metadata rows created for it, and the error is raised; earlier batches
+    stay committed.
+
+    Args:
+        source: Path to a CSV/TSV/Parquet file, or an iterable of row chunks
+        connection: DB-API connection to a database created from the dictionary
+        dialect: SQL dialect name (optional for sqlite3 connections)
+        metadata: Metadata field -> ID applied to every row (source
+            columns for these fields are ignored)
+        column_map: Dictionary field -> source column, for fields whose source
+            column is named differently (e.g. {"Timestamp": "time"})
+        batch_size: Rows per INSERT batch and transaction (also the read chunk size)
+        max_pending_chunks: Parsed chunks buffered ahead of the database
+            before the reader blocks
+        resolver: Metadata resolver to use (defaults to a new MetadataResolver)
+        parse_timestamp: Converts a source timestamp to the stored value
+        progress: Called with the running report after every batch
+
+    Returns:
+        IngestReport with row counts and throughput
+    """
+    if max_pending_chunks < 1:
+        raise ValueError(f"max_pending_chunks must be positive, got {max_pending_chunks}")
+
+    if isinstance(source, (str, Path)):
+        source = read_chunks(source, chunk_size=batch_size)
+
+    if resolver is None:  # An empty resolver is falsy (see __len__)
+        resolver = MetadataResolver(connection, dialect=dialect)
+    writer = ValueWriter(
+        connection,
+        dialect=dialect,
+        batch_size=batch_size,
+        before_flush=resolver.flush,
+        after_commit=resolver.mark_committed,
+    )
+    column_map = dict(column_map or {})
+    constants = dict(metadata or {})
+
+    def column(field: str) -> str:
+        return column_map.get(field, field)
+
+    timestamp_column = column("Timestamp")
+    value_column = column("Value")
+    experiment_column = column("Number_of_experiment")
+    comment_column = column("Comment_ID")
+
+    # Combination template holding the constants; row values fill the rest
+    template = resolver.key(constants)
+    metadata_columns = [
+        (position, column(field))
+        for position, field in enumerate(resolver.key_fields)
+        if field not in constants
+    ]
+
+    report = IngestReport()
+    started = time.perf_counter()
+
+    def record(written: int) -> None:
+        if written:
+            report.rows_written += written
+            report.batches += 1
+            report.elapsed = time.perf_counter() - started
+            if progress is not None:
+                progress(report)
+
+    chunks: queue.Queue = queue.Queue(maxsize=max_pending_chunks)
+    stop = threading.Event()
+    reader = threading.Thread(
+        target=_produce, args=(source, chunks, stop), name="ingest-reader", daemon=True
+    )
+    reader.start()
+
+    try:
+        while True:
+            chunk = chunks.get()
+            if chunk is _DONE:
+                break
+            if isinstance(chunk, BaseException):
+                raise chunk
+
+            # Only look up the metadata columns the source actually has
+            present = chunk[0].keys() if chunk else ()
+            row_columns = [(i, name) for i, name in metadata_columns if name in present]
+
+            for row in chunk:
+                report.rows_read += 1
+                try:
+                    timestamp = parse_timestamp(row.get(timestamp_column))
+                    value = _to_float(row.get(value_column))
+                    if timestamp is None or value is None:
+                        report.rows_rejected += 1
+                        continue
+
+                    key = template
+                    if row_columns:
+                        key_values = list(template)
+                        for position, name in row_columns:
+                            key_values[position] = _to_int(row.get(name))
+                        key = tuple(key_values)
+
+                    value_row = (
+                        resolver.resolve(key),
+                        timestamp,
+                        value,
+                        _to_int(row.get(experiment_column)),
+                        _to_int(row.get(comment_column)),
+                    )
+                except (TypeError, ValueError):
+                    report.rows_rejected += 1
+                    continue
+
+                record(writer.write(value_row))
+
+        record(writer.flush())
+        if resolver.flush():
+            connection.commit()
+            resolver.mark_committed()
+    except BaseException:
+        # Metadata rows may have been inserted outside a value batch
+        connection.rollback()
+        resolver.discard_uncommitted()
+        raise
+    finally:
+        stop.set()
+        reader.join(timeout=1.0)
+
+    report.elapsed = time.perf_counter() - started
+    return report
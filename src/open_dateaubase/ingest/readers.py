@@ -0,0 +1,102 @@
+"""
+Chunked readers for sensor exports.
+
+Readers yield lists of row dicts (column name -> value) of at most
+``chunk_size`` rows, so files of any size are streamed with bounded memory.
+CSV is read with the standard library; Parquet requires the optional
+``pyarrow`` dependency (``pip install "open-dateaubase[parquet]"``).
+
+Usage:
+    from open_dateaubase.ingest.readers import read_chunks
+
+    for chunk in read_chunks("export.csv", chunk_size=10_000):
+        ...
+"""
+
+import csv
+from itertools import islice
+from pathlib import Path
+from typing import Any, Dict, Iterator, List
+
+Chunk = List[Dict[str, Any]]
+
+CSV_SUFFIXES = {".csv": ",", ".tsv": "\t", ".txt": ","}
+PARQUET_SUFFIXES = (".parquet", ".pq")
+
+
+def read_csv_chunks(
+    path: str | Path,
+    chunk_size: int = 10_000,
+    delimiter: str = ",",
+    encoding: str = "utf-8",
+) -> Iterator[Chunk]:
+    """
+    Stream a delimited text file with a header row in chunks.
+
+    Args:
+        path: Path to the file
+        chunk_size: Maximum number of rows per chunk
+        delimiter: Field delimiter
+        encoding: File encoding
+
+    Yields:
+        Lists of row dicts (all values are strings)
+    """
+    with open(path, newline="", encoding=encoding) as f:
+        reader = csv.DictReader(f, delimiter=delimiter)
+        while chunk := list(islice(reader, chunk_size)):
+            yield chunk
+
+
+def read_parquet_chunks(path: str | Path, chunk_size: int = 10_000) -> Iterator[Chunk]:
+    """
+    Stream a Parquet file in chunks (one record batch at a time).
+
+    Args:
+        path: Path to the file
+        chunk_size: Maximum number of rows per chunk
+
+    Yields:
+        Lists of row dicts with Python values
+
+    Raises:
+        ImportError: If pyarrow is not installed
+    """
+    try:
+        import pyarrow.parquet as pq
+    except ImportError as e:
+        raise ImportError(
+            "Reading Parquet files requires pyarrow: "
+            'pip install "open-dateaubase[parquet]"'
+        ) from e
+
+    parquet_file = pq.ParquetFile(path)
+    for batch in parquet_file.iter_batches(batch_size=chunk_size):
+        yield batch.to_pylist()
+
+
+def read_chunks(path: str | Path, chunk_size: int = 10_000, **kwargs) -> Iterator[Chunk]:
+    """
+    Stream a CSV/TSV or Parquet file in chunks, chosen by file suffix.
+
+    Args:
+        path: Path to the file
+        chunk_size: Maximum number of rows per chunk
+        **kwargs: Passed to the CSV reader (delimiter, encoding)
+
+    Yields:
+        Lists of row dicts
+
+    Raises:
+        ValueError: If the file type is not supported
+    """
+    suffix = Path(path).suffix.lower()
+    if suffix in PARQUET_SUFFIXES:
+        return read_parquet_chunks(path, chunk_size)
+    if suffix in CSV_SUFFIXES:
+        kwargs.setdefault("delimiter", CSV_SUFFIXES[suffix])
+        return read_csv_chunks(path, chunk_size, **kwargs)
+    raise ValueError(
+        f"Unsupported file type: {suffix or path}. "
+        f"Supported: {sorted([*CSV_SUFFIXES, *PARQUET_SUFFIXES])}"
+    )
@@ -0,0 +1,388 @@
+"""
+Copy tables between databases in foreign key dependency order.
+
+``copy_tables`` moves the rows of a set of tables (by default every table of
+the dictionary) from one database to another, e.g. to migrate a site to a
+new server. Tables are scheduled on the foreign key graph (see
+``open_dateaubase.data_model.graph``): a table starts as soon as every table
+it references has been copied, so independent tables (``contact``, ``unit``,
+``purpose``, ``watershed``, ...) are copied concurrently while dependent ones
+(``site`` -> ``sampling_points`` -> ``metadata`` -> ``value``) wait for their
+parents.
+
+Each worker thread opens its own source and target connections through the
+given factories, on first use and from the thread that uses them, so
+thread-bound drivers (sqlite3) work as well. Rows are read with
+``fetchmany`` and written with one ``executemany`` per batch, and every
+batch is committed. Keys are copied as-is, so the target tables should be
+empty; ``truncate=True`` deletes their rows first, referencing tables first.
+
+Rows are read in primary key order, which inserts the parents of
+self-referencing rows (parent keys) first as long as parents have lower keys.
+
+Usage:
+    import sqlite3
+    from open_dateaubase.ingest.transfer import copy_tables
+
+    report = copy_tables(
+        lambda: sqlite3.connect("old_site.db"),
+        lambda: sqlite3.connect("new_site.db"),
+        max_workers=4,
+    )
+    print(report)
+"""
+
+import queue
+import threading
+import time
+from dataclasses import dataclass, field
+from importlib.resources import files
+from typing import Any, Callable, Dict, Iterable, List, Mapping, Optional, Set
+
+from open_dateaubase.data_model.graph import ForeignKeyGraph
+from open_dateaubase.data_model.schema import extract_field_name, load_schema
+from open_dateaubase.sql.connection import connection_dialect, placeholder
+
+_DONE = object()  # Stop marker on the task queue
+
+Connect = Callable[[], Any]
+
+
+@dataclass
+class CopyReport:
+    """Counters of a copy run."""
+
+    rows: Dict[str, int] = field(default_factory=dict)
+    deleted: Dict[str, int] = field(default_factory=dict)
+    elapsed: float = 0.0
+
+    @property
+    def rows_copied(self) -> int:
+        """Rows copied over all tables."""
+        return sum(self.rows.values())
+
+    def __str__(self) -> str:
+        return (
+            f"Copied {self.rows_copied} rows from {len(self.rows)} tables "
+            f"in {self.elapsed:.2f}s"
+        )
+
+
+class _WorkerConnections:
+    """Source and target connections of one worker thread, opened lazily."""
+
+    def __init__(self, connect_source: Optional[Connect], connect_target: Connect):
+        self._connect_source = connect_source
+        self._connect_target = connect_target
+        self._source = None
+        self._target = None
+
+    @property
+    def source(self) -> Any:
+        if self._source is None:
+            self._source = self._connect_source()
+        return self._source
+
+    @property
+    def target(self) -> Any:
+        if self._target is None:
+            self._target = self._connect_target()
+        return self._target
+
+    def close(self) -> None:
+        for connection in (self._source, self._target):
+            if connection is not None:
+                connection.close()
+
+
+def _default_schema() -> Mapping[str, Any]:
+    return load_schema(files("open_dateaubase").joinpath("dictionary.json"))
+
+
+def load_waves(
+    schema: Optional[Mapping[str, Any]] = None, tables: Optional[Iterable[str]] = None
+) -> List[List[str]]:
+    """
+    Group tables into dependency waves (see ForeignKeyGraph.waves).
+
+    References to tables outside ``tables`` are ignored.
+
+    Args:
+        schema: Compiled schema (defaults to the packaged dictionary)
+        tables: Tables to order (defaults to all tables)
+
+    Returns:
+        Waves as sorted lists of table IDs
+
+    Raises:
+        ValueError: If the tables reference each other in a cycle
+    """
+    return _table_graph(schema or _default_schema(), tables).waves()
+
+
+def _table_graph(schema: Mapping[str, Any], tables: Optional[Iterable[str]]) -> ForeignKeyGraph:
+    graph = ForeignKeyGraph.from_schema(schema)
+    selected = set(graph.tables if tables is None else tables)
+    unknown = selected - set(schema["tables"])
+    if unknown:
+        raise ValueError(f"Unknown tables: {sorted(unknown)}")
+    return ForeignKeyGraph({t: graph.references(t) & selected for t in selected})
+
+
+def copy_table(
+    schema: Mapping[str, Any],
+    table_id: str,
+    source: Any,
+    target: Any,
+    *,
+    source_dialect: Optional[str] = None,
+    target_dialect: Optional[str] = None,
+    batch_size: int = 10_000,
+) -> int:
+    """
+    Copy all rows of one table, committing the target after every batch.
+
+    Args:
+        schema: Compiled schema
+        table_id: Table to copy
+        source: DB-API connection to read from
+        target: DB-API connection to write to
+        source_dialect / target_dialect: SQL dialect names (optional for
+            sqlite3 connections)
+        batch_size: Rows per fetch, INSERT batch and transaction
+
+    Returns:
+        Number of rows copied
+    """
+    fields = schema["tables"][table_id]["fields"]
+    columns = [extract_field_name(f["part_id"]) for f in fields]
+    key_columns = [
+        extract_field_name(f["part_id"])
+        for f in fields
+        if f["part_type"] in ("key", "compositeKeyFirst", "compositeKeySecond")
+    ]
+
+    source_quote = connection_dialect(source, source_dialect)["quote"]
+    target_quote = connection_dialect(target, target_dialect)["quote"]
+    select = (
+        f"SELECT {', '.join(source_quote(c) for c in columns)} "
+        f"FROM {source_quote(table_id)}"
+    )
+    if key_columns:
+        select += f" ORDER BY {', '.join(source_quote(c) for c in key_columns)}"
+    insert = (
+        f"INSERT INTO {target_quote(table_id)} "
+        f"({', '.join(target_quote(c) for c in columns)}) "
+        f"VALUES ({', '.join([placeholder(target)] * len(columns))})"
+    )
+
+    copied = 0
+    reader = source.cursor()
+    writer = target.cursor()
+    try:
+        reader.execute(select)
+        while True:
+            rows = reader.fetchmany(batch_size)
+            if not rows:
+                break
+            writer.executemany(insert, [tuple(row) for row in rows])
+            target.commit()
+            copied += len(rows)
+    finally:
+        reader.close()
+        writer.close()
+    return copied
+
+
+def _delete_rows(table_id: str, target: Any, target_dialect: Optional[str]) -> int:
+    quote = connection_dialect(target, target_dialect)["quote"]
+    cursor = target.cursor()
+    try:
+        cursor.execute(f"DELETE FROM {quote(table_id)}")
+        deleted = cursor.rowcount
+    finally:
+        cursor.close()
+    target.commit()
+    return max(deleted, 0)
+
+
+def _worker(
+    tasks: queue.Queue,
+    results: queue.Queue,
+    work: Callable[[str, _WorkerConnections], int],
+    connections: _WorkerConnections,
+) -> None:
+    """Worker thread: run tasks until the stop marker, reporting each result."""
+    try:
+        while True:
+            table_id = tasks.get()
+            if table_id is _DONE:
+                return
+            try:
+                results.put((table_id, work(table_id, connections), None))
+            except BaseException as e:
+                results.put((table_id, None, e))
+    finally:
+        connections.close()
+
+
+def _run_scheduled(
+    dependencies: Mapping[str, Set[str]],
+    work: Callable[[str, _WorkerConnections], int],
+    connect_source: Optional[Connect],
+    connect_target: Connect,
+    max_workers: int,
+    done: Callable[[str, int], None],
+) -> None:
+    """
+    Run work on every table once all of its dependencies are done.
+
+    After the first failure no new tables are started; the running ones are
+    awaited and the failure is raised.
+    """
+    pending = {t: len(deps - {t}) for t, deps in dependencies.items()}
+    dependents: Dict[str, List[str]] = {t: [] for t in dependencies}
+    for table_id, deps in dependencies.items():
+        for dep in deps - {table_id}:
+            dependents[dep].append(table_id)
+
+    tasks: queue.Queue = queue.Queue()
+    results: queue.Queue = queue.Queue()
+    workers = [
+        threading.Thread(
+            target=_worker,
+            args=(tasks, results, work, _WorkerConnections(connect_source, connect_target)),
+            name=f"copy-worker-{i}",
+            daemon=True,
+        )
+        for i in range(min(max_workers, len(dependencies)) or 1)
+    ]
+    for worker in workers:
+        worker.start()
+
+    running = 0
+    error: Optional[BaseException] = None
+    try:
+        for table_id in sorted(t for t, count in pending.items() if count == 0):
+            tasks.put(table_id)
+            running += 1
+
+        while running:
+            table_id, count, failure = results.get()
+            running -= 1
+            if failure is not None:
+                error = error or failure
+                continue
+            done(table_id, count)
+            if error is not None:
+                continue
+            for child in sorted(dependents[table_id]):
+                pending[child] -= 1
+                if pending[child] == 0:
+                    tasks.put(child)
+                    running += 1
+    finally:
+        # Drop tables not started yet (only left over if the loop itself failed)
+        while True:
+            try:
+                tasks.get_nowait()
+            except queue.Empty:
+                break
+        for _ in workers:
+            tasks.put(_DONE)
+        for worker in workers:
+            worker.join()
+
+    if error is not None:
+        raise error
+
+
+def copy_tables(
+    connect_source: Connect,
+    connect_target: Connect,
+    *,
+    schema: Optional[Mapping[str, Any]] = None,
+    tables: Optional[Iterable[str]] = None,
+    source_dialect: Optional[str] = None,
+    target_dialect: Optional[str] = None,
+    truncate: bool = False,
+    batch_size: int = 10_000,
+    max_workers: int = 4,
+    progress: Optional[Callable[[str, CopyReport], None]] = None,
+) -> CopyReport:
+    """
+    Copy tables from one database to another in dependency order.
+
+    Args:
+        connect_source: Returns a new DB-API connection to the source database
+        connect_target: Returns a new DB-API connection to the target
+            database, created from the same dictionary
+        schema: Compiled schema (defaults to the packaged dictionary)
+        tables: Tables to copy (defaults to all tables). References to
+            tables outside this set are not waited for.
+        source_dialect / target_dialect: SQL dialect names (optional for
+            sqlite3 connections)
+        truncate: Delete the target rows of the tables first
+        batch_size: Rows per fetch, INSERT batch and transaction
+        max_workers: Number of worker threads (each with its own connections)
+        progress: Called with the table ID and the running report each time
+            a table is done
+
+    Returns:
+        CopyReport with the rows copied (and deleted) per table
+
+    Raises:
+        ValueError: If a parameter is invalid, a table is unknown or the
+            tables reference each other in a cycle
+    """
+    if batch_size < 1:
+        raise ValueError(f"batch_size must be positive, got {batch_size}")
+    if max_workers < 1:
+        raise ValueError(f"max_workers must be positive, got {max_workers}")
+
+    schema = schema or _default_schema()
+    graph = _table_graph(schema, tables)
+    graph.waves()  # Raises on cycles before anything is touched
+
+    report = CopyReport()
+    started = time.perf_counter()
+
+    def record(counts: Dict[str, int]) -> Callable[[str, int], None]:
+        def done(table_id: str, count: int) -> None:
+            counts[table_id] = count
+            report.elapsed = time.perf_counter() - started
+            if progress is not None:
+                progress(table_id, report)
+
+        return done
+
+    if truncate:
+        # Referencing tables first: run on the reversed graph
+        _run_scheduled(
+            {t: graph.referenced_by(t) for t in graph.tables},
+            lambda table_id, c: _delete_rows(table_id, c.target, target_dialect),
+            None,
+            connect_target,
+            max_workers,
+            record(report.deleted),
+        )
+
+    _run_scheduled(
+        {t: graph.references(t) for t in graph.tables},
+        lambda table_id, c: copy_table(
+            schema,
+            table_id,
+            c.source,
+            c.target,
+            source_dialect=source_dialect,
+            target_dialect=target_dialect,
+            batch_size=batch_size,
+        ),
+        connect_source,
+        connect_target,
+        max_workers,
+        record(report.rows),
+    )
+
+    report.elapsed = time.perf_counter() - started
+    return report
@@ -0,0 +1,543 @@
+"""
+Time-bucket aggregation and downsampling of values.
+
+Plots of month-long windows do not need millions of raw values. These
+queries reduce the data where it is stored and only transfer the result:
+
+- ``fetch_buckets`` returns count, min, max and mean per series
+  (Metadata_ID) and time bucket. ``build_bucket_query`` renders the GROUP BY
+  query for the dialect; the bucket start is computed by a dialect-specific
+  expression (see the ``time_bucket`` dialect key). Dialects without one
+  stream the values as columnar batches and aggregate them with NumPy
+  (``aggregate_batches``).
+- ``downsample`` returns at most ``points`` real values per series for
+  plotting. The database first keeps the first, last, lowest and highest
+  value of every bucket (M4 aggregation, ``build_m4_query``), which preserves
+  the shape of a line chart; Largest-Triangle-Three-Buckets (``lttb``) then
+  picks the final points with NumPy.
+
+Buckets are aligned to midnight (of 1900-01-01 for buckets of several days),
+so their width must divide a day or be a whole number of days. The values
+are selected like ``open_dateaubase.query.values`` (same filters, joins and
+index-friendly time window); NULL values are ignored.
+
+Usage:
+    from open_dateaubase.query.aggregate import downsample, fetch_buckets
+    from open_dateaubase.query.values import ValueQuery
+
+    query = ValueQuery(parameter="NH4", start="2024-01-01", end="2024-02-01")
+    hourly = fetch_buckets(connection, query, bucket_seconds=3600)
+    # [(Metadata_ID, bucket start, count, min, max, mean), ...]
+    series = downsample(connection, query, points=1000)
+    # {Metadata_ID: (timestamps, values)}
+"""
+
+import math
+from dataclasses import replace
+from datetime import datetime
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Tuple
+
+from open_dateaubase.sql.connection import connection_dialect, placeholder
+from open_dateaubase.sql.dialects import get_dialect
+from open_dateaubase.sql.value_table import VALUE_TABLE
+from .values import (
+    CURSOR_COLUMNS,
+    VALUE_COLUMNS,
+    ValueQuery,
+    _default_schema,
+    iter_value_batches,
+    qualified,
+    value_from_where,
+)
+
+DAY = 86_400  # seconds
+
+# Start of the first bucket; every bucket starts a whole number of buckets later
+BUCKET_ORIGIN = datetime(1900, 1, 1)
+_ORIGIN_EPOCH = -2_208_988_800  # BUCKET_ORIGIN as Unix time
+
+# Widths that bucket_width() chooses from; wider buckets are whole days
+BUCKET_WIDTHS = (
+    1, 2, 5, 10, 15, 30,
+    60, 120, 300, 600, 900, 1800,
+    3600, 7200, 10800, 21600, 43200, DAY,
+)  # fmt: skip
+
+# Columns of fetch_buckets() rows
+AGGREGATE_COLUMNS = ("Metadata_ID", "bucket", "count", "min", "max", "mean")
+
+
+def check_bucket(bucket_seconds: int) -> int:
+    """
+    Check that a bucket width can be aligned to midnight.
+
+    Args:
+        bucket_seconds: Bucket width in seconds
+
+    Returns:
+        The width
+
+    Raises:
+        ValueError: If the width is not positive, or neither divides a day
+            nor is a whole number of days
+    """
+    if bucket_seconds < 1 or (DAY % bucket_seconds and bucket_seconds % DAY):
+        raise ValueError(
+            "bucket_seconds must divide a day or be a whole number of days, "
+            f"got {bucket_seconds}"
+        )
+    return bucket_seconds
+
+
+def bucket_width(start: Any, end: Any, buckets: int) -> int:
+    """
+    Return the narrowest bucket width giving at most ``buckets`` buckets.
+
+    Args:
+        start: Start of the window (datetime or ISO 8601 string)
+        end: End of the window (datetime or ISO 8601 string)
+        buckets: Maximum number of buckets
+
+    Returns:
+        Width in seconds, from BUCKET_WIDTHS or a whole number of days
+    """
+    span = (_to_datetime(end) - _to_datetime(start)).total_seconds()
+    target = span / max(buckets, 1)
+    for width in BUCKET_WIDTHS:
+        if width >= target:
+            return width
+    return math.ceil(target / DAY) * DAY
+
+
+def _to_datetime(value: Any) -> datetime:
+    return value if isinstance(value, datetime) else datetime.fromisoformat(str(value))
+
+
+def time_bucket_sql(config: Mapping[str, Any], column: str, bucket_seconds: int) -> str:
+    """
+    Return the SQL expression of the bucket start of a timestamp column.
+
+    Bucket widths are rendered as integer literals rather than parameters,
+    so the expression is identical wherever it appears in a statement.
+
+    Args:
+        config: Dialect configuration from get_dialect()
+        column: Quoted timestamp column
+        bucket_seconds: Bucket width in seconds (see check_bucket)
+
+    Returns:
+        SQL expression of the same type as the column
+
+    Raises:
+        ValueError: If the dialect has no time bucket expression
+    """
+    seconds = check_bucket(bucket_seconds)
+    style = config["time_bucket"]
+    if style == "mssql":
+        # Seconds since 1900 overflow DATEADD's int, so count days or
+        # seconds since midnight
+        if seconds % DAY == 0:
+            days = seconds // DAY
+            return (
+                f"DATEADD(DAY, DATEDIFF(DAY, '19000101', {column}) / {days} * {days}, "
+                "CAST('19000101' AS datetime2(3)))"
+            )
+        midnight = f"CAST(CAST({column} AS date) AS datetime2(3))"
+        return (
+            f"DATEADD(SECOND, DATEDIFF(SECOND, {midnight}, {column}) / {seconds} * {seconds}, "
+            f"{midnight})"
+        )
+    if style == "postgres":
+        return (
+            "TIMESTAMP '1900-01-01' + CAST(FLOOR(EXTRACT(EPOCH FROM "
+            f"{column} - TIMESTAMP '1900-01-01') / {seconds}) * {seconds} AS double precision) "
+            "* INTERVAL '1 second'"
+        )
+    if style == "sqlite":
+        # Timestamps are 'YYYY-MM-DD HH:MM:SS.fff' text
+        return (
+            f"strftime('%Y-%m-%d %H:%M:%S.000', (CAST(strftime('%s', {column}) AS INTEGER) "
+            f"- ({_ORIGIN_EPOCH})) / {seconds} * {seconds} + ({_ORIGIN_EPOCH}), 'unixepoch')"
+        )
+    raise ValueError(f"Dialect {config['name']} has no time bucket expression")
+
+
+def _bucketed_values(
+    query: ValueQuery,
+    config: Mapping[str, Any],
+    schema: Mapping[str, Any],
+    ph: str,
+    bucket_seconds: int,
+) -> Tuple[List[str], List[Any]]:
+    """Return the lines of a derived table of the query's values with a 'bucket' column."""
+    from_lines, where, params, _ = value_from_where(
+        replace(query, labels=()), config, schema, ph
+    )
+    quote = config["quote"]
+    value = qualified(config, VALUE_TABLE, "Value")
+    bucket = time_bucket_sql(config, qualified(config, VALUE_TABLE, "Timestamp"), bucket_seconds)
+    selected = [qualified(config, VALUE_TABLE, c) for c in VALUE_COLUMNS]
+    lines = [
+        f"SELECT {', '.join(selected)}, {bucket} AS {quote('bucket')}",
+        *from_lines,
+        f"WHERE {' AND '.join([*where, f'{value} IS NOT NULL'])}",
+    ]
+    return lines, params
+
+
+def build_bucket_query(
+    query: ValueQuery,
+    bucket_seconds: int,
+    dialect: str = "mssql",
+    *,
+    schema: Optional[Mapping[str, Any]] = None,
+    placeholder: str = "?",
+) -> Tuple[str, List[Any]]:
+    """
+    Build the query of count, min, max and mean per series and time bucket.
+
+    Args:
+        query: Values to aggregate (labels are ignored)
+        bucket_seconds: Bucket width in seconds (see check_bucket)
+        dialect: SQL dialect name
+        schema: Compiled schema (defaults to the packaged dictionary)
+        placeholder: Parameter placeholder of the driver ('?' or '%s')
+
+    Returns:
+        (sql, params); rows have the AGGREGATE_COLUMNS, ordered by series
+        and bucket
+
+    Raises:
+        ValueError: If the bucket width is invalid or the dialect has no
+            time bucket expression
+    """
+    config = get_dialect(dialect)
+    quote = config["quote"]
+    inner, params = _bucketed_values(
+        query, config, schema or _default_schema(), placeholder, bucket_seconds
+    )
+    metadata_id, bucket, value = quote("Metadata_ID"), quote("bucket"), quote("Value")
+    lines = [
+        f"SELECT {metadata_id}, {bucket}, COUNT(*) AS {quote('count')}, "
+        f"MIN({value}) AS {quote('min')}, MAX({value}) AS {quote('max')}, "
+        f"AVG({value}) AS {quote('mean')}",
+        "FROM (",
+        *(f"    {line}" for line in inner),
+        f") {quote('buckets')}",
+        f"GROUP BY {metadata_id}, {bucket}",
+        f"ORDER BY {metadata_id}, {bucket}",
+    ]
+    return "\n".join(lines), params
+
+
+def build_m4_query(
+    query: ValueQuery,
+    bucket_seconds: int,
+    dialect: str = "mssql",
+    *,
+    schema: Optional[Mapping[str, Any]] = None,
+    placeholder: str = "?",
+) -> Tuple[str, List[Any]]:
+    """
+    Build the query of the first, last, lowest and highest value per bucket.
+
+    At most four rows per series and bucket are returned, and they are
+    actual values, so a line chart of them looks like the chart of all
+    values at one bucket per pixel.
+
+    Args:
+        query: Values to reduce (labels are ignored)
+        bucket_seconds: Bucket width in seconds (see check_bucket)
+        dialect: SQL dialect name
+        schema: Compiled schema (defaults to the packaged dictionary)
+        placeholder: Parameter placeholder of the driver ('?' or '%s')
+
+    Returns:
+        (sql, params); rows have the VALUE_COLUMNS, in value query order
+
+    Raises:
+        ValueError: If the bucket width is invalid or the dialect has no
+            time bucket expression
+    """
+    config = get_dialect(dialect)
+    quote = config["quote"]
+    inner, params = _bucketed_values(
+        query, config, schema or _default_schema(), placeholder, bucket_seconds
+    )
+    timestamp, value, value_id = quote("Timestamp"), quote("Value"), quote("Value_ID")
+    window = f"PARTITION BY {quote('Metadata_ID')}, {quote('bucket')} ORDER BY"
+    ranks = {
+        "r_first": f"{timestamp}, {value_id}",
+        "r_last": f"{timestamp} DESC, {value_id} DESC",
+        "r_low": f"{value}, {timestamp}",
+        "r_high": f"{value} DESC, {timestamp}",
+    }
+    columns = ", ".join(quote(c) for c in VALUE_COLUMNS)
+    lines = [
+        f"SELECT {columns}",
+        "FROM (",
+        f"    SELECT {columns},",
+        *(
+            f"        ROW_NUMBER() OVER ({window} {order}) AS {quote(name)}"
+            + ("," if i < len(ranks) - 1 else "")
+            for i, (name, order) in enumerate(ranks.items())
+        ),
+        "    FROM (",
+        *(f"        {line}" for line in inner),
+        f"    ) {quote('buckets')}",
+        f") {quote('ranked')}",
+        f"WHERE {' OR '.join(f'{quote(name)} = 1' for name in ranks)}",
+        f"ORDER BY {', '.join(quote(c) for c in CURSOR_COLUMNS)}",
+    ]
+    return "\n".join(lines), params
+
+
+def _run(connection: Any, sql: str, params: List[Any]) -> List[Tuple[Any, ...]]:
+    cursor = connection.cursor()
+    try:
+        cursor.execute(sql, params)
+        return [tuple(row) for row in cursor.fetchall()]
+    finally:
+        cursor.close()
+
+
+def aggregate_batches(batches: Iterable[Any], bucket_seconds: int) -> List[Tuple[Any, ...]]:
+    """
+    Aggregate value batches per series and time bucket with NumPy.
+
+    The client-side counterpart of build_bucket_query, for dialects without
+    a time bucket expression. Batches must be in (Metadata_ID, Timestamp)
+    order, as iter_value_batches returns them; a bucket may span batches.
+
+    Args:
+        batches: ValueBatch objects
+        bucket_seconds: Bucket width in seconds (see check_bucket)
+
+    Returns:
+        Rows with the AGGREGATE_COLUMNS; bucket starts are datetimes
+    """
+    np = _import_numpy()
+    step = np.timedelta64(check_bucket(bucket_seconds), "s")
+    origin = np.datetime64(BUCKET_ORIGIN, "ms")
+
+    # [Metadata_ID, bucket number, count, min, max, sum] per group
+    groups: List[List[Any]] = []
+    for batch in batches:
+        keep = ~batch.null_mask("Metadata_ID", "Timestamp", "Value")
+        metadata_ids = batch.columns["Metadata_ID"][keep]
+        if not len(metadata_ids):
+            continue
+        buckets = (batch.columns["Timestamp"][keep] - origin) // step
+        values = batch.columns["Value"][keep].astype("float64", copy=False)
+
+        starts = np.flatnonzero(
+            np.concatenate(
+                ([True], (metadata_ids[1:] != metadata_ids[:-1]) | (buckets[1:] != buckets[:-1]))
+            )
+        )
+        for group in zip(
+            metadata_ids[starts].tolist(),
+            buckets[starts].tolist(),
+            np.diff(np.append(starts, len(values))).tolist(),
+            np.minimum.reduceat(values, starts).tolist(),
+            np.maximum.reduceat(values, starts).tolist(),
+            np.add.reduceat(values, starts).tolist(),
+        ):
+            last = groups[-1] if groups else None
+            if last is not None and last[0] == group[0] and last[1] == group[1]:
+                # Bucket continued from the previous batch
+                last[2] += group[2]
+                last[3] = min(last[3], group[3])
+                last[4] = max(last[4], group[4])
+                last[5] += group[5]
+            else:
+                groups.append(list(group))
+
+    starts = (origin + np.array([g[1] for g in groups], dtype="int64") * step).tolist()
+    return [
+        (metadata_id, start, count, low, high, total / count)
+        for (metadata_id, _, count, low, high, total), start in zip(groups, starts)
+    ]
+
+
+def fetch_buckets(
+    connection: Any,
+    query: ValueQuery,
+    bucket_seconds: int,
+    *,
+    dialect: Optional[str] = None,
+    schema: Optional[Mapping[str, Any]] = None,
+    page_size: int = 100_000,
+) -> List[Tuple[Any, ...]]:
+    """
+    Return count, min, max and mean per series and time bucket.
+
+    Aggregated by the database, or with NumPy when the dialect has no time
+    bucket expression.
+
+    Args:
+        connection: DB-API connection
+        query: Values to aggregate (labels are ignored)
+        bucket_seconds: Bucket width in seconds (see check_bucket)
+        dialect: SQL dialect name (optional for sqlite3 connections)
+        schema: Compiled schema (defaults to the packaged dictionary)
+        page_size: Rows per page streamed to the NumPy fallback
+
+    Returns:
+        Rows with the AGGREGATE_COLUMNS, ordered by series and bucket
+
+    Raises:
+        ValueError: If the bucket width is invalid
+    """
+    config = connection_dialect(connection, dialect)
+    if config["time_bucket"] is None:
+        check_bucket(bucket_seconds)
+        return aggregate_batches(
+            iter_value_batches(
+                connection, query, dialect=dialect, schema=schema, page_size=page_size
+            ),
+            bucket_seconds,
+        )
+
+    sql, params = build_bucket_query(
+        query,
+        bucket_seconds,
+        config["name"],
+        schema=schema,
+        placeholder=placeholder(connection),
+    )
+    return _run(connection, sql, params)
+
+
+def lttb(x: Any, y: Any, points: int) -> Any:
+    """
+    Select points with Largest-Triangle-Three-Buckets.
+
+    The first and last points are kept. The points in between are split
+    into ``points - 2`` buckets, and from each bucket the point forming the
+    largest triangle with the previously selected point and the mean of the
+    next bucket is kept, which preserves peaks and the overall shape.
+
+    Args:
+        x: Increasing x values (e.g. int64 timestamps)
+        y: y values
+        points: Number of points to keep (at least 3)
+
+    Returns:
+        Sorted indices of the kept points (all indices if there are no more
+        than ``points``)
+
+    Raises:
+        ValueError: If points is less than 3
+    """
+    np = _import_numpy()
+    if points < 3:
+        raise ValueError(f"points must be at least 3, got {points}")
+    x = np.asarray(x, dtype="float64")
+    y = np.asarray(y, dtype="float64")
+    size = len(x)
+    if size <= points:
+        return np.arange(size)
+
+    # Bucket i covers [edges[i], edges[i + 1]); the last "bucket" is the last point
+    edges = np.append(np.linspace(1, size - 1, points - 1).astype("int64"), size)
+    selected = np.empty(points, dtype="int64")
+    selected[0] = 0
+    previous = 0
+    for i in range(points - 2):
+        start, stop, next_stop = edges[i], edges[i + 1], edges[i + 2]
+        mean_x = x[stop:next_stop].mean()
+        mean_y = y[stop:next_stop].mean()
+        areas = np.abs(
+            (x[previous] - mean_x) * (y[start:stop] - y[previous])
+            - (x[previous] - x[start:stop]) * (mean_y - y[previous])
+        )
+        previous = start + int(areas.argmax())
+        selected[i + 1] = previous
+    selected[-1] = size - 1
+    return selected
+
+
+def downsample(
+    connection: Any,
+    query: ValueQuery,
+    points: int,
+    *,
+    dialect: Optional[str] = None,
+    schema: Optional[Mapping[str, Any]] = None,
+    page_size: int = 100_000,
+) -> Dict[int, Tuple[Any, Any]]:
+    """
+    Reduce every series to at most ``points`` values for plotting.
+
+    With a time window (start and end) and a dialect with a time bucket
+    expression, the database first reduces each series to the M4 values of
+    ``points // 4`` buckets (see build_m4_query). LTTB then selects the
+    final points.
+
+    Args:
+        connection: DB-API connection
+        query: Values to downsample (labels are ignored)
+        points: Maximum number of values per series (at least 3)
+        dialect: SQL dialect name (optional for sqlite3 connections)
+        schema: Compiled schema (defaults to the packaged dictionary)
+        page_size: Rows per page when the values are streamed unreduced
+
+    Returns:
+        Metadata_ID -> (timestamps, values) NumPy arrays
+
+    Raises:
+        ValueError: If points is less than 3
+        ImportError: If numpy is not installed
+    """
+    np = _import_numpy()
+    from open_dateaubase.ingest.columnar import ValueBatch
+
+    if points < 3:
+        raise ValueError(f"points must be at least 3, got {points}")
+
+    config = connection_dialect(connection, dialect)
+    if config["time_bucket"] is not None and query.start is not None and query.end is not None:
+        sql, params = build_m4_query(
+            query,
+            bucket_width(query.start, query.end, max(points // 4, 1)),
+            config["name"],
+            schema=schema,
+            placeholder=placeholder(connection),
+        )
+        rows = _run(connection, sql, params)
+        batches = [ValueBatch.from_params(rows)] if rows else []
+    else:
+        batches = iter_value_batches(
+            connection, query, dialect=dialect, schema=schema, page_size=page_size
+        )
+
+    parts: Dict[int, List[Tuple[Any, Any]]] = {}
+    for batch in batches:
+        keep = ~batch.null_mask("Metadata_ID", "Timestamp", "Value")
+        metadata_ids = batch.columns["Metadata_ID"][keep]
+        timestamps = batch.columns["Timestamp"][keep]
+        values = batch.columns["Value"][keep]
+        for metadata_id in np.unique(metadata_ids).tolist():
+            series = metadata_ids == metadata_id
+            parts.setdefault(metadata_id, []).append((timestamps[series], values[series]))
+
+    result = {}
+    for metadata_id, chunks in parts.items():
+        timestamps = np.concatenate([t for t, _ in chunks])
+        values = np.concatenate([v for _, v in chunks])
+        kept = lttb(timestamps.astype("int64"), values, points)
+        result[metadata_id] = (timestamps[kept], values[kept])
+    return result
+
+
+def _import_numpy():
+    """Import numpy, with an install hint if it is missing."""
+    try:
+        import numpy
+    except ImportError as e:
+        raise ImportError(
+            "Downsampling requires numpy: "
+            'pip install "open-dateaubase[columnar]"'
+        ) from e
+    return numpy
@@ -0,0 +1,441 @@
+"""
+Time-window queries on the value table.
+
+``build_value_query`` turns a ``ValueQuery`` ("all values for parameter X at
+sampling point Y between t0 and t1") into one parameterized SELECT for a
+dialect. The joins ``value`` -> ``metadata`` -> ``parameter`` /
+``sampling_points`` / ``unit`` / ... are derived from the dictionary's
+foreign keys, and a table is only joined when the query filters on its
+names or asks for them as labels.
+
+The statement is written so the ``(Metadata_ID, Timestamp)`` index of the
+value table can be used:
+
+- the time window is a half-open range (``start <= Timestamp < end``) on the
+  bare column, never a function of it
+- rows are ordered by ``(Metadata_ID, Timestamp, Value_ID)``, the index order
+  (``Value_ID`` only breaks ties between equal timestamps)
+- pages continue from a keyset cursor, the last row's
+  ``(Metadata_ID, Timestamp, Value_ID)``, so reading page n does not scan
+  the n - 1 pages before it as OFFSET does
+
+Rows without a Timestamp are never returned.
+
+``iter_value_pages`` streams a whole result page by page with such cursors
+(each page is a short query, so no cursor is held open between pages), and
+``iter_value_batches`` returns the pages as columnar ``ValueBatch`` arrays
+(requires numpy).
+
+Usage:
+    from open_dateaubase.query.values import ValueQuery, fetch_values, iter_value_batches
+
+    query = ValueQuery(
+        parameter="NH4",
+        sampling_point="Inlet",
+        start="2024-01-01",
+        end="2024-02-01",
+        labels=("unit",),
+    )
+    rows = fetch_values(connection, query, limit=100)
+    for batch in iter_value_batches(connection, query, page_size=50_000):
+        print(batch.columns["Value"].mean())
+"""
+
+from dataclasses import dataclass, replace
+from functools import lru_cache
+from importlib.resources import files
+from typing import Any, Dict, Iterator, List, Mapping, Optional, Sequence, Tuple
+
+from open_dateaubase.data_model.schema import key_table, load_schema
+from open_dateaubase.sql.connection import connection_dialect, placeholder
+from open_dateaubase.sql.dialects import get_dialect
+from open_dateaubase.sql.value_table import VALUE_TABLE, format_timestamp
+
+# Columns of every result row, before any labels (the order of ValueBatch)
+VALUE_COLUMNS = ("Value_ID", "Metadata_ID", "Timestamp", "Value", "Number_of_experiment")
+
+# Sort order of the results, which is also the keyset cursor
+CURSOR_COLUMNS = ("Metadata_ID", "Timestamp", "Value_ID")
+
+# ValueQuery filter / label -> (metadata field, name column of the table it references)
+FILTER_FIELDS = {
+    "parameter": ("Parameter_ID", "Parameter"),
+    "sampling_point": ("Sampling_point_ID", "Sampling_point"),
+    "unit": ("Unit_ID", "Unit"),
+    "equipment": ("Equipment_ID", "Equipment_identifier"),
+    "project": ("Project_ID", "Project_name"),
+}
+
+Cursor = Tuple[int, Any, int]
+
+
+@dataclass(frozen=True)
+class ValueQuery:
+    """Which values to read.
+
+    Each filter (parameter, sampling_point, ...) takes an ID (int), a name
+    (str, matched against the name column of the referenced table) or a
+    sequence of them. Filters are combined with AND.
+
+    Attributes:
+        start: First timestamp of the window, inclusive (None for unbounded)
+        end: End of the window, exclusive (None for unbounded)
+        metadata_ids: Restrict to these Metadata_IDs
+        parameter / sampling_point / unit / equipment / project: Filters
+        labels: Filter names (keys of FILTER_FIELDS) whose name column is
+            appended to every row, in this order
+    """
+
+    start: Any = None
+    end: Any = None
+    metadata_ids: Sequence[int] = ()
+    parameter: Any = None
+    sampling_point: Any = None
+    unit: Any = None
+    equipment: Any = None
+    project: Any = None
+    labels: Sequence[str] = ()
+
+    def filters(self) -> Dict[str, Tuple[Any, ...]]:
+        """Return the filters that are set, as filter name -> tuple of values."""
+        filters = {}
+        for name in FILTER_FIELDS:
+            value = getattr(self, name)
+            if value is None:
+                continue
+            values = tuple(value) if isinstance(value, (list, tuple, set, frozenset)) else (value,)
+            if not values:
+                raise ValueError(f"Empty {name} filter")
+            filters[name] = values
+        return filters
+
+
+@lru_cache(maxsize=1)
+def _default_schema() -> Mapping[str, Any]:
+    return load_schema(files("open_dateaubase").joinpath("dictionary.json"))
+
+
+def _join_target(schema: Mapping[str, Any], table_id: str, field_id: str) -> str:
+    """Return the table referenced by a foreign key field of a table."""
+    fields = {f["part_id"]: f for f in schema["tables"][table_id]["fields"]}
+    field = fields.get(field_id)
+    target = key_table(schema, field["fk_to"]) if field and field["fk_to"] else None
+    if target is None:
+        raise ValueError(f"{table_id}.{field_id} is not a foreign key in the dictionary")
+    return target
+
+
+def _in(column: str, values: Sequence[Any], ph: str) -> Tuple[str, List[Any]]:
+    if len(values) == 1:
+        return f"{column} = {ph}", list(values)
+    return f"{column} IN ({', '.join([ph] * len(values))})", list(values)
+
+
+def qualified(config: Mapping[str, Any], table_id: str, field_id: str) -> str:
+    """Return a table-qualified, quoted column name."""
+    quote = config["quote"]
+    return f"{quote(table_id)}.{quote(field_id)}"
+
+
+def value_from_where(
+    query: ValueQuery,
+    config: Mapping[str, Any],
+    schema: Mapping[str, Any],
+    ph: str,
+) -> Tuple[List[str], List[str], List[Any], Dict[str, str]]:
+    """
+    Build the FROM clause and WHERE predicates of a value query.
+
+    Shared by the row and aggregation queries, so that every query on the
+    value table filters and joins the same way.
+
+    Args:
+        query: Values to read
+        config: Dialect configuration from get_dialect()
+        schema: Compiled schema
+        ph: Parameter placeholder
+
+    Returns:
+        (FROM and JOIN lines, WHERE predicates, their params, label -> joined table)
+
+    Raises:
+        ValueError: If a label is unknown or a filter does not map to a
+            foreign key of the dictionary
+    """
+    unknown = [label for label in query.labels if label not in FILTER_FIELDS]
+    if unknown:
+        raise ValueError(f"Unknown labels: {unknown}. Supported: {list(FILTER_FIELDS)}")
+
+    quote = config["quote"]
+
+    def column(table_id: str, field_id: str) -> str:
+        return qualified(config, table_id, field_id)
+
+    filters = query.filters()
+    metadata_key = _join_target(schema, VALUE_TABLE, "Metadata_ID")
+    lines = [f"FROM {quote(VALUE_TABLE)}"]
+    where: List[str] = []
+    params: List[Any] = []
+
+    if filters or query.labels:
+        lines.append(
+            f"INNER JOIN {quote(metadata_key)} ON "
+            f"{column(metadata_key, 'Metadata_ID')} = {column(VALUE_TABLE, 'Metadata_ID')}"
+        )
+
+    # Lookup tables: inner joins filter by name, left joins only add labels
+    joined: Dict[str, str] = {}
+    name_filters = {n for n, values in filters.items() if any(isinstance(v, str) for v in values)}
+    for name in [*filters, *query.labels]:
+        if name in joined or (name not in name_filters and name not in query.labels):
+            continue
+        field_id = FILTER_FIELDS[name][0]
+        target = _join_target(schema, metadata_key, field_id)
+        kind = "INNER" if name in name_filters else "LEFT"
+        lines.append(
+            f"{kind} JOIN {quote(target)} ON "
+            f"{column(target, field_id)} = {column(metadata_key, field_id)}"
+        )
+        joined[name] = target
+
+    for name, values in filters.items():
+        field_id, name_column = FILTER_FIELDS[name]
+        ids = [v for v in values if not isinstance(v, str)]
+        names = [v for v in values if isinstance(v, str)]
+        terms = []
+        if ids:
+            term, term_params = _in(column(metadata_key, field_id), ids, ph)
+            terms.append(term)
+            params.extend(term_params)
+        if names:
+            term, term_params = _in(column(joined[name], name_column), names, ph)
+            terms.append(term)
+            params.extend(term_params)
+        where.append(terms[0] if len(terms) == 1 else f"({' OR '.join(terms)})")
+
+    if query.metadata_ids:
+        term, term_params = _in(column(VALUE_TABLE, "Metadata_ID"), list(query.metadata_ids), ph)
+        where.append(term)
+        params.extend(term_params)
+
+    timestamp = column(VALUE_TABLE, "Timestamp")
+    if query.start is not None:
+        where.append(f"{timestamp} >= {ph}")
+        params.append(format_timestamp(query.start))
+    else:
+        where.append(f"{timestamp} IS NOT NULL")
+    if query.end is not None:
+        where.append(f"{timestamp} < {ph}")
+        params.append(format_timestamp(query.end))
+
+    return lines, where, params, joined
+
+
+def build_value_query(
+    query: ValueQuery,
+    dialect: str = "mssql",
+    *,
+    schema: Optional[Mapping[str, Any]] = None,
+    placeholder: str = "?",
+    limit: Optional[int] = None,
+    offset: Optional[int] = None,
+    after: Optional[Cursor] = None,
+) -> Tuple[str, List[Any]]:
+    """
+    Build the SELECT statement of a value query.
+
+    Args:
+        query: Values to read
+        dialect: SQL dialect name
+        schema: Compiled schema (defaults to the packaged dictionary)
+        placeholder: Parameter placeholder of the driver ('?' or '%s')
+        limit: Maximum number of rows (None for all)
+        offset: Rows to skip, with a limit (prefer ``after`` for deep pages)
+        after: Keyset cursor; only rows sorting after it are returned
+
+    Returns:
+        (sql, params)
+
+    Raises:
+        ValueError: If a label or limit is invalid, or a filter does not map
+            to a foreign key of the dictionary
+    """
+    if limit is not None and limit < 1:
+        raise ValueError(f"limit must be positive, got {limit}")
+    if offset is not None and (offset < 0 or limit is None):
+        raise ValueError(f"offset requires a limit and must not be negative, got {offset}")
+
+    config = get_dialect(dialect)
+    quote = config["quote"]
+    ph = placeholder
+    from_lines, where, params, joined = value_from_where(
+        query, config, schema or _default_schema(), ph
+    )
+
+    def column(table_id: str, field_id: str) -> str:
+        return qualified(config, table_id, field_id)
+
+    timestamp = column(VALUE_TABLE, "Timestamp")
+    if after is not None:
+        # Row-value comparison (a, b, c) > (?, ?, ?) spelled out for MSSQL; the
+        # leading Metadata_ID >= ? keeps the index seek
+        metadata_id, after_timestamp, value_id = after
+        metadata_column = column(VALUE_TABLE, "Metadata_ID")
+        where.append(
+            f"{metadata_column} >= {ph} AND ({metadata_column} > {ph} OR {timestamp} > {ph} "
+            f"OR ({timestamp} = {ph} AND {column(VALUE_TABLE, 'Value_ID')} > {ph}))"
+        )
+        params.extend([metadata_id, metadata_id, after_timestamp, after_timestamp, value_id])
+
+    selected = [column(VALUE_TABLE, c) for c in VALUE_COLUMNS]
+    selected += [
+        f"{column(joined[label], FILTER_FIELDS[label][1])} AS {quote(label)}"
+        for label in query.labels
+    ]
+    lines = [f"SELECT {', '.join(selected)}", *from_lines, f"WHERE {' AND '.join(where)}"]
+    lines.append(f"ORDER BY {', '.join(column(VALUE_TABLE, c) for c in CURSOR_COLUMNS)}")
+
+    if limit is not None:
+        if config["pagination"] == "offset_fetch":
+            lines.append(f"OFFSET {ph} ROWS FETCH NEXT {ph} ROWS ONLY")
+            params.extend([offset or 0, limit])
+        else:
+            lines.append(f"LIMIT {ph}" + (f" OFFSET {ph}" if offset else ""))
+            params.extend([limit, offset] if offset else [limit])
+
+    return "\n".join(lines), params
+
+
+def page_cursor(row: Sequence[Any]) -> Cursor:
+    """
+    Return the keyset cursor of a result row, to continue after it.
+
+    Args:
+        row: Row returned by a value query (VALUE_COLUMNS first)
+
+    Returns:
+        (Metadata_ID, Timestamp, Value_ID)
+    """
+    return (row[1], row[2], row[0])
+
+
+def fetch_values(
+    connection: Any,
+    query: ValueQuery,
+    *,
+    dialect: Optional[str] = None,
+    schema: Optional[Mapping[str, Any]] = None,
+    limit: Optional[int] = None,
+    offset: Optional[int] = None,
+    after: Optional[Cursor] = None,
+) -> List[Tuple[Any, ...]]:
+    """
+    Run a value query and return its rows.
+
+    Args:
+        connection: DB-API connection
+        query: Values to read
+        dialect: SQL dialect name (optional for sqlite3 connections)
+        schema: Compiled schema (defaults to the packaged dictionary)
+        limit / offset / after: See build_value_query
+
+    Returns:
+        Row tuples: VALUE_COLUMNS followed by the query's labels
+    """
+    sql, params = build_value_query(
+        query,
+        connection_dialect(connection, dialect)["name"],
+        schema=schema,
+        placeholder=placeholder(connection),
+        limit=limit,
+        offset=offset,
+        after=after,
+    )
+    cursor = connection.cursor()
+    try:
+        cursor.execute(sql, params)
+        return [tuple(row) for row in cursor.fetchall()]
+    finally:
+        cursor.close()
+
+
+def iter_value_pages(
+    connection: Any,
+    query: ValueQuery,
+    *,
+    dialect: Optional[str] = None,
+    schema: Optional[Mapping[str, Any]] = None,
+    page_size: int = 10_000,
+    after: Optional[Cursor] = None,
+) -> Iterator[List[Tuple[Any, ...]]]:
+    """
+    Stream the rows of a value query page by page, with keyset cursors.
+
+    Args:
+        connection: DB-API connection
+        query: Values to read
+        dialect: SQL dialect name (optional for sqlite3 connections)
+        schema: Compiled schema (defaults to the packaged dictionary)
+        page_size: Rows per page (and per query)
+        after: Cursor to resume from (see page_cursor)
+
+    Yields:
+        Non-empty lists of row tuples
+
+    Raises:
+        ValueError: If page_size is not positive
+    """
+    if page_size < 1:
+        raise ValueError(f"page_size must be positive, got {page_size}")
+
+    schema = schema or _default_schema()
+    while True:
+        page = fetch_values(
+            connection, query, dialect=dialect, schema=schema, limit=page_size, after=after
+        )
+        if page:
+            yield page
+        if len(page) < page_size:
+            return
+        after = page_cursor(page[-1])
+
+
+def iter_value_batches(
+    connection: Any,
+    query: ValueQuery,
+    *,
+    dialect: Optional[str] = None,
+    schema: Optional[Mapping[str, Any]] = None,
+    page_size: int = 100_000,
+    after: Optional[Cursor] = None,
+):
+    """
+    Stream a value query as columnar batches (one ValueBatch per page).
+
+    Labels are not part of a ValueBatch and are not selected.
+
+    Args:
+        connection: DB-API connection
+        query: Values to read
+        dialect: SQL dialect name (optional for sqlite3 connections)
+        schema: Compiled schema (defaults to the packaged dictionary)
+        page_size: Rows per batch (and per query)
+        after: Cursor to resume from (see page_cursor)
+
+    Yields:
+        ValueBatch per page
+
+    Raises:
+        ImportError: If numpy is not installed
+    """
+    from open_dateaubase.ingest.columnar import ValueBatch
+
+    for page in iter_value_pages(
+        connection,
+        replace(query, labels=()),
+        dialect=dialect,
+        schema=schema,
+        page_size=page_size,
+        after=after,
+    ):
+        yield ValueBatch.from_params(page)
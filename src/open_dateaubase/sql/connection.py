@@ -0,0 +1,60 @@
+"""
+DB-API connection helpers.
+
+Loaders, queries and validators talk to any DB-API 2.0 connection. These
+helpers work out the parameter placeholder of the driver and the SQL dialect
+used for quoting.
+"""
+
+import sqlite3
+import sys
+from typing import Any, Dict, Optional
+
+from .dialects import get_dialect
+
+# DB-API paramstyle -> positional placeholder
+PLACEHOLDERS = {"qmark": "?", "format": "%s", "pyformat": "%s"}
+
+
+def placeholder(connection: Any) -> str:
+    """
+    Return the positional parameter placeholder of a connection's driver.
+
+    Args:
+        connection: DB-API connection
+
+    Returns:
+        '?' or '%s'
+
+    Raises:
+        ValueError: If the driver only supports named or numeric parameters
+    """
+    module = sys.modules.get(type(connection).__module__.split(".")[0])
+    paramstyle = getattr(module, "paramstyle", "qmark")
+    if paramstyle not in PLACEHOLDERS:
+        raise ValueError(
+            f"Unsupported DB-API paramstyle: {paramstyle}. "
+            f"Supported: {list(PLACEHOLDERS)}"
+        )
+    return PLACEHOLDERS[paramstyle]
+
+
+def connection_dialect(connection: Any, dialect: Optional[str] = None) -> Dict[str, Any]:
+    """
+    Return the dialect configuration to use with a connection.
+
+    Args:
+        connection: DB-API connection
+        dialect: Dialect name; may be omitted for sqlite3 connections
+
+    Returns:
+        Dialect configuration from get_dialect()
+
+    Raises:
+        ValueError: If no dialect is given for a non-SQLite connection
+    """
+    if dialect is None:
+        if not isinstance(connection, sqlite3.Connection):
+            raise ValueError("A dialect is required for non-SQLite connections")
+        dialect = "sqlite"
+    return get_dialect(dialect)
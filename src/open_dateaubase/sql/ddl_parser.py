@@ -0,0 +1,854 @@
+"""
+Parse as-built DDL dumps back into the dictionary model.
+
+Databases drift from ``dictionary.json``: columns get added by hand, types
+get widened, foreign keys get dropped. This module reads a DDL dump (MSSQL
+scripts, SSMS exports with ``GO`` batches, or MySQL dumps) and recovers the
+tables, columns, primary keys, foreign keys and indexes it declares, so they
+can be compared with the dictionary or turned into ``Dictionary`` parts.
+
+The dump is read in a single pass, line by line. A small state machine
+splits it into statements while skipping comments and respecting quoted
+strings and identifiers; statements other than ``CREATE``/``ALTER`` (e.g.
+the ``INSERT`` data of a full dump) are scanned but never buffered. Each
+kept statement is tokenized with one linear regular expression and parsed
+by a hand-written recursive descent parser, so no pattern ever has to match
+a whole statement.
+
+Usage:
+    from open_dateaubase.data_model.schema import load_schema
+    from open_dateaubase.sql.ddl_parser import parse_ddl_file, schema_drift, format_drift_report
+
+    ddl = parse_ddl_file("sql_generation_scripts/2025-09-08_as-built_mssql.sql")
+    drift = schema_drift(ddl, load_schema("src/open_dateaubase/dictionary.json"))
+    print(format_drift_report(drift))
+"""
+
+import re
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Mapping, Optional, Tuple
+
+from open_dateaubase.data_model.models import Dictionary
+from open_dateaubase.data_model.schema import extract_field_name, key_table
+from .dialects import get_dialect, map_sql_type
+
+# Statements that can change the schema; everything else is skipped unbuffered
+SCHEMA_KEYWORDS = ("CREATE", "ALTER")
+
+# Integer types whose MySQL display width (int(11)) is not part of the type
+_INTEGER_TYPES = frozenset({"tinyint", "smallint", "mediumint", "int", "integer", "bigint"})
+
+# Words that continue a multi-word type name (double precision, character varying)
+_TYPE_CONTINUATIONS = frozenset({"precision", "varying", "with", "without", "time", "zone"})
+
+# Constraint keywords that end a column's type and modifiers
+_ELEMENT_KEYWORDS = frozenset(
+    {"CONSTRAINT", "PRIMARY", "FOREIGN", "UNIQUE", "KEY", "INDEX", "CHECK", "FULLTEXT"}
+)
+
+_KEY_ROLES = ("key", "compositeKeyFirst", "compositeKeySecond")
+
+_SPECIAL = re.compile(r"--|/\*|[;'\"\[`]")
+# Longest run of text without a statement end, comment or unterminated quote.
+# Possessive quantifiers keep the match linear even on long data lines.
+_RUN_PATTERN = r"""(?:[^;'"\[`/-]++|'STRING'|\[(?:[^\]]|\]\])*+\]|"[^"]*+"|`[^`]*+`|-(?!-)|/(?!\*))*+"""
+_RUN = re.compile(_RUN_PATTERN.replace("STRING", r"(?:[^']++|'')*+"))
+_MYSQL_RUN = re.compile(_RUN_PATTERN.replace("STRING", r"(?:[^'\\]++|''|\\.)*+"))
+_QUOTE_ENDS = {"'": "'", '"': '"', "[": "]", "`": "`"}
+
+_TOKEN_PATTERN = r"""
+    \s+
+    | (?P<ident>\[(?:[^\]]|\]\])*\]|`[^`]*`|"[^"]*")
+    | [Nn]?'(?P<string>STRING)'
+    | (?P<number>-?\d+(?:\.\d+)?)
+    | (?P<word>[^\W\d][\w@#$]*|[@#][\w@#$]*)
+    | (?P<punct>.)
+"""
+_TOKEN = re.compile(_TOKEN_PATTERN.replace("STRING", "(?:[^']|'')*"), re.VERBOSE | re.DOTALL)
+# MySQL also escapes quotes in strings with a backslash
+_MYSQL_TOKEN = re.compile(
+    _TOKEN_PATTERN.replace("STRING", r"(?:[^'\\]|''|\\.)*"), re.VERBOSE | re.DOTALL
+)
+
+Token = Tuple[str, str]
+
+
+# ============================================================================
+# Statement splitting
+# ============================================================================
+
+
+def _closing_quote(line: str, pos: int, quote_end: str, backslash_escapes: bool) -> int:
+    """Return the index of the quote ending a quoted run that starts at pos, or -1."""
+    close = line.find(quote_end, pos)
+    while close >= 0:
+        if backslash_escapes and quote_end == "'":
+            start = close
+            while start > pos and line[start - 1] == "\\":
+                start -= 1
+            if (close - start) % 2:
+                close = line.find(quote_end, close + 1)
+                continue
+        if quote_end in "']" and line.startswith(quote_end, close + 1):
+            close = line.find(quote_end, close + 2)  # Doubled quote escape
+            continue
+        return close
+    return -1
+
+
+def iter_statements(
+    lines: Iterable[str], keywords: Optional[Iterable[str]] = SCHEMA_KEYWORDS
+) -> Iterator[str]:
+    """
+    Split DDL text into statements, without comments.
+
+    Statements end at a ';' or a 'GO' batch separator line outside quotes.
+    Only statements starting with one of the keywords are buffered and
+    yielded; the others (e.g. INSERT data) are scanned and dropped. Once a
+    backtick-quoted identifier has been seen, the dump is taken to be from
+    MySQL and backslash escapes in strings are honoured.
+
+    Args:
+        lines: Lines of the dump (e.g. an open file)
+        keywords: Leading keywords to keep (case-insensitive), or None for all
+
+    Yields:
+        Statement text without the terminating ';'
+    """
+    keywords = frozenset(k.upper() for k in keywords) if keywords is not None else None
+    buffer: List[str] = []
+    keep: Optional[bool] = None if keywords is not None else True
+    quote_end = ""
+    in_comment = False
+    mysql = False
+
+    def append(text):
+        nonlocal keep
+        if keep is False or not text:
+            return
+        buffer.append(text)
+        if keep is None:
+            head = "".join(buffer).lstrip()
+            word = re.match(r"\w+", head)
+            if word and word.end() < len(head):
+                keep = word.group().upper() in keywords
+                if not keep:
+                    buffer.clear()
+            elif head and not word:
+                keep = False
+                buffer.clear()
+
+    def finish():
+        nonlocal keep
+        statement = "".join(buffer).strip() if keep is not False else ""
+        buffer.clear()
+        keep = None if keywords is not None else True
+        return statement
+
+    for line in lines:
+        if not quote_end and not in_comment and line.strip().upper() == "GO":
+            statement = finish()
+            if statement:
+                yield statement
+            continue
+
+        pos = 0
+        end = len(line)
+        while pos < end:
+            if in_comment:
+                close = line.find("*/", pos)
+                if close < 0:
+                    break
+                pos = close + 2
+                in_comment = False
+            elif quote_end:
+                close = _closing_quote(line, pos, quote_end, mysql)
+                if close < 0:
+                    append(line[pos:])
+                    break
+                append(line[pos : close + 1])
+                pos = close + 1
+                quote_end = ""
+            else:
+                run = (_MYSQL_RUN if mysql else _RUN).match(line, pos)
+                if run.end() > pos:
+                    text = line[pos : run.end()]
+                    append(text)
+                    mysql = mysql or "`" in text
+                    pos = run.end()
+                match = _SPECIAL.search(line, pos)
+                if match is None:
+                    append(line[pos:])
+                    break
+                append(line[pos : match.start()])
+                special = match.group()
+                pos = match.end()
+                if special == "--":
+                    append("\n")
+                    break
+                if special == "/*":
+                    append(" ")
+                    in_comment = True
+                elif special == ";":
+                    statement = finish()
+                    if statement:
+                        yield statement
+                else:
+                    append(special)
+                    quote_end = _QUOTE_ENDS[special]
+                    mysql = mysql or special == "`"
+
+    statement = finish()
+    if statement:
+        yield statement
+
+
+def tokenize(statement: str, backslash_escapes: bool = False) -> List[Token]:
+    """
+    Tokenize a statement into (kind, text) pairs.
+
+    Kinds are 'ident' (quoted identifier, unquoted), 'string' (literal,
+    unescaped), 'number', 'word' and 'punct'. Whitespace is dropped.
+
+    Args:
+        statement: Statement text without comments
+        backslash_escapes: Strings use MySQL backslash escapes
+    """
+    pattern = _MYSQL_TOKEN if backslash_escapes else _TOKEN
+    tokens = []
+    for match in pattern.finditer(statement):
+        kind = match.lastgroup
+        if kind is None:
+            continue
+        text = match.group(kind)
+        if kind == "ident":
+            text = text[1:-1].replace("]]", "]") if text[0] == "[" else text[1:-1]
+        elif kind == "string":
+            text = text.replace("''", "'")
+            if backslash_escapes:
+                text = re.sub(r"\\(.)", r"\1", text, flags=re.DOTALL)
+        tokens.append((kind, text))
+    return tokens
+
+
+# ============================================================================
+# Statement parsing
+# ============================================================================
+
+
+class _Cursor:
+    """Position in a token list, with the lookahead helpers the parser needs."""
+
+    __slots__ = ("tokens", "pos")
+
+    def __init__(self, tokens: List[Token]):
+        self.tokens = tokens
+        self.pos = 0
+
+    def peek(self, offset: int = 0) -> Token:
+        index = self.pos + offset
+        return self.tokens[index] if index < len(self.tokens) else ("end", "")
+
+    def next(self) -> Token:
+        token = self.peek()
+        self.pos += 1
+        return token
+
+    def at_end(self) -> bool:
+        return self.pos >= len(self.tokens)
+
+    def is_word(self, *words: str, offset: int = 0) -> bool:
+        kind, text = self.peek(offset)
+        return kind == "word" and text.upper() in words
+
+    def is_punct(self, char: str) -> bool:
+        return self.peek() == ("punct", char)
+
+    def accept(self, *words: str) -> bool:
+        """Consume the words in sequence if they all follow; return whether they did."""
+        if all(self.is_word(w, offset=i) for i, w in enumerate(words)):
+            self.pos += len(words)
+            return True
+        return False
+
+    def name(self) -> str:
+        """Read a possibly schema-qualified name and return its last part."""
+        _, text = self.next()
+        while self.is_punct("."):
+            self.pos += 1
+            _, text = self.next()
+        return text
+
+    def group(self) -> List[Token]:
+        """Read a parenthesized group and return the tokens inside it."""
+        if not self.is_punct("("):
+            return []
+        start = self.pos + 1
+        depth = 0
+        while not self.at_end():
+            token = self.next()
+            if token == ("punct", "("):
+                depth += 1
+            elif token == ("punct", ")"):
+                depth -= 1
+                if depth == 0:
+                    return self.tokens[start : self.pos - 1]
+        return self.tokens[start:]
+
+
+def _split_commas(tokens: List[Token]) -> List[List[Token]]:
+    """Split tokens at top-level commas."""
+    items = [[]]
+    depth = 0
+    for token in tokens:
+        if token == ("punct", "("):
+            depth += 1
+        elif token == ("punct", ")"):
+            depth -= 1
+        elif token == ("punct", ",") and depth == 0:
+            items.append([])
+            continue
+        items[-1].append(token)
+    return [item for item in items if item]
+
+
+def _column_list(tokens: List[Token]) -> List[str]:
+    """Column names of an index or key list, without ASC/DESC or prefix lengths."""
+    return [item[0][1] for item in _split_commas(tokens) if item[0][0] in ("ident", "word")]
+
+
+def _render(tokens: List[Token]) -> str:
+    """Render an expression back to text (used for defaults)."""
+    text = ""
+    for kind, value in tokens:
+        if kind == "string":
+            value = "'" + value.replace("'", "''") + "'"
+        elif kind == "word":
+            value = value.upper()
+        if text and kind != "punct" and text[-1] not in "(":
+            text += " "
+        text += value
+    return text
+
+
+def _default_value(tokens: List[Token]) -> Optional[str]:
+    """Convert a DEFAULT expression to a dictionary Default_value."""
+    while len(tokens) >= 2 and tokens[0] == ("punct", "(") and tokens[-1] == ("punct", ")"):
+        tokens = tokens[1:-1]  # MSSQL wraps defaults: ((0)), ('x'), (getdate())
+    if len(tokens) == 1 and tokens[0][0] in ("string", "number"):
+        return tokens[0][1]
+    if len(tokens) == 1 and tokens[0][0] == "word" and tokens[0][1].upper() == "NULL":
+        return None
+    return _render(tokens) or None
+
+
+def _new_table(name: str) -> Dict[str, Any]:
+    return {"name": name, "columns": {}, "primary_key": [], "foreign_keys": [], "indexes": []}
+
+
+def _parse_type(cursor: _Cursor) -> str:
+    """Read a column type such as nvarchar(100), [decimal](10, 2) or double precision."""
+    words = [cursor.next()[1].lower()]
+    while cursor.peek()[0] == "word" and cursor.peek()[1].lower() in _TYPE_CONTINUATIONS:
+        words.append(cursor.next()[1].lower())
+    base = " ".join(words)
+    args = [text.lower() for kind, text in cursor.group() if kind in ("number", "word")]
+    if base in _INTEGER_TYPES:
+        args = []
+    cursor.accept("UNSIGNED")
+    return f"{base}({','.join(args)})" if args else base
+
+
+def _parse_constraint(cursor: _Cursor, table: Dict[str, Any], name: Optional[str]) -> None:
+    """Parse a table-level PRIMARY KEY, FOREIGN KEY, UNIQUE or KEY/INDEX element."""
+    if cursor.accept("PRIMARY", "KEY"):
+        cursor.accept("CLUSTERED") or cursor.accept("NONCLUSTERED")
+        table["primary_key"] = _column_list(cursor.group())
+    elif cursor.accept("FOREIGN", "KEY"):
+        columns = _column_list(cursor.group())
+        if cursor.accept("REFERENCES"):
+            ref_table = cursor.name()
+            table["foreign_keys"].append(
+                {
+                    "name": name,
+                    "columns": columns,
+                    "ref_table": ref_table,
+                    "ref_columns": _column_list(cursor.group()),
+                }
+            )
+    elif cursor.is_word("UNIQUE", "KEY", "INDEX", "FULLTEXT"):
+        is_unique = cursor.accept("UNIQUE")
+        cursor.accept("KEY") or cursor.accept("INDEX")
+        cursor.accept("CLUSTERED") or cursor.accept("NONCLUSTERED")
+        if not cursor.is_punct("("):
+            name = cursor.name()
+        table["indexes"].append(
+            {
+                "name": name,
+                "columns": _column_list(cursor.group()),
+                "include_columns": [],
+                "is_unique": is_unique,
+            }
+        )
+
+
+def _parse_column(cursor: _Cursor, table: Dict[str, Any]) -> None:
+    """Parse a column definition and its inline constraints."""
+    name = cursor.next()[1]
+    column = {
+        "name": name,
+        "sql_data_type": _parse_type(cursor),
+        "is_required": False,
+        "default_value": None,
+        "order": len(table["columns"]) + 1,
+    }
+    while not cursor.at_end():
+        if cursor.accept("NOT", "NULL"):
+            column["is_required"] = True
+        elif cursor.accept("NULL"):
+            column["is_required"] = False
+        elif cursor.accept("DEFAULT"):
+            if cursor.is_punct("("):
+                expression = [("punct", "(")] + cursor.group() + [("punct", ")")]
+            else:
+                expression = [cursor.next()]
+                if cursor.is_punct("("):
+                    expression += [("punct", "(")] + cursor.group() + [("punct", ")")]
+            column["default_value"] = _default_value(expression)
+        elif cursor.accept("PRIMARY", "KEY"):
+            table["primary_key"] = [name]
+        elif cursor.accept("REFERENCES"):
+            ref_table = cursor.name()
+            table["foreign_keys"].append(
+                {
+                    "name": None,
+                    "columns": [name],
+                    "ref_table": ref_table,
+                    "ref_columns": _column_list(cursor.group()),
+                }
+            )
+        elif cursor.accept("CONSTRAINT"):
+            cursor.name()
+        else:
+            cursor.next()
+            cursor.group()  # IDENTITY(1,1), CHECK (...), etc.
+    table["columns"][name] = column
+
+
+def _parse_create_table(cursor: _Cursor, tables: Dict[str, Any]) -> None:
+    name = cursor.name()
+    if cursor.is_word("PARTITION"):
+        return  # PostgreSQL partition of a table declared elsewhere
+    table = tables.setdefault(name.lower(), _new_table(name))
+    for element in _split_commas(cursor.group()):
+        element_cursor = _Cursor(element)
+        constraint_name = None
+        if element_cursor.accept("CONSTRAINT"):
+            constraint_name = element_cursor.name()
+        if element_cursor.is_word(*_ELEMENT_KEYWORDS):
+            _parse_constraint(element_cursor, table, constraint_name)
+        elif element_cursor.peek()[0] in ("ident", "word"):
+            _parse_column(element_cursor, table)
+
+
+def _parse_alter_table(cursor: _Cursor, tables: Dict[str, Any]) -> None:
+    name = cursor.name()
+    table = tables.setdefault(name.lower(), _new_table(name))
+    cursor.accept("WITH", "CHECK") or cursor.accept("WITH", "NOCHECK")
+    if not cursor.accept("ADD"):
+        return
+    constraint_name = None
+    if cursor.accept("CONSTRAINT"):
+        constraint_name = cursor.name()
+    if cursor.accept("DEFAULT"):
+        # MSSQL: ADD CONSTRAINT df DEFAULT (expr) FOR column
+        expression = []
+        while not cursor.at_end() and not cursor.is_word("FOR"):
+            expression.append(cursor.next())
+        if cursor.accept("FOR"):
+            column = table["columns"].get(cursor.name())
+            if column is not None:
+                column["default_value"] = _default_value(expression)
+    elif cursor.is_word(*_ELEMENT_KEYWORDS):
+        _parse_constraint(cursor, table, constraint_name)
+    else:
+        cursor.accept("COLUMN")
+        _parse_column(cursor, table)
+
+
+def _parse_create_index(cursor: _Cursor, tables: Dict[str, Any]) -> None:
+    is_unique = cursor.accept("UNIQUE")
+    cursor.accept("CLUSTERED") or cursor.accept("NONCLUSTERED")
+    if not cursor.accept("INDEX"):
+        return
+    index_name = cursor.name()
+    if not cursor.accept("ON"):
+        return
+    name = cursor.name()
+    table = tables.setdefault(name.lower(), _new_table(name))
+    columns = _column_list(cursor.group())
+    include_columns = _column_list(cursor.group()) if cursor.accept("INCLUDE") else []
+    table["indexes"].append(
+        {
+            "name": index_name,
+            "columns": columns,
+            "include_columns": include_columns,
+            "is_unique": is_unique,
+        }
+    )
+
+
+def parse_ddl(lines: Iterable[str]) -> Dict[str, Any]:
+    """
+    Parse DDL text into tables.
+
+    Handles CREATE TABLE (columns, inline and table-level constraints),
+    ALTER TABLE ... ADD (constraints, columns and MSSQL named defaults) and
+    CREATE INDEX. Other statements are ignored.
+
+    Args:
+        lines: Lines of the dump (e.g. an open file); read once
+
+    Returns:
+        Dict with 'tables': lowercase table name -> {'name', 'columns'
+        (column name -> {'name', 'sql_data_type', 'is_required',
+        'default_value', 'order'}), 'primary_key', 'foreign_keys' ({'name',
+        'columns', 'ref_table', 'ref_columns'}) and 'indexes' ({'name',
+        'columns', 'include_columns', 'is_unique'})}
+    """
+    tables: Dict[str, Any] = {}
+    for statement in iter_statements(lines):
+        cursor = _Cursor(tokenize(statement, backslash_escapes="`" in statement))
+        if cursor.accept("CREATE", "TABLE"):
+            cursor.accept("IF", "NOT", "EXISTS")
+            _parse_create_table(cursor, tables)
+        elif cursor.accept("ALTER", "TABLE"):
+            cursor.accept("ONLY")
+            _parse_alter_table(cursor, tables)
+        elif cursor.accept("CREATE"):
+            _parse_create_index(cursor, tables)
+
+    for table in tables.values():
+        for column in table["primary_key"]:
+            if column in table["columns"]:
+                table["columns"][column]["is_required"] = True
+    return {"tables": tables}
+
+
+def parse_ddl_file(path: str | Path) -> Dict[str, Any]:
+    """
+    Parse a DDL dump file (streamed line by line).
+
+    Args:
+        path: Path to the .sql file
+
+    Returns:
+        Parsed tables (see parse_ddl)
+    """
+    with open(path, encoding="utf-8", errors="replace") as f:
+        return parse_ddl(f)
+
+
+# ============================================================================
+# Conversion to Dictionary parts
+# ============================================================================
+
+
+def _label(name: str) -> str:
+    return name.replace("_", " ").strip() or name
+
+
+def ddl_to_dictionary(parsed: Mapping[str, Any]) -> Tuple[Dictionary, List[str]]:
+    """
+    Build Dictionary parts from parsed DDL.
+
+    Columns with the same name and type share one field part, like the
+    dictionary's shared ID fields; same-named columns of a different type
+    get a table-prefixed Part_ID. Primary key columns ending in '_ID' become
+    key parts, and single-column foreign keys whose column has the name of
+    the referenced table's key become relationships. Foreign keys the
+    dictionary cannot express (e.g. a column referencing a differently named
+    key) and tables it cannot name are reported instead.
+
+    Args:
+        parsed: Result of parse_ddl
+
+    Returns:
+        Tuple of (Dictionary, list of messages about what was not imported)
+
+    Raises:
+        pydantic.ValidationError: If the imported parts are not a valid
+            dictionary (e.g. a column type with invalid precision)
+    """
+    warnings = []
+    tables = {}
+    for key, table in parsed["tables"].items():
+        if " " in table["name"]:
+            warnings.append(f"{table['name']}: table names cannot contain spaces; skipped")
+        else:
+            tables[key] = table
+    parts: List[Dict[str, Any]] = []
+    fields: Dict[str, Dict[str, Any]] = {}
+    part_ids: Dict[Tuple[str, str], str] = {}  # (table, column) -> Part_ID
+
+    table_ids = {table["name"] for table in tables.values()}
+    for table in tables.values():
+        parts.append(
+            {
+                "Part_ID": table["name"],
+                "Label": _label(table["name"]),
+                "Description": f"Table {table['name']} imported from DDL",
+                "Part_type": "table",
+            }
+        )
+
+    for table in tables.values():
+        table_name = table["name"]
+        primary_key = table["primary_key"]
+        for column in table["columns"].values():
+            name = column["name"]
+            part_id = name
+            existing = fields.get(part_id)
+            if part_id in table_ids or (
+                existing is not None and existing["SQL_data_type"] != column["sql_data_type"]
+            ):
+                part_id = f"{table_name}_{name}"
+            if extract_field_name(part_id) != name:
+                warnings.append(
+                    f"{table_name}.{name}: no Part_ID maps back to this column name"
+                )
+
+            if name in primary_key and name.endswith("_ID"):
+                position = primary_key.index(name)
+                role = (
+                    "key"
+                    if len(primary_key) == 1
+                    else ("compositeKeyFirst", "compositeKeySecond", "property")[min(position, 2)]
+                )
+            else:
+                role = "property"
+
+            part = fields.get(part_id)
+            if part is None:
+                part = fields[part_id] = {
+                    "Part_ID": part_id,
+                    "Label": _label(name),
+                    "Description": f"Column {name} imported from DDL",
+                    "Part_type": role,
+                    "SQL_data_type": column["sql_data_type"],
+                    "table_presence": {},
+                }
+                if column["default_value"] is not None:
+                    part["Default_value"] = column["default_value"]
+            elif role == "key" or part["Part_type"] == "property":
+                part["Part_type"] = role
+            part["table_presence"][table_name] = {
+                "role": role,
+                "required": column["is_required"],
+                "order": column["order"],
+            }
+            part_ids[(table_name.lower(), name)] = part_id
+
+    for table in tables.values():
+        for fk in table["foreign_keys"]:
+            ref = tables.get(fk["ref_table"].lower())
+            column = fk["columns"][0] if len(fk["columns"]) == 1 else None
+            part_id = part_ids.get((table["name"].lower(), column))
+            part = fields.get(part_id)
+            ref_key = ref["primary_key"] if ref else []
+            if (
+                part is None
+                or ref is None
+                or fk["ref_columns"] not in ([column], [])
+                or ref_key != [column]
+                or part["Part_type"] != "key"
+            ):
+                warnings.append(
+                    f"{table['name']}: foreign key ({', '.join(fk['columns'])}) -> "
+                    f"{fk['ref_table']} ({', '.join(fk['ref_columns'])}) is not "
+                    "expressible in the dictionary"
+                )
+                continue
+            presence = part["table_presence"][table["name"]]
+            presence["relationship_type"] = {
+                "key": "one-to-one",
+                "property": "one-to-many",
+            }.get(presence["role"], "many-to-many")
+
+    parts.extend(fields.values())
+    return Dictionary.model_validate({"parts": parts}), warnings
+
+
+# ============================================================================
+# Drift report
+# ============================================================================
+
+
+def _normalize_type(sql_type: Optional[str]) -> str:
+    return (sql_type or "").replace(" ", "").lower()
+
+
+def schema_drift(
+    parsed: Mapping[str, Any], schema: Mapping[str, Any], dialect: str = "mssql"
+) -> Dict[str, List]:
+    """
+    Compare parsed DDL with a compiled dictionary schema.
+
+    Table and column names are compared case-insensitively, as MSSQL does.
+    A column type matches if it is the dictionary type as written or as the
+    SQL generator renders it for the dialect (lowercase, without spaces), so
+    a dump from another database reports its native types as type drift.
+
+    Args:
+        parsed: Result of parse_ddl (the as-built database)
+        schema: Compiled schema (see open_dateaubase.data_model.schema)
+        dialect: Dialect the dump was written in
+
+    Returns:
+        Dict of lists:
+            missing_tables / extra_tables: tables only in the dictionary / DDL
+            missing_columns / extra_columns: (table, column)
+            type_changes: (table, column, dictionary type, DDL type)
+            nullability_changes: (table, column, dictionary required, DDL required)
+            default_changes: (table, column, dictionary default, DDL default)
+            primary_key_changes: (table, dictionary columns, DDL columns)
+            missing_foreign_keys / extra_foreign_keys: (table, column, referenced table)
+    """
+    drift = {
+        "missing_tables": [],
+        "extra_tables": [],
+        "missing_columns": [],
+        "extra_columns": [],
+        "type_changes": [],
+        "nullability_changes": [],
+        "default_changes": [],
+        "primary_key_changes": [],
+        "missing_foreign_keys": [],
+        "extra_foreign_keys": [],
+    }
+    config = get_dialect(dialect)
+    ddl_tables = parsed["tables"]
+    dictionary_tables = {t.lower(): t for t in schema["tables"]}
+
+    drift["missing_tables"] = sorted(
+        name for key, name in dictionary_tables.items() if key not in ddl_tables
+    )
+    drift["extra_tables"] = sorted(
+        t["name"] for key, t in ddl_tables.items() if key not in dictionary_tables
+    )
+
+    for key, table_id in sorted(dictionary_tables.items()):
+        ddl_table = ddl_tables.get(key)
+        if ddl_table is None:
+            continue
+        fields = schema["tables"][table_id]["fields"]
+        ddl_columns = {c.lower(): column for c, column in ddl_table["columns"].items()}
+        expected = {extract_field_name(f["part_id"]).lower(): f for f in fields}
+
+        # Partitioned tables carry their partition column in the primary key
+        key_columns = [
+            extract_field_name(f["part_id"]) for f in fields if f["part_type"] in _KEY_ROLES
+        ]
+        storage = schema["tables"][table_id]["storage"]
+        if key_columns and storage and storage["partition_column"] and config["partitioning"]:
+            partition_column = extract_field_name(storage["partition_column"])
+            if partition_column not in key_columns:
+                key_columns.append(partition_column)
+        key_lower = {c.lower() for c in key_columns}
+
+        for name, field in expected.items():
+            column_name = extract_field_name(field["part_id"])
+            column = ddl_columns.get(name)
+            if column is None:
+                drift["missing_columns"].append((table_id, column_name))
+                continue
+            sql_type = field["sql_data_type"] or "nvarchar(255)"
+            expected_types = {
+                _normalize_type(sql_type),
+                _normalize_type(map_sql_type(sql_type, config)),
+            }
+            if _normalize_type(column["sql_data_type"]) not in expected_types:
+                drift["type_changes"].append(
+                    (table_id, column_name, field["sql_data_type"], column["sql_data_type"])
+                )
+            # Primary key columns are NOT NULL whether or not they are marked required
+            required = field["is_required"] or name in key_lower
+            if required != column["is_required"]:
+                drift["nullability_changes"].append(
+                    (table_id, column_name, required, column["is_required"])
+                )
+            if (field["default_value"] or None) != column["default_value"]:
+                drift["default_changes"].append(
+                    (table_id, column_name, field["default_value"] or None, column["default_value"])
+                )
+        for name, column in ddl_columns.items():
+            if name not in expected:
+                drift["extra_columns"].append((table_id, column["name"]))
+
+        if [c.lower() for c in key_columns] != [c.lower() for c in ddl_table["primary_key"]]:
+            drift["primary_key_changes"].append(
+                (table_id, key_columns, list(ddl_table["primary_key"]))
+            )
+
+        expected_fks = {}
+        for field in fields:
+            target = key_table(schema, field["fk_to"]) if field["fk_to"] else None
+            if target is not None:
+                column_name = extract_field_name(field["part_id"])
+                expected_fks[(column_name.lower(), target.lower())] = (column_name, target)
+        actual_fks = {
+            (fk["columns"][0].lower(), fk["ref_table"].lower()): (fk["columns"][0], fk["ref_table"])
+            for fk in ddl_table["foreign_keys"]
+            if len(fk["columns"]) == 1
+        }
+        for fk_key, (column_name, target) in expected_fks.items():
+            if fk_key not in actual_fks:
+                drift["missing_foreign_keys"].append((table_id, column_name, target))
+        for fk_key, (column_name, target) in actual_fks.items():
+            if fk_key not in expected_fks:
+                drift["extra_foreign_keys"].append((table_id, column_name, target))
+
+    return drift
+
+
+_REPORT_SECTIONS = (
+    ("missing_tables", "Tables in the dictionary but not in the database", "{}"),
+    ("extra_tables", "Tables in the database but not in the dictionary", "{}"),
+    ("missing_columns", "Columns missing from the database", "{}.{}"),
+    ("extra_columns", "Columns not in the dictionary", "{}.{}"),
+    ("type_changes", "Type differences (dictionary -> database)", "{}.{}: {} -> {}"),
+    ("nullability_changes", "Required differences (dictionary -> database)", "{}.{}: {} -> {}"),
+    ("default_changes", "Default differences (dictionary -> database)", "{}.{}: {} -> {}"),
+    ("primary_key_changes", "Primary key differences (dictionary -> database)", "{}: {} -> {}"),
+    ("missing_foreign_keys", "Foreign keys missing from the database", "{}.{} -> {}"),
+    ("extra_foreign_keys", "Foreign keys not in the dictionary", "{}.{} -> {}"),
+)
+
+
+def format_drift_report(drift: Mapping[str, List], title: str = "Schema drift") -> str:
+    """
+    Render a drift report as Markdown.
+
+    Args:
+        drift: Result of schema_drift
+        title: Report heading
+
+    Returns:
+        Markdown text with one section per kind of difference found
+    """
+    lines = [f"# {title}", ""]
+    total = sum(len(items) for items in drift.values())
+    if not total:
+        lines.append("No drift: the database matches the dictionary.")
+        return "\n".join(lines) + "\n"
+
+    lines.append(f"{total} differences found.")
+    for key, heading, template in _REPORT_SECTIONS:
+        items = drift.get(key)
+        if not items:
+            continue
+        lines += ["", f"## {heading} ({len(items)})", ""]
+        for item in items:
+            values = (item,) if isinstance(item, str) else item
+            lines.append("- " + template.format(*values))
+    return "\n".join(lines) + "\n"
@@ -0,0 +1,363 @@
+"""
+SQL dialect configurations.
+
+Each dialect is a plain configuration dict describing how the dictionary's
+(MSSQL-flavoured) column types, identifiers, defaults and foreign keys are
+rendered for a target database. New dialects can be added at runtime with
+``register_dialect``.
+
+Configuration keys:
+    quote_char / quote_char_end: Identifier quoting characters
+    type_mappings: Base type -> target base type. Length/precision parameters
+        of the source type are preserved unless the target is unsized.
+    unsized_types: Target base types that never take parameters
+    max_type_length: Target base type -> (max length, fallback type) for
+        sized types whose length exceeds what the database accepts
+    max_type_precision: Target base type -> highest fractional-second
+        precision; larger precisions are clamped
+    boolean_literals: Rendering of the dictionary's "True"/"False" defaults
+    default_functions: Function defaults rendered unquoted (source -> target)
+    inline_foreign_keys: Declare FKs inside CREATE TABLE instead of ALTER TABLE
+    derive_fk_table_from_field_name: Derive FK target tables from the field
+        name ('Equipment_model_ID' -> 'Equipment_model') instead of looking up
+        the table that owns the key. Only relies on case-insensitive names
+        and is kept for MSSQL to match the published scripts.
+    supports_include_columns: Indexes accept INCLUDE (...) for covering
+        columns. Otherwise included columns are appended to the index key.
+    partitioning: How range partitioning is declared: 'scheme' (MSSQL
+        partition function + scheme), 'declarative' (PostgreSQL PARTITION BY)
+        or None (storage partitioning hints are ignored)
+    supports_columnstore: Honour the Columnstore storage hint
+    supports_check_constraints / supports_deferred_constraints: Capabilities
+    add_column_keyword: 'ADD' or 'ADD COLUMN' in ALTER TABLE
+    alter_column: How column types and nullability are changed: 'mssql'
+        (ALTER COLUMN with the full type), 'postgres' (ALTER COLUMN ... TYPE /
+        SET NOT NULL) or None (not supported; the table must be rebuilt)
+    rename_column: 'sp_rename' (MSSQL) or 'rename' (ALTER TABLE ... RENAME COLUMN)
+    drop_index_on_table: DROP INDEX names the table (DROP INDEX ix ON t)
+    online_ddl: Online schema-change syntax for large tables: 'mssql'
+        (ONLINE = ON, WITH NOCHECK), 'postgres' (CONCURRENTLY, NOT VALID) or
+        None
+    pagination: Row limit syntax of queries: 'offset_fetch' (OFFSET ... ROWS
+        FETCH NEXT ... ROWS ONLY) or 'limit_offset' (LIMIT ... OFFSET ...)
+    time_bucket: How timestamps are rounded down to time buckets in
+        aggregation queries: 'mssql' (DATEADD/DATEDIFF), 'postgres' (epoch
+        arithmetic), 'sqlite' (strftime on ISO 8601 text) or None (values are
+        aggregated client-side with NumPy). SQLite defaults to None: it runs
+        in-process, and its window functions are slower than NumPy.
+
+Usage:
+    from open_dateaubase.sql.dialects import get_dialect, map_sql_type
+
+    config = get_dialect("postgres")
+    map_sql_type("nvarchar(1073741823)", config)  # -> "text"
+    map_sql_type("datetime2(3)", config)  # -> "timestamp(3)"
+"""
+
+import copy
+from typing import Any, Dict, Optional
+
+# Source types whose defaults are rendered without quotes
+NUMERIC_BASE_TYPES = frozenset(
+    {"int", "bigint", "smallint", "float", "real", "numeric", "decimal", "bit"}
+)
+
+DIALECTS: Dict[str, Dict[str, Any]] = {
+    "mssql": {
+        "quote_char": "[",
+        "quote_char_end": "]",
+        "type_mappings": {
+            "nvarchar": "nvarchar",
+            "ntext": "nvarchar(max)",  # ntext deprecated in modern MSSQL
+            "int": "int",
+            "float": "float",
+            "bigint": "bigint",
+            "smallint": "smallint",
+            "real": "real",
+            "numeric": "numeric",
+            "decimal": "decimal",
+            "bit": "bit",
+            "date": "date",
+            "datetime": "datetime",
+            "datetime2": "datetime2",
+            "datetimeoffset": "datetimeoffset",
+            "timestamptz": "datetimeoffset",
+            "time": "time",
+        },
+        "unsized_types": frozenset(),
+        "max_type_length": {},
+        "max_type_precision": {},
+        "boolean_literals": {"True": "1", "False": "0"},
+        "default_functions": {
+            "GETDATE()": "GETDATE()",
+            "CURRENT_TIMESTAMP": "CURRENT_TIMESTAMP",
+        },
+        "inline_foreign_keys": False,
+        "derive_fk_table_from_field_name": True,
+        "supports_include_columns": True,
+        "partitioning": "scheme",
+        "supports_columnstore": True,
+        "supports_check_constraints": True,
+        "supports_deferred_constraints": False,
+        "add_column_keyword": "ADD",
+        "alter_column": "mssql",
+        "rename_column": "sp_rename",
+        "drop_index_on_table": True,
+        "online_ddl": "mssql",
+        "pagination": "offset_fetch",
+        "time_bucket": "mssql",
+    },
+    "postgres": {
+        "quote_char": '"',
+        "quote_char_end": '"',
+        "type_mappings": {
+            "nvarchar": "varchar",
+            "varchar": "varchar",
+            "nchar": "char",
+            "char": "char",
+            "ntext": "text",
+            "text": "text",
+            "int": "integer",
+            "bigint": "bigint",
+            "smallint": "smallint",
+            "float": "double precision",
+            "real": "real",
+            "numeric": "numeric",
+            "decimal": "numeric",
+            "bit": "boolean",
+            "image": "bytea",
+            "blob": "bytea",
+            "date": "date",
+            "datetime": "timestamp",
+            "datetime2": "timestamp",
+            "datetimeoffset": "timestamptz",
+            "timestamptz": "timestamptz",
+            "time": "time",
+        },
+        "unsized_types": frozenset(
+            {
+                "text",
+                "integer",
+                "bigint",
+                "smallint",
+                "double precision",
+                "real",
+                "boolean",
+                "bytea",
+                "date",
+            }
+        ),
+        "max_type_length": {"varchar": (10485760, "text"), "char": (10485760, "text")},
+        "max_type_precision": {"timestamp": 6, "timestamptz": 6, "time": 6},
+        "boolean_literals": {"True": "TRUE", "False": "FALSE"},
+        "default_functions": {
+            "GETDATE()": "CURRENT_TIMESTAMP",
+            "CURRENT_TIMESTAMP": "CURRENT_TIMESTAMP",
+        },
+        "inline_foreign_keys": False,
+        "derive_fk_table_from_field_name": False,
+        "supports_include_columns": True,
+        "partitioning": "declarative",
+        "supports_columnstore": False,
+        "supports_check_constraints": True,
+        "supports_deferred_constraints": True,
+        "add_column_keyword": "ADD COLUMN",
+        "alter_column": "postgres",
+        "rename_column": "rename",
+        "drop_index_on_table": False,
+        "online_ddl": "postgres",
+        "pagination": "limit_offset",
+        "time_bucket": "postgres",
+    },
+    "sqlite": {
+        "quote_char": '"',
+        "quote_char_end": '"',
+        # SQLite only has storage classes; map every type to its affinity
+        "type_mappings": {
+            "nvarchar": "TEXT",
+            "varchar": "TEXT",
+            "nchar": "TEXT",
+            "char": "TEXT",
+            "ntext": "TEXT",
+            "text": "TEXT",
+            "int": "INTEGER",
+            "bigint": "INTEGER",
+            "smallint": "INTEGER",
+            "float": "REAL",
+            "real": "REAL",
+            "numeric": "NUMERIC",
+            "decimal": "NUMERIC",
+            "bit": "INTEGER",
+            "image": "BLOB",
+            "blob": "BLOB",
+            # ISO 8601 text sorts chronologically (for a fixed UTC offset)
+            "date": "TEXT",
+            "datetime": "TEXT",
+            "datetime2": "TEXT",
+            "datetimeoffset": "TEXT",
+            "timestamptz": "TEXT",
+            "time": "TEXT",
+        },
+        "unsized_types": frozenset({"TEXT", "INTEGER", "REAL", "NUMERIC", "BLOB"}),
+        "max_type_length": {},
+        "max_type_precision": {},
+        "boolean_literals": {"True": "1", "False": "0"},
+        "default_functions": {
+            "GETDATE()": "CURRENT_TIMESTAMP",
+            "CURRENT_TIMESTAMP": "CURRENT_TIMESTAMP",
+        },
+        "inline_foreign_keys": True,
+        "derive_fk_table_from_field_name": False,
+        "supports_include_columns": False,
+        "partitioning": None,
+        "supports_columnstore": False,
+        "supports_check_constraints": True,
+        "supports_deferred_constraints": True,
+        "add_column_keyword": "ADD COLUMN",
+        "alter_column": None,
+        "rename_column": "rename",
+        "drop_index_on_table": False,
+        "online_ddl": None,
+        "pagination": "limit_offset",
+        "time_bucket": None,
+    },
+}
+
+
+def register_dialect(name: str, config: Dict[str, Any]) -> None:
+    """
+    Register (or replace) a dialect configuration.
+
+    Missing keys are filled from the MSSQL configuration.
+
+    Args:
+        name: Dialect name used as target_db
+        config: Dialect configuration dict (see module docstring)
+    """
+    DIALECTS[name] = {**copy.deepcopy(DIALECTS["mssql"]), **config}
+
+
+def get_dialect(target_db: str) -> Dict[str, Any]:
+    """
+    Get a dialect configuration with a 'quote' helper for identifiers.
+
+    Args:
+        target_db: Database flavor string
+
+    Returns:
+        Dict with DB-specific settings (a copy that callers may modify)
+
+    Raises:
+        ValueError: If the dialect is unknown
+    """
+    if target_db not in DIALECTS:
+        raise ValueError(
+            f"Unsupported database: {target_db}. Supported: {list(DIALECTS.keys())}"
+        )
+
+    config = copy.deepcopy(DIALECTS[target_db])
+    config["name"] = target_db
+
+    # Add convenience method for quoting identifiers
+    config["quote"] = lambda name: (
+        f"{config['quote_char']}{name}{config['quote_char_end']}"
+    )
+
+    return config
+
+
+def split_sql_type(sql_type: str) -> tuple[str, str]:
+    """Split 'nvarchar(255)' into ('nvarchar', '(255)')."""
+    if "(" in sql_type:
+        index = sql_type.index("(")
+        return sql_type[:index].strip(), sql_type[index:]
+    return sql_type.strip(), ""
+
+
+def map_sql_type(sql_type: str, config: Dict[str, Any]) -> str:
+    """
+    Map a dictionary SQL type to the target dialect.
+
+    Args:
+        sql_type: Type as written in the dictionary (e.g. 'nvarchar(255)')
+        config: Dialect configuration from get_dialect()
+
+    Returns:
+        Type to use in DDL. Unknown types are passed through unchanged.
+    """
+    base_type, params = split_sql_type(sql_type)
+    target = config["type_mappings"].get(base_type.lower())
+    if target is None:
+        return sql_type
+
+    if target in config["unsized_types"]:
+        return target
+
+    if not params:
+        return target
+
+    # Preserve parameters (e.g. 'nvarchar' + '(255)')
+    target_base = target.split("(")[0]
+    max_length = config["max_type_length"].get(target_base)
+    if max_length is not None:
+        length = _first_int(params)
+        if length is not None and length > max_length[0]:
+            return max_length[1]
+
+    max_precision = config["max_type_precision"].get(target_base)
+    if max_precision is not None:
+        precision = _first_int(params)
+        if precision is not None and precision > max_precision:
+            params = f"({max_precision})"
+
+    return target_base + params
+
+
+def format_default(
+    default_value: str, sql_type: Optional[str], config: Dict[str, Any]
+) -> str:
+    """
+    Render a dictionary Default_value as a SQL literal for the target dialect.
+
+    Args:
+        default_value: Default as written in the dictionary
+        sql_type: Source SQL type of the field (decides quoting)
+        config: Dialect configuration from get_dialect()
+
+    Returns:
+        SQL expression usable after DEFAULT
+    """
+    if default_value in config["default_functions"]:
+        return config["default_functions"][default_value]
+
+    return format_literal(default_value, sql_type, config)
+
+
+def format_literal(value: str, sql_type: Optional[str], config: Dict[str, Any]) -> str:
+    """
+    Render a dictionary value (e.g. a partition boundary) as a SQL literal.
+
+    Args:
+        value: Value as written in the dictionary
+        sql_type: Source SQL type of the field (decides quoting)
+        config: Dialect configuration from get_dialect()
+
+    Returns:
+        SQL literal
+    """
+    # Handle boolean values
+    value = config["boolean_literals"].get(value, value)
+
+    # Handle numeric vs string values
+    base_type = split_sql_type(sql_type)[0].lower() if sql_type else ""
+    if base_type in NUMERIC_BASE_TYPES:
+        return value
+
+    escaped = value.replace("'", "''")
+    return f"'{escaped}'"
+
+
+def _first_int(params: str) -> Optional[int]:
+    """Return the first integer parameter of '(n)' / '(p, s)', if any."""
+    first = params.strip("()").split(",")[0].strip()
+    return int(first) if first.isdigit() else None
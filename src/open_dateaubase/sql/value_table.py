@@ -0,0 +1,36 @@
+"""
+The value table, as shared by ingestion and queries.
+
+Loaders write time-series values to ``VALUE_TABLE`` and queries read them
+back. Both render timestamps with ``format_timestamp``, so stored values and
+query bounds compare the same way on every dialect, including SQLite, which
+stores them as text.
+"""
+
+from datetime import datetime, timezone
+from typing import Any, Optional
+
+VALUE_TABLE = "value"
+
+
+def format_timestamp(value: Any) -> Optional[str]:
+    """
+    Render a source timestamp for the Timestamp column (None if empty).
+
+    Other values than datetimes are parsed as ISO 8601, so the stored text
+    always has the datetime2(3) form 'YYYY-MM-DD HH:MM:SS.fff'. Timestamps
+    with a UTC offset are converted to UTC, as the column holds no offset.
+
+    Raises:
+        ValueError: If the value is not a valid timestamp
+    """
+    if value is None:
+        return None
+    if not isinstance(value, datetime):
+        value = str(value).strip()
+        if not value:
+            return None
+        value = datetime.fromisoformat(value)
+    if value.tzinfo is not None:
+        value = value.astimezone(timezone.utc).replace(tzinfo=None)
+    return value.isoformat(sep=" ", timespec="milliseconds")
@@ -0,0 +1,99 @@
+"""
+Stream generated SQL to files or straight into a database.
+
+The SQL generators yield the script line by line (see
+``scripts/generate_sql.py``). These helpers consume such a stream without
+ever joining it into one string: ``write_sql`` writes it to any file-like
+object (a file, ``sys.stdout`` piped into ``sqlcmd``/``psql``, a socket),
+and ``execute_sql`` splits it into statements and runs them on a DB-API
+connection, committing every ``batch_size`` statements.
+
+Statements are split with the same scanner that reads as-built dumps
+(``open_dateaubase.sql.ddl_parser.iter_statements``), so comments are
+dropped and ``;`` inside quoted strings or identifiers is left alone.
+Scripts that rely on batch-scoped variables (``DECLARE`` ... ``WHILE`` in
+MSSQL migrations) or dollar-quoted bodies (PostgreSQL ``DO $$``) must be
+run by the database's own client instead.
+
+Usage:
+    import sqlite3
+    from generate_sql import iter_sql_schema  # scripts/generate_sql.py
+    from open_dateaubase.sql.writer import write_sql, execute_sql
+
+    with open("schema.sql", "w", encoding="utf-8") as f:
+        write_sql(iter_sql_schema(schema, "sqlite"), f)
+
+    execute_sql(iter_sql_schema(schema, "sqlite"), sqlite3.connect("site.db"))
+"""
+
+from typing import Any, Iterable, Iterator, TextIO
+
+from .ddl_parser import iter_statements
+
+
+def write_sql(lines: Iterable[str], stream: TextIO) -> None:
+    """
+    Write SQL lines to a stream, separated by newlines.
+
+    The output is identical to ``stream.write("\\n".join(lines))``, without
+    holding the whole script in memory.
+
+    Args:
+        lines: SQL lines (each may itself span several lines)
+        stream: Writable text stream
+    """
+    separator = ""
+    for line in lines:
+        stream.write(separator)
+        stream.write(line)
+        separator = "\n"
+
+
+def split_sql(lines: Iterable[str]) -> Iterator[str]:
+    """
+    Split SQL lines into executable statements.
+
+    Args:
+        lines: SQL lines (each may itself span several lines)
+
+    Yields:
+        Statements without comments or the terminating ';'
+    """
+    text_lines = (
+        text_line for line in lines for text_line in (line + "\n").splitlines(True)
+    )
+    return iter_statements(text_lines, keywords=None)
+
+
+def execute_sql(lines: Iterable[str], connection: Any, batch_size: int = 100) -> int:
+    """
+    Execute SQL lines statement by statement on a DB-API connection.
+
+    The connection is committed after every ``batch_size`` statements and
+    once more at the end, so a failure leaves the completed batches in place
+    (on databases with transactional DDL, the failed batch is not committed).
+
+    Args:
+        lines: SQL lines (each may itself span several lines)
+        connection: DB-API connection
+        batch_size: Number of statements per transaction
+
+    Returns:
+        Number of statements executed
+
+    Raises:
+        ValueError: If batch_size is not positive
+    """
+    if batch_size < 1:
+        raise ValueError(f"batch_size must be positive, got {batch_size}")
+
+    cursor = connection.cursor()
+    executed = 0
+    for statement in split_sql(lines):
+        cursor.execute(statement)
+        executed += 1
+        if executed % batch_size == 0:
+            connection.commit()
+    connection.commit()
+    cursor.close()
+    return executed
@@ -20,6 +20,14 @@ from fixtures.sample_dictionary import (
 )
 
 
+@pytest.fixture(autouse=True)
+def isolated_dictionary_cache(tmp_path_factory, monkeypatch):
+    """Keep dictionary snapshots out of the user's cache directory."""
+    cache_dir = tmp_path_factory.mktemp("dictionary_cache")
+    monkeypatch.setenv("OPEN_DATEAUBASE_CACHE_DIR", str(cache_dir))
+    return cache_dir
+
+
 @pytest.fixture
 def sample_json_dict():
     """Return sample dictionary data as Python dict."""
@@ -62,6 +70,19 @@ def edge_case_json_file(tmp_path):
     return json_file
 
 
+@pytest.fixture
+def dateaubase_db():
+    """In-memory SQLite database created from the packaged dictionary."""
+    import sqlite3
+    from generate_sql import generate_sql_schema, parse_parts_json
+
+    schema = parse_parts_json(project_root / "src" / "open_dateaubase" / "dictionary.json")
+    connection = sqlite3.connect(":memory:")
+    connection.executescript(generate_sql_schema(schema, target_db="sqlite"))
+    yield connection
+    connection.close()
+
+
 @pytest.fixture
 def output_dirs(tmp_path):
     """Create standard output directory structure for tests."""
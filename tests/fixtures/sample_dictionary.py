@@ -405,3 +405,44 @@ WHERE c.Is_active = 1
             },
         ]
     }
+
+
+def chain_dictionary_data(references: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Dictionary data with one table per key of references, linked by foreign keys.
+
+    Args:
+        references: Table -> tables it references (tables are lowercase
+            names whose key is '<Name>_ID')
+    """
+    parts = []
+    for table_id in references:
+        parts.append(
+            {
+                "Part_ID": table_id,
+                "Label": table_id.title(),
+                "Description": f"The {table_id} table",
+                "Part_type": "table",
+            }
+        )
+    for table_id in references:
+        presence = {table_id: {"role": "key", "required": True, "order": 1}}
+        for referencing, targets in references.items():
+            if table_id in targets:
+                presence[referencing] = {
+                    "role": "property",
+                    "required": False,
+                    "order": 2 + sorted(targets).index(table_id),
+                    "relationship_type": "one-to-many",
+                }
+        parts.append(
+            {
+                "Part_ID": f"{table_id.title()}_ID",
+                "Label": f"{table_id.title()} ID",
+                "Description": f"Key of {table_id}",
+                "Part_type": "key",
+                "SQL_data_type": "int",
+                "table_presence": presence,
+            }
+        )
+    return {"parts": parts}
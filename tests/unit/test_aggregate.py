@@ -0,0 +1,193 @@
+"""Tests for time-bucket aggregation and downsampling."""
+
+import pytest
+import sys
+from collections import defaultdict
+from datetime import datetime, timedelta
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from open_dateaubase.query.aggregate import (
+    DAY,
+    bucket_width,
+    build_bucket_query,
+    build_m4_query,
+    check_bucket,
+    downsample,
+    fetch_buckets,
+    lttb,
+    time_bucket_sql,
+)
+from open_dateaubase.query.values import ValueQuery
+from open_dateaubase.sql.dialects import DIALECTS, get_dialect
+
+START = datetime(2024, 1, 1)
+STEP = timedelta(seconds=30)
+ROWS = 2 * 24 * 120  # Two days of 30 s values per series
+SPIKE = 1234
+
+
+def value_at(metadata_id, i):
+    return 1000.0 if (metadata_id, i) == (1, SPIKE) else float((i * 37 + metadata_id) % 100)
+
+
+@pytest.fixture
+def series_db(dateaubase_db):
+    """Two series (NH4 on metadata 1, TSS on 2), one NULL value and one spike."""
+    dateaubase_db.execute("""INSERT INTO "unit" ("Unit_ID", "Unit") VALUES (1, 'mg/L')""")
+    dateaubase_db.executemany(
+        """INSERT INTO "parameter" ("Parameter_ID", "Parameter", "Unit_ID") VALUES (?, ?, 1)""",
+        [(1, "NH4"), (2, "TSS")],
+    )
+    dateaubase_db.executemany(
+        """INSERT INTO "metadata" ("Metadata_ID", "Parameter_ID", "Unit_ID") VALUES (?, ?, 1)""",
+        [(1, 1), (2, 2)],
+    )
+    rows = [
+        (
+            2 * i + metadata_id,
+            metadata_id,
+            (START + i * STEP).isoformat(sep=" ", timespec="milliseconds"),
+            None if (metadata_id, i) == (2, 7) else value_at(metadata_id, i),
+        )
+        for i in range(ROWS)
+        for metadata_id in (1, 2)
+    ]
+    dateaubase_db.executemany(
+        """INSERT INTO "value" ("Value_ID", "Metadata_ID", "Timestamp", "Value") VALUES (?, ?, ?, ?)""",
+        rows,
+    )
+    dateaubase_db.commit()
+    return dateaubase_db
+
+
+@pytest.fixture
+def sqlite_buckets(monkeypatch):
+    """Aggregate in SQL on SQLite (the default is the NumPy fallback)."""
+    monkeypatch.setitem(DIALECTS["sqlite"], "time_bucket", "sqlite")
+
+
+def expected_buckets(metadata_id, bucket_seconds):
+    groups = defaultdict(list)
+    for i in range(ROWS):
+        if (metadata_id, i) == (2, 7):
+            continue
+        offset = int((i * STEP).total_seconds()) // bucket_seconds * bucket_seconds
+        groups[START + timedelta(seconds=offset)].append(value_at(metadata_id, i))
+    return [
+        (metadata_id, start, len(v), min(v), max(v), pytest.approx(sum(v) / len(v)))
+        for start, v in sorted(groups.items())
+    ]
+
+
+class TestBucketSql:
+    def test_mssql_expressions(self):
+        config = get_dialect("mssql")
+
+        sub_day = time_bucket_sql(config, "[Timestamp]", 900)
+        days = time_bucket_sql(config, "[Timestamp]", 7 * DAY)
+
+        assert "DATEDIFF(SECOND, CAST(CAST([Timestamp] AS date) AS datetime2(3)), [Timestamp]) / 900 * 900" in sub_day
+        assert "DATEDIFF(DAY, '19000101', [Timestamp]) / 7 * 7" in days
+
+    def test_bucket_query_shape(self):
+        sql, params = build_bucket_query(
+            ValueQuery(parameter="NH4", start="2024-01-01", labels=("unit",)), 3600, "postgres"
+        )
+
+        assert "EXTRACT(EPOCH FROM" in sql
+        assert 'GROUP BY "Metadata_ID", "bucket"' in sql
+        assert '"value"."Value" IS NOT NULL' in sql
+        assert 'JOIN "unit"' not in sql
+        assert params == ["NH4", "2024-01-01 00:00:00.000"]
+
+    def test_invalid_widths(self):
+        assert check_bucket(DAY) == DAY
+        with pytest.raises(ValueError, match="divide a day"):
+            check_bucket(7)
+        with pytest.raises(ValueError, match="divide a day"):
+            check_bucket(DAY + 1)
+        with pytest.raises(ValueError, match="no time bucket expression"):
+            build_bucket_query(ValueQuery(), 60, "sqlite")
+
+    def test_bucket_width(self):
+        assert bucket_width("2024-01-01", "2024-01-01 00:01:00", 60) == 1
+        assert bucket_width("2024-01-01", "2024-02-01", 100) == 43200
+        assert bucket_width(datetime(2024, 1, 1), datetime(2025, 1, 1), 10) == 37 * DAY
+
+
+class TestFetchBuckets:
+    @pytest.mark.parametrize("page_size", [100_000, 333])
+    def test_numpy_fallback(self, series_db, page_size):
+        pytest.importorskip("numpy")
+
+        rows = fetch_buckets(series_db, ValueQuery(), 3600, page_size=page_size)
+
+        assert rows == expected_buckets(1, 3600) + expected_buckets(2, 3600)
+
+    def test_sql_matches_fallback(self, series_db, monkeypatch):
+        pytest.importorskip("numpy")
+        query = ValueQuery(parameter="TSS", start="2024-01-01 06:00", end="2024-01-02")
+        fallback = fetch_buckets(series_db, query, 900)
+
+        monkeypatch.setitem(DIALECTS["sqlite"], "time_bucket", "sqlite")
+        rows = fetch_buckets(series_db, query, 900)
+
+        assert len(rows) == len(fallback) == 72
+        for row, expected in zip(rows, fallback):
+            assert row[0] == expected[0]
+            assert datetime.fromisoformat(row[1]) == expected[1]
+            assert row[2:5] == expected[2:5]
+            assert row[5] == pytest.approx(expected[5])
+
+
+class TestDownsample:
+    def test_lttb(self):
+        np = pytest.importorskip("numpy")
+        x = np.arange(1000)
+        y = np.sin(x / 50.0)
+        y[500] = 10.0
+
+        kept = lttb(x, y, 50)
+
+        assert len(kept) == 50
+        assert kept[0] == 0 and kept[-1] == 999
+        assert 500 in kept
+        assert (np.diff(kept) > 0).all()
+        assert lttb(x[:10], y[:10], 50).tolist() == list(range(10))
+        with pytest.raises(ValueError, match="at least 3"):
+            lttb(x, y, 2)
+
+    def test_m4_query_keeps_extremes(self, series_db, sqlite_buckets):
+        pytest.importorskip("numpy")
+        query = ValueQuery(metadata_ids=[1])
+        sql, params = build_m4_query(query, 3600, "sqlite")
+
+        rows = series_db.execute(sql, params).fetchall()
+
+        per_bucket = defaultdict(list)
+        for row in rows:
+            per_bucket[row[2][:13]].append(row[3])
+        assert len(per_bucket) == 48
+        assert all(2 <= len(values) <= 4 for values in per_bucket.values())
+        assert 1000.0 in per_bucket["2024-01-01 10"]
+        assert [row[0] for row in rows] == sorted(row[0] for row in rows)
+
+    @pytest.mark.parametrize("in_sql", [False, True])
+    def test_downsample(self, series_db, monkeypatch, in_sql):
+        pytest.importorskip("numpy")
+        if in_sql:
+            monkeypatch.setitem(DIALECTS["sqlite"], "time_bucket", "sqlite")
+        query = ValueQuery(start="2024-01-01", end="2024-01-03")
+
+        series = downsample(series_db, query, points=100)
+
+        assert sorted(series) == [1, 2]
+        timestamps, values = series[1]
+        # M4 returns up to 4 values for each of the 24 two-hour buckets
+        assert len(timestamps) == len(values) == (96 if in_sql else 100)
+        assert values.max() == 1000.0
+        assert (timestamps[1:] > timestamps[:-1]).all()
+        assert len(series[2][0]) <= 100
@@ -0,0 +1,116 @@
+"""Tests for the validated dictionary snapshot cache."""
+
+import pytest
+import json
+import sys
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from open_dateaubase.data_model import cache
+from open_dateaubase.data_model.cache import load_dictionary
+from open_dateaubase.data_model.models import Dictionary
+from fixtures.sample_dictionary import sample_dictionary_data
+
+
+@pytest.fixture
+def dict_file(tmp_path):
+    json_file = tmp_path / "dictionary.json"
+    json_file.write_text(json.dumps(sample_dictionary_data(), indent=2))
+    return json_file
+
+
+def _count_validations(monkeypatch):
+    calls = []
+    original = Dictionary.model_validate
+    monkeypatch.setattr(
+        Dictionary,
+        "model_validate",
+        lambda *args, **kwargs: calls.append(1) or original(*args, **kwargs),
+    )
+    return calls
+
+
+class TestLoadDictionary:
+    def test_miss_writes_snapshot(self, dict_file, isolated_dictionary_cache):
+        dictionary = load_dictionary(dict_file)
+
+        assert len(dictionary.parts) == 9
+        assert len(list(isolated_dictionary_cache.glob("dictionary-*.pickle"))) == 1
+
+    def test_hit_skips_validation(self, dict_file, monkeypatch):
+        load_dictionary(dict_file)
+        calls = _count_validations(monkeypatch)
+
+        dictionary = load_dictionary(dict_file)
+
+        assert calls == []
+        assert isinstance(dictionary, Dictionary)
+        assert dictionary.parts[0].part_id == "test_table"
+
+    def test_content_change_invalidates_snapshot(
+        self, dict_file, monkeypatch, isolated_dictionary_cache
+    ):
+        load_dictionary(dict_file)
+        data = sample_dictionary_data()
+        data["parts"][0]["Label"] = "Renamed"
+        dict_file.write_text(json.dumps(data))
+        calls = _count_validations(monkeypatch)
+
+        dictionary = load_dictionary(dict_file)
+
+        assert calls == [1]
+        assert dictionary.parts[0].label == "Renamed"
+        # The stale snapshot is replaced, not accumulated
+        assert len(list(isolated_dictionary_cache.glob("dictionary-*.pickle"))) == 1
+
+    def test_files_do_not_evict_each_other(self, tmp_path, monkeypatch, isolated_dictionary_cache):
+        files = []
+        for site in ("s1", "s2"):
+            (tmp_path / site).mkdir()
+            files.append(tmp_path / site / "dictionary.json")
+            files[-1].write_text(json.dumps(sample_dictionary_data()))
+        other = tmp_path / "dictionary-v2.json"
+        other.write_text(json.dumps(sample_dictionary_data()))
+        for path in (*files, other):
+            load_dictionary(path)
+        calls = _count_validations(monkeypatch)
+
+        for path in (*files, other):
+            load_dictionary(path)
+
+        assert calls == []
+        assert len(list(isolated_dictionary_cache.glob("*.pickle"))) == 3
+
+    def test_corrupt_snapshot_is_a_miss(self, dict_file, isolated_dictionary_cache):
+        load_dictionary(dict_file)
+        snapshot = next(isolated_dictionary_cache.glob("dictionary-*.pickle"))
+        snapshot.write_bytes(b"not a pickle")
+
+        dictionary = load_dictionary(dict_file)
+        assert len(dictionary.parts) == 9
+
+    def test_use_cache_false(self, dict_file, isolated_dictionary_cache):
+        load_dictionary(dict_file, use_cache=False)
+        assert list(isolated_dictionary_cache.iterdir()) == []
+
+    def test_unwritable_cache_dir_still_loads(self, dict_file, tmp_path):
+        blocker = tmp_path / "blocker"
+        blocker.write_text("a file, not a directory")
+
+        dictionary = load_dictionary(dict_file, cache_dir=blocker / "cache")
+        assert len(dictionary.parts) == 9
+
+    def test_invalid_dictionary_not_cached(self, tmp_path, isolated_dictionary_cache):
+        json_file = tmp_path / "invalid.json"
+        json_file.write_text(json.dumps({"parts": [{"Part_ID": "x"}]}))
+
+        with pytest.raises(ValueError):
+            load_dictionary(json_file)
+        assert list(isolated_dictionary_cache.iterdir()) == []
+
+
+def test_default_cache_dir_honours_env(monkeypatch, tmp_path):
+    monkeypatch.setenv(cache.CACHE_DIR_ENV, str(tmp_path))
+    assert cache.default_cache_dir() == tmp_path
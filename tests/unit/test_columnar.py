@@ -0,0 +1,99 @@
+"""Tests for columnar value batches."""
+
+import pytest
+import sys
+from datetime import datetime
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+np = pytest.importorskip("numpy")
+
+from open_dateaubase.ingest.columnar import (
+    BATCH_FIELDS,
+    ValueBatch,
+    numpy_dtype,
+    value_dtypes,
+)
+
+ROWS = [
+    (1, 2, "2024-01-01 00:00:00.123", 7.1, None),
+    (2, None, None, 20.0, 3),
+    (3, 2, datetime(2024, 1, 1, 0, 0, 2), -1.0, 1),
+]
+
+
+class TestDtypes:
+    @pytest.mark.parametrize(
+        "sql_type,time_unit,expected",
+        [
+            ("int", None, "int32"),
+            ("float", None, "float64"),
+            ("datetime2(3)", None, "datetime64[ms]"),
+            ("datetime2", None, "datetime64[ns]"),
+            ("numeric(18,0)", None, "int64"),
+            ("numeric(10,2)", None, "float64"),
+            ("bigint", "ms", "datetime64[ms]"),
+            ("nvarchar(100)", None, "object"),
+        ],
+    )
+    def test_numpy_dtype(self, sql_type, time_unit, expected):
+        assert numpy_dtype(sql_type, time_unit) == np.dtype(expected)
+
+    def test_value_dtypes_follow_dictionary(self):
+        dtypes = value_dtypes()
+        assert tuple(dtypes) == BATCH_FIELDS
+        assert dtypes["Timestamp"] == np.dtype("datetime64[ms]")
+        assert dtypes["Value"] == np.dtype("float64")
+
+
+class TestValueBatch:
+    def test_params_round_trip(self):
+        batch = ValueBatch.from_params(ROWS)
+        params = batch.to_params()
+
+        assert len(batch) == 3
+        assert batch.columns["Metadata_ID"].dtype == np.dtype("int32")
+        assert params[0] == (1, 2, datetime(2024, 1, 1, 0, 0, 0, 123000), 7.1, None)
+        assert params[1] == (2, None, None, 20.0, 3)
+
+    def test_text_timestamps(self):
+        params = ValueBatch.from_params(ROWS).to_params(text_timestamps=True)
+        assert params[0][2] == "2024-01-01 00:00:00.123"
+        assert params[1][2] is None
+
+    def test_vectorized_checks(self):
+        batch = ValueBatch.from_params(ROWS)
+
+        assert batch.null_mask("Metadata_ID", "Timestamp").tolist() == [False, True, False]
+        assert batch.out_of_range("Value", 0, 14).tolist() == [False, True, True]
+        # NULLs are not out of range
+        assert batch.out_of_range("Number_of_experiment", minimum=2).tolist() == [
+            False,
+            False,
+            True,
+        ]
+
+    def test_filter(self):
+        batch = ValueBatch.from_params(ROWS)
+        kept = batch.filter(~batch.null_mask())
+
+        assert [row[0] for row in kept.to_params()] == [3]
+
+    def test_rejects_ragged_columns(self):
+        columns = {f: np.zeros(2) for f in BATCH_FIELDS}
+        columns["Value"] = np.zeros(3)
+        with pytest.raises(ValueError, match="differ in length"):
+            ValueBatch(columns)
+
+    def test_parquet_round_trip(self, tmp_path):
+        pytest.importorskip("pyarrow")
+        path = tmp_path / "values.parquet"
+        batch = ValueBatch.from_params(ROWS)
+        batch.write_parquet(path)
+
+        batches = list(ValueBatch.read_parquet(path, batch_size=2))
+
+        assert [len(b) for b in batches] == [2, 1]
+        assert [row for b in batches for row in b.to_params()] == batch.to_params()
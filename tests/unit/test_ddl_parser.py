@@ -0,0 +1,228 @@
+"""Tests for parsing as-built DDL back into the dictionary model."""
+
+import pytest
+import sys
+from pathlib import Path
+
+# Add src and scripts to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+sys.path.insert(0, str(Path(__file__).parent.parent / "scripts"))
+
+from generate_migration import generate_migration, parse_old_schema
+from generate_sql import generate_sql_schema
+from open_dateaubase.data_model.schema import compile_schema, load_schema
+from open_dateaubase.sql.ddl_parser import (
+    ddl_to_dictionary,
+    format_drift_report,
+    iter_statements,
+    parse_ddl,
+    parse_ddl_file,
+    schema_drift,
+    tokenize,
+)
+
+REPO_ROOT = Path(__file__).parent.parent.parent
+PACKAGED_DICTIONARY = REPO_ROOT / "src" / "open_dateaubase" / "dictionary.json"
+AS_BUILT_2025 = REPO_ROOT / "sql_generation_scripts" / "2025-09-08_as-built_mssql.sql"
+AS_BUILT_2016 = REPO_ROOT / "sql_generation_scripts" / "2016-03-23_as_built_mssql.sql"
+
+SSMS_DUMP = """\
+SET ANSI_NULLS ON
+GO
+/****** Object:  Table [dbo].[site] ******/
+CREATE TABLE [dbo].[site](
+    [Site_ID] [int] IDENTITY(1,1) NOT NULL,
+    [Site_name] [nvarchar](100) NULL,  -- the name; not unique
+    [Notes] [nvarchar](max) NULL,
+    [Score] [decimal](5, 2) NOT NULL,
+ CONSTRAINT [PK_site] PRIMARY KEY CLUSTERED
+(
+    [Site_ID] ASC
+) WITH (PAD_INDEX = OFF) ON [PRIMARY]
+) ON [PRIMARY]
+GO
+CREATE TABLE [dbo].[sample](
+    [Sample_ID] [int] NOT NULL PRIMARY KEY,
+    [Site_ID] [int] NULL,
+    [Label] [nvarchar](20) NOT NULL CONSTRAINT [DF_sample_Label] DEFAULT (N'it''s'),
+)
+GO
+ALTER TABLE [dbo].[site] ADD CONSTRAINT [DF_site_Score] DEFAULT ((0)) FOR [Score]
+GO
+ALTER TABLE [dbo].[sample] WITH CHECK ADD CONSTRAINT [FK_sample_Site_ID] FOREIGN KEY([Site_ID])
+REFERENCES [dbo].[site] ([Site_ID])
+GO
+CREATE NONCLUSTERED INDEX [IX_sample_Site_ID] ON [dbo].[sample] ([Site_ID] ASC) INCLUDE ([Label])
+GO
+INSERT INTO [dbo].[site] VALUES (1, 'CREATE TABLE [x] (y int); -- not DDL', NULL, 1)
+GO
+"""
+
+MYSQL_DUMP = """\
+/*!40101 SET NAMES utf8 */;
+CREATE TABLE `contact` (
+  `Contact_ID` int(11) NOT NULL AUTO_INCREMENT,
+  `Skype_name` varchar(100) DEFAULT 'None',
+  PRIMARY KEY (`Contact_ID`),
+  KEY `fk_contact_idx` (`Skype_name`(10))
+) ENGINE=InnoDB DEFAULT CHARSET=utf8;
+INSERT INTO `contact` VALUES (1,'O\\'Brien; CREATE TABLE fake (a int)');
+CREATE TABLE `project` (
+  `Project_ID` int(11) NOT NULL,
+  `Contact_ID` int(11) NOT NULL,
+  PRIMARY KEY (`Project_ID`),
+  CONSTRAINT `fk_project_contact` FOREIGN KEY (`Contact_ID`) REFERENCES `contact` (`Contact_ID`)
+);
+"""
+
+
+@pytest.fixture
+def packaged_schema():
+    return load_schema(PACKAGED_DICTIONARY)
+
+
+class TestStatements:
+    def test_splits_on_semicolons_and_go(self):
+        statements = list(iter_statements(SSMS_DUMP.splitlines(True)))
+
+        assert len(statements) == 5
+        assert all(s.split()[0] in ("CREATE", "ALTER") for s in statements)
+        # Comments are dropped, quoted text is kept intact
+        assert "-- the name" not in statements[0]
+        assert "N'it''s'" in statements[1]
+
+    def test_keeps_other_statements_on_request(self):
+        statements = list(iter_statements(["SET X ON;\n", "SELECT ';' /* ; */;\n"], keywords=None))
+        assert statements == ["SET X ON", "SELECT ';'"]
+
+    def test_mysql_backslash_escapes(self):
+        statements = list(iter_statements(MYSQL_DUMP.splitlines(True)))
+        assert [s.split("(")[0].strip() for s in statements] == [
+            "CREATE TABLE `contact`",
+            "CREATE TABLE `project`",
+        ]
+
+    def test_tokenize(self):
+        tokens = tokenize("[my col] nvarchar(10) DEFAULT N'a''b'")
+        assert tokens == [
+            ("ident", "my col"),
+            ("word", "nvarchar"),
+            ("punct", "("),
+            ("number", "10"),
+            ("punct", ")"),
+            ("word", "DEFAULT"),
+            ("string", "a'b"),
+        ]
+
+
+class TestParseDdl:
+    def test_ssms_dump(self):
+        tables = parse_ddl(SSMS_DUMP.splitlines(True))["tables"]
+
+        site = tables["site"]
+        assert list(site["columns"]) == ["Site_ID", "Site_name", "Notes", "Score"]
+        assert site["columns"]["Notes"]["sql_data_type"] == "nvarchar(max)"
+        assert site["columns"]["Score"]["sql_data_type"] == "decimal(5,2)"
+        assert site["columns"]["Score"]["default_value"] == "0"
+        assert site["primary_key"] == ["Site_ID"]
+        assert site["columns"]["Site_ID"]["is_required"]
+
+        sample = tables["sample"]
+        assert sample["primary_key"] == ["Sample_ID"]
+        assert sample["columns"]["Label"]["default_value"] == "it's"
+        assert sample["foreign_keys"] == [
+            {
+                "name": "FK_sample_Site_ID",
+                "columns": ["Site_ID"],
+                "ref_table": "site",
+                "ref_columns": ["Site_ID"],
+            }
+        ]
+        assert sample["indexes"] == [
+            {
+                "name": "IX_sample_Site_ID",
+                "columns": ["Site_ID"],
+                "include_columns": ["Label"],
+                "is_unique": False,
+            }
+        ]
+
+    def test_mysql_dump(self):
+        tables = parse_ddl(MYSQL_DUMP.splitlines(True))["tables"]
+
+        assert set(tables) == {"contact", "project"}
+        contact = tables["contact"]
+        assert contact["columns"]["Contact_ID"]["sql_data_type"] == "int"
+        assert contact["columns"]["Skype_name"]["default_value"] == "None"
+        assert contact["indexes"][0]["columns"] == ["Skype_name"]
+        assert tables["project"]["foreign_keys"][0]["ref_table"] == "contact"
+
+    def test_as_built_dumps(self):
+        tables = parse_ddl_file(AS_BUILT_2025)["tables"]
+        assert len(tables) == 34
+        assert tables["value"]["columns"]["Timestamp"]["sql_data_type"] == "int"
+
+        # The 2016 dump is a MySQL dump with binary data in its INSERTs
+        assert len(parse_ddl_file(AS_BUILT_2016)["tables"]) == 23
+
+    @pytest.mark.parametrize("target_db", ["mssql", "postgres", "sqlite"])
+    def test_generated_ddl_round_trip(self, packaged_schema, target_db):
+        sql = generate_sql_schema(packaged_schema, target_db)
+        drift = schema_drift(parse_ddl(sql.splitlines(True)), packaged_schema, target_db)
+
+        if target_db == "mssql":
+            # MSSQL derives FK tables from field names ('Procedure_ID' -> [Procedure])
+            drift.pop("missing_foreign_keys")
+            drift.pop("extra_foreign_keys")
+        assert not any(drift.values())
+
+
+class TestDictionaryImport:
+    def test_builds_valid_dictionary(self):
+        dictionary, warnings = ddl_to_dictionary(parse_ddl(MYSQL_DUMP.splitlines(True)))
+        schema = compile_schema(dictionary)
+
+        assert warnings == []
+        fields = {f["part_id"]: f for f in schema["tables"]["project"]["fields"]}
+        assert fields["Project_ID"]["part_type"] == "key"
+        assert fields["Contact_ID"]["relationship_type"] == "one-to-many"
+        assert schema["id_field_locations"]["Contact_ID"] == {
+            "contact": "key",
+            "project": "property",
+        }
+
+    def test_reports_what_cannot_be_imported(self):
+        dictionary, warnings = ddl_to_dictionary(parse_ddl_file(AS_BUILT_2025))
+
+        assert any("cannot contain spaces" in w for w in warnings)
+        assert any("control_loop: foreign key (Actuator)" in w for w in warnings)
+        assert "control_loop" in compile_schema(dictionary)["tables"]
+
+
+class TestDrift:
+    def test_as_built_drift(self, packaged_schema):
+        drift = schema_drift(parse_ddl_file(AS_BUILT_2025), packaged_schema)
+
+        assert "sysdiagrams" in drift["extra_tables"]
+        assert ("value", "Timestamp", "datetime2(3)", "int") in drift["type_changes"]
+        assert ("metadata", "Source_ID", "source") in drift["extra_foreign_keys"]
+
+        report = format_drift_report(drift)
+        assert "## Type differences (dictionary -> database) (2)" in report
+        assert "- value.Timestamp: datetime2(3) -> int" in report
+
+    def test_no_drift(self):
+        assert "No drift" in format_drift_report({"missing_tables": []})
+
+
+class TestMigrationFromDdl:
+    def test_as_built_dump_as_old_side(self, packaged_schema):
+        old, warnings = parse_old_schema(AS_BUILT_2025)
+        assert warnings
+
+        sql = generate_migration(old, packaged_schema, include_timestamp=False, keep_extra=True)
+
+        assert "-- Not dropped: table sysdiagrams" in sql
+        assert "DROP TABLE" not in sql
+        assert "ALTER TABLE [metadata] ADD [Unit_ID] int NULL;" in sql
+        assert "[value_Timestamp__new]" not in sql
@@ -0,0 +1,102 @@
+"""Tests for SQL dialect configurations."""
+
+import pytest
+import sys
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from open_dateaubase.sql import dialects
+from open_dateaubase.sql.dialects import (
+    format_default,
+    format_literal,
+    get_dialect,
+    map_sql_type,
+    register_dialect,
+)
+
+
+class TestMapSqlType:
+    def test_mssql_preserves_parameters(self):
+        config = get_dialect("mssql")
+        assert map_sql_type("nvarchar(255)", config) == "nvarchar(255)"
+        assert map_sql_type("ntext", config) == "nvarchar(max)"
+        assert map_sql_type("date", config) == "date"
+
+    def test_postgres_types(self):
+        config = get_dialect("postgres")
+        assert map_sql_type("nvarchar(100)", config) == "varchar(100)"
+        assert map_sql_type("nvarchar(1073741823)", config) == "text"
+        assert map_sql_type("ntext(1073741823)", config) == "text"
+        assert map_sql_type("image(2147483647)", config) == "bytea"
+        assert map_sql_type("BLOB", config) == "bytea"
+        assert map_sql_type("float", config) == "double precision"
+        assert map_sql_type("numeric(10,2)", config) == "numeric(10,2)"
+        assert map_sql_type("bit", config) == "boolean"
+
+    def test_sqlite_affinities(self):
+        config = get_dialect("sqlite")
+        assert map_sql_type("nvarchar(100)", config) == "TEXT"
+        assert map_sql_type("int", config) == "INTEGER"
+        assert map_sql_type("real", config) == "REAL"
+        assert map_sql_type("numeric", config) == "NUMERIC"
+        assert map_sql_type("image(2147483647)", config) == "BLOB"
+
+    def test_temporal_types(self):
+        mssql = get_dialect("mssql")
+        assert map_sql_type("datetime2(3)", mssql) == "datetime2(3)"
+        assert map_sql_type("timestamptz(3)", mssql) == "datetimeoffset(3)"
+
+        postgres = get_dialect("postgres")
+        assert map_sql_type("datetime2(3)", postgres) == "timestamp(3)"
+        assert map_sql_type("datetime2(7)", postgres) == "timestamp(6)"
+        assert map_sql_type("datetimeoffset", postgres) == "timestamptz"
+        assert map_sql_type("datetime", postgres) == "timestamp"
+
+        assert map_sql_type("timestamptz(3)", get_dialect("sqlite")) == "TEXT"
+
+    def test_unknown_type_passes_through(self):
+        assert map_sql_type("geography", get_dialect("postgres")) == "geography"
+
+
+class TestFormatDefault:
+    def test_boolean_defaults(self):
+        assert format_default("True", "bit", get_dialect("mssql")) == "1"
+        assert format_default("False", "bit", get_dialect("postgres")) == "FALSE"
+
+    def test_numeric_and_string_defaults(self):
+        config = get_dialect("postgres")
+        assert format_default("42", "int", config) == "42"
+        assert format_default("O'Brien", "nvarchar(50)", config) == "'O''Brien'"
+
+    def test_function_defaults(self):
+        assert format_default("GETDATE()", "datetime", get_dialect("mssql")) == "GETDATE()"
+        assert (
+            format_default("GETDATE()", "datetime", get_dialect("postgres"))
+            == "CURRENT_TIMESTAMP"
+        )
+
+    def test_literals_do_not_evaluate_functions(self):
+        config = get_dialect("postgres")
+        assert format_literal("GETDATE()", "nvarchar(20)", config) == "'GETDATE()'"
+        assert format_literal("2024-01-01", "datetime", config) == "'2024-01-01'"
+
+
+class TestRegistry:
+    def test_unknown_dialect_rejected(self):
+        with pytest.raises(ValueError, match="Unsupported database"):
+            get_dialect("oracle")
+
+    def test_register_dialect_fills_defaults(self, monkeypatch):
+        monkeypatch.setattr(dialects, "DIALECTS", dict(dialects.DIALECTS))
+        register_dialect("mysql", {"quote_char": "`", "quote_char_end": "`"})
+
+        config = get_dialect("mysql")
+        assert config["quote"]("site") == "`site`"
+        assert "type_mappings" in config
+
+    def test_configs_are_copies(self):
+        config = get_dialect("sqlite")
+        config["type_mappings"]["int"] = "changed"
+        assert get_dialect("sqlite")["type_mappings"]["int"] == "INTEGER"
@@ -334,3 +334,24 @@ class TestEdgeCases:
         # Parent_ID FK should be displayed with link
         assert "FK →" in markdown
         assert "[TestTable_ID]" in markdown
+
+    def test_shows_epoch_time_unit(self, tmp_path):
+        """Epoch timestamp columns show their unit next to the SQL type."""
+        json_data = sample_dictionary_data()
+        json_data["parts"].append(
+            {
+                "Part_ID": "Recorded_at",
+                "Label": "Recorded at",
+                "Description": "Recording time",
+                "Part_type": "property",
+                "SQL_data_type": "bigint",
+                "Time_unit": "ms",
+                "table_presence": {"test_table": {"role": "property", "order": 5}},
+            }
+        )
+        json_file = tmp_path / "epoch.json"
+        json_file.write_text(json.dumps(json_data))
+
+        markdown = generate_tables_markdown(parse_parts_json(json_file))
+
+        assert "| Recorded at | bigint (epoch ms) |" in markdown
@@ -0,0 +1,79 @@
+"""Tests for the table-level foreign key graph."""
+
+import pytest
+import sys
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from open_dateaubase.data_model.graph import ForeignKeyGraph
+from open_dateaubase.data_model.models import Dictionary
+from open_dateaubase.data_model.schema import compile_schema, load_schema
+from fixtures.sample_dictionary import chain_dictionary_data, sample_dictionary_data
+
+PACKAGED_DICTIONARY = (
+    Path(__file__).parent.parent.parent / "src" / "open_dateaubase" / "dictionary.json"
+)
+
+
+def chain_schema(references):
+    return compile_schema(Dictionary.model_validate(chain_dictionary_data(references)))
+
+
+class TestFromSchema:
+    def test_edges_follow_key_tables(self):
+        graph = ForeignKeyGraph.from_schema(
+            chain_schema({"site": ["watershed"], "watershed": [], "value": ["site"]})
+        )
+
+        assert graph.edges() == {"site": ["watershed"], "value": ["site"], "watershed": []}
+        assert graph.referenced_by("site") == {"value"}
+
+    def test_self_reference_is_not_a_cycle(self):
+        schema = compile_schema(Dictionary.model_validate(sample_dictionary_data()))
+        graph = ForeignKeyGraph.from_schema(schema)
+
+        assert graph.references("test_table") == {"test_table"}
+        assert graph.cycles() == []
+        assert graph.topological_order() == ["test_table"]
+
+    def test_packaged_dictionary(self):
+        graph = ForeignKeyGraph.from_schema(load_schema(PACKAGED_DICTIONARY))
+        order = graph.topological_order()
+
+        assert graph.cycles() == []
+        assert order.index("watershed") < order.index("site") < order.index("sampling_points")
+        assert order.index("metadata") < order.index("value")
+        assert graph.waves()[-1] == ["value"]
+
+
+class TestCycles:
+    def test_finds_long_cycles(self):
+        graph = ForeignKeyGraph({"a": ["b"], "b": ["c"], "c": ["a"], "d": ["a"], "e": ["e"]})
+
+        assert graph.cycles() == [["a", "b", "c"]]
+        assert graph.cycle_path(["a", "b", "c"]) == ["a", "b", "c", "a"]
+        with pytest.raises(ValueError, match="a -> b -> c -> a"):
+            graph.topological_order()
+
+    def test_components_are_referenced_first(self):
+        graph = ForeignKeyGraph({"a": ["b"], "b": ["a", "c"], "c": []})
+        assert graph.strongly_connected_components() == [["c"], ["a", "b"]]
+
+    def test_deep_chains_do_not_recurse(self):
+        depth = 5_000
+        graph = ForeignKeyGraph({f"t{i:05d}": [f"t{i + 1:05d}"] for i in range(depth)})
+
+        assert len(graph.strongly_connected_components()) == depth + 1
+        assert graph.topological_order()[0] == f"t{depth:05d}"
+
+
+class TestOrders:
+    def test_topological_order_breaks_ties_by_name(self):
+        graph = ForeignKeyGraph({"c": [], "b": ["c"], "a": [], "d": ["a", "b"]})
+        assert graph.topological_order() == ["a", "c", "b", "d"]
+
+    def test_waves(self):
+        graph = ForeignKeyGraph({"c": [], "b": ["c"], "a": [], "d": ["a", "b"]})
+        assert graph.waves() == [["a", "c"], ["b"], ["d"]]
@@ -287,6 +287,33 @@ class TestTableOperations:
             and parent_key.ancestor_part_id == "TestTable_ID"
         )
 
+    def test_create_index(self, tmp_path):
+        """Test declaring a covering index on a table."""
+        dict_data = sample_dictionary_data()
+        dict_file = tmp_path / "test_dict.json"
+        dict_file.write_text(json.dumps(dict_data, indent=2))
+
+        manager = DictionaryManager.load(dict_file)
+        manager.create_index(
+            table_id="test_table",
+            index_id="IX_test_table_Status",
+            label="By status",
+            description="Records by status",
+            columns=["Status"],
+            include_columns=["Description"],
+        )
+        manager.save()
+
+        index = DictionaryManager.load(dict_file)._find_part("IX_test_table_Status")
+        assert index.part_type == "index"
+        assert index.index_columns == ["Status"]
+        assert index.include_columns == ["Description"]
+
+        with pytest.raises(ValueError, match="not in table"):
+            manager.create_index(
+                "test_table", "IX_bad", "Bad", "Bad", columns=["Missing_field"]
+            )
+
 
 class TestQueryOperations:
     """Test query methods for retrieving dictionary information."""
@@ -545,3 +572,165 @@ class TestEdgeCasesAndErrorHandling:
             hasattr(priority_field, "value_set_part_id")
             and priority_field.value_set_part_id == "PrioritySet"
         )
+
+
+class TestIncrementalValidation:
+    """Test incremental validation of DictionaryManager mutations."""
+
+    def test_mutations_defer_full_validation(self, tmp_path, monkeypatch):
+        """Test that incremental mutations do not re-validate the dictionary."""
+        dict_file = tmp_path / "test_dict.json"
+        dict_file.write_text(json.dumps(sample_dictionary_data(), indent=2))
+        manager = DictionaryManager.load(dict_file)
+
+        calls = []
+        original = Dictionary.model_validate
+        monkeypatch.setattr(
+            Dictionary,
+            "model_validate",
+            lambda *args, **kwargs: calls.append(1) or original(*args, **kwargs),
+        )
+
+        for i in range(20):
+            manager.add_value_set_member(
+                "StatusSet", f"member_{i}", f"Member {i}", "Bulk member", order=i + 10
+            )
+        assert calls == []
+
+        manager.commit()
+        assert len(calls) == 1
+        assert len(manager.get_value_set_members("Status")) == 23
+
+    def test_invalid_value_set_reference_rejected_before_append(self, tmp_path):
+        """Test that a dangling value set reference leaves the dictionary untouched."""
+        dict_file = tmp_path / "test_dict.json"
+        dict_file.write_text(json.dumps(sample_dictionary_data(), indent=2))
+        manager = DictionaryManager.load(dict_file)
+        part_count = len(manager.dictionary.parts)
+
+        with pytest.raises(ValueError, match="non-existent value set 'MissingSet'"):
+            manager.add_field_to_table(
+                "test_table", "Kind", "Kind", "Kind", value_set_id="MissingSet"
+            )
+
+        assert len(manager.dictionary.parts) == part_count
+        assert not manager._part_exists("Kind")
+
+    def test_presence_must_reference_a_table(self, tmp_path):
+        """Test that a field cannot be placed in a part that is not a table."""
+        dict_file = tmp_path / "test_dict.json"
+        dict_file.write_text(json.dumps(sample_dictionary_data(), indent=2))
+        manager = DictionaryManager.load(dict_file)
+
+        with pytest.raises(ValueError, match="non-existent table 'StatusSet'"):
+            manager.add_field_to_table("StatusSet", "Status", "Status", "Status")
+
+    def test_save_commits_pending_changes(self, tmp_path):
+        """Test that save() runs the full validation for pending changes."""
+        dict_file = tmp_path / "test_dict.json"
+        dict_file.write_text(json.dumps(sample_dictionary_data(), indent=2))
+        manager = DictionaryManager.load(dict_file)
+
+        manager.create_table("other_table", "Other", "Another table")
+        assert manager._uncommitted
+        manager.save()
+
+        assert not manager._uncommitted
+        saved = Dictionary.model_validate(json.loads(dict_file.read_text()))
+        assert any(p.part_id == "other_table" for p in saved.parts)
+
+    def test_non_incremental_mode_validates_every_mutation(self, tmp_path):
+        """Test that incremental=False keeps the dictionary committed."""
+        dict_file = tmp_path / "test_dict.json"
+        dict_file.write_text(json.dumps(sample_dictionary_data(), indent=2))
+        manager = DictionaryManager.load(dict_file, incremental=False)
+
+        manager.create_table("other_table", "Other", "Another table")
+        assert not manager._uncommitted
+        assert "other_table" in manager.list_tables()
+
+
+class TestBatchOperations:
+    """Test atomic batches of DictionaryManager mutations."""
+
+    def _manager(self, tmp_path):
+        dict_file = tmp_path / "test_dict.json"
+        dict_file.write_text(json.dumps(sample_dictionary_data(), indent=2))
+        return DictionaryManager.load(dict_file)
+
+    def test_batch_applies_and_saves_once(self, tmp_path, capsys):
+        """Test that a batch applies all operations and saves at the end."""
+        manager = self._manager(tmp_path)
+
+        with manager.batch():
+            manager.create_table("site", "Site", "Sampling sites")
+            manager.add_field_to_table(
+                "site", "Site_ID", "Site ID", "Primary key", role="key", order=1
+            )
+            manager.add_field_to_table("site", "Status", "Status", "Site status")
+            manager.add_parent_key(
+                "site", "Parent_site_ID", "Site_ID", "Parent site", "Parent site"
+            )
+            manager.add_value_set_member("StatusSet", "closed", "Closed", "Closed")
+
+        output = capsys.readouterr().out
+        assert "Applied 5 operations" in output
+        assert output.count("Dictionary saved to") == 1
+        assert "Created table" not in output
+
+        saved = DictionaryManager.load(manager.path)
+        assert "site" in saved.list_tables()
+        assert [c["Part_ID"] for c in saved.get_table_columns("site")] == [
+            "Site_ID",
+            "Status",
+            "Parent_site_ID",
+        ]
+
+    def test_batch_rolls_back_on_error(self, tmp_path):
+        """Test that a failing batch restores the pre-batch state."""
+        manager = self._manager(tmp_path)
+        original = manager.dictionary.model_dump(by_alias=True)
+        original_file = manager.path.read_text()
+
+        with pytest.raises(ValueError, match="does not exist"):
+            with manager.batch():
+                manager.create_table("site", "Site", "Sampling sites")
+                manager.add_field_to_table("site", "Status", "Status", "Site status")
+                manager.add_value_set_member("MissingSet", "x", "X", "Missing")
+
+        assert manager.dictionary.model_dump(by_alias=True) == original
+        assert manager.path.read_text() == original_file
+        assert not manager._part_exists("site")
+        assert [c["Part_ID"] for c in manager.get_table_columns("site")] == []
+        assert [t["Table_ID"] for t in manager.get_field_tables("Status")] == [
+            "test_table"
+        ]
+
+    def test_commit_and_save_inside_batch(self, tmp_path):
+        """Test that commit() defers to the batch and save() is refused."""
+        manager = self._manager(tmp_path)
+        original_file = manager.path.read_text()
+
+        with pytest.raises(RuntimeError, match="inside a batch"):
+            with manager.batch():
+                manager.create_table("site", "Site", "Sampling sites")
+                manager.add_field_to_table("site", "Status", "Status", "Site status")
+                manager.commit()
+                manager.save()
+
+        assert manager.path.read_text() == original_file
+        assert not manager._part_exists("site")
+        assert [t["Table_ID"] for t in manager.get_field_tables("Status")] == [
+            "test_table"
+        ]
+
+    def test_batch_without_save(self, tmp_path):
+        """Test that save=False leaves the file untouched."""
+        manager = self._manager(tmp_path)
+        original_file = manager.path.read_text()
+
+        with manager.batch(save=False):
+            manager.create_table("site", "Site", "Sampling sites")
+
+        assert "site" in manager.list_tables()
+        assert manager.path.read_text() == original_file
@@ -0,0 +1,101 @@
+"""Tests for DictionaryIndex hash indexes."""
+
+import pytest
+import sys
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from open_dateaubase.data_model.index import DictionaryIndex
+from open_dateaubase.data_model.models import (
+    Dictionary,
+    PropertyPart,
+    TablePresence,
+    ValueSetMemberPart,
+)
+from fixtures.sample_dictionary import sample_dictionary_data, complex_dictionary_data
+
+
+@pytest.fixture
+def index():
+    return DictionaryIndex(Dictionary.model_validate(sample_dictionary_data()))
+
+
+class TestLookups:
+    def test_get_part(self, index):
+        assert index.get("TestTable_ID").part_type == "key"
+        assert index.get("missing") is None
+        assert "StatusSet" in index
+        assert "missing" not in index
+
+    def test_parts_of_type(self, index):
+        assert [p.part_id for p in index.parts_of_type("table")] == ["test_table"]
+        assert index.parts_of_type("view") == []
+
+    def test_table_columns_are_ordered(self, index):
+        columns = index.table_columns("test_table")
+        assert [part.part_id for part, _ in columns] == [
+            "TestTable_ID",
+            "Status",
+            "Description",
+            "Parent_ID",
+        ]
+        assert columns[0][1].role == "key"
+
+    def test_value_set_members_are_sorted(self, index):
+        members = index.value_set_members("StatusSet")
+        orders = [m.sort_order for m in members]
+        assert orders == sorted(orders)
+        assert len(members) == 3
+
+    def test_field_tables(self, index):
+        assert set(index.field_tables("Status")) == {"test_table"}
+        assert index.field_tables("StatusSet") == {}
+        assert index.field_tables("missing") == {}
+
+    def test_shared_fields(self):
+        index = DictionaryIndex(Dictionary.model_validate(complex_dictionary_data()))
+        for part in index.shared_fields():
+            assert len(part.table_presence) > 1
+
+
+class TestMaintenance:
+    def test_add_part_updates_indexes(self, index):
+        member = ValueSetMemberPart(
+            Part_ID="archived",
+            Label="Archived",
+            Description="Archived status",
+            Part_type="valueSetMember",
+            Member_of_set_part_ID="StatusSet",
+            Sort_order=1,
+        )
+        index.add_part(member)
+
+        assert index.get("archived") is member
+        members = index.value_set_members("StatusSet")
+        # Ties on Sort_order keep dictionary order
+        assert [m.sort_order for m in members][:2] == [1, 1]
+        assert members[1] is member
+
+    def test_add_duplicate_part_raises(self, index):
+        with pytest.raises(ValueError, match="already exists"):
+            index.add_part(index.get("TestTable_ID"))
+
+    def test_add_table_presence_replaces_previous_entry(self, index):
+        field = PropertyPart(
+            Part_ID="Notes",
+            Label="Notes",
+            Description="Free text",
+            Part_type="property",
+            table_presence={"test_table": TablePresence(role="property", order=10)},
+        )
+        index.add_part(field)
+        assert index.table_columns("test_table")[-1][0] is field
+
+        field.table_presence["test_table"] = TablePresence(role="property", order=1)
+        index.add_table_presence(field, "test_table")
+
+        columns = [part.part_id for part, _ in index.table_columns("test_table")]
+        assert columns[:2] == ["TestTable_ID", "Notes"]
+        assert columns.count("Notes") == 1
@@ -0,0 +1,265 @@
+"""Tests for the time-series ingestion pipeline."""
+
+import pytest
+import sqlite3
+import sys
+import threading
+from datetime import datetime
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from open_dateaubase.ingest.db import next_key
+from open_dateaubase.ingest.metadata import MetadataResolver, metadata_key_fields
+from open_dateaubase.ingest.pipeline import (
+    IngestReport,
+    ValueWriter,
+    ingest,
+)
+from open_dateaubase.ingest.readers import read_chunks, read_csv_chunks
+from open_dateaubase.sql.connection import connection_dialect, placeholder
+from open_dateaubase.sql.value_table import format_timestamp
+
+
+def write_csv(path, header, rows):
+    lines = [",".join(header)] + [",".join(str(v) for v in row) for row in rows]
+    path.write_text("\n".join(lines) + "\n")
+    return path
+
+
+class TestReaders:
+    def test_csv_chunks(self, tmp_path):
+        path = write_csv(tmp_path / "export.csv", ["a", "b"], [(i, i * 2) for i in range(5)])
+
+        chunks = list(read_csv_chunks(path, chunk_size=2))
+
+        assert [len(c) for c in chunks] == [2, 2, 1]
+        assert chunks[0][1] == {"a": "1", "b": "2"}
+
+    def test_delimiter_from_suffix(self, tmp_path):
+        path = tmp_path / "export.tsv"
+        path.write_text("a\tb\n1\t2\n")
+
+        assert list(read_chunks(path)) == [[{"a": "1", "b": "2"}]]
+
+    def test_unsupported_suffix(self, tmp_path):
+        with pytest.raises(ValueError, match="Unsupported file type"):
+            read_chunks(tmp_path / "export.xlsx")
+
+    def test_parquet_chunks(self, tmp_path):
+        pa = pytest.importorskip("pyarrow")
+        pq = pytest.importorskip("pyarrow.parquet")
+        path = tmp_path / "export.parquet"
+        pq.write_table(pa.table({"Value": [1.0, 2.0, 3.0]}), path)
+
+        chunks = list(read_chunks(path, chunk_size=2))
+
+        assert [row["Value"] for chunk in chunks for row in chunk] == [1.0, 2.0, 3.0]
+
+
+class TestDbHelpers:
+    def test_sqlite_defaults(self, dateaubase_db):
+        assert placeholder(dateaubase_db) == "?"
+        assert connection_dialect(dateaubase_db)["name"] == "sqlite"
+        assert next_key(dateaubase_db, "value", "Value_ID", lambda n: f'"{n}"') == 1
+
+    def test_dialect_required_for_other_drivers(self):
+        with pytest.raises(ValueError, match="dialect is required"):
+            connection_dialect(object())
+
+
+class TestMetadataResolver:
+    def test_key_fields_come_from_dictionary(self):
+        fields = metadata_key_fields()
+        assert "Equipment_ID" in fields
+        assert "Parameter_ID" in fields
+        assert "Metadata_ID" not in fields
+
+    def test_creates_each_combination_once(self, dateaubase_db):
+        resolver = MetadataResolver(dateaubase_db)
+        first = resolver.resolve(resolver.key({"Equipment_ID": 1, "Unit_ID": "2"}))
+        second = resolver.resolve(resolver.key({"Equipment_ID": 2}))
+
+        assert first != second
+        assert resolver.resolve(resolver.key({"Equipment_ID": "1", "Unit_ID": 2})) == first
+        assert resolver.flush() == 2
+        assert dateaubase_db.execute("SELECT COUNT(*) FROM metadata").fetchone() == (2,)
+
+    def test_finds_existing_rows(self, dateaubase_db):
+        dateaubase_db.execute(
+            'INSERT INTO metadata ("Metadata_ID", "Equipment_ID") VALUES (41, 5)'
+        )
+        resolver = MetadataResolver(dateaubase_db)
+
+        assert resolver.resolve(resolver.key({"Equipment_ID": 5})) == 41
+        # Unset fields must match NULL, not any value
+        assert resolver.resolve(resolver.key({"Equipment_ID": 5, "Unit_ID": 1})) == 42
+
+    def test_preloaded_cache_avoids_queries(self, dateaubase_db):
+        dateaubase_db.executemany(
+            'INSERT INTO metadata ("Metadata_ID", "Equipment_ID") VALUES (?, ?)',
+            [(i, i) for i in range(1, 4)],
+        )
+        resolver = MetadataResolver(dateaubase_db)
+        statements = []
+        dateaubase_db.set_trace_callback(statements.append)
+
+        assert resolver.resolve(resolver.key({"Equipment_ID": 2})) == 2
+        new_id = resolver.resolve(resolver.key({"Equipment_ID": 9}))
+
+        # Only the key allocation hits the database; the insert is deferred
+        assert new_id == 4
+        assert [s for s in statements if "SELECT" in s and "MAX" not in s] == []
+        assert not any("INSERT" in s for s in statements)
+        assert (resolver.hits, resolver.misses, resolver.created) == (1, 1, 1)
+
+    def test_evicted_combinations_are_looked_up(self, dateaubase_db):
+        dateaubase_db.executemany(
+            'INSERT INTO metadata ("Metadata_ID", "Equipment_ID") VALUES (?, ?)',
+            [(i, i) for i in range(1, 4)],
+        )
+        resolver = MetadataResolver(dateaubase_db, cache_size=2)
+
+        assert len(resolver) == 2
+        # Oldest row was not preloaded but must still be found, not recreated
+        assert resolver.resolve(resolver.key({"Equipment_ID": 1})) == 1
+        assert len(resolver) == 2
+        assert resolver.created == 0
+
+    def test_new_rows_are_inserted_in_batches(self, dateaubase_db):
+        resolver = MetadataResolver(dateaubase_db, insert_batch_size=3)
+        ids = [resolver.resolve(resolver.key({"Equipment_ID": i})) for i in range(4)]
+
+        count = "SELECT COUNT(*) FROM metadata"
+        assert ids == [1, 2, 3, 4]
+        assert dateaubase_db.execute(count).fetchone() == (3,)
+        assert resolver.flush() == 1
+        assert dateaubase_db.execute(count).fetchone() == (4,)
+
+
+class TestValueWriter:
+    def test_writes_in_batches_after_existing_keys(self, dateaubase_db):
+        dateaubase_db.execute(
+            'INSERT INTO value ("Value_ID", "Value") VALUES (10, 0.0)'
+        )
+        writer = ValueWriter(dateaubase_db, batch_size=2)
+
+        written = [writer.write((1, f"2024-01-01 00:00:0{i}", float(i), None, None)) for i in range(3)]
+        written.append(writer.flush())
+
+        assert written == [0, 2, 0, 1]
+        ids = [row[0] for row in dateaubase_db.execute('SELECT "Value_ID" FROM value')]
+        assert ids == [10, 11, 12, 13]
+
+    def test_rejects_invalid_batch_size(self, dateaubase_db):
+        with pytest.raises(ValueError, match="batch_size"):
+            ValueWriter(dateaubase_db, batch_size=0)
+
+
+class TestIngest:
+    def test_csv_end_to_end(self, dateaubase_db, tmp_path):
+        rows = [(f"2024-01-01 00:00:{i:02d}", i * 0.5, i % 3) for i in range(25)]
+        rows.append(("", 1.0, 0))  # no timestamp
+        rows.append(("2024-01-01 00:01:00", "n/a", 0))  # unparsable value
+        rows.append(("2024-13-01 00:00:00", 1.0, 0))  # malformed timestamp
+        path = write_csv(tmp_path / "export.csv", ["time", "NH4", "Equipment_ID"], rows)
+        reports = []
+
+        report = ingest(
+            path,
+            dateaubase_db,
+            metadata={"Parameter_ID": 7},
+            column_map={"Timestamp": "time", "Value": "NH4"},
+            batch_size=10,
+            progress=lambda r: reports.append(r.rows_written),
+        )
+
+        assert (report.rows_read, report.rows_written, report.rows_rejected) == (28, 25, 3)
+        assert report.batches == 3
+        assert reports == [10, 20, 25]
+        assert "25 rows" in str(report)
+        assert dateaubase_db.execute(
+            'SELECT COUNT(*), COUNT(DISTINCT "Equipment_ID"), MIN("Parameter_ID") FROM metadata'
+        ).fetchone() == (3, 3, 7)
+        assert dateaubase_db.execute(
+            'SELECT COUNT(*) FROM value v JOIN metadata m ON v."Metadata_ID" = m."Metadata_ID"'
+        ).fetchone() == (25,)
+
+    def test_backpressure_bounds_pending_chunks(self, dateaubase_db):
+        produced = []
+        pending = []
+
+        def chunks():
+            for i in range(20):
+                produced.append(i)
+                yield [{"Timestamp": datetime(2024, 1, 1, 0, 0, i), "Value": i}]
+
+        def progress(report):
+            # Chunks handed out by the reader but not yet written
+            pending.append(len(produced) - report.rows_written)
+
+        report = ingest(
+            chunks(),
+            dateaubase_db,
+            metadata={"Equipment_ID": 1},
+            batch_size=1,
+            max_pending_chunks=2,
+            progress=progress,
+        )
+
+        assert report.rows_written == 20
+        # At most: queue capacity + one chunk being written + one blocked in put
+        assert max(pending) <= 4
+        assert dateaubase_db.execute(
+            'SELECT "Timestamp" FROM value ORDER BY "Value_ID" LIMIT 1'
+        ).fetchone() == ("2024-01-01 00:00:00.000",)
+
+    def test_source_errors_propagate(self, dateaubase_db):
+        def chunks():
+            yield [{"Timestamp": "2024-01-01", "Value": 1}]
+            raise OSError("disk gone")
+
+        with pytest.raises(OSError, match="disk gone"):
+            ingest(chunks(), dateaubase_db)
+
+        assert not any(t.name == "ingest-reader" for t in threading.enumerate())
+
+    def test_report_rate(self):
+        report = IngestReport(rows_written=500, elapsed=2.0)
+        assert report.rows_per_second == 250.0
+        assert IngestReport().rows_per_second == 0.0
+
+    def test_format_timestamp(self):
+        assert format_timestamp(datetime(2024, 5, 1, 12, 0, 0, 123456)) == "2024-05-01 12:00:00.123"
+        assert format_timestamp(" 2024-05-01 ") == "2024-05-01 00:00:00.000"
+        assert format_timestamp("2024-05-01T12:00:00+02:00") == "2024-05-01 10:00:00.000"
+        assert format_timestamp("") is None
+        with pytest.raises(ValueError):
+            format_timestamp("01/05/2024")
+
+    def test_failed_batch_rolls_back_new_metadata(self, dateaubase_db):
+        dateaubase_db.execute(
+            'CREATE TRIGGER reject_negative BEFORE INSERT ON value WHEN NEW."Value" < 0 '
+            "BEGIN SELECT RAISE(ABORT, 'negative value'); END"
+        )
+        resolver = MetadataResolver(dateaubase_db)
+        rows = [
+            {"Timestamp": "2024-01-01 00:00:00", "Value": 1, "Equipment_ID": 1},
+            {"Timestamp": "2024-01-01 00:00:01", "Value": 2, "Equipment_ID": 1},
+            {"Timestamp": "2024-01-01 00:00:02", "Value": 3, "Equipment_ID": 2},
+            {"Timestamp": "2024-01-01 00:00:03", "Value": -1, "Equipment_ID": 2},
+        ]
+
+        with pytest.raises(sqlite3.IntegrityError, match="negative value"):
+            ingest([rows], dateaubase_db, batch_size=2, resolver=resolver)
+
+        # The first batch stays; the second and its metadata row are gone
+        assert dateaubase_db.execute("SELECT COUNT(*) FROM value").fetchone() == (2,)
+        assert dateaubase_db.execute('SELECT "Equipment_ID" FROM metadata').fetchall() == [(1,)]
+        assert len(resolver) == 1
+        metadata_id = resolver.resolve(resolver.key({"Equipment_ID": 2}))
+        resolver.flush()
+        assert dateaubase_db.execute(
+            'SELECT "Equipment_ID" FROM metadata WHERE "Metadata_ID" = ?', (metadata_id,)
+        ).fetchone() == (2,)
@@ -0,0 +1,127 @@
+"""Tests for creating and bulk loading a local SQLite datEAUbase."""
+
+import pytest
+import sqlite3
+import sys
+from pathlib import Path
+
+# Add scripts directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "scripts"))
+
+from create_local_db import (
+    bulk_load,
+    create_local_database,
+    open_local_database,
+)
+from generate_sql import generate_sql_schema, parse_parts_json
+
+PACKAGED_DICTIONARY = (
+    Path(__file__).parent.parent.parent / "src" / "open_dateaubase" / "dictionary.json"
+)
+
+
+@pytest.fixture(scope="module")
+def schema():
+    return parse_parts_json(PACKAGED_DICTIONARY)
+
+
+@pytest.fixture
+def station_db(tmp_path, schema):
+    connection = create_local_database(tmp_path / "station.db", schema)
+    yield connection
+    connection.close()
+
+
+def make_row(schema, table_id, **values):
+    """Build a row in the table's column order from column values."""
+    return tuple(values.get(f["part_id"]) for f in schema["tables"][table_id]["fields"])
+
+
+def index_names(connection, table_id):
+    rows = connection.execute(
+        "SELECT name FROM sqlite_master WHERE type = 'index' AND tbl_name = ? AND sql IS NOT NULL",
+        (table_id,),
+    )
+    return sorted(name for (name,) in rows)
+
+
+class TestCreateLocalDatabase:
+    def test_schema_and_indexes(self, station_db, schema):
+        tables = station_db.execute("SELECT COUNT(*) FROM sqlite_master WHERE type = 'table'")
+        indexes = station_db.execute(
+            "SELECT COUNT(*) FROM sqlite_master WHERE type = 'index' AND sql IS NOT NULL"
+        )
+
+        assert tables.fetchone()[0] == len(schema["tables"])
+        assert indexes.fetchone()[0] == generate_sql_schema(schema, "sqlite").count("CREATE INDEX")
+
+    def test_pragmas(self, station_db, tmp_path):
+        assert station_db.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+        assert station_db.execute("PRAGMA foreign_keys").fetchone()[0] == 1
+
+        # WAL mode is kept in the file; per-connection pragmas are reapplied
+        reopened = open_local_database(tmp_path / "station.db", {"foreign_keys": "OFF"})
+        assert reopened.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+        assert reopened.execute("PRAGMA foreign_keys").fetchone()[0] == 0
+        reopened.close()
+
+    def test_foreign_keys_are_enforced(self, station_db):
+        with pytest.raises(sqlite3.IntegrityError):
+            station_db.execute('INSERT INTO "site" ("Site_ID", "Watershed_ID") VALUES (1, 99)')
+
+    def test_existing_file(self, station_db, tmp_path, schema):
+        path = tmp_path / "station.db"
+        with pytest.raises(FileExistsError):
+            create_local_database(path, schema)
+
+        station_db.execute('INSERT INTO "unit" ("Unit_ID") VALUES (1)')
+        station_db.commit()
+        station_db.close()
+        replaced = create_local_database(path, schema, overwrite=True)
+        assert replaced.execute('SELECT COUNT(*) FROM "unit"').fetchone()[0] == 0
+        replaced.close()
+
+    def test_failed_creation_removes_the_file(self, tmp_path, schema, monkeypatch):
+        import create_local_db
+
+        def failing_schema(*args, **kwargs):
+            yield from generate_sql_schema(schema, "sqlite").splitlines()
+            yield "CREATE TABLE broken (;"
+
+        monkeypatch.setattr(create_local_db, "iter_sql_schema", failing_schema)
+        path = tmp_path / "station.db"
+
+        with pytest.raises(sqlite3.OperationalError):
+            create_local_database(path, schema)
+
+        assert list(tmp_path.iterdir()) == []
+
+
+class TestBulkLoad:
+    def test_loads_rows_and_restores_indexes(self, station_db, schema):
+        before = index_names(station_db, "unit")
+        rows = (make_row(schema, "unit", Unit_ID=i, Unit=f"u{i}") for i in range(1, 1001))
+
+        assert bulk_load(station_db, "unit", rows, schema, batch_size=64) == 1000
+
+        assert station_db.execute('SELECT COUNT(*) FROM "unit"').fetchone()[0] == 1000
+        assert index_names(station_db, "unit") == before
+        assert station_db.execute("PRAGMA synchronous").fetchone()[0] == 1  # NORMAL
+
+    def test_failed_load_rolls_back(self, station_db, schema):
+        before = index_names(station_db, "site")
+        # The second row references a watershed that does not exist
+        rows = [
+            make_row(schema, "site", Site_ID=1),
+            make_row(schema, "site", Site_ID=2, Watershed_ID=99),
+        ]
+
+        with pytest.raises(sqlite3.IntegrityError):
+            bulk_load(station_db, "site", rows, schema)
+
+        assert station_db.execute('SELECT COUNT(*) FROM "site"').fetchone()[0] == 0
+        assert index_names(station_db, "site") == before
+
+    def test_invalid_batch_size(self, station_db, schema):
+        with pytest.raises(ValueError, match="batch_size"):
+            bulk_load(station_db, "unit", [], schema, batch_size=0)
@@ -0,0 +1,255 @@
+"""Tests for migration generation between dictionary versions."""
+
+import copy
+import json
+import pytest
+import sys
+from pathlib import Path
+
+# Add scripts directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "tests"))
+sys.path.insert(0, str(Path(__file__).parent.parent / "scripts"))
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from generate_migration import diff_schemas, generate_migration
+from generate_sql import get_db_config
+from open_dateaubase.data_model.models import Dictionary
+from open_dateaubase.data_model.schema import compile_schema
+from fixtures.sample_dictionary import chain_dictionary_data, sample_dictionary_data
+
+PACKAGED_DICTIONARY = (
+    Path(__file__).parent.parent.parent / "src" / "open_dateaubase" / "dictionary.json"
+)
+
+
+def compile_data(data):
+    return compile_schema(Dictionary.model_validate(data))
+
+
+def edit_parts(data, **changes):
+    """Return a copy of dictionary data with Part_ID -> {key: value} changes applied."""
+    data = copy.deepcopy(data)
+    parts = {p["Part_ID"]: p for p in data["parts"]}
+    for part_id, fields in changes.items():
+        parts[part_id].update(fields)
+    return data
+
+
+def with_notes_table(data):
+    """Return a copy of dictionary data with a 'notes' table pointing at test_table."""
+    data = copy.deepcopy(data)
+    data["parts"] += [
+        {
+            "Part_ID": "notes",
+            "Label": "Notes",
+            "Description": "Notes table",
+            "Part_type": "table",
+        },
+        {
+            "Part_ID": "Note_ID",
+            "Label": "Note ID",
+            "Description": "Primary key",
+            "Part_type": "key",
+            "SQL_data_type": "int",
+            "Is_required": True,
+            "table_presence": {"notes": {"role": "key", "required": True, "order": 1}},
+        },
+    ]
+    parts = {p["Part_ID"]: p for p in data["parts"]}
+    parts["TestTable_ID"]["table_presence"]["notes"] = {
+        "role": "property",
+        "required": False,
+        "order": 2,
+        "relationship_type": "one-to-many",
+    }
+    return data
+
+
+@pytest.fixture
+def old():
+    return compile_data(sample_dictionary_data())
+
+
+class TestDiffSchemas:
+    def test_identical_schemas(self, old):
+        diff = diff_schemas(old, old, get_db_config("mssql"))
+        assert not any(diff.values())
+
+    def test_column_changes(self, old):
+        new = compile_data(
+            edit_parts(
+                sample_dictionary_data(),
+                Description={"SQL_data_type": "nvarchar(500)"},
+                Status={"Default_value": "active"},
+            )
+        )
+
+        diff = diff_schemas(old, new, get_db_config("mssql"))
+
+        changes = {
+            field["part_id"]: kinds for _, _, field, kinds in diff["changed_columns"]
+        }
+        assert changes == {"Description": {"type"}, "Status": {"default"}}
+
+    def test_changes_invisible_to_the_dialect_are_ignored(self, old):
+        new = compile_data(
+            edit_parts(sample_dictionary_data(), Description={"SQL_data_type": "nvarchar(500)"})
+        )
+        # Both sizes map to TEXT
+        assert not diff_schemas(old, new, get_db_config("sqlite"))["changed_columns"]
+
+    def test_tables_and_foreign_keys(self, old):
+        new = compile_data(with_notes_table(sample_dictionary_data()))
+
+        diff = diff_schemas(old, new, get_db_config("mssql"))
+        assert diff["added_tables"] == ["notes"]
+        assert [(t, f["part_id"]) for t, f in diff["added_foreign_keys"]] == [
+            ("notes", "TestTable_ID")
+        ]
+
+        diff = diff_schemas(new, old, get_db_config("mssql"))
+        assert diff["dropped_tables"] == ["notes"]
+
+
+class TestGenerateMigration:
+    def test_statement_order(self, old):
+        new_data = with_notes_table(sample_dictionary_data())
+        new_data = edit_parts(new_data, Description={"SQL_data_type": "nvarchar(500)"})
+        new = compile_data(new_data)
+
+        sql = generate_migration(old, new, include_timestamp=False)
+
+        create = sql.index("CREATE TABLE [notes]")
+        alter = sql.index("ALTER TABLE [test_table] ALTER COLUMN [Description] nvarchar(500) NOT NULL;")
+        fk = sql.index("ADD CONSTRAINT [FK_notes_TestTable_ID]")
+        assert create < alter < fk
+
+        reverse = generate_migration(new, old, include_timestamp=False)
+        assert reverse.index("DROP CONSTRAINT IF EXISTS [FK_notes_TestTable_ID]") < reverse.index(
+            "DROP TABLE [notes];"
+        )
+
+    def test_tables_follow_dependencies(self):
+        old = compile_data(chain_dictionary_data({"gamma": []}))
+        new = compile_data(chain_dictionary_data({"alpha": ["beta"], "beta": ["gamma"], "gamma": []}))
+
+        sql = generate_migration(old, new, "sqlite", include_timestamp=False)
+        assert sql.index('CREATE TABLE "beta"') < sql.index('CREATE TABLE "alpha"')
+
+        reverse = generate_migration(new, old, include_timestamp=False)
+        assert reverse.index("DROP TABLE [alpha];") < reverse.index("DROP TABLE [beta];")
+
+    def test_required_column_without_default_is_added_nullable(self, old):
+        new_data = sample_dictionary_data()
+        new_data["parts"].append(
+            {
+                "Part_ID": "Notes",
+                "Label": "Notes",
+                "Description": "Notes",
+                "Part_type": "property",
+                "SQL_data_type": "nvarchar(100)",
+                "Is_required": True,
+                "table_presence": {
+                    "test_table": {"role": "property", "required": True, "order": 5}
+                },
+            }
+        )
+
+        sql = generate_migration(old, compile_data(new_data), "postgres", include_timestamp=False)
+
+        assert 'ALTER TABLE "test_table" ADD COLUMN "Notes" varchar(100) NULL;' in sql
+        assert '-- ALTER TABLE "test_table" ALTER COLUMN "Notes" SET NOT NULL;' in sql
+
+    def test_default_changes(self, old):
+        new = compile_data(edit_parts(sample_dictionary_data(), Status={"Default_value": "active"}))
+
+        assert "ADD DEFAULT 'active' FOR [Status];" in generate_migration(old, new)
+        postgres = generate_migration(old, new, "postgres")
+        assert """ALTER COLUMN "Status" SET DEFAULT 'active';""" in postgres
+
+        # Removing the default looks up MSSQL's generated constraint name
+        reverse = generate_migration(new, old)
+        assert "sys.default_constraints" in reverse
+        assert 'ALTER COLUMN "Status" DROP DEFAULT;' in generate_migration(new, old, "postgres")
+
+    def test_online_type_change_on_large_tables(self, old):
+        new = compile_data(
+            edit_parts(sample_dictionary_data(), Description={"SQL_data_type": "nvarchar(500)"})
+        )
+
+        sql = generate_migration(old, new, large_tables=["test_table"], batch_size=1000)
+
+        assert "ADD [Description__new] nvarchar(500) NULL;" in sql
+        assert "UPDATE TOP (1000) [test_table]" in sql
+        assert sql.index("DROP COLUMN [Description];") < sql.index("EXEC sp_rename")
+        assert "ALTER COLUMN [Description] nvarchar(500) NOT NULL;" in sql
+
+        postgres = generate_migration(old, new, "postgres", large_tables=["test_table"])
+        assert "LIMIT 50000" in postgres
+        assert 'RENAME COLUMN "Description__new" TO "Description";' in postgres
+
+    def test_online_type_change_batches(self, old):
+        new = compile_data(
+            edit_parts(sample_dictionary_data(), Description={"SQL_data_type": "nvarchar(500)"})
+        )
+
+        lines = generate_migration(old, new, large_tables=["test_table"]).splitlines()
+
+        # MSSQL compiles a batch before running it: the staging column must
+        # exist before the backfill batch, and be renamed before later batches
+        add = lines.index("ALTER TABLE [test_table] ADD [Description__new] nvarchar(500) NULL;")
+        assert lines[add + 1] == "GO"
+        assert lines[lines.index("END;") + 1] == "GO"
+        assert lines[lines.index("ALTER TABLE [test_table] DROP COLUMN [Description];") - 1] == "GO"
+        assert lines[lines.index("EXEC sp_rename 'test_table.Description__new', 'Description', 'COLUMN';") + 1] == "GO"
+
+        postgres = generate_migration(old, new, "postgres", large_tables=["test_table"]).splitlines()
+        loop = postgres[postgres.index("    LOOP"):postgres.index("    END LOOP;")]
+        assert "        COMMIT;" in loop
+        assert loop.index("        EXIT WHEN NOT FOUND;") < loop.index("        COMMIT;")
+
+    def test_unsupported_changes_raise(self, old):
+        new_data = sample_dictionary_data()
+        parts = {p["Part_ID"]: p for p in new_data["parts"]}
+        parts["Status"]["table_presence"]["test_table"]["required"] = True
+        new = compile_data(new_data)
+        changed_type = compile_data(
+            edit_parts(sample_dictionary_data(), TestTable_ID={"SQL_data_type": "bigint"})
+        )
+
+        with pytest.raises(ValueError, match="test_table.Status"):
+            generate_migration(old, new, "sqlite")
+        with pytest.raises(ValueError, match="primary key"):
+            generate_migration(old, changed_type)
+
+    def test_dropped_foreign_keys_need_rebuild_with_inline_constraints(self):
+        data = json.loads(PACKAGED_DICTIONARY.read_text())
+        old_schema = compile_data(data)
+        parts = {p["Part_ID"]: p for p in data["parts"]}
+        del parts["Unit_ID"]["table_presence"]["metadata"]["relationship_type"]
+        new_schema = compile_data(data)
+
+        with pytest.raises(ValueError, match=r"metadata\.Unit_ID \(dropped foreign key\)"):
+            generate_migration(old_schema, new_schema, "sqlite")
+        postgres = generate_migration(old_schema, new_schema, "postgres")
+        assert 'ALTER TABLE "metadata" DROP CONSTRAINT IF EXISTS "FK_metadata_Unit_ID";' in postgres
+
+    def test_large_table_constraints_online(self):
+        with open(PACKAGED_DICTIONARY, encoding="utf-8") as f:
+            old_data = json.load(f)
+        new_data = copy.deepcopy(old_data)
+        parts = {p["Part_ID"]: p for p in new_data["parts"]}
+        parts["Metadata_ID"]["table_presence"]["value"]["required"] = True
+        old, new = compile_data(old_data), compile_data(new_data)
+
+        sql = generate_migration(old, new)
+        assert "DROP CONSTRAINT IF EXISTS [FK_value_Metadata_ID];" in sql
+        assert "ALTER TABLE [value] WITH NOCHECK" in sql
+        assert "WITH CHECK CHECK CONSTRAINT [FK_value_Metadata_ID];" in sql
+        assert "INCLUDE ([Value]) WITH (ONLINE = ON);" in sql
+
+        # The partitioned value table cannot use CONCURRENTLY or NOT VALID
+        postgres = generate_migration(old, new, "postgres")
+        assert 'ALTER COLUMN "Metadata_ID" SET NOT NULL;' in postgres
+        assert "CONCURRENTLY" not in postgres
+        assert "NOT VALID" not in postgres
@@ -17,6 +17,7 @@ from open_dateaubase.data_model.models import (
     ValueSetMemberPart,
     ParentKeyPart,
 )
+from pydantic import ValidationError
 
 
 class TestTablePresence:
@@ -143,3 +144,210 @@ class TestDictionary:
         }
         with pytest.raises(ValueError, match="Duplicate Part_IDs"):
             Dictionary.model_validate(data)
+
+    def test_reports_all_dangling_references(self):
+        data = {
+            "parts": [
+                {
+                    "Part_ID": "test_table",
+                    "Label": "Test",
+                    "Description": "Test",
+                    "Part_type": "table",
+                },
+                {
+                    "Part_ID": "Kind",
+                    "Label": "Kind",
+                    "Description": "Kind",
+                    "Part_type": "property",
+                    "Value_set_part_ID": "MissingSet",
+                    "table_presence": {
+                        "test_table": {"role": "property", "order": 1},
+                        "missing_table": {"role": "property", "order": 1},
+                    },
+                },
+                {
+                    "Part_ID": "orphan",
+                    "Label": "Orphan",
+                    "Description": "Orphan member",
+                    "Part_type": "valueSetMember",
+                    "Member_of_set_part_ID": "Other_set",
+                },
+            ]
+        }
+        with pytest.raises(ValueError) as exc_info:
+            Dictionary.model_validate(data)
+
+        message = str(exc_info.value)
+        assert "Found 3 invalid cross-references" in message
+        assert "value set 'MissingSet'" in message
+        assert "table 'missing_table'" in message
+        assert "set 'Other_set'" in message
+
+    def test_fk_on_non_key_field_rejected(self):
+        data = {
+            "parts": [
+                {
+                    "Part_ID": "test_table",
+                    "Label": "Test",
+                    "Description": "Test",
+                    "Part_type": "table",
+                },
+                {
+                    "Part_ID": "Other_ID",
+                    "Label": "Other",
+                    "Description": "Other",
+                    "Part_type": "property",
+                    "table_presence": {
+                        "test_table": {
+                            "role": "property",
+                            "order": 1,
+                            "relationship_type": "one-to-many",
+                        }
+                    },
+                },
+            ]
+        }
+        with pytest.raises(ValueError, match="not defined as a key field"):
+            Dictionary.model_validate(data)
+
+
+class TestIndexPart:
+    def _data(self, **index):
+        return {
+            "parts": [
+                {
+                    "Part_ID": "test_table",
+                    "Label": "Test",
+                    "Description": "Test",
+                    "Part_type": "table",
+                },
+                {
+                    "Part_ID": "Test_ID",
+                    "Label": "Test ID",
+                    "Description": "Test ID",
+                    "Part_type": "key",
+                    "table_presence": {"test_table": {"role": "key", "order": 1}},
+                },
+                {
+                    "Part_ID": "IX_test",
+                    "Label": "Index",
+                    "Description": "Index",
+                    "Part_type": "index",
+                    "Table_part_ID": "test_table",
+                    **index,
+                },
+            ]
+        }
+
+    def test_valid_index(self):
+        dictionary = Dictionary.model_validate(self._data(Index_columns=["Test_ID"]))
+        index = dictionary.parts[-1]
+        assert index.index_columns == ["Test_ID"]
+        assert index.include_columns == []
+        assert index.is_unique is False
+
+    def test_requires_columns(self):
+        with pytest.raises(ValidationError):
+            Dictionary.model_validate(self._data(Index_columns=[]))
+
+    def test_rejects_repeated_columns(self):
+        with pytest.raises(ValueError, match="more than once"):
+            Dictionary.model_validate(
+                self._data(Index_columns=["Test_ID"], Include_columns=["Test_ID"])
+            )
+
+    def test_rejects_field_outside_table(self):
+        with pytest.raises(ValueError, match="'Other_ID' which is not in table"):
+            Dictionary.model_validate(self._data(Index_columns=["Other_ID"]))
+
+    def test_rejects_unknown_table(self):
+        data = self._data(Index_columns=["Test_ID"])
+        data["parts"][-1]["Table_part_ID"] = "missing"
+        with pytest.raises(ValueError, match="non-existent table 'missing'"):
+            Dictionary.model_validate(data)
+
+
+class TestTableStorage:
+    def _data(self, **storage):
+        return {
+            "parts": [
+                {
+                    "Part_ID": "test_table",
+                    "Label": "Test",
+                    "Description": "Test",
+                    "Part_type": "table",
+                    "Storage": storage,
+                },
+                {
+                    "Part_ID": "Test_ID",
+                    "Label": "Test ID",
+                    "Description": "Test ID",
+                    "Part_type": "key",
+                    "table_presence": {"test_table": {"role": "key", "order": 1}},
+                },
+            ]
+        }
+
+    def test_valid_storage(self):
+        dictionary = Dictionary.model_validate(
+            self._data(
+                Partition_column="Test_ID",
+                Partition_boundaries=["10", "20"],
+                Columnstore=True,
+            )
+        )
+        storage = dictionary.parts[0].storage
+        assert storage.partition_column == "Test_ID"
+        assert storage.partition_boundaries == ["10", "20"]
+        assert storage.columnstore is True
+
+    def test_boundaries_require_partition_column(self):
+        with pytest.raises(ValueError, match="require a Partition_column"):
+            Dictionary.model_validate(self._data(Partition_boundaries=["10"]))
+
+    def test_rejects_repeated_boundaries(self):
+        with pytest.raises(ValueError, match="must be distinct"):
+            Dictionary.model_validate(
+                self._data(Partition_column="Test_ID", Partition_boundaries=["1", "1"])
+            )
+
+    def test_partition_column_must_be_in_table(self):
+        with pytest.raises(ValueError, match="partitioned on field 'Other_ID'"):
+            Dictionary.model_validate(self._data(Partition_column="Other_ID"))
+
+
+class TestSqlDataTypes:
+    def _property(self, **kwargs):
+        return PropertyPart(
+            Part_ID="Recorded_at",
+            Label="Recorded at",
+            Description="Recording time",
+            Part_type="property",
+            table_presence={"test_table": TablePresence(role="property", order=1)},
+            **kwargs,
+        )
+
+    @pytest.mark.parametrize(
+        "sql_type",
+        ["datetime2(3)", "datetime2", "timestamptz(6)", "numeric(18, 0)", "nvarchar(max)"],
+    )
+    def test_valid_types(self, sql_type):
+        assert self._property(SQL_data_type=sql_type).sql_data_type == sql_type
+
+    @pytest.mark.parametrize(
+        "sql_type",
+        ["datetime2(8)", "timestamptz(7)", "time(1,2)", "numeric(0)", "numeric(5,6)", "decimal(x)"],
+    )
+    def test_invalid_types(self, sql_type):
+        with pytest.raises(ValidationError):
+            self._property(SQL_data_type=sql_type)
+
+    def test_epoch_time_unit(self):
+        part = self._property(SQL_data_type="bigint", Time_unit="ms")
+        assert part.time_unit == "ms"
+
+    def test_time_unit_requires_bigint(self):
+        with pytest.raises(ValidationError, match="not a bigint epoch column"):
+            self._property(SQL_data_type="int", Time_unit="s")
+        with pytest.raises(ValidationError):
+            self._property(SQL_data_type="bigint", Time_unit="minutes")
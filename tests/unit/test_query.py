@@ -0,0 +1,136 @@
+"""Tests for time-window queries on the value table."""
+
+import pytest
+import sys
+from datetime import datetime
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from open_dateaubase.query.values import (
+    VALUE_COLUMNS,
+    ValueQuery,
+    build_value_query,
+    fetch_values,
+    iter_value_batches,
+    iter_value_pages,
+    page_cursor,
+)
+
+ROWS = 300
+
+
+@pytest.fixture
+def values_db(dateaubase_db):
+    """Two parameters (NH4 on metadata 1 and 3, TSS on 2) with hourly values."""
+    dateaubase_db.execute("""INSERT INTO "unit" ("Unit_ID", "Unit") VALUES (1, 'mg/L')""")
+    dateaubase_db.executemany(
+        """INSERT INTO "parameter" ("Parameter_ID", "Parameter", "Unit_ID") VALUES (?, ?, 1)""",
+        [(1, "NH4"), (2, "TSS")],
+    )
+    dateaubase_db.executemany(
+        """INSERT INTO "metadata" ("Metadata_ID", "Parameter_ID", "Unit_ID") VALUES (?, ?, 1)""",
+        [(1, 1), (2, 2), (3, 1)],
+    )
+    dateaubase_db.executemany(
+        """INSERT INTO "value" ("Value_ID", "Metadata_ID", "Timestamp", "Value") VALUES (?, ?, ?, ?)""",
+        [
+            # Two values per hour and metadata, so timestamps tie
+            (i, 1 + i % 3, f"2024-01-{1 + i // 144:02d} {i // 6 % 24:02d}:00:00.000", float(i))
+            for i in range(ROWS)
+        ],
+    )
+    dateaubase_db.commit()
+    return dateaubase_db
+
+
+class TestBuildValueQuery:
+    def test_only_needed_joins(self):
+        sql, params = build_value_query(ValueQuery(metadata_ids=[1, 2]), "postgres")
+
+        assert "JOIN" not in sql
+        assert '"value"."Metadata_ID" IN (?, ?)' in sql
+        assert params == [1, 2]
+
+    def test_joins_follow_foreign_keys(self):
+        sql, params = build_value_query(
+            ValueQuery(parameter="NH4", sampling_point=4, labels=("unit",)), "postgres"
+        )
+
+        assert 'INNER JOIN "metadata" ON "metadata"."Metadata_ID" = "value"."Metadata_ID"' in sql
+        assert 'INNER JOIN "parameter" ON "parameter"."Parameter_ID" = "metadata"."Parameter_ID"' in sql
+        assert 'LEFT JOIN "unit" ON "unit"."Unit_ID" = "metadata"."Unit_ID"' in sql
+        # Filtering by ID needs no lookup join
+        assert 'JOIN "sampling_points"' not in sql
+        assert params[:2] == ["NH4", 4]
+
+    def test_sargable_time_window(self):
+        sql, params = build_value_query(
+            ValueQuery(start=datetime(2024, 1, 1), end="2024-02-01"), "sqlite"
+        )
+
+        assert '"value"."Timestamp" >= ? AND "value"."Timestamp" < ?' in sql
+        assert params == ["2024-01-01 00:00:00.000", "2024-02-01 00:00:00.000"]
+        assert sql.endswith('ORDER BY "value"."Metadata_ID", "value"."Timestamp", "value"."Value_ID"')
+
+    def test_pagination_per_dialect(self):
+        query = ValueQuery(metadata_ids=[1])
+
+        mssql, mssql_params = build_value_query(query, "mssql", limit=10, offset=20)
+        postgres, postgres_params = build_value_query(
+            query, "postgres", placeholder="%s", limit=10, offset=20
+        )
+
+        assert mssql.endswith("OFFSET ? ROWS FETCH NEXT ? ROWS ONLY")
+        assert mssql_params[-2:] == [20, 10]
+        assert postgres.endswith("LIMIT %s OFFSET %s")
+        assert postgres_params[-2:] == [10, 20]
+
+    def test_invalid_arguments(self):
+        with pytest.raises(ValueError, match="Unknown labels"):
+            build_value_query(ValueQuery(labels=("site",)))
+        with pytest.raises(ValueError, match="offset requires a limit"):
+            build_value_query(ValueQuery(), offset=5)
+        with pytest.raises(ValueError, match="Empty parameter filter"):
+            build_value_query(ValueQuery(parameter=[]))
+
+
+class TestFetchValues:
+    def test_filters_and_labels(self, values_db):
+        rows = fetch_values(
+            values_db,
+            ValueQuery(parameter="NH4", start="2024-01-02", end="2024-01-03", labels=("unit",)),
+        )
+
+        assert rows
+        assert {row[1] for row in rows} == {1, 3}
+        assert all("2024-01-02" <= row[2] < "2024-01-03" for row in rows)
+        assert all(row[-1] == "mg/L" for row in rows)
+        assert len(rows[0]) == len(VALUE_COLUMNS) + 1
+
+    def test_keyset_pages_match_single_fetch(self, values_db):
+        query = ValueQuery(parameter=[1, "TSS"])
+
+        pages = list(iter_value_pages(values_db, query, page_size=7))
+
+        assert [row for page in pages for row in page] == fetch_values(values_db, query)
+        assert sum(len(page) for page in pages) == ROWS
+        assert all(len(page) == 7 for page in pages[:-1])
+
+    def test_resume_from_cursor(self, values_db):
+        query = ValueQuery(metadata_ids=[2])
+        first = fetch_values(values_db, query, limit=5)
+
+        rest = fetch_values(values_db, query, after=page_cursor(first[-1]))
+
+        assert first + rest == fetch_values(values_db, query)
+
+    def test_columnar_batches(self, values_db):
+        pytest.importorskip("numpy")
+
+        batches = list(iter_value_batches(values_db, ValueQuery(parameter="TSS"), page_size=40))
+
+        assert [len(batch) for batch in batches] == [40, 40, 20]
+        assert batches[0].columns["Timestamp"].dtype.kind == "M"
+        assert (batches[0].columns["Metadata_ID"] == 2).all()
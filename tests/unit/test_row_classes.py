@@ -0,0 +1,131 @@
+"""Tests for typed row class generation from dictionary."""
+
+import pytest
+import json
+import types
+from datetime import datetime
+from decimal import Decimal
+from pathlib import Path
+import sys
+
+# Add scripts directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "tests"))
+sys.path.insert(0, str(Path(__file__).parent.parent / "scripts"))
+
+from generate_row_classes import (
+    parse_parts_json,
+    python_type,
+    class_name,
+    generate_row_classes,
+)
+from fixtures.sample_dictionary import sample_dictionary_data
+
+PACKAGED_DICTIONARY = (
+    Path(__file__).parent.parent.parent / "src" / "open_dateaubase" / "dictionary.json"
+)
+
+
+def load_rows_module(data, name="generated_rows"):
+    """Execute the generated source as a module."""
+    module = types.ModuleType(name)
+    # dataclasses resolves string ClassVar annotations through sys.modules
+    sys.modules[name] = module
+    exec(compile(generate_row_classes(data), f"{name}.py", "exec"), module.__dict__)
+    return module
+
+
+@pytest.fixture(scope="module")
+def rows():
+    """Row classes generated from the packaged dictionary."""
+    return load_rows_module(parse_parts_json(PACKAGED_DICTIONARY))
+
+
+class TestTypeMapping:
+    """Tests for SQL type -> Python type mapping."""
+
+    @pytest.mark.parametrize(
+        "sql_type,expected",
+        [
+            ("int", ("int", "_int")),
+            ("nvarchar(100)", ("str", "_str")),
+            ("datetime2(3)", ("datetime", "_datetime")),
+            ("numeric(18,0)", ("int", "_int")),
+            ("numeric(10,2)", ("Decimal", "_decimal")),
+            ("BLOB", ("bytes", "_bytes")),
+            ("geography", ("Any", None)),
+        ],
+    )
+    def test_python_type(self, sql_type, expected):
+        assert python_type(sql_type) == expected
+
+    def test_class_name(self):
+        assert class_name("equipment_model_has_Parameter") == "EquipmentModelHasParameter"
+
+
+class TestGeneratedClasses:
+    """Tests for the generated module."""
+
+    def test_one_class_per_table(self, rows):
+        data = parse_parts_json(PACKAGED_DICTIONARY)
+        assert set(rows.ROW_CLASSES) == set(data["tables"])
+        assert rows.ROW_CLASSES["value"] is rows.Value
+
+    def test_instances_are_slotted(self, rows):
+        value = rows.Value()
+        assert not hasattr(value, "__dict__")
+        with pytest.raises(AttributeError):
+            value.unknown = 1
+
+    def test_columns_use_sql_names(self, rows):
+        # Table-prefixed Part_IDs map to their SQL column name
+        assert "City" in rows.Site.__columns__
+        assert rows.Value.__table__ == "value"
+
+    def test_from_row_coerces_types(self, rows):
+        row = dict.fromkeys(rows.Value.__columns__)
+        row.update(Metadata_ID="3", Timestamp="2024-01-01 00:00:00.123", Value="1.5", Value_ID=7)
+        value = rows.Value.from_row(list(row.values()))
+
+        assert value.Metadata_ID == 3
+        assert value.Timestamp == datetime(2024, 1, 1, 0, 0, 0, 123000)
+        assert value.Value == 1.5
+        assert value.Comment_ID is None
+
+    def test_to_params_round_trips(self, rows):
+        value = rows.Value.from_mapping({"Value_ID": 1, "Metadata_ID": 2, "Value": 0.5})
+        params = value.to_params()
+
+        assert len(params) == len(rows.Value.__columns__)
+        assert rows.Value.from_row(params) == value
+
+    def test_decimal_columns(self, tmp_path):
+        data = sample_dictionary_data()
+        for part in data["parts"]:
+            if part["Part_ID"] == "Description":
+                part["SQL_data_type"] = "decimal(10,2)"
+        json_file = tmp_path / "dictionary.json"
+        json_file.write_text(json.dumps(data, indent=2))
+        module = load_rows_module(parse_parts_json(json_file), name="sample_rows")
+
+        row = module.TestTable.from_mapping({"TestTable_ID": "1", "Description": "1.10"})
+        assert row.Description == Decimal("1.10")
+        assert row.TestTable_ID == 1
+
+    def test_bit_columns(self, tmp_path):
+        data = sample_dictionary_data()
+        for part in data["parts"]:
+            if part["Part_ID"] == "Description":
+                part["SQL_data_type"] = "bit"
+        json_file = tmp_path / "dictionary.json"
+        json_file.write_text(json.dumps(data, indent=2))
+        module = load_rows_module(parse_parts_json(json_file), name="bit_rows")
+
+        def parse(value):
+            return module.TestTable.from_mapping({"Description": value}).Description
+
+        assert [parse(v) for v in ("1", " TRUE ", 1, True)] == [True] * 4
+        assert [parse(v) for v in ("0", "false", "False", 0, False)] == [False] * 5
+        assert parse(None) is None
+        for invalid in ("yes", "", 2, 1.0):
+            with pytest.raises(ValueError, match="Invalid bit value"):
+                parse(invalid)
@@ -0,0 +1,76 @@
+"""Tests for the compiled schema shared by all generators."""
+
+import pytest
+import json
+import pickle
+import sys
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from open_dateaubase.data_model.models import Dictionary
+from open_dateaubase.data_model.schema import compile_schema, load_schema, thaw_schema
+from fixtures.sample_dictionary import sample_dictionary_data
+
+
+@pytest.fixture
+def schema():
+    return compile_schema(Dictionary.model_validate(sample_dictionary_data()))
+
+
+class TestCompileSchema:
+    def test_buckets_fields_by_table_in_order(self, schema):
+        fields = schema["tables"]["test_table"]["fields"]
+        assert [f["part_id"] for f in fields] == [
+            "TestTable_ID",
+            "Status",
+            "Description",
+            "Parent_ID",
+        ]
+
+    def test_resolves_parent_key_fk(self, schema):
+        fields = schema["tables"]["test_table"]["fields"]
+        parent = next(f for f in fields if f["part_id"] == "Parent_ID")
+        assert parent["fk_to"] == "TestTable_ID"
+
+    def test_buckets_value_set_members_sorted(self, schema):
+        members = schema["value_sets"]["StatusSet"]["members"]
+        orders = [m["sort_order"] for m in members]
+        assert orders == sorted(orders)
+
+    def test_tracks_id_field_locations(self, schema):
+        assert schema["id_field_locations"]["TestTable_ID"] == {"test_table": "key"}
+
+    def test_fields_before_table_are_attached(self):
+        data = sample_dictionary_data()
+        # Move the table definition to the end of the parts list
+        data["parts"].append(data["parts"].pop(0))
+        schema = compile_schema(Dictionary.model_validate(data))
+        assert len(schema["tables"]["test_table"]["fields"]) == 4
+
+    def test_schema_is_read_only(self, schema):
+        with pytest.raises(TypeError):
+            schema["tables"]["new_table"] = {}
+        with pytest.raises(TypeError):
+            schema["tables"]["test_table"]["label"] = "Changed"
+        with pytest.raises(AttributeError):
+            schema["tables"]["test_table"]["fields"].append({})
+
+    def test_thawed_schema_can_be_pickled(self, schema):
+        with pytest.raises(TypeError):
+            pickle.dumps(schema)
+
+        thawed = pickle.loads(pickle.dumps(thaw_schema(schema)))
+
+        assert thawed["tables"]["test_table"]["fields"][0]["part_id"] == "TestTable_ID"
+        assert thawed == thaw_schema(thawed)
+
+
+class TestLoadSchema:
+    def test_load_schema_from_file(self, tmp_path):
+        json_file = tmp_path / "dictionary.json"
+        json_file.write_text(json.dumps(sample_dictionary_data()))
+
+        schema = load_schema(json_file)
+        assert "test_table" in schema["tables"]
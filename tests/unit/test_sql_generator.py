@@ -1,7 +1,10 @@
 """Tests for SQL schema generation from dictionary."""
 
 import pytest
+import io
 import json
+import re
+import sqlite3
 from pathlib import Path
 import sys
 
@@ -18,8 +21,16 @@ from generate_sql import (
     get_db_config,
     extract_field_name,
     generate_sql_schemas,
+    iter_sql_schema,
+    write_sql_schema,
+    execute_sql_schema,
+    prepare_sql_schema,
+    render_sql_schema,
 )
-from fixtures.sample_dictionary import sample_dictionary_data
+from open_dateaubase.sql.writer import split_sql
+from fixtures.sample_dictionary import chain_dictionary_data, sample_dictionary_data
+from open_dateaubase.data_model.models import Dictionary
+from open_dateaubase.data_model.schema import compile_schema
 
 
 @pytest.fixture
@@ -98,6 +109,108 @@ class TestGenerateSQLSchema:
         assert "REFERENCES [TestTable] ([TestTable_ID])" in sql
 
 
+class TestStreaming:
+    """Tests for streaming the DDL instead of building it in memory."""
+
+    @pytest.mark.parametrize("target_db", ["mssql", "postgres", "sqlite"])
+    def test_write_matches_generated_string(self, sample_json_file, target_db):
+        data = parse_parts_json(sample_json_file)
+        stream = io.StringIO()
+
+        write_sql_schema(data, stream, target_db, include_timestamp=False)
+
+        assert stream.getvalue() == generate_sql_schema(data, target_db, include_timestamp=False)
+
+    def test_validates_before_streaming(self, sample_json_file):
+        data = parse_parts_json(sample_json_file)
+
+        with pytest.raises(ValueError, match="Unsupported database"):
+            iter_sql_schema(data, target_db="oracle")
+
+    def test_execute_on_connection(self, sample_json_file):
+        data = parse_parts_json(sample_json_file)
+        connection = sqlite3.connect(":memory:")
+
+        executed = execute_sql_schema(data, connection, "sqlite", batch_size=2)
+
+        tables = connection.execute("SELECT name FROM sqlite_master WHERE type = 'table'")
+        assert [name for (name,) in tables] == ["test_table"]
+        assert executed == len(list(split_sql(iter_sql_schema(data, "sqlite"))))
+
+    def test_stream_to_stdout(self, sample_json_file, capsys):
+        data = parse_parts_json(sample_json_file)
+
+        generate_sql_schemas(data, None, ["postgres"])
+
+        assert 'CREATE TABLE "test_table"' in capsys.readouterr().out
+
+
+class TestMultipleDialects:
+    """Tests for generating several dialects from one prepared schema."""
+
+    def test_prepare_once_render_many(self, sample_json_file):
+        data = parse_parts_json(sample_json_file)
+        prepared = prepare_sql_schema(data)
+
+        assert prepared["table_order"] == ["test_table"]
+        for target_db in ["mssql", "postgres", "sqlite"]:
+            rendered = "\n".join(render_sql_schema(prepared, target_db, include_timestamp=False))
+            assert rendered == generate_sql_schema(data, target_db, include_timestamp=False)
+
+    @pytest.mark.parametrize("max_workers", [None, 1])
+    def test_generate_files(self, sample_json_file, tmp_path, max_workers):
+        data = parse_parts_json(sample_json_file)
+        db_list = ["mssql", "postgres", "sqlite"]
+
+        generate_sql_schemas(data, tmp_path, db_list, max_workers=max_workers)
+
+        for target_db in db_list:
+            (path,) = tmp_path.glob(f"*_as-designed_{target_db}.sql")
+            written = re.sub(r"-- Generated: .*\n", "", path.read_text(encoding="utf-8"))
+            assert written == generate_sql_schema(data, target_db, include_timestamp=False)
+
+    def test_worker_errors_are_raised(self, sample_json_file, tmp_path):
+        data = parse_parts_json(sample_json_file)
+
+        with pytest.raises(ValueError, match="Unsupported database"):
+            generate_sql_schemas(data, tmp_path, ["mssql", "oracle"])
+
+
+class TestForeignKeyOrder:
+    """Tests for FK cycle detection and dependency ordering."""
+
+    def test_detects_cycles_through_multi_word_tables(self):
+        data = compile_schema(
+            Dictionary.model_validate(
+                chain_dictionary_data(
+                    {
+                        "equipment_model": ["sampling_points"],
+                        "sampling_points": ["site"],
+                        "site": ["equipment_model"],
+                    }
+                )
+            )
+        )
+
+        with pytest.raises(ValueError, match="equipment_model → sampling_points → site → equipment_model"):
+            validate_no_circular_fks(data)
+
+    def test_inline_foreign_keys_follow_dependencies(self):
+        data = compile_schema(
+            Dictionary.model_validate(
+                chain_dictionary_data({"alpha": ["beta"], "beta": ["gamma"], "gamma": []})
+            )
+        )
+
+        sqlite = generate_sql_schema(data, "sqlite")
+        assert sqlite.index('CREATE TABLE "gamma"') < sqlite.index('CREATE TABLE "beta"')
+        assert sqlite.index('CREATE TABLE "beta"') < sqlite.index('CREATE TABLE "alpha"')
+
+        # Dialects adding FKs afterwards keep the alphabetical order
+        mssql = generate_sql_schema(data, "mssql")
+        assert mssql.index("CREATE TABLE [alpha]") < mssql.index("CREATE TABLE [gamma]")
+
+
 class TestExtractFieldName:
     """Tests for field name extraction helper."""
 
@@ -141,6 +254,242 @@ class TestDatabaseTargeting:
         assert "supports_check_constraints" in config
         assert callable(config["quote"])
 
+    def test_postgres_quoting_and_types(self, sample_json_file):
+        data = parse_parts_json(sample_json_file)
+        sql = generate_sql_schema(data, target_db="postgres")
+
+        assert 'CREATE TABLE "test_table"' in sql
+        assert '"TestTable_ID" integer NOT NULL' in sql
+        assert '"Status" varchar(50) NULL' in sql
+        assert "[" not in sql
+
+    def test_postgres_references_exact_table_name(self, sample_json_file):
+        data = parse_parts_json(sample_json_file)
+        sql = generate_sql_schema(data, target_db="postgres")
+
+        assert 'ALTER TABLE "test_table"' in sql
+        assert 'REFERENCES "test_table" ("TestTable_ID")' in sql
+
+    def test_sqlite_declares_foreign_keys_inline(self, sample_json_file):
+        data = parse_parts_json(sample_json_file)
+        sql = generate_sql_schema(data, target_db="sqlite")
+
+        assert "ALTER TABLE" not in sql
+        assert (
+            'CONSTRAINT "FK_test_table_Parent_ID" FOREIGN KEY ("Parent_ID") '
+            'REFERENCES "test_table" ("TestTable_ID")'
+        ) in sql
+
+    def test_sqlite_schema_executes(self, complex_json_file):
+        import sqlite3
+
+        data = parse_parts_json(complex_json_file)
+        sql = generate_sql_schema(data, target_db="sqlite")
+
+        connection = sqlite3.connect(":memory:")
+        connection.execute("PRAGMA foreign_keys = ON")
+        connection.executescript(sql)
+        tables = {
+            row[0]
+            for row in connection.execute(
+                "SELECT name FROM sqlite_master WHERE type = 'table'"
+            )
+        }
+        assert tables == set(data["tables"])
+        for table_id in tables:
+            for fk in connection.execute(f'PRAGMA foreign_key_list("{table_id}")'):
+                assert fk[2] in tables
+
+
+@pytest.fixture
+def indexed_json_file(tmp_path):
+    """Sample dictionary with a declared covering index."""
+    data = sample_dictionary_data()
+    data["parts"].append(
+        {
+            "Part_ID": "IX_test_table_Status",
+            "Label": "By status",
+            "Description": "Records by status",
+            "Part_type": "index",
+            "Table_part_ID": "test_table",
+            "Index_columns": ["Status", "Parent_ID"],
+            "Include_columns": ["Description"],
+        }
+    )
+    json_file = tmp_path / "indexed_dictionary.json"
+    json_file.write_text(json.dumps(data, indent=2))
+    return json_file
+
+
+class TestIndexes:
+    """Tests for CREATE INDEX generation."""
+
+    def test_indexes_foreign_key_columns(self, sample_json_file):
+        data = parse_parts_json(sample_json_file)
+        sql = generate_sql_schema(data, target_db="mssql")
+
+        assert "-- Indexes" in sql
+        assert (
+            "CREATE INDEX [IX_test_table_Parent_ID] ON [test_table] ([Parent_ID]);"
+            in sql
+        )
+        # Primary key columns are already indexed
+        assert "IX_test_table_TestTable_ID" not in sql
+
+    def test_declared_covering_index(self, indexed_json_file):
+        data = parse_parts_json(indexed_json_file)
+        sql = generate_sql_schema(data, target_db="postgres")
+
+        assert (
+            'CREATE INDEX "IX_test_table_Status" ON "test_table" '
+            '("Status", "Parent_ID") INCLUDE ("Description");'
+        ) in sql
+        # Parent_ID is not the leading column, so it keeps its own FK index
+        assert '"IX_test_table_Parent_ID"' in sql
+
+    def test_declared_index_covers_leading_foreign_key(self, tmp_path):
+        data = sample_dictionary_data()
+        data["parts"].append(
+            {
+                "Part_ID": "IX_test_table_Parent",
+                "Label": "By parent",
+                "Description": "Children of a record",
+                "Part_type": "index",
+                "Table_part_ID": "test_table",
+                "Index_columns": ["Parent_ID", "Status"],
+                "Is_unique": True,
+            }
+        )
+        json_file = tmp_path / "dictionary.json"
+        json_file.write_text(json.dumps(data))
+        sql = generate_sql_schema(parse_parts_json(json_file), target_db="mssql")
+
+        assert "CREATE UNIQUE INDEX [IX_test_table_Parent]" in sql
+        assert "IX_test_table_Parent_ID" not in sql
+
+    def test_sqlite_appends_include_columns(self, indexed_json_file):
+        import sqlite3
+
+        data = parse_parts_json(indexed_json_file)
+        sql = generate_sql_schema(data, target_db="sqlite")
+
+        assert "INCLUDE" not in sql
+        connection = sqlite3.connect(":memory:")
+        connection.executescript(sql)
+        columns = [
+            row[2]
+            for row in connection.execute('PRAGMA index_info("IX_test_table_Status")')
+        ]
+        assert columns == ["Status", "Parent_ID", "Description"]
+
+
+def partitioned_dictionary_data(**storage):
+    """Sample dictionary with storage hints on test_table."""
+    data = sample_dictionary_data()
+    data["parts"][0]["Storage"] = storage
+    return data
+
+
+class TestStorage:
+    """Tests for partitioning and columnstore DDL."""
+
+    def _generate(self, tmp_path, target_db, **storage):
+        json_file = tmp_path / "dictionary.json"
+        json_file.write_text(json.dumps(partitioned_dictionary_data(**storage)))
+        return generate_sql_schema(
+            parse_parts_json(json_file), target_db=target_db, include_timestamp=False
+        )
+
+    def test_mssql_partition_scheme_and_columnstore(self, tmp_path):
+        sql = self._generate(
+            tmp_path,
+            "mssql",
+            Partition_column="TestTable_ID",
+            Partition_boundaries=["1000", "2000"],
+            Columnstore=True,
+        )
+
+        assert (
+            "CREATE PARTITION FUNCTION [PF_test_table] (int)\n"
+            "    AS RANGE RIGHT FOR VALUES (1000, 2000);"
+        ) in sql
+        assert "AS PARTITION [PF_test_table] ALL TO ([PRIMARY]);" in sql
+        assert ") ON [PS_test_table] ([TestTable_ID]);" in sql
+        assert "PRIMARY KEY NONCLUSTERED ([TestTable_ID])" in sql
+        assert (
+            "CREATE CLUSTERED COLUMNSTORE INDEX [CCI_test_table] ON [test_table] "
+            "ON [PS_test_table] ([TestTable_ID]);"
+        ) in sql
+
+    def test_partition_column_joins_primary_key(self, tmp_path):
+        sql = self._generate(
+            tmp_path,
+            "mssql",
+            Partition_column="Status",
+            Partition_boundaries=["b"],
+        )
+
+        assert "PRIMARY KEY ([TestTable_ID], [Status])" in sql
+        assert "FOR VALUES ('b');" in sql
+        assert "COLUMNSTORE" not in sql
+
+    def test_postgres_declarative_partitions(self, tmp_path):
+        sql = self._generate(
+            tmp_path,
+            "postgres",
+            Partition_column="TestTable_ID",
+            Partition_boundaries=["1000", "2000"],
+            Columnstore=True,
+        )
+
+        assert ') PARTITION BY RANGE ("TestTable_ID");' in sql
+        assert (
+            'CREATE TABLE "test_table_p0" PARTITION OF "test_table" '
+            "FOR VALUES FROM (MINVALUE) TO (1000);"
+        ) in sql
+        assert "FROM (1000) TO (2000);" in sql
+        assert "FROM (2000) TO (MAXVALUE);" in sql
+        assert "COLUMNSTORE" not in sql
+
+    def test_sqlite_ignores_storage_hints(self, tmp_path, sample_json_file):
+        sql = self._generate(
+            tmp_path,
+            "sqlite",
+            Partition_column="TestTable_ID",
+            Partition_boundaries=["1000"],
+            Columnstore=True,
+        )
+        plain = generate_sql_schema(
+            parse_parts_json(sample_json_file),
+            target_db="sqlite",
+            include_timestamp=False,
+        )
+
+        assert sql == plain
+
+    @pytest.mark.parametrize("target_db", ["postgres", "mssql"])
+    def test_referenced_partitioned_table_rejected(self, tmp_path, target_db):
+        data = partitioned_dictionary_data(Partition_column="TestTable_ID")
+        data["parts"].append(
+            {
+                "Part_ID": "child_table",
+                "Label": "Child",
+                "Description": "Rows referencing test_table",
+                "Part_type": "table",
+            }
+        )
+        key = next(p for p in data["parts"] if p["Part_ID"] == "TestTable_ID")
+        key["table_presence"]["child_table"] = {
+            "role": "property",
+            "order": 1,
+            "relationship_type": "one-to-many",
+        }
+        json_file = tmp_path / "dictionary.json"
+        json_file.write_text(json.dumps(data))
+
+        with pytest.raises(ValueError, match="'test_table' is partitioned"):
+            generate_sql_schema(parse_parts_json(json_file), target_db=target_db)
+
 
 class TestEdgeCases:
     """Test edge cases and error handling for SQL generation."""
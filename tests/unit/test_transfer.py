@@ -0,0 +1,138 @@
+"""Tests for copying tables between databases in dependency order."""
+
+import pytest
+import sqlite3
+import sys
+import threading
+from pathlib import Path
+
+# Add src and scripts to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+sys.path.insert(0, str(Path(__file__).parent.parent / "scripts"))
+
+from generate_sql import generate_sql_schema, parse_parts_json
+from open_dateaubase.ingest.transfer import CopyReport, copy_tables, load_waves
+
+PACKAGED_DICTIONARY = (
+    Path(__file__).parent.parent.parent / "src" / "open_dateaubase" / "dictionary.json"
+)
+ROWS = 30
+
+
+@pytest.fixture(scope="module")
+def schema():
+    return parse_parts_json(PACKAGED_DICTIONARY)
+
+
+def create_database(path, schema):
+    connection = sqlite3.connect(path)
+    connection.executescript(generate_sql_schema(schema, target_db="sqlite"))
+    return connection
+
+
+def fill(connection, schema):
+    """Give every table rows 1..ROWS; foreign keys point at the same numbers."""
+    for table_id in schema["tables"]:
+        columns = connection.execute(f'PRAGMA table_info("{table_id}")').fetchall()
+        rows = [
+            [i if "INT" in column_type.upper() else str(i) for _, _, column_type, *_ in columns]
+            for i in range(1, ROWS + 1)
+        ]
+        marks = ", ".join("?" * len(columns))
+        connection.executemany(f'INSERT INTO "{table_id}" VALUES ({marks})', rows)
+    connection.commit()
+
+
+@pytest.fixture
+def databases(tmp_path, schema):
+    source, target = tmp_path / "source.db", tmp_path / "target.db"
+    fill(create_database(source, schema), schema)
+    create_database(target, schema).close()
+
+    def connect_target():
+        connection = sqlite3.connect(target, timeout=30)
+        # Fail on any child row written before its parent
+        connection.execute("PRAGMA foreign_keys = ON")
+        return connection
+
+    return (lambda: sqlite3.connect(source)), connect_target
+
+
+def table_rows(connection, table_id):
+    return connection.execute(f'SELECT * FROM "{table_id}" ORDER BY 1, 2').fetchall()
+
+
+class TestLoadWaves:
+    def test_packaged_dictionary(self, schema):
+        waves = load_waves(schema)
+
+        assert "watershed" in waves[0] and "contact" in waves[0]
+        assert waves[-1] == ["value"]
+
+    def test_subset_ignores_other_tables(self, schema):
+        assert load_waves(schema, ["value", "sampling_points"]) == [["sampling_points", "value"]]
+
+    def test_unknown_table(self, schema):
+        with pytest.raises(ValueError, match="Unknown tables"):
+            load_waves(schema, ["nope"])
+
+
+class TestCopyTables:
+    def test_copies_every_table_parents_first(self, databases, schema):
+        connect_source, connect_target = databases
+        finished = []
+
+        report = copy_tables(
+            connect_source,
+            connect_target,
+            schema=schema,
+            batch_size=7,
+            max_workers=4,
+            progress=lambda table_id, report: finished.append(table_id),
+        )
+
+        assert report.rows_copied == ROWS * len(schema["tables"])
+        assert finished.index("site") < finished.index("sampling_points") < finished.index("value")
+        source, target = connect_source(), connect_target()
+        for table_id in schema["tables"]:
+            assert table_rows(target, table_id) == table_rows(source, table_id)
+
+    def test_one_connection_pair_per_worker(self, databases, schema):
+        connect_source, connect_target = databases
+        threads = set()
+
+        def connect():
+            threads.add(threading.current_thread().name)
+            return connect_source()
+
+        copy_tables(connect, connect_target, schema=schema, max_workers=3)
+
+        assert 1 <= len(threads) <= 3
+
+    def test_truncate_replaces_rows(self, databases, schema):
+        connect_source, connect_target = databases
+        copy_tables(connect_source, connect_target, schema=schema)
+
+        report = copy_tables(connect_source, connect_target, schema=schema, truncate=True)
+
+        assert sum(report.deleted.values()) == report.rows_copied
+        assert str(report).startswith(f"Copied {report.rows_copied} rows from 23 tables")
+
+    def test_failures_stop_dependent_tables(self, databases, schema):
+        connect_source, connect_target = databases
+        copy_tables(connect_source, connect_target, schema=schema, tables=["watershed"])
+
+        with pytest.raises(sqlite3.IntegrityError):
+            copy_tables(
+                connect_source, connect_target, schema=schema, tables=["watershed", "site"]
+            )
+
+        assert table_rows(connect_target(), "site") == []
+
+    def test_rejects_invalid_parameters(self, databases):
+        with pytest.raises(ValueError, match="max_workers"):
+            copy_tables(*databases, max_workers=0)
+
+    def test_report(self):
+        report = CopyReport(rows={"a": 2, "b": 3}, elapsed=1.0)
+        assert str(report) == "Copied 5 rows from 2 tables in 1.00s"
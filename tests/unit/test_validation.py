@@ -0,0 +1,176 @@
+"""Tests for validation of incoming data against the dictionary."""
+
+import pytest
+import sys
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from open_dateaubase.data_model.models import Dictionary
+from open_dateaubase.data_model.schema import compile_schema, load_schema
+from open_dateaubase.data_model.validation import (
+    INVALID_CODE,
+    NULL_CODE,
+    RecordValidator,
+    ValueSetValidator,
+    bitmask_rows,
+    rows_bitmask,
+    type_check,
+)
+from fixtures.sample_dictionary import sample_dictionary_data
+
+PACKAGED_DICTIONARY = (
+    Path(__file__).parent.parent.parent / "src" / "open_dateaubase" / "dictionary.json"
+)
+
+
+@pytest.fixture
+def schema():
+    return compile_schema(Dictionary.model_validate(sample_dictionary_data()))
+
+
+class TestBitmasks:
+    def test_round_trip(self):
+        assert rows_bitmask([]) == 0
+        assert rows_bitmask([0, 3, 64]) == (1 << 0) | (1 << 3) | (1 << 64)
+        assert bitmask_rows(rows_bitmask([0, 3, 9, 64])) == [0, 3, 9, 64]
+
+
+class TestValueSetValidator:
+    def test_compiles_constrained_columns(self, schema):
+        validator = ValueSetValidator(schema)
+
+        assert validator.columns == {"test_table": {"Status": "StatusSet"}}
+        assert validator.members["StatusSet"] == frozenset({"active", "inactive", "pending"})
+        assert validator.is_member("StatusSet", None)
+        assert not validator.is_member("StatusSet", "archived")
+
+    def test_validate_rows_returns_bitmasks(self, schema):
+        validator = ValueSetValidator(schema)
+        rows = [
+            {"Status": "active"},
+            {"Status": "archived"},
+            {},
+            {"Status": "Active"},
+        ]
+
+        violations = validator.validate_rows("test_table", rows)
+
+        assert violations == {"Status": 0b1010}
+        assert bitmask_rows(violations["Status"]) == [1, 3]
+
+    def test_valid_rows_and_unconstrained_tables(self, schema):
+        validator = ValueSetValidator(schema)
+        assert validator.validate_rows("test_table", [{"Status": "pending"}]) == {}
+        assert validator.validate_rows("other_table", [{"Status": "nope"}]) == {}
+
+    def test_categorical_codes(self, schema):
+        np = pytest.importorskip("numpy")
+        validator = ValueSetValidator(schema)
+        values = np.array(["pending", None, "active", "archived", "active"], dtype=object)
+
+        codes = validator.encode("StatusSet", values)
+
+        assert codes.tolist() == [2, NULL_CODE, 0, INVALID_CODE, 0]
+        assert [validator.categories["StatusSet"][c] for c in codes[[0, 2]]] == [
+            "pending",
+            "active",
+        ]
+
+    def test_validate_batch(self, schema):
+        pytest.importorskip("numpy")
+        validator = ValueSetValidator(schema)
+
+        violations = validator.validate_batch(
+            "test_table", {"Status": ["active", "archived", None]}
+        )
+
+        assert violations["Status"].tolist() == [False, True, False]
+        assert validator.validate_batch("test_table", {"Description": ["x"]}) == {}
+
+
+class TestTypeCheck:
+    @pytest.mark.parametrize(
+        "sql_type,value,expected",
+        [
+            ("int", 5, True),
+            ("int", "5", True),
+            ("int", "5.5", False),
+            ("int", 2**31, False),
+            ("int", True, False),
+            ("tinyint", -1, False),
+            ("float", "1e3", True),
+            ("float", "abc", False),
+            ("numeric(5,2)", "123.45", True),
+            ("numeric(5,2)", "1234.5", False),
+            ("numeric(5,2)", "1.234", False),
+            ("nvarchar(3)", "abc", True),
+            ("nvarchar(3)", "abcd", False),
+            ("nvarchar(3)", 12, False),
+        ],
+    )
+    def test_type_check(self, sql_type, value, expected):
+        assert type_check(sql_type)(value) is expected
+
+    def test_unchecked_types(self):
+        assert type_check("image(2147483647)") is None
+        assert type_check("nvarchar(max)")("x" * 10_000)
+
+
+class TestRecordValidator:
+    def test_reports_rules_per_column(self, schema):
+        validator = RecordValidator(schema)
+        rows = [
+            {"TestTable_ID": 1, "Description": "ok", "Status": "active"},
+            {"TestTable_ID": "x", "Description": "ok"},
+            {"TestTable_ID": 3, "Description": None, "Status": "archived"},
+            {"TestTable_ID": 4, "Description": "d" * 256},
+        ]
+
+        violations = validator.validate("test_table", rows)
+
+        assert violations == {
+            ("TestTable_ID", "type"): 0b0010,
+            ("Description", "required"): 0b0100,
+            ("Description", "type"): 0b1000,
+            ("Status", "value_set"): 0b0100,
+        }
+
+    def test_foreign_keys_use_cached_key_sets(self, schema):
+        rows = [
+            {"TestTable_ID": 2, "Description": "child", "Parent_ID": 1},
+            {"TestTable_ID": 3, "Description": "orphan", "Parent_ID": "9"},
+        ]
+        # Without a key set, foreign keys are not checked
+        assert RecordValidator(schema).validate("test_table", rows) == {}
+
+        validator = RecordValidator(schema, key_sets={"test_table": [1]})
+        assert validator.validate("test_table", rows) == {("Parent_ID", "foreign_key"): 0b10}
+
+        validator.add_keys("test_table", [9])
+        assert validator.validate("test_table", rows) == {}
+
+    def test_split(self, schema):
+        validator = RecordValidator(schema)
+        rows = [
+            {"TestTable_ID": 1, "Description": "ok"},
+            {"TestTable_ID": 2},
+            {"TestTable_ID": 3, "Description": "ok"},
+        ]
+
+        valid, rejected = validator.split("test_table", rows)
+
+        assert [r["TestTable_ID"] for r in valid] == [1, 3]
+        assert rejected == [{"TestTable_ID": 2}]
+
+    def test_load_keys_from_database(self, dateaubase_db):
+        dateaubase_db.execute('INSERT INTO metadata ("Metadata_ID") VALUES (7)')
+        validator = RecordValidator(load_schema(PACKAGED_DICTIONARY))
+        validator.load_keys(dateaubase_db)
+
+        assert validator.key_sets["metadata"] == {7}
+        violations = validator.validate(
+            "value", [{"Value_ID": 1, "Metadata_ID": 7}, {"Value_ID": 2, "Metadata_ID": 8}]
+        )
+        assert violations == {("Metadata_ID", "foreign_key"): 0b10}
@@ -0,0 +1,78 @@
+"""Tests for streaming SQL to files and DB-API connections."""
+
+import io
+import sqlite3
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from open_dateaubase.sql.writer import execute_sql, split_sql, write_sql
+
+SCRIPT = [
+    "-- header",
+    "CREATE TABLE [t] (",
+    "    [a] int NULL, -- a comment; with a semicolon",
+    "    [b] nvarchar(10) DEFAULT 'x;y'",
+    ");\n",
+    "CREATE INDEX [ix] ON [t] ([a]);",
+    "\n-- Views\n",
+    "CREATE VIEW [v] AS\nSELECT [a] FROM [t];",
+]
+
+
+class CountingConnection:
+    """sqlite3 connection wrapper counting commits."""
+
+    def __init__(self):
+        self.connection = sqlite3.connect(":memory:")
+        self.commits = 0
+
+    def cursor(self):
+        return self.connection.cursor()
+
+    def commit(self):
+        self.commits += 1
+        self.connection.commit()
+
+
+class TestWriteSql:
+    def test_matches_join(self):
+        stream = io.StringIO()
+        write_sql(iter(SCRIPT), stream)
+        assert stream.getvalue() == "\n".join(SCRIPT)
+
+    def test_empty(self):
+        stream = io.StringIO()
+        write_sql([], stream)
+        assert stream.getvalue() == ""
+
+
+class TestSplitSql:
+    def test_statements(self):
+        statements = list(split_sql(SCRIPT))
+
+        assert len(statements) == 3
+        assert statements[0].startswith("CREATE TABLE [t]")
+        assert "'x;y'" in statements[0]
+        assert "comment" not in statements[0]
+        assert statements[2] == "CREATE VIEW [v] AS\nSELECT [a] FROM [t]"
+
+
+class TestExecuteSql:
+    def test_commits_in_batches(self):
+        connection = CountingConnection()
+
+        assert execute_sql(SCRIPT, connection, batch_size=2) == 3
+
+        # One commit after the first two statements, one at the end
+        assert connection.commits == 2
+        rows = connection.connection.execute("SELECT name FROM sqlite_master ORDER BY name")
+        assert [name for (name,) in rows] == ["ix", "t", "v"]
+
+    def test_rejects_non_positive_batch_size(self):
+        with pytest.raises(ValueError, match="batch_size"):
+            execute_sql(SCRIPT, CountingConnection(), batch_size=0)